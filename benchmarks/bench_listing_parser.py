@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark parsing of scraped eBay sold-listing pages.
+
+Parses the saved pages in benchmarks/fixtures with every available parser
+backend (BeautifulSoup, lxml, selectolax) through EbayAPIClient, checks that
+all backends return the same items, and reports the time per page for a
+full page and for an early stop at a typical limit.
+
+Usage:
+    python benchmarks/bench_listing_parser.py [--repeat N] [--limit N]
+"""
+
+import os
+import sys
+import glob
+import time
+import logging
+import argparse
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'ebay_tools'))
+
+from bs4 import BeautifulSoup
+
+from ebay_pricing_complete import EbayAPIClient
+from ebay_tools.utils.listing_parser_utils import available_parser_backends
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# The fixtures' sales end on 2025-06-01; look back far enough to keep them all
+FIXTURE_DAYS_BACK = (datetime.now() - datetime(2025, 1, 1)).days
+
+
+def parse(client, html, limit):
+    """Parse a page the way EbayAPIClient._fetch_via_scraping does."""
+    if client.listing_parser:
+        return client._parse_listings(html, limit, FIXTURE_DAYS_BACK)
+    return client._parse_scraped_items(BeautifulSoup(html, 'html.parser'), limit, FIXTURE_DAYS_BACK)
+
+
+def best_time(function, repeat):
+    """Run a function repeat times and return its best time in seconds and last result."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='runs per measurement (best is reported)')
+    parser.add_argument('--limit', type=int, default=20, help='items wanted for the early-stop measurement')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    fixtures = sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html')))
+    if not fixtures:
+        sys.exit(f"No fixtures in {FIXTURE_DIR}; run fixtures/generate_sold_listing_fixtures.py")
+
+    backends = ['bs4'] + available_parser_backends()
+    clients = {backend: EbayAPIClient(use_scraping=True, parser_backend=backend) for backend in backends}
+
+    print(f"Backends: {', '.join(backends)}")
+    print(f"{'fixture':<24}{'backend':<12}{'full page':>12}{'limit ' + str(args.limit):>12}{'items':>8}{'speedup':>10}")
+
+    for path in fixtures:
+        with open(path, 'rb') as f:
+            html = f.read()
+        name = os.path.basename(path)
+
+        reference = None
+        baseline = None
+        for backend in backends:
+            client = clients[backend]
+            full_time, items = best_time(lambda: parse(client, html, 10 ** 6), args.repeat)
+            limit_time, limited = best_time(lambda: parse(client, html, args.limit), args.repeat)
+
+            if reference is None:
+                reference = items
+                baseline = full_time
+            elif items != reference:
+                sys.exit(f"{backend} returned different items than bs4 for {name}")
+            if limited != reference[:args.limit]:
+                sys.exit(f"{backend} early stop returned different items for {name}")
+
+            print(f"{name:<24}{backend:<12}{full_time * 1000:>10.1f}ms{limit_time * 1000:>10.1f}ms"
+                  f"{len(items):>8}{baseline / full_time:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
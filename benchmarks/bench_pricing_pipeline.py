@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pricing fetch, parse and analysis path end to end.
+
+Replays the saved fixtures through a local stand-in HTTP server
+(replay_server.py) and times each stage of pricing an item:
+
+    fetch scraping      EbayAPIClient.fetch_sold_items over the search page
+    fetch finding api   EbayAPIClient.fetch_sold_items over 3 Finding API pages
+    parse finding api   one 100-item Finding API response
+    parse listings      one 240-listing search page
+    extract terms       SmartSearchExtractor.extract_search_terms per item
+    price stats         price_stats per comp set, and batch_price_stats
+
+For each stage it reports the best time per run, throughput in items per
+second and the peak memory traced while the stage ran.  Results can be
+saved as JSON and compared with an earlier run, so regressions show up as
+failures.
+
+Usage:
+    python benchmarks/bench_pricing_pipeline.py [--repeat N] [--latency S]
+        [--only STAGE ...] [--save FILE] [--baseline FILE] [--tolerance F]
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(ROOT))
+sys.path.insert(0, os.path.join(os.path.dirname(ROOT), 'ebay_tools'))
+
+from ebay_pricing_complete import EbayAPIClient
+from ebay_tools.apps.price_analyzer import SmartSearchExtractor
+from ebay_tools.utils.price_stats_utils import batch_price_stats, price_stats
+
+from bench_listing_parser import FIXTURE_DAYS_BACK, parse
+from replay_server import FIXTURE_DIR, FixtureReplayServer
+
+SEARCH_TERMS = "vintage pyrex bowl"
+COMP_SET_SIZE = 20
+
+
+def measure(function, repeat):
+    """
+    Time a function and trace its memory.
+
+    The function runs repeat times untraced (best time is kept) and once more
+    under tracemalloc, so tracing overhead does not skew the timings.
+
+    Returns:
+        Tuple of (best seconds, peak traced bytes, last result)
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return best, peak, result
+
+
+def load_fixture(name):
+    """Read a fixture file."""
+    with open(os.path.join(FIXTURE_DIR, name), 'rb') as f:
+        return f.read()
+
+
+def build_stages(server):
+    """
+    Build the benchmark stages.
+
+    Returns:
+        List of (name, function, items per run) tuples
+    """
+    scraper = EbayAPIClient(use_scraping=True)
+    server.point_client(scraper)
+
+    api_client = EbayAPIClient(app_id='BENCHMARK', use_scraping=False)
+    server.point_client(api_client)
+
+    api_xml = load_fixture('finding_api_page_1.xml')
+    search_html = load_fixture('sold_listings_240.html')
+
+    # Comparables and queue items built from the fixtures
+    api_items = api_client.fetch_sold_items(SEARCH_TERMS, limit=300, days_back=FIXTURE_DAYS_BACK)
+    queue_items = [{"title": item.title, "description": f"{item.condition} {item.title}",
+                    "item_specifics": {"Condition": item.condition}} for item in api_items]
+    comp_sets = [api_items[start:start + COMP_SET_SIZE] for start in range(0, len(api_items), COMP_SET_SIZE)]
+    comp_prices = [[item.total_price for item in comps] for comps in comp_sets]
+    comp_dates = [[item.sold_date for item in comps] for comps in comp_sets]
+
+    extractor = SmartSearchExtractor()
+
+    return [
+        ('fetch scraping',
+         lambda: scraper.fetch_sold_items(SEARCH_TERMS, limit=100, days_back=FIXTURE_DAYS_BACK), 100),
+        ('fetch finding api',
+         lambda: api_client.fetch_sold_items(SEARCH_TERMS, limit=300, days_back=FIXTURE_DAYS_BACK), 300),
+        ('parse finding api',
+         lambda: api_client._parse_finding_api_response(api_xml), 100),
+        ('parse listings',
+         lambda: parse(scraper, search_html, 10 ** 6), 240),
+        ('extract terms',
+         lambda: [extractor.extract_search_terms(item) for item in queue_items], len(queue_items)),
+        ('price stats',
+         lambda: [price_stats(prices, dates) for prices, dates in zip(comp_prices, comp_dates)], len(api_items)),
+        ('batch price stats',
+         lambda: batch_price_stats(comp_prices, comp_dates), len(api_items)),
+    ]
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results with a baseline run.
+
+    Returns:
+        Names of stages slower than the baseline by more than tolerance
+    """
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        ratio = result['seconds'] / previous['seconds']
+        marker = ''
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            marker = '  REGRESSION'
+        print(f"  {name:<20}{previous['seconds'] * 1000:>10.1f}ms -> {result['seconds'] * 1000:>8.1f}ms"
+              f"{ratio:>8.2f}x{marker}")
+    return regressions
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='runs per stage (best is reported)')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds the server delays each response')
+    parser.add_argument('--only', nargs='+', metavar='STAGE', help='run only stages whose name starts with these')
+    parser.add_argument('--save', metavar='FILE', help='write the results as JSON')
+    parser.add_argument('--baseline', metavar='FILE', help='compare with results saved by --save')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='slowdown over the baseline reported as a regression (0.25 = 25%%)')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    results = {}
+    with FixtureReplayServer(latency=args.latency) as server:
+        stages = build_stages(server)
+        if args.only:
+            stages = [stage for stage in stages if any(stage[0].startswith(prefix) for prefix in args.only)]
+
+        print(f"{'stage':<20}{'best':>12}{'items/s':>12}{'peak mem':>12}{'requests':>10}")
+        for name, function, item_count in stages:
+            server.reset()
+            seconds, peak, _ = measure(function, args.repeat)
+            requests_per_run = server.request_count() // (args.repeat + 1)
+            results[name] = {
+                'seconds': seconds,
+                'items_per_second': item_count / seconds if seconds else None,
+                'peak_bytes': peak,
+                'requests': requests_per_run,
+            }
+            print(f"{name:<20}{seconds * 1000:>10.1f}ms{item_count / seconds:>12,.0f}"
+                  f"{peak / 1024:>10,.0f}KB{requests_per_run:>10}")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved results to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"Compared with {args.baseline}:")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            sys.exit(f"Slower than the baseline: {', '.join(regressions)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Generate the saved eBay Finding API responses used by the benchmarks.
+
+Each file is one page of a findCompletedItems XML response (namespaced
+envelope, searchResult items, paginationOutput) with made-up sold items,
+so benchmarks run offline and reproducibly.  Run this again after changing
+it to refresh the fixtures.
+"""
+
+import os
+import random
+from datetime import datetime, timedelta
+from html import escape
+
+from generate_sold_listing_fixtures import ADJECTIVES, BRANDS, PRODUCTS, REFERENCE_DATE
+
+FIXTURE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+NAMESPACE = "http://www.ebay.com/marketplace/search/v1/services"
+ENTRIES_PER_PAGE = 100
+TOTAL_PAGES = 3
+
+CONDITIONS = [("1000", "New"), ("1500", "Open box"), ("3000", "Used"), ("7000", "For parts or not working")]
+
+
+def item_xml(rng, page, index):
+    """Build one sold item's markup."""
+    item_id = 200000000000 + page * 10000 + index
+    title = f"{rng.choice(ADJECTIVES)} {rng.choice(BRANDS)} {rng.choice(PRODUCTS)} #{rng.randint(1, 999)} & more"
+    ended = REFERENCE_DATE - timedelta(days=rng.randint(0, 120), minutes=rng.randint(0, 1439))
+    started = ended - timedelta(days=rng.choice((3, 5, 7, 10, 30)))
+    price = f"{rng.randint(3, 900)}.{rng.randint(0, 99):02d}"
+    shipping = "0.0" if rng.random() < 0.3 else f"{rng.randint(3, 25)}.{rng.randint(0, 99):02d}"
+    condition_id, condition = rng.choice(CONDITIONS)
+    listing_type = rng.choice(("Auction", "FixedPrice", "StoreInventory"))
+
+    return (
+        f"<item><itemId>{item_id}</itemId><title>{escape(title)}</title><globalId>EBAY-US</globalId>"
+        f"<primaryCategory><categoryId>{rng.randint(1, 99999)}</categoryId><categoryName>Collectibles</categoryName></primaryCategory>"
+        f"<galleryURL>https://thumbs.ebaystatic.com/pict/{item_id}.jpg</galleryURL>"
+        f"<viewItemURL>https://www.ebay.com/itm/{item_id}</viewItemURL>"
+        f"<autoPay>true</autoPay><postalCode>9****</postalCode><location>Springfield,USA</location><country>US</country>"
+        f"<shippingInfo><shippingServiceCost currencyId=\"USD\">{shipping}</shippingServiceCost>"
+        f"<shippingType>Flat</shippingType><shipToLocations>Worldwide</shipToLocations></shippingInfo>"
+        f"<sellingStatus><currentPrice currencyId=\"USD\">{price}</currentPrice>"
+        f"<convertedCurrentPrice currencyId=\"USD\">{price}</convertedCurrentPrice>"
+        f"<bidCount>{rng.randint(0, 40) if listing_type == 'Auction' else 0}</bidCount>"
+        f"<sellingState>EndedWithSales</sellingState></sellingStatus>"
+        f"<listingInfo><bestOfferEnabled>false</bestOfferEnabled><buyItNowAvailable>false</buyItNowAvailable>"
+        f"<startTime>{started:%Y-%m-%dT%H:%M:%S.000Z}</startTime><endTime>{ended:%Y-%m-%dT%H:%M:%S.000Z}</endTime>"
+        f"<listingType>{listing_type}</listingType><gift>false</gift></listingInfo>"
+        f"<returnsAccepted>true</returnsAccepted>"
+        f"<condition><conditionId>{condition_id}</conditionId><conditionDisplayName>{escape(condition)}</conditionDisplayName></condition>"
+        f"<isMultiVariationListing>false</isMultiVariationListing><topRatedListing>false</topRatedListing></item>"
+    )
+
+
+def page_xml(page, total_pages=TOTAL_PAGES, entries=ENTRIES_PER_PAGE):
+    """Build one page of a findCompletedItems response."""
+    rng = random.Random(page)
+    items = "".join(item_xml(rng, page, index) for index in range(entries))
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<findCompletedItemsResponse xmlns="{NAMESPACE}">'
+        f"<ack>Success</ack><version>1.13.0</version>"
+        f"<timestamp>{REFERENCE_DATE:%Y-%m-%dT%H:%M:%S.000Z}</timestamp>"
+        f'<searchResult count="{entries}">{items}</searchResult>'
+        f"<paginationOutput><pageNumber>{page}</pageNumber><entriesPerPage>{entries}</entriesPerPage>"
+        f"<totalPages>{total_pages}</totalPages><totalEntries>{total_pages * entries}</totalEntries></paginationOutput>"
+        f"<itemSearchURL>https://www.ebay.com/sch/i.html?_nkw=vintage+pyrex+bowl&amp;LH_Complete=1&amp;LH_Sold=1</itemSearchURL>"
+        f"</findCompletedItemsResponse>\n"
+    )
+
+
+def main():
+    """Write the fixtures."""
+    for page in range(1, TOTAL_PAGES + 1):
+        path = os.path.join(FIXTURE_DIR, f"finding_api_page_{page}.xml")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(page_xml(page))
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Generate the saved eBay sold-listing search pages used by the benchmarks.
+
+The pages follow the markup of eBay's search results (s-item containers,
+"Shop on eBay" placeholder, <!--F#--> comments splitting prices, page
+boilerplate) with made-up listings, so benchmarks run offline and
+reproducibly.  Run this again after changing it to refresh the fixtures.
+"""
+
+import os
+import random
+from datetime import datetime, timedelta
+from html import escape
+
+FIXTURE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Fixed reference date so regenerated fixtures are identical
+REFERENCE_DATE = datetime(2025, 6, 1)
+
+BRANDS = ["Apple", "Samsung", "Sony", "Nintendo", "Pyrex", "Fiesta", "Lego", "Rolex",
+          "Seiko", "Coach", "Dewalt", "Makita", "Madame Alexander", "Hot Wheels"]
+PRODUCTS = ["Mixing Bowl", "Watch", "Console", "Doll", "Drill", "Handbag", "Set", "Phone",
+            "Camera", "Figure", "Vase", "Lunch Box", "Record Player", "Lamp"]
+ADJECTIVES = ["Vintage", "Rare", "Boxed", "Used", "Mint", "Retro", "Classic", "Original"]
+CONDITIONS = ["Pre-Owned", "Brand New", "Open Box", "Parts Only", "Refurbished"]
+LOCATIONS = ["from United States", "from Canada", "from China", "from United Kingdom", ""]
+
+BOILERPLATE_HEAD = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8">
+<title>{query} for sale | eBay</title>
+<link rel="stylesheet" href="https://ir.ebaystatic.com/rs/c/srp.css">
+<style>{css}</style>
+<script>{script}</script>
+</head><body class="srp-main">
+<header class="gh-header"><div class="gh-flex">{nav}</div></header>
+<div class="srp-controls"><h1 class="srp-controls__count-heading"><span class="BOLD">{count}</span> results for <span class="BOLD">{query}</span></h1></div>
+<div id="srp-river-main" class="srp-main srp-main--isLarge">
+<ul class="srp-results srp-list clearfix">
+"""
+
+BOILERPLATE_TAIL = """</ul>
+<nav class="pagination" role="navigation"><a class="pagination__next" href="?_pgn=2">Next</a></nav>
+</div>
+<footer id="glbfooter"><div class="gh-footer">{links}</div></footer>
+<script>{script}</script>
+</body></html>
+"""
+
+PLACEHOLDER_ITEM = """<li class="s-item s-item__pl-on-bottom" data-view="mi:1686|iid:1"><div class="s-item__wrapper clearfix"><div class="s-item__image-section"><div class="s-item__image"></div></div><div class="s-item__info clearfix"><a class="s-item__link" href="https://ebay.com/itm/123456"><div class="s-item__title"><span role="heading" aria-level="3">Shop on eBay</span></div></a><div class="s-item__details clearfix"><div class="s-item__detail s-item__detail--primary"><span class="s-item__price">$20.00</span></div></div></div></div></li>
+"""
+
+
+def listing_html(rng, index):
+    """Build one sold listing's markup."""
+    item_id = 110000000000 + rng.randrange(10 ** 11)
+    title = f"{rng.choice(ADJECTIVES)} {rng.choice(BRANDS)} {rng.choice(PRODUCTS)} #{rng.randint(1, 999)} & more"
+    sold = REFERENCE_DATE - timedelta(days=rng.randint(0, 120))
+    dollars = rng.randint(3, 900)
+    cents = rng.randint(0, 99)
+    condition = rng.choice(CONDITIONS)
+    location = rng.choice(LOCATIONS)
+
+    shipping_roll = rng.random()
+    if shipping_roll < 0.3:
+        shipping = '<span class="s-item__shipping s-item__logisticsCost"><span class="ITALIC">Free shipping</span></span>'
+    elif shipping_roll < 0.9:
+        shipping = (f'<span class="s-item__shipping s-item__logisticsCost">+$<!--F#f_0-->{rng.randint(3, 25)}.'
+                    f'<!--F#f_1-->{rng.randint(0, 99):02d} shipping</span>')
+    else:
+        shipping = ""
+
+    price = f'<span class="s-item__price"><span class="POSITIVE">$<!--F#f_0-->{dollars:,}.<!--F#f_1-->{cents:02d}</span></span>'
+    if rng.random() < 0.05:
+        price = f'<span class="s-item__price"><span class="POSITIVE">${dollars}.00</span> to <span class="POSITIVE">${dollars + 20}.00</span></span>'
+
+    bids = f'<span class="s-item__bids s-item__bidCount">{rng.randint(1, 40)} bids</span>' if rng.random() < 0.4 else ""
+    location_html = (f'<div class="s-item__detail s-item__detail--primary"><span class="s-item__location s-item__itemLocation">{location}</span></div>'
+                     if location else "")
+
+    # A few listings lack an item link, so they are skipped as invalid
+    link = f"https://www.ebay.com/itm/{item_id}?hash=item{item_id:x}:g:AbCdEfGhIj&amp;amdata=enc%3AAQAIAAAA{index}"
+    if rng.random() < 0.03:
+        link = "https://www.ebay.com/sch/i.html?_nkw=similar"
+
+    return (
+        f'<li class="s-item s-item__pl-on-bottom" data-viewport="{{&quot;trackableId&quot;:&quot;{index}&quot;}}" id="item{item_id:x}">'
+        f'<div class="s-item__wrapper clearfix">'
+        f'<div class="s-item__image-section"><div class="s-item__image"><a tabindex="-1" href="{link}" data-interactions="[{{&quot;actionKind&quot;:&quot;NAVSRC&quot;}}]">'
+        f'<div class="s-item__image-wrapper image-treatment"><img alt="{escape(title)}" src="https://i.ebayimg.com/thumbs/images/g/{item_id}/s-l225.webp" loading="lazy"></div></a></div></div>'
+        f'<div class="s-item__info clearfix">'
+        f'<div class="s-item__caption-section"><div class="s-item__caption--row"><span class="s-item__caption--signal POSITIVE"><span>Sold  {sold:%b %d, %Y}</span></span></div></div>'
+        f'<div class="s-item__title--tag"><div class="POSITIVE"><span class="POSITIVE">Sold  {sold:%b %d, %Y}</span></div></div>'
+        f'<a class="s-item__link" href="{link}" data-interactions="[]"><div class="s-item__title"><span role="heading" aria-level="3"><!--F#f_0-->{escape(title)}<!--F#f_0--></span></div></a>'
+        f'<div class="s-item__subtitle"><span class="SECONDARY_INFO">{condition}</span></div>'
+        f'<div class="s-item__reviews"><div class="x-star-rating"><span class="clipped">4.5 out of 5 stars.</span></div></div>'
+        f'<div class="s-item__details clearfix">'
+        f'<div class="s-item__detail s-item__detail--primary">{price}</div>'
+        f'<div class="s-item__detail s-item__detail--primary"><span class="s-item__purchase-options s-item__purchaseOptions">Buy It Now</span></div>'
+        f'<div class="s-item__detail s-item__detail--primary">{shipping}</div>'
+        f'<div class="s-item__detail s-item__detail--primary">{bids}</div>'
+        f'{location_html}'
+        f'<div class="s-item__detail s-item__detail--secondary"><span class="s-item__watchcount">{rng.randint(1, 30)} watchers</span></div>'
+        f'</div></div></div></li>\n'
+    )
+
+
+def page_html(count, seed, query="vintage pyrex bowl"):
+    """Build a search results page with count sold listings."""
+    rng = random.Random(seed)
+    css = " ".join(f".s-item__x{i}{{margin:{i}px}}" for i in range(400))
+    script = "var srp=" + repr([rng.random() for _ in range(800)]) + ";"
+    nav = "".join(f'<a class="gh-p" href="/b/{i}">Category {i}</a>' for i in range(60))
+    links = "".join(f'<a href="/help/{i}">Help {i}</a>' for i in range(120))
+
+    parts = [BOILERPLATE_HEAD.format(query=escape(query), css=css, script=script, nav=nav, count=count * 7),
+             PLACEHOLDER_ITEM]
+    parts.extend(listing_html(rng, index) for index in range(count))
+    parts.append(BOILERPLATE_TAIL.format(links=links, script=script))
+    return "".join(parts)
+
+
+def main():
+    """Write the fixtures."""
+    for count, seed in ((60, 60), (240, 240)):
+        path = os.path.join(FIXTURE_DIR, f"sold_listings_{count}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(page_html(count, seed))
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
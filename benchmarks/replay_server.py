@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the eBay hosts, replaying the saved fixtures.
+
+Serves the sold-listing search pages and Finding API responses in
+benchmarks/fixtures over HTTP on 127.0.0.1, so the whole fetch path of
+EbayAPIClient (session, rate limiting, pagination, parsing) runs offline
+and reproducibly.  Routes:
+
+    /sch/i.html                          sold_listings_<n>.html, the smallest
+                                         page holding _ipg listings
+    /services/search/FindingService/v1   finding_api_page_<paginationInput.pageNumber>.xml
+    /robots.txt                          allows everything
+
+Usage as a script (serves until interrupted):
+    python benchmarks/replay_server.py [--port N] [--latency SECONDS]
+"""
+
+import os
+import re
+import glob
+import time
+import argparse
+import threading
+import urllib.parse
+import http.server
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+SEARCH_PATH = '/sch/i.html'
+FINDING_API_PATH = '/services/search/FindingService/v1'
+
+ROBOTS_TXT = b"User-agent: *\nAllow: /\n"
+
+FINDING_API_ERROR = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<findCompletedItemsResponse xmlns="http://www.ebay.com/marketplace/search/v1/services">'
+    '<ack>Failure</ack><errorMessage><error><message>{message}</message></error></errorMessage>'
+    '</findCompletedItemsResponse>\n'
+)
+
+
+class FixtureReplayServer:
+    """
+    Threaded HTTP server answering eBay requests from the saved fixtures.
+
+    Fixtures are read into memory once.  Every request is recorded in
+    requests (path and query), and each response can be delayed by latency
+    seconds to stand in for a network round trip.
+
+    Use as a context manager, or call start() and stop().
+    """
+
+    def __init__(self, fixture_dir: str = FIXTURE_DIR, latency: float = 0.0,
+                 host: str = '127.0.0.1', port: int = 0):
+        """
+        Initialize the server.
+
+        Args:
+            fixture_dir: Directory holding the fixtures
+            latency: Seconds to wait before answering each request
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+        """
+        self.latency = latency
+        self.requests = []
+        self.lock = threading.Lock()
+
+        # Search pages by listing count, smallest first
+        self.search_pages = []
+        for path in glob.glob(os.path.join(fixture_dir, 'sold_listings_*.html')):
+            count = int(re.search(r'_(\d+)\.html$', path).group(1))
+            with open(path, 'rb') as f:
+                self.search_pages.append((count, f.read()))
+        self.search_pages.sort()
+
+        self.api_pages = {}
+        for path in glob.glob(os.path.join(fixture_dir, 'finding_api_page_*.xml')):
+            page = int(re.search(r'_(\d+)\.xml$', path).group(1))
+            with open(path, 'rb') as f:
+                self.api_pages[page] = f.read()
+
+        self.httpd = http.server.ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the server."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def search_url(self) -> str:
+        """URL standing in for the eBay search page."""
+        return self.base_url + SEARCH_PATH
+
+    @property
+    def finding_api_url(self) -> str:
+        """URL standing in for the Finding API endpoint."""
+        return self.base_url + FINDING_API_PATH
+
+    def point_client(self, client):
+        """
+        Send an EbayAPIClient's requests to this server.
+
+        Request spacing is switched off so the benchmark measures the client
+        rather than its politeness delays.
+
+        Args:
+            client: EbayAPIClient to redirect
+        """
+        client.search_url = self.search_url
+        client.finding_api_url = self.finding_api_url
+        client.min_request_interval = 0.0
+        client.api_request_interval = 0.0
+        if getattr(client, 'scheduler', None):
+            client.scheduler.rate_limiter.min_interval = 0.0
+
+    def request_count(self, path: str = None) -> int:
+        """Number of requests served, optionally only those for a path."""
+        with self.lock:
+            return sum(1 for request_path, _ in self.requests if path is None or request_path == path)
+
+    def reset(self):
+        """Forget the recorded requests."""
+        with self.lock:
+            self.requests.clear()
+
+    def start(self):
+        """Start serving in a background thread."""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def respond(self, path: str, query: dict) -> tuple:
+        """
+        Pick the response for a request.
+
+        Args:
+            path: Request path
+            query: Parsed query string
+
+        Returns:
+            Tuple of (status, content type, body)
+        """
+        with self.lock:
+            self.requests.append((path, query))
+
+        if path == SEARCH_PATH:
+            wanted = int(query.get('_ipg', ['60'])[0])
+            for count, body in self.search_pages:
+                if count >= wanted:
+                    return 200, 'text/html; charset=utf-8', body
+            return 200, 'text/html; charset=utf-8', self.search_pages[-1][1]
+
+        if path == FINDING_API_PATH:
+            page = int(query.get('paginationInput.pageNumber', ['1'])[0])
+            body = self.api_pages.get(page)
+            if body is None:
+                body = FINDING_API_ERROR.format(message=f"No fixture for page {page}").encode('utf-8')
+            return 200, 'text/xml; charset=utf-8', body
+
+        if path == '/robots.txt':
+            return 200, 'text/plain', ROBOTS_TXT
+
+        return 404, 'text/plain', b"Not found\n"
+
+    def _handler_class(self):
+        """Build the request handler bound to this server."""
+        replay = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                parts = urllib.parse.urlsplit(self.path)
+                status, content_type, body = replay.respond(parts.path, urllib.parse.parse_qs(parts.query))
+                if replay.latency:
+                    time.sleep(replay.latency)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    """Serve the fixtures until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8008, help='port to listen on')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds to delay each response')
+    args = parser.parse_args()
+
+    server = FixtureReplayServer(latency=args.latency, port=args.port)
+    print(f"Search page:  {server.search_url}")
+    print(f"Finding API:  {server.finding_api_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -17,10 +17,14 @@ import json
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
+import math
+import io
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
+import sys
 import statistics
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional, Union
 import webbrowser
 
@@ -31,7 +35,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Research cache and price statistics shared with the other eBay Tools pricing front-ends
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ebay_tools'))
+try:
+    from ebay_tools.utils.research_cache_utils import get_research_cache
+except ImportError:
+    get_research_cache = None
+try:
+    from ebay_tools.utils import price_stats_utils
+except ImportError:
+    price_stats_utils = None
+try:
+    from ebay_tools.utils.listing_parser_utils import get_listing_parser
+except ImportError:
+    get_listing_parser = None
+try:
+    from ebay_tools.utils.fetch_utils import FetchScheduler, HostRateLimiter, url_host
+except ImportError:
+    FetchScheduler = None
+try:
+    from ebay_tools.utils.comp_set_utils import CompSet
+except ImportError:
+    CompSet = None
+
+# Slotted records use less memory per item (dataclass slots need Python 3.10)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_SLOTS)
 class EbayItem:
     """Data class for eBay sold items."""
     title: str
@@ -50,9 +80,14 @@ class EbayItem:
         """Total price including shipping."""
         return self.price + self.shipping
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PriceAnalysis:
-    """Data class for price analysis results."""
+    """
+    Data class for price analysis results.
+    
+    items holds the comparables as a columnar CompSet when the eBay Tools
+    package is available (it iterates like a list of EbayItem).
+    """
     count: int
     min_price: float
     max_price: float
@@ -70,19 +105,39 @@ class EbayAPIClient:
     Supports both eBay Finding API and web scraping with proper rate limiting.
     """
     
-    def __init__(self, app_id: Optional[str] = None, use_scraping: bool = True):
+    # Finding API item fields by (parent, element) local names
+    API_ITEM_FIELDS = {
+        ('item', 'itemId'): 'item_id',
+        ('item', 'title'): 'title',
+        ('item', 'viewItemURL'): 'url',
+        ('item', 'location'): 'location',
+        ('sellingStatus', 'currentPrice'): 'price',
+        ('sellingStatus', 'bidCount'): 'bid_count',
+        ('shippingInfo', 'shippingServiceCost'): 'shipping',
+        ('condition', 'conditionDisplayName'): 'condition',
+        ('listingInfo', 'endTime'): 'end_time',
+    }
+    
+    def __init__(self, app_id: Optional[str] = None, use_scraping: bool = True,
+                 parser_backend: Optional[str] = None):
         """
         Initialize eBay API client.
         
         Args:
             app_id: eBay Developer App ID (get from https://developer.ebay.com)
             use_scraping: Enable web scraping as fallback/primary method
+            parser_backend: HTML parser for scraped pages: 'selectolax', 'lxml',
+                            'bs4', or None for the fastest one installed
         """
         self.app_id = app_id
         self.use_scraping = use_scraping
         
+        # Fast parser for scraped pages; BeautifulSoup when none is available
+        self.listing_parser = get_listing_parser(parser_backend) if get_listing_parser else None
+        
         # API endpoints
         self.finding_api_url = "https://svcs.ebay.com/services/search/FindingService/v1"
+        self.search_url = "https://www.ebay.com/sch/i.html"
         
         # Headers for web requests
         self.headers = {
@@ -102,10 +157,59 @@ class EbayAPIClient:
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = 2.0  # 2 seconds between requests
+        self.api_request_interval = 0.25  # Finding API pages are quota-limited, not throttled
+        self.rate_limit_lock = threading.Lock()
+        
+        # Finding API pagination
+        self.api_page_size = 100  # Maximum entries per page the API allows
+        self.api_max_pages = 100  # The API serves at most 100 pages
+        self.api_page_workers = 4  # Pages requested at once
+        
+        # Scraping pagination and concurrent searches
+        self.scrape_max_pages = 4  # Search result pages fetched for one search
+        self.scrape_page_workers = 2  # Search result pages requested at once
+        self.search_workers = 4  # Searches run at once by fetch_sold_items_many
         
         # Session for connection reuse
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        
+        # Requests go through the fetch scheduler when available: it caps the
+        # requests in flight per host, obeys robots.txt, revalidates pages
+        # with ETag/Last-Modified and backs off when the host throttles
+        self.scheduler = None
+        if FetchScheduler:
+            self.scheduler = FetchScheduler(
+                session=self.session,
+                rate_limiter=HostRateLimiter(self.min_request_interval),
+                max_per_host=self.scrape_page_workers,
+                host_limits={url_host(self.finding_api_url): self.api_page_workers},
+                max_workers=self.search_workers
+            )
+    
+    def fetch_sold_items_many(self, search_terms_list: List[str], limit: int = 20, days_back: int = 90,
+                              condition_filter: Optional[str] = None) -> Dict[str, List[EbayItem]]:
+        """
+        Fetch sold items for several searches at once.
+        
+        Searches run concurrently, search_workers at a time; the fetch
+        scheduler keeps their combined requests within each host's budget.
+        Repeated searches are fetched once.
+        
+        Args:
+            search_terms_list: Search queries
+            limit: Maximum number of items to return per search
+            days_back: How many days back to search
+            condition_filter: Filter by condition (e.g., "Used", "New")
+            
+        Returns:
+            Dictionary mapping each search query to its list of EbayItem objects
+        """
+        unique_terms = list(dict.fromkeys(search_terms_list))
+        results = self._run_concurrently(
+            lambda terms: self.fetch_sold_items(terms, limit, days_back, condition_filter),
+            unique_terms, self.search_workers)
+        return dict(zip(unique_terms, results))
     
     def fetch_sold_items(self, search_terms: str, limit: int = 20, days_back: int = 90, 
                         condition_filter: Optional[str] = None) -> List[EbayItem]:
@@ -155,12 +259,15 @@ class EbayAPIClient:
     
     def _fetch_via_finding_api(self, search_terms: str, limit: int, days_back: int, 
                               condition_filter: Optional[str]) -> List[EbayItem]:
-        """Fetch items using eBay Finding API."""
+        """
+        Fetch items using eBay Finding API.
+        
+        The first page tells how many pages there are; the further pages
+        needed to reach limit are then requested concurrently.
+        """
         if not self.app_id:
             raise ValueError("eBay App ID required for API access")
         
-        self._rate_limit()
-        
         # Calculate date range
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
@@ -172,7 +279,7 @@ class EbayAPIClient:
             'SECURITY-APPNAME': self.app_id,
             'RESPONSE-DATA-FORMAT': 'XML',
             'keywords': search_terms,
-            'paginationInput.entriesPerPage': str(min(limit, 100)),
+            'paginationInput.entriesPerPage': str(min(limit, self.api_page_size)),
             'paginationInput.pageNumber': '1',
             'itemFilter(0).name': 'SoldItemsOnly',
             'itemFilter(0).value': 'true',
@@ -201,12 +308,38 @@ class EbayAPIClient:
                 params[f'itemFilter({filter_idx}).name'] = 'Condition'
                 params[f'itemFilter({filter_idx}).value'] = condition_map[condition_filter]
         
+        items, pagination = self._fetch_finding_api_page(params, 1)
+        
+        # Fetch the remaining pages needed to reach the limit
+        pages_needed = min(math.ceil(limit / self.api_page_size), pagination.get('total_pages', 1),
+                           self.api_max_pages)
+        if pages_needed > 1:
+            logger.info(f"Fetching {pages_needed - 1} more Finding API pages")
+            pages = self._run_concurrently(lambda page: self._fetch_finding_api_page(params, page)[0],
+                                           range(2, pages_needed + 1), self.api_page_workers)
+            for page_items in pages:
+                items.extend(page_items)
+        
+        return items[:limit]
+    
+    def _fetch_finding_api_page(self, params: Dict[str, str], page: int) -> tuple:
+        """
+        Fetch one page of Finding API results.
+        
+        Returns:
+            Tuple of (items, pagination) where pagination has total_pages and total_entries
+        """
+        page_params = dict(params)
+        page_params['paginationInput.pageNumber'] = str(page)
+        
         # Make API request
         try:
-            response = self.session.get(self.finding_api_url, params=params, timeout=30)
-            response.raise_for_status()
+            content = self._get(self.finding_api_url, page_params, self.api_request_interval,
+                                check_robots=False)
             
-            return self._parse_finding_api_response(response.content)
+            pagination = {}
+            items = list(self._iter_finding_api_items(content, pagination))
+            return items, pagination
             
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed: {e}")
@@ -214,89 +347,91 @@ class EbayAPIClient:
     
     def _parse_finding_api_response(self, xml_content: bytes) -> List[EbayItem]:
         """Parse eBay Finding API XML response."""
-        items = []
-        
         try:
-            root = ET.fromstring(xml_content)
-            ns = {'ns': 'http://www.ebay.com/marketplace/search/v1/services'}
-            
-            # Check for API errors
-            ack = root.find('.//ns:ack', ns)
-            if ack is not None and ack.text != 'Success':
-                error_msg = root.find('.//ns:message', ns)
-                error_text = error_msg.text if error_msg is not None else "Unknown API error"
-                raise Exception(f"eBay API error: {error_text}")
-            
-            # Parse items
-            search_result = root.find('.//ns:searchResult', ns)
-            if search_result is not None:
-                for item_elem in search_result.findall('.//ns:item', ns):
-                    try:
-                        item = self._parse_api_item(item_elem, ns)
-                        if item:
-                            items.append(item)
-                    except Exception as e:
-                        logger.warning(f"Error parsing API item: {e}")
-                        continue
-            
+            return list(self._iter_finding_api_items(xml_content))
         except ET.ParseError as e:
             logger.error(f"XML parsing error: {e}")
             raise
-        
-        return items
     
-    def _parse_api_item(self, item_elem, ns) -> Optional[EbayItem]:
-        """Parse individual item from API response."""
-        try:
-            # Title
-            title_elem = item_elem.find('.//ns:title', ns)
-            title = title_elem.text if title_elem is not None else "Unknown"
-            
-            # Price
-            price_elem = item_elem.find('.//ns:sellingStatus/ns:currentPrice', ns)
-            price = float(price_elem.text) if price_elem is not None else 0.0
+    def _iter_finding_api_items(self, xml_content: bytes, pagination: Optional[Dict] = None):
+        """
+        Stream items from a Finding API XML response.
+        
+        Each <item> is read in one pass over its elements as soon as the
+        parser finishes it, then cleared, so a large page is never held whole.
+        
+        Args:
+            xml_content: Response body
+            pagination: Optional dictionary that receives total_pages and total_entries
             
-            # Shipping
-            shipping_elem = item_elem.find('.//ns:shippingInfo/ns:shippingServiceCost', ns)
-            shipping = float(shipping_elem.text) if shipping_elem is not None else 0.0
+        Yields:
+            EbayItem for each valid item
             
-            # Condition
-            condition_elem = item_elem.find('.//ns:condition/ns:conditionDisplayName', ns)
-            condition = condition_elem.text if condition_elem is not None else "Unknown"
+        Raises:
+            Exception: If the response reports an API error
+        """
+        ack = None
+        error_text = None
+        local_names = {}
+        
+        def local_name(tag):
+            name = local_names.get(tag)
+            if name is None:
+                name = local_names[tag] = tag.rpartition('}')[2]
+            return name
+        
+        for _, elem in ET.iterparse(io.BytesIO(xml_content)):
+            tag = local_name(elem.tag)
             
+            if tag == 'item':
+                fields = {}
+                for parent in elem.iter():
+                    parent_tag = local_name(parent.tag)
+                    for child in parent:
+                        field = self.API_ITEM_FIELDS.get((parent_tag, local_name(child.tag)))
+                        if field and field not in fields:
+                            fields[field] = (child.text or '').strip()
+                elem.clear()
+                
+                try:
+                    item = self._item_from_api_fields(fields)
+                    if item:
+                        yield item
+                except Exception as e:
+                    logger.warning(f"Error parsing API item: {e}")
+            elif tag == 'ack':
+                ack = elem.text
+            elif tag == 'message' and error_text is None:
+                error_text = elem.text
+            elif pagination is not None and tag == 'totalPages':
+                pagination['total_pages'] = int(elem.text or 0)
+            elif pagination is not None and tag == 'totalEntries':
+                pagination['total_entries'] = int(elem.text or 0)
+        
+        # Check for API errors
+        if ack is not None and ack != 'Success':
+            raise Exception(f"eBay API error: {error_text or 'Unknown API error'}")
+    
+    def _item_from_api_fields(self, fields: Dict[str, str]) -> Optional[EbayItem]:
+        """Build an item from the field texts of a Finding API <item>."""
+        try:
             # Sold date
-            end_time_elem = item_elem.find('.//ns:listingInfo/ns:endTime', ns)
-            if end_time_elem is not None:
-                end_time = datetime.fromisoformat(end_time_elem.text.replace('Z', '+00:00'))
-                sold_date = end_time.strftime('%Y-%m-%d')
+            end_time = fields.get('end_time')
+            if end_time:
+                sold_date = datetime.fromisoformat(end_time.replace('Z', '+00:00')).strftime('%Y-%m-%d')
             else:
                 sold_date = datetime.now().strftime('%Y-%m-%d')
             
-            # URL and ID
-            url_elem = item_elem.find('.//ns:viewItemURL', ns)
-            url = url_elem.text if url_elem is not None else ""
-            
-            id_elem = item_elem.find('.//ns:itemId', ns)
-            item_id = id_elem.text if id_elem is not None else ""
-            
-            # Location
-            location_elem = item_elem.find('.//ns:location', ns)
-            location = location_elem.text if location_elem is not None else ""
-            
-            # Bid count
-            bid_count_elem = item_elem.find('.//ns:sellingStatus/ns:bidCount', ns)
-            bid_count = int(bid_count_elem.text) if bid_count_elem is not None else 0
-            
             return EbayItem(
-                title=title,
-                price=price,
-                shipping=shipping,
-                condition=condition,
+                title=fields.get('title', "Unknown"),
+                price=float(fields['price']) if 'price' in fields else 0.0,
+                shipping=float(fields['shipping']) if 'shipping' in fields else 0.0,
+                condition=fields.get('condition', "Unknown"),
                 sold_date=sold_date,
-                url=url,
-                item_id=item_id,
-                location=location,
-                bid_count=bid_count,
+                url=fields.get('url', ""),
+                item_id=fields.get('item_id', ""),
+                location=fields.get('location', ""),
+                bid_count=int(fields['bid_count']) if 'bid_count' in fields else 0,
                 source='ebay_api'
             )
             
@@ -309,22 +444,20 @@ class EbayAPIClient:
         """
         Fetch items via web scraping eBay sold listings.
         
+        The first results page shows how many usable listings a page yields.
+        If it falls short of limit, the further pages needed (up to
+        scrape_max_pages in all) are fetched concurrently.
+        
         Note: This method respects robots.txt and implements proper rate limiting.
         Use responsibly and in compliance with eBay's Terms of Service.
         """
-        self._rate_limit()
-        
-        # Build search URL
-        encoded_terms = urllib.parse.quote_plus(search_terms)
-        base_url = "https://www.ebay.com/sch/i.html"
-        
         params = {
             '_nkw': search_terms,
             '_sacat': '0',
             'LH_Sold': '1',
             'LH_Complete': '1',
             '_sop': '13',  # Sort by recently ended
-            '_ipg': '240'  # Items per page
+            '_ipg': str(self._page_size(limit))  # Items per page
         }
         
         # Add condition filter if specified
@@ -337,21 +470,105 @@ class EbayAPIClient:
             if condition_filter in condition_map:
                 params['LH_ItemCondition'] = condition_map[condition_filter]
         
-        url = f"{base_url}?" + urllib.parse.urlencode(params)
+        items = self._fetch_search_page(params, 1, limit, days_back)
+        if not items or len(items) >= limit:
+            return items
+        
+        # Fetch the remaining pages needed to reach the limit
+        pages_needed = min(1 + math.ceil((limit - len(items)) / len(items)), self.scrape_max_pages)
+        if pages_needed > 1:
+            logger.info(f"Fetching {pages_needed - 1} more search result pages")
+            pages = self._run_concurrently(lambda page: self._fetch_search_page(params, page, limit, days_back),
+                                           range(2, pages_needed + 1), self.scrape_page_workers)
+            for page_items in pages:
+                items.extend(page_items)
+        
+        return items[:limit]
+    
+    def _fetch_search_page(self, params: Dict[str, str], page: int, limit: int,
+                           days_back: int) -> List[EbayItem]:
+        """Fetch and parse one page of sold listing search results."""
+        page_params = dict(params)
+        if page > 1:
+            page_params['_pgn'] = str(page)
         
         try:
-            # Make request
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            return self._parse_scraped_items(soup, limit, days_back)
-            
+            content = self._get(self.search_url, page_params)
         except requests.exceptions.RequestException as e:
             logger.error(f"Scraping request failed: {e}")
             raise
+        
+        # Parse HTML
+        if self.listing_parser:
+            return self._parse_listings(content, limit, days_back)
+        
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        return self._parse_scraped_items(soup, limit, days_back)
+    
+    def _get(self, url: str, params: Optional[Dict[str, str]] = None,
+             interval: Optional[float] = None, check_robots: bool = True) -> bytes:
+        """
+        Make a GET request and return the response body.
+        
+        Requests go through the fetch scheduler when available; otherwise
+        they are spaced out with _rate_limit.
+        
+        Args:
+            url: URL to request
+            params: Query parameters
+            interval: Seconds between requests (defaults to min_request_interval)
+            check_robots: Apply robots.txt rules (not needed for API endpoints)
+            
+        Returns:
+            Response body
+        """
+        interval = self.min_request_interval if interval is None else interval
+        
+        if self.scheduler:
+            return self.scheduler.get(url, params=params, interval=interval,
+                                      check_robots=check_robots).content
+        
+        self._rate_limit(interval)
+        response = self.session.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        return response.content
+    
+    @staticmethod
+    def _run_concurrently(function, items, workers: int) -> list:
+        """Call function for each item on up to workers threads, returning results in order."""
+        items = list(items)
+        if len(items) <= 1:
+            return [function(item) for item in items]
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as executor:
+            return list(executor.map(function, items))
+    
+    @staticmethod
+    def _page_size(limit: int) -> int:
+        """Get the smallest eBay page size likely to hold limit valid items."""
+        # Leave room for ads, old sales and listings without an item ID
+        for size in (60, 120):
+            if limit * 2 <= size:
+                return size
+        return 240
+    
+    def _parse_listings(self, html: bytes, limit: int, days_back: int) -> List[EbayItem]:
+        """Parse items from a scraped page with the fast listing parser, stopping at limit."""
+        items = []
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        
+        for fields in self.listing_parser.iter_listings(html):
+            try:
+                item = self._item_from_fields(fields, cutoff_date)
+            except Exception as e:
+                logger.debug(f"Error parsing scraped item: {e}")
+                continue
+            if item:
+                items.append(item)
+                if len(items) >= limit:
+                    break
+        
+        return items
     
     def _parse_scraped_items(self, soup: BeautifulSoup, limit: int, days_back: int) -> List[EbayItem]:
         """Parse items from scraped eBay search results."""
@@ -373,16 +590,18 @@ class EbayAPIClient:
         
         logger.info(f"Found {len(item_containers)} item containers")
         
-        for container in item_containers[:limit * 2]:  # Parse extra in case some fail
+        for container in item_containers:
             try:
                 item = self._parse_scraped_item(container, cutoff_date)
-                if item and len(items) < limit:
-                    items.append(item)
             except Exception as e:
                 logger.debug(f"Error parsing scraped item: {e}")
                 continue
+            if item:
+                items.append(item)
+                if len(items) >= limit:
+                    break
         
-        return items[:limit]
+        return items
     
     def _parse_scraped_item(self, container, cutoff_date: datetime) -> Optional[EbayItem]:
         """Parse individual item from scraped HTML."""
@@ -395,10 +614,6 @@ class EbayAPIClient:
             ]
             title = self._extract_text_by_selectors(container, title_selectors, "Unknown")
             
-            # Skip if this is an ad or invalid item
-            if 'advertisement' in title.lower() or 'shop on ebay' in title.lower():
-                return None
-            
             # Price
             price_selectors = [
                 '.s-item__price .notranslate',
@@ -407,7 +622,6 @@ class EbayAPIClient:
                 '.bidsold'
             ]
             price_text = self._extract_text_by_selectors(container, price_selectors, "$0.00")
-            price = self._parse_price(price_text)
             
             # Shipping
             shipping_selectors = [
@@ -416,7 +630,6 @@ class EbayAPIClient:
                 '.vi-acc-del-range'
             ]
             shipping_text = self._extract_text_by_selectors(container, shipping_selectors, "")
-            shipping = self._parse_shipping(shipping_text)
             
             # Condition
             condition_selectors = [
@@ -426,23 +639,18 @@ class EbayAPIClient:
             ]
             condition = self._extract_text_by_selectors(container, condition_selectors, "Used")
             
-            # URL and item ID
+            # URL
             link_selectors = [
                 '.s-item__link',
                 'h3.s-item__title a',
                 '.it-ttl a'
             ]
             url = ""
-            item_id = ""
             
             for selector in link_selectors:
                 link_elem = container.select_one(selector)
                 if link_elem and link_elem.get('href'):
                     url = link_elem.get('href')
-                    # Extract item ID from URL
-                    id_match = re.search(r'/itm/(\d+)', url)
-                    if id_match:
-                        item_id = id_match.group(1)
                     break
             
             # Sold date
@@ -452,7 +660,6 @@ class EbayAPIClient:
                 '.sold-date'
             ]
             date_text = self._extract_text_by_selectors(container, date_selectors, "")
-            sold_date = self._parse_sold_date(date_text)
             
             # Location
             location_selectors = [
@@ -461,36 +668,71 @@ class EbayAPIClient:
             ]
             location = self._extract_text_by_selectors(container, location_selectors, "")
             
-            # Validate item
-            if price <= 0 or not item_id:
-                return None
-            
-            # Check date if parsed successfully
-            if sold_date:
-                try:
-                    item_date = datetime.strptime(sold_date, '%Y-%m-%d')
-                    if item_date < cutoff_date:
-                        return None
-                except:
-                    pass  # Use item anyway if date parsing fails
-            
-            return EbayItem(
-                title=title,
-                price=price,
-                shipping=shipping,
-                condition=condition,
-                sold_date=sold_date or datetime.now().strftime('%Y-%m-%d'),
-                url=url,
-                item_id=item_id,
-                location=location,
-                bid_count=0,
-                source='web_scraping'
-            )
+            return self._item_from_fields({
+                'title': title,
+                'price': price_text,
+                'shipping': shipping_text,
+                'condition': condition,
+                'url': url,
+                'sold_date': date_text,
+                'location': location
+            }, cutoff_date)
             
         except Exception as e:
             logger.debug(f"Error parsing scraped item: {e}")
             return None
     
+    def _item_from_fields(self, fields: Dict[str, str], cutoff_date: datetime) -> Optional[EbayItem]:
+        """
+        Build an item from the raw texts of a scraped listing.
+        
+        Returns None for ads, listings without a price or item ID, and sales
+        before the cutoff date.
+        """
+        title = fields['title']
+        
+        # Skip if this is an ad or invalid item
+        if 'advertisement' in title.lower() or 'shop on ebay' in title.lower():
+            return None
+        
+        price = self._parse_price(fields['price'])
+        shipping = self._parse_shipping(fields['shipping'])
+        
+        # Extract item ID from URL
+        url = fields['url']
+        item_id = ""
+        id_match = re.search(r'/itm/(\d+)', url)
+        if id_match:
+            item_id = id_match.group(1)
+        
+        sold_date = self._parse_sold_date(fields['sold_date'])
+        
+        # Validate item
+        if price <= 0 or not item_id:
+            return None
+        
+        # Check date if parsed successfully
+        if sold_date:
+            try:
+                item_date = datetime.strptime(sold_date, '%Y-%m-%d')
+                if item_date < cutoff_date:
+                    return None
+            except:
+                pass  # Use item anyway if date parsing fails
+        
+        return EbayItem(
+            title=title,
+            price=price,
+            shipping=shipping,
+            condition=fields['condition'],
+            sold_date=sold_date or datetime.now().strftime('%Y-%m-%d'),
+            url=url,
+            item_id=item_id,
+            location=fields['location'],
+            bid_count=0,
+            source='web_scraping'
+        )
+    
     def _extract_text_by_selectors(self, container, selectors: List[str], default: str = "") -> str:
         """Try multiple CSS selectors to extract text."""
         for selector in selectors:
@@ -575,17 +817,27 @@ class EbayAPIClient:
         # Fallback to current date
         return datetime.now().strftime('%Y-%m-%d')
     
-    def _rate_limit(self):
-        """Implement rate limiting."""
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
+    def _rate_limit(self, interval: Optional[float] = None):
+        """
+        Implement rate limiting.
+        
+        Each call reserves the next free request slot under a lock, so
+        concurrent page requests are spaced out instead of bursting.
+        
+        Args:
+            interval: Seconds since the previous request (defaults to min_request_interval)
+        """
+        interval = self.min_request_interval if interval is None else interval
         
-        if elapsed < self.min_request_interval:
-            sleep_time = self.min_request_interval - elapsed
+        with self.rate_limit_lock:
+            current_time = time.time()
+            slot = max(current_time, self.last_request_time + interval)
+            self.last_request_time = slot
+        
+        sleep_time = slot - current_time
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: sleeping {sleep_time:.2f} seconds")
             time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
 
 class PriceAnalyzer:
     """
@@ -610,11 +862,18 @@ class PriceAnalyzer:
             'exclude_words': ['broken', 'for parts', 'not working', 'damaged', 'cracked'],
             'outlier_threshold': 0.3,       # 30% from median for outlier detection
             'confidence_min_items': 5,      # Minimum items for high confidence
-            'price_round_to': 0.99          # Round prices to X.99
+            'outlier_method': 'iqr',        # Outlier rejection: 'iqr', 'mad' or 'none'
+            'price_round_to': 0.99,         # Round prices to X.99
+            'use_cache': True,              # Reuse recent research for the same search
+            'cache_ttl_hours': None         # Maximum age of reused research (None = cache default)
         }
         
         if config:
             self.config.update(config)
+        
+        self.research_cache = None
+        if self.config['use_cache'] and get_research_cache:
+            self.research_cache = get_research_cache()
     
     def analyze_item_pricing(self, search_terms: str, markup_percent: Optional[float] = None,
                            max_items: Optional[int] = None, condition_filter: Optional[str] = None) -> PriceAnalysis:
@@ -637,12 +896,7 @@ class PriceAnalyzer:
         limit = max_items if max_items is not None else self.config['max_results']
         
         # Fetch sold items
-        items = self.ebay_client.fetch_sold_items(
-            search_terms=search_terms,
-            limit=limit,
-            days_back=self.config['days_back'],
-            condition_filter=condition_filter
-        )
+        items = self._fetch_sold_items(search_terms, limit, condition_filter)
         
         # Filter items
         filtered_items = self._filter_items(items)
@@ -674,7 +928,51 @@ class PriceAnalyzer:
             std_dev=stats['std_dev'],
             suggested_price=suggested_price,
             confidence_score=confidence,
-            items=items_clean
+            items=CompSet.from_items(items_clean) if CompSet else items_clean
+        )
+    
+    def _fetch_sold_items(self, search_terms: str, limit: int,
+                          condition_filter: Optional[str]) -> List[EbayItem]:
+        """Fetch sold items, reusing cached research for the same search."""
+        days_back = self.config['days_back']
+        
+        if self.research_cache:
+            ttl_hours = self.config['cache_ttl_hours']
+            cached = self.research_cache.get(
+                'sold', search_terms, condition_filter, days_back, limit,
+                max_age=ttl_hours * 3600 if ttl_hours is not None else None
+            )
+            if cached:
+                logger.info(f"Using cached research for: {search_terms}")
+                return [self._item_from_cache(data) for data in cached]
+        
+        items = self.ebay_client.fetch_sold_items(
+            search_terms=search_terms,
+            limit=limit,
+            days_back=days_back,
+            condition_filter=condition_filter
+        )
+        
+        if self.research_cache and items:
+            self.research_cache.put('sold', search_terms, [asdict(item) for item in items],
+                                    condition_filter, days_back, limit)
+        
+        return items
+    
+    @staticmethod
+    def _item_from_cache(data: Dict) -> EbayItem:
+        """Rebuild an EbayItem from cached research (which other tools may have written)."""
+        return EbayItem(
+            title=data.get('title', ''),
+            price=float(data.get('price') or 0),
+            shipping=float(data.get('shipping') or 0),
+            condition=data.get('condition', ''),
+            sold_date=data.get('sold_date', ''),
+            url=data.get('url', ''),
+            item_id=str(data.get('item_id', '')),
+            source=data.get('source', 'cache'),
+            location=data.get('location', ''),
+            bid_count=int(data.get('bid_count') or 0)
         )
     
     def _filter_items(self, items: List[EbayItem]) -> List[EbayItem]:
@@ -700,6 +998,14 @@ class PriceAnalyzer:
     
     def _remove_outliers(self, prices: List[float], items: List[EbayItem]) -> tuple:
         """Remove price outliers using IQR method."""
+        if price_stats_utils:
+            keep = price_stats_utils.outlier_mask(prices, self.config.get('outlier_method', 'iqr'))
+            for price, item, kept in zip(prices, items, keep):
+                if not kept:
+                    logger.debug(f"Removing outlier: ${price:.2f} - {item.title}")
+            return ([price for price, kept in zip(prices, keep) if kept],
+                    [item for item, kept in zip(items, keep) if kept])
+        
         if len(prices) < 4:
             return prices, items
         
@@ -729,6 +1035,17 @@ class PriceAnalyzer:
     
     def _calculate_statistics(self, prices: List[float]) -> Dict[str, float]:
         """Calculate price statistics."""
+        if price_stats_utils:
+            # Outliers were already removed
+            stats = price_stats_utils.price_stats(prices, method='none')
+            return {
+                'min': stats['min'],
+                'max': stats['max'],
+                'mean': stats['mean'],
+                'median': stats['median'],
+                'std_dev': stats['stdev']
+            }
+        
         return {
             'min': min(prices),
             'max': max(prices),
@@ -749,6 +1066,10 @@ class PriceAnalyzer:
     
     def _calculate_confidence_score(self, item_count: int, std_dev: float, median: float) -> float:
         """Calculate confidence score (0-100)."""
+        if price_stats_utils:
+            return price_stats_utils.confidence_score(item_count, std_dev, median,
+                                                      self.config['confidence_min_items'])
+        
         # Base score from item count
         count_score = min(100, (item_count / self.config['confidence_min_items']) * 50)
         
@@ -1158,8 +1479,21 @@ CONFIDENCE ANALYSIS
             messagebox.showerror("Connection Test", f"❌ Connection failed:\n\n{result}")
     
     def clear_cache(self):
-        """Clear application cache."""
-        messagebox.showinfo("Cache", "Cache cleared (feature not yet implemented)")
+        """Clear cached price research."""
+        cache = get_research_cache() if get_research_cache else None
+        if not cache:
+            messagebox.showwarning("Cache", "The research cache is not available")
+            return
+        
+        stats = cache.stats()
+        if not messagebox.askyesno("Clear Cache",
+                                   f"Remove {stats['entries']} cached searches "
+                                   f"({stats['listings']} sold listings)?"):
+            return
+        
+        removed = cache.clear()
+        self.status_var.set(f"Cleared {removed} cached searches")
+        messagebox.showinfo("Cache", f"Cleared {removed} cached searches")
     
     def export_results(self):
         """Export analysis results."""
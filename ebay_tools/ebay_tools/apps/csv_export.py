@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 """
-ebay_export_gui.py - GUI for exporting eBay listing data from JSON to CSV format
+ebay_export_gui.py - GUI for exporting eBay listing data from JSON for eBay upload
 
-This script provides a graphical interface to export eBay listing data from JSON
-format to CSV format suitable for eBay bulk upload.
+This script provides a graphical interface to the export engine in
+ebay_csv_export.py, offering every export format registered there (CSV,
+Excel bulk upload template, HTML descriptions, JSON).
 """
 
 import os
-import json
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import sys
@@ -42,11 +42,11 @@ except ImportError:
         y = (window.winfo_screenheight() // 2) - (w_height // 2)
         window.geometry(f'+{x}+{y}')
 
-# Import CSV and Excel export functionality
-from ebay_csv_export import export_items_to_csv, export_items_to_excel, load_json_queue
+# Import the export engine
+from ebay_csv_export import EXPORT_FORMATS, export_queue_file, load_default_values, load_json_queue
 
 class EbayExportGUI:
-    """GUI for exporting eBay listing data from JSON to CSV and Excel formats."""
+    """GUI for exporting eBay listing data from JSON in any registered export format."""
     def __init__(self, root):
         self.root = root
         self.root.title("eBay Export Tool - CSV & Excel")
@@ -106,10 +106,10 @@ class EbayExportGUI:
         format_frame = ttk.LabelFrame(main_frame, text="Export Format", padding=10)
         format_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Radiobutton(format_frame, text="CSV Format", variable=self.export_format_var, 
-                       value="csv", command=self.on_format_change).pack(side=tk.LEFT, padx=10)
-        ttk.Radiobutton(format_frame, text="Excel Format (eBay Bulk Upload)", variable=self.export_format_var, 
-                       value="excel", command=self.on_format_change).pack(side=tk.LEFT, padx=10)
+        for export_format in EXPORT_FORMATS.values():
+            ttk.Radiobutton(format_frame, text=export_format.label, variable=self.export_format_var,
+                           value=export_format.name, command=self.on_format_change,
+                           state=tk.NORMAL if export_format.available else tk.DISABLED).pack(side=tk.LEFT, padx=10)
         
         # Output file selection
         output_frame = ttk.LabelFrame(main_frame, text="Output File", padding=10)
@@ -192,26 +192,24 @@ class EbayExportGUI:
                 # Suggest output filename
                 if not self.output_file_var.get():
                     base_name = os.path.splitext(file_path)[0]
-                    extension = ".xlsx" if self.export_format_var.get() == "excel" else ".csv"
-                    self.output_file_var.set(f"{base_name}_export{extension}")
+                    self.output_file_var.set(self.output_path(f"{base_name}_export"))
                 
             except Exception as e:
                 self.update_info_text(f"Error loading file: {str(e)}")
                 messagebox.showerror("Error", f"Failed to load file: {str(e)}")
     
     def browse_output_file(self):
-        """Browse for output file."""
-        if self.export_format_var.get() == "excel":
-            file_path = filedialog.asksaveasfilename(
-                title="Save Excel File",
-                defaultextension=".xlsx",
-                filetypes=[("Excel Files", "*.xlsx"), ("All Files", "*.*")]
+        """Browse for output file (or directory, for formats that write one)."""
+        export_format = EXPORT_FORMATS[self.export_format_var.get()]
+        if export_format.writes_directory:
+            file_path = filedialog.askdirectory(
+                title=f"Select Directory for {export_format.label}"
             )
         else:
             file_path = filedialog.asksaveasfilename(
-                title="Save CSV File",
-                defaultextension=".csv",
-                filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")]
+                title=f"Save {export_format.label} File",
+                defaultextension=export_format.extension,
+                filetypes=[(export_format.label, f"*{export_format.extension}"), ("All Files", "*.*")]
             )
         if file_path:
             self.output_file_var.set(file_path)
@@ -235,14 +233,11 @@ class EbayExportGUI:
             
             # Try to load and display info about the file
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    defaults = json.load(f)
-                
-                if isinstance(defaults, dict):
-                    self.append_info_text(f"\nLoaded {len(defaults)} default values from {os.path.basename(file_path)}\n")
-                else:
-                    self.append_info_text(f"\nWarning: Default values file does not contain a dictionary.\n")
+                defaults = load_default_values(file_path)
+                self.append_info_text(f"\nLoaded {len(defaults)} default values from {os.path.basename(file_path)}\n")
                 
+            except ValueError as e:
+                self.append_info_text(f"\nWarning: {str(e)}\n")
             except Exception as e:
                 self.append_info_text(f"\nError loading default values: {str(e)}\n")
     
@@ -262,13 +257,11 @@ class EbayExportGUI:
         """Handle format change - update file extension if needed."""
         current_file = self.output_file_var.get()
         if current_file:
-            base_name = os.path.splitext(current_file)[0]
-            if self.export_format_var.get() == "excel":
-                if not current_file.endswith('.xlsx'):
-                    self.output_file_var.set(f"{base_name}.xlsx")
-            else:
-                if not current_file.endswith('.csv'):
-                    self.output_file_var.set(f"{base_name}.csv")
+            self.output_file_var.set(self.output_path(os.path.splitext(current_file)[0]))
+    
+    def output_path(self, base_name):
+        """Output path for the selected format, from a path without extension."""
+        return base_name + EXPORT_FORMATS[self.export_format_var.get()].extension
     
     def update_info_text(self, text):
         """Update the information text widget."""
@@ -284,7 +277,7 @@ class EbayExportGUI:
         self.info_text.config(state=tk.DISABLED)
     
     def export_data(self):
-        """Export data from JSON to CSV."""
+        """Export data from JSON in the selected format."""
         input_file = self.input_file_var.get()
         output_file = self.output_file_var.get()
         
@@ -309,42 +302,29 @@ class EbayExportGUI:
             default_values_file = self.default_values_var.get()
             if default_values_file:
                 try:
-                    with open(default_values_file, 'r', encoding='utf-8') as f:
-                        default_values = json.load(f)
-                        
-                    if not isinstance(default_values, dict):
-                        messagebox.showerror("Error", "Default values file does not contain a dictionary.")
-                        return
-                        
+                    default_values = load_default_values(default_values_file)
+                    
+                except ValueError as e:
+                    messagebox.showerror("Error", str(e))
+                    return
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to load default values: {str(e)}")
                     return
         
         try:
-            # Load the items
-            items = load_json_queue(input_file)
-            
             # Show a progress indicator
-            export_format = self.export_format_var.get()
-            format_name = "Excel" if export_format == "excel" else "CSV"
-            self.status_bar.update(f"Exporting {len(items)} items to {format_name}...")
+            export_format = EXPORT_FORMATS[self.export_format_var.get()]
+            self.status_bar.update(f"Exporting to {export_format.label}...")
             self.root.update_idletasks()
             
-            # Export based on selected format
-            if export_format == "excel":
-                success, message = export_items_to_excel(
-                    items,
-                    output_file,
-                    default_values=default_values,
-                    description_dir=desc_dir
-                )
-            else:
-                success, message = export_items_to_csv(
-                    items,
-                    output_file,
-                    default_values=default_values,
-                    description_dir=desc_dir
-                )
+            # The engine streams the queue file, so it is never loaded whole
+            success, message = export_queue_file(
+                input_file,
+                output_file,
+                export_format.name,
+                default_values=default_values,
+                description_dir=desc_dir
+            )
             
             if success:
                 self.status_bar.update(message)
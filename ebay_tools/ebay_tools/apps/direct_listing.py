@@ -13,6 +13,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 from ebay_api_integration import EbayAPIIntegration
+from ebay_csv_export import export_items
 
 # Configure logging
 logging.basicConfig(
@@ -527,55 +528,18 @@ class EbayDirectListingDemo:
         if not file_path:
             return
         
-        try:
-            # Simple CSV export example
-            import csv
-            
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                # Define fields
-                fieldnames = [
-                    "SKU", "Title", "Condition", "Price", "Quantity", 
-                    "Category", "Format", "Description"
-                ]
-                
-                # Add specific fields
-                for item in self.queue_data:
-                    if "item_specifics" in item:
-                        for key in item["item_specifics"].keys():
-                            field_name = f"Specific:{key}"
-                            if field_name not in fieldnames:
-                                fieldnames.append(field_name)
-                
-                # Create writer
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                # Write rows
-                for item in self.queue_data:
-                    row = {
-                        "SKU": item.get("sku", ""),
-                        "Title": item.get("title", "") or item.get("temp_title", ""),
-                        "Condition": item.get("condition", ""),
-                        "Price": item.get("price", ""),
-                        "Quantity": item.get("quantity", "1"),
-                        "Category": item.get("category", ""),
-                        "Format": item.get("format", "FIXED_PRICE"),
-                        "Description": item.get("description", "")
-                    }
-                    
-                    # Add item specifics
-                    if "item_specifics" in item:
-                        for key, value in item["item_specifics"].items():
-                            row[f"Specific:{key}"] = value
-                    
-                    writer.writerow(row)
-            
+        # Same eBay File Exchange columns as the export tool, plus each item's
+        # description; items without a quantity or format list one at a fixed price
+        success, message = export_items(self.queue_data, file_path, "csv",
+                                        default_values={"Quantity": "1", "Format": "FIXED_PRICE"},
+                                        extra_columns=["Description"])
+        
+        if success:
             self.status_bar.config(text=f"Exported {len(self.queue_data)} items to {os.path.basename(file_path)}")
             messagebox.showinfo("Success", f"Successfully exported {len(self.queue_data)} items to CSV.")
-            
-        except Exception as e:
-            logger.error(f"Error exporting to CSV: {str(e)}")
-            messagebox.showerror("Error", f"Failed to export to CSV: {str(e)}")
+        else:
+            logger.error(message)
+            messagebox.showerror("Error", f"Failed to export to CSV: {message}")
 
 
 def main():
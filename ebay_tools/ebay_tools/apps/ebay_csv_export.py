@@ -2,29 +2,54 @@
 """
 ebay_csv_export.py - Export functionality for eBay listing data
 
-This module provides functionality to export eBay listing data from JSON format
-to both CSV and Excel formats suitable for eBay bulk upload.
+This module is the export engine of the eBay tools: every tool that exports
+listing data goes through it, and it can be run from the command line.
+Exports stream items from a list or a JSON queue file to pluggable formats:
+- eBay File Exchange CSV
+- eBay bulk upload template (Excel)
+- HTML description files
+- Normalized JSON queue
+
+Usage:
+    python ebay_csv_export.py QUEUE_FILE OUTPUT [--format NAME] [--defaults FILE]
+        [--descriptions DIR] [--workers N] [--column NAME ...]
 """
 
 import os
 import csv
 import json
 import sys
-from typing import Dict, List, Any, Optional, Tuple
+import argparse
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from html import escape
+from itertools import chain, islice
+from string import Template
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from core.schema import EbayItemSchema, load_queue
+from core.schema import EbayItemSchema, iter_queue_items, load_queue
 
 # Excel support (optional, graceful fallback if not available)
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils import get_column_letter
     EXCEL_AVAILABLE = True
     WorkbookType = openpyxl.Workbook
     WorksheetType = openpyxl.worksheet.worksheet.Worksheet
+    
+    # Styles are built once and shared by every cell using them
+    WELCOME_TITLE_FONT = Font(size=16, bold=True)
+    INSTRUCTIONS_TITLE_FONT = Font(size=14, bold=True)
+    HEADER_FONT = Font(bold=True)
+    HEADER_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
 except ImportError:
     EXCEL_AVAILABLE = False
     openpyxl = None
@@ -34,6 +59,64 @@ except ImportError:
     class WorksheetType:
         pass
 
+EXCEL_UNAVAILABLE_MESSAGE = "Excel export requires openpyxl package. Install with: pip install openpyxl"
+
+# Standard eBay fields lead the CSV columns, in this order
+STANDARD_CSV_FIELDS = [
+    "CustomLabel", "Title", "Category", "StartPrice", "Quantity", 
+    "ConditionID", "ConditionDescription", "Format", "Duration"
+]
+
+# Items handed to a row conversion worker at a time
+DEFAULT_ROW_CHUNK_SIZE = 200
+
+# Threads rendering and writing HTML description files, and items per thread task
+DEFAULT_DESCRIPTION_WORKERS = 8
+DESCRIPTION_CHUNK_SIZE = 50
+
+# Description failures listed in an export message; the rest are counted
+MAX_REPORTED_DESCRIPTION_ERRORS = 10
+
+# Description page for items without a processed description, compiled once;
+# values are HTML-escaped before they are substituted
+DESCRIPTION_TEMPLATE = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <title>$title</title>
+    <style>
+        body { font-family: Arial, sans-serif; }
+        .specs { margin: 10px 0; }
+        .spec-name { font-weight: bold; }
+    </style>
+</head>
+<body>
+    <h1>$title</h1>
+    <p><strong>Condition:</strong> $condition</p>
+$specifics</body>
+</html>""")
+DESCRIPTION_SPECIFICS_TEMPLATE = Template("<h2>Item Specifics</h2>\n<div class='specs'>\n$rows</div>\n")
+DESCRIPTION_SPECIFIC_TEMPLATE = Template("<div><span class='spec-name'>$name:</span> $value</div>\n")
+
+# Columns of the eBay prefill template (per specification):
+# header and key in the result of _convert_item_to_ebay_format
+EXCEL_TEMPLATE_COLUMNS = [
+    ("Custom Label (SKU)", "custom_label"),  # A - SKU/identifier
+    ("Item Photo URL", "photo_urls"),        # B - Image URLs
+    ("Title", "title"),                      # C - Listing title
+    ("Category", "category"),                # D - Category or Product ID
+    ("Aspects", "aspects"),                  # E - Aspects or Product ID Type
+    ("Item URL", "item_url"),                # F - E-commerce URLs
+]
+
+# Required header rows above the column headers
+EXCEL_TEMPLATE_INFO_ROWS = [
+    ["#INFO | Version=1.0.0 | | Template=eBay-taxonomy-mapping-template_US"],
+    ["#INFO | Set A | | Set B"],
+]
+
+# Template column widths are sized from this many leading rows
+EXCEL_WIDTH_SAMPLE_ROWS = 1000
+EXCEL_MAX_COLUMN_WIDTH = 50
 
 def load_json_queue(file_path: str) -> List[Dict[str, Any]]:
     """
@@ -48,137 +131,351 @@ def load_json_queue(file_path: str) -> List[Dict[str, Any]]:
     return load_queue(file_path)
 
 
+def _item_description(item: Dict[str, Any]) -> Any:
+    """The item's own description text."""
+    return item.get("description", "")
+
+
+def _item_photo_paths(item: Dict[str, Any]) -> str:
+    """The item's photo paths (local files or URLs), separated by "|"."""
+    photos = item.get("photos")
+    if not isinstance(photos, list):
+        return ""
+    return "|".join(photo["path"] for photo in photos if isinstance(photo, dict) and photo.get("path"))
+
+
+# Optional CSV columns a front end can ask for: column name -> value of an item.
+# The column is always written, empty for items without a value.
+CSV_EXTRA_COLUMNS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "Description": _item_description,
+    "PicURL": _item_photo_paths,
+}
+
+
+def order_csv_fields(field_names: Iterable[str]) -> List[str]:
+    """
+    Order CSV columns with the standard eBay fields first.
+    
+    Args:
+        field_names: Column names (repeats are ignored)
+        
+    Returns:
+        Standard fields in eBay order, then the rest alphabetically
+    """
+    all_fields = set(field_names)
+    
+    sorted_fields = []
+    for field in STANDARD_CSV_FIELDS:
+        if field in all_fields:
+            sorted_fields.append(field)
+            all_fields.remove(field)
+    
+    # Add remaining fields in alphabetical order
+    sorted_fields.extend(sorted(all_fields))
+    return sorted_fields
+
+
+def discover_csv_fields(items: Iterable[Dict[str, Any]],
+                        default_values: Dict[str, str] = None,
+                        extra_columns: Iterable[str] = ()) -> List[str]:
+    """
+    Find the CSV columns needed for a set of items (export phase one).
+    
+    Only column names are collected, so no rows are built or kept.
+    
+    Args:
+        items: Item dictionaries
+        default_values: Default values for CSV fields
+        extra_columns: Names of CSV_EXTRA_COLUMNS to include
+        
+    Returns:
+        Ordered list of column names
+    """
+    all_fields = set(default_values or ())
+    all_fields.update(extra_columns)
+    for item in items:
+        all_fields.update(EbayItemSchema.csv_field_names(item, default_values))
+    return order_csv_fields(all_fields)
+
+
+def iter_csv_rows(items: Iterable[Dict[str, Any]],
+                  default_values: Dict[str, str] = None,
+                  workers: int = 0,
+                  chunk_size: int = DEFAULT_ROW_CHUNK_SIZE,
+                  extra_columns: Iterable[str] = ()) -> Iterator[Dict[str, str]]:
+    """
+    Convert items to CSV rows lazily, in order.
+    
+    With workers > 1, rows are converted in a process pool a window of
+    workers * chunk_size items at a time, so memory stays bounded.  This
+    pays off for items carrying large api_results or descriptions; for
+    small items the pool's overhead outweighs the gain.
+    
+    Args:
+        items: Item dictionaries
+        default_values: Default values for CSV fields
+        workers: Processes converting rows (0 or 1 converts in this process)
+        chunk_size: Items handed to a worker at a time
+        extra_columns: Names of CSV_EXTRA_COLUMNS to fill in
+        
+    Yields:
+        CSV row dictionaries
+    """
+    return _iter_converted(items, partial(_csv_row, default_values=default_values,
+                                          extra_columns=tuple(extra_columns)),
+                           workers, chunk_size)
+
+
+def _csv_row(item: Dict[str, Any], default_values: Optional[Dict[str, str]],
+             extra_columns: Tuple[str, ...]) -> Dict[str, str]:
+    """Convert an item to a CSV row with the requested extra columns."""
+    row = EbayItemSchema.to_csv_row(item, default_values)
+    for column in extra_columns:
+        value = CSV_EXTRA_COLUMNS[column](item)
+        if value:
+            row[column] = value
+    return row
+
+
+def iter_excel_rows(items: Iterable[Dict[str, Any]],
+                    default_values: Dict[str, str] = None,
+                    workers: int = 0,
+                    chunk_size: int = DEFAULT_ROW_CHUNK_SIZE) -> Iterator[List[Any]]:
+    """
+    Convert items to rows of the eBay prefill template lazily, in order.
+    
+    Workers are used as in iter_csv_rows.
+    
+    Args:
+        items: Item dictionaries
+        default_values: Default values for fields
+        workers: Processes converting rows (0 or 1 converts in this process)
+        chunk_size: Items handed to a worker at a time
+        
+    Yields:
+        Lists of cell values in EXCEL_TEMPLATE_COLUMNS order
+    """
+    return _iter_converted(items, partial(_excel_template_row, default_values=default_values or {}),
+                           workers, chunk_size)
+
+
+def _excel_template_row(item: Dict[str, Any], default_values: Dict[str, str]) -> List[Any]:
+    """Convert an item to a row of the eBay prefill template."""
+    ebay_row = _convert_item_to_ebay_format(item, default_values)
+    return [ebay_row.get(key, "") for _, key in EXCEL_TEMPLATE_COLUMNS]
+
+
+def _iter_converted(items: Iterable[Dict[str, Any]], convert, workers: int, chunk_size: int) -> Iterator[Any]:
+    """Apply a picklable conversion to items in order, in a process pool if workers > 1."""
+    if workers <= 1:
+        for item in items:
+            yield convert(item)
+        return
+    
+    items = iter(items)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            window = list(islice(items, workers * chunk_size))
+            if not window:
+                return
+            yield from executor.map(convert, window, chunksize=chunk_size)
+
+
+def write_csv_rows(rows: Iterable[Dict[str, str]], output_file: str, fieldnames: List[str]) -> int:
+    """
+    Stream CSV rows to a file (export phase two).
+    
+    Args:
+        rows: CSV row dictionaries
+        output_file: Path to output CSV file
+        fieldnames: Column names in order
+        
+    Returns:
+        Number of rows written
+        
+    Raises:
+        ValueError: If a row has a column that isn't in fieldnames
+    """
+    count = 0
+    with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
 def export_items_to_csv(items: List[Dict[str, Any]], 
                        output_file: str, 
                        default_values: Dict[str, str] = None,
-                       description_dir: Optional[str] = None) -> Tuple[bool, str]:
+                       description_dir: Optional[str] = None,
+                       fieldnames: Optional[List[str]] = None,
+                       workers: int = 0) -> Tuple[bool, str]:
     """
     Export items to CSV format suitable for eBay bulk upload.
     
+    Columns are discovered in a first pass over the items (skipped when
+    fieldnames is given); rows are then streamed to disk one at a time
+    instead of being collected first.
+    
     Args:
         items: List of item dictionaries to export
         output_file: Path to output CSV file
         default_values: Default values for CSV fields
         description_dir: Directory to save HTML description files
+        fieldnames: Precomputed column names (e.g. from discover_csv_fields)
+        workers: Processes converting rows (see iter_csv_rows)
         
     Returns:
         Tuple of (success: bool, message: str)
     """
-    try:
-        if not items:
-            return False, "No items to export"
-        
-        if default_values is None:
-            default_values = {}
-        
-        # Convert all items to CSV format
-        csv_rows = []
-        for item in items:
-            row = EbayItemSchema.to_csv_row(item, default_values)
-            csv_rows.append(row)
-        
-        # Get all unique field names from all rows
-        all_fields = set()
-        for row in csv_rows:
-            all_fields.update(row.keys())
-        
-        # Sort fields to put standard eBay fields first
-        standard_fields = [
-            "CustomLabel", "Title", "Category", "StartPrice", "Quantity", 
-            "ConditionID", "ConditionDescription", "Format", "Duration"
-        ]
-        
-        sorted_fields = []
-        for field in standard_fields:
-            if field in all_fields:
-                sorted_fields.append(field)
-                all_fields.remove(field)
-        
-        # Add remaining fields in alphabetical order
-        sorted_fields.extend(sorted(all_fields))
-        
-        # Write CSV file
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=sorted_fields)
-            writer.writeheader()
-            writer.writerows(csv_rows)
-        
-        # Create HTML description files if requested
-        created_descriptions = 0
-        if description_dir:
-            os.makedirs(description_dir, exist_ok=True)
-            for item in items:
-                if _create_html_description(item, description_dir):
-                    created_descriptions += 1
-        
-        # Prepare success message
-        message = f"Successfully exported {len(items)} items to {output_file}"
-        if created_descriptions > 0:
-            message += f"\nCreated {created_descriptions} HTML description files in {description_dir}"
-        
-        return True, message
+    if not items:
+        return False, "No items to export"
+    
+    return export_items(items, output_file, "csv", default_values, description_dir, workers,
+                        fieldnames=fieldnames)
+
+
+def export_queue_file_to_csv(queue_file: str,
+                             output_file: str,
+                             default_values: Dict[str, str] = None,
+                             description_dir: Optional[str] = None,
+                             fieldnames: Optional[List[str]] = None,
+                             workers: int = 0) -> Tuple[bool, str]:
+    """
+    Export a queue file to CSV without loading the whole queue.
+    
+    The queue is read item by item twice: once to discover the columns
+    (skipped when fieldnames is given) and once to write the rows.
+    
+    Args:
+        queue_file: Path to the JSON queue file
+        output_file: Path to output CSV file
+        default_values: Default values for CSV fields
+        description_dir: Directory to save HTML description files
+        fieldnames: Precomputed column names (e.g. from discover_csv_fields)
+        workers: Processes converting rows (see iter_csv_rows)
         
-    except Exception as e:
-        return False, f"Error exporting to CSV: {str(e)}"
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    return export_queue_file(queue_file, output_file, "csv", default_values, description_dir, workers,
+                             fieldnames=fieldnames)
+
+
+def _export_message(exported: int, output_file: str, descriptions: Optional[Dict[str, Any]],
+                    description_dir: Optional[str]) -> str:
+    """Build the message reported after a CSV export."""
+    message = f"Successfully exported {exported} items to {output_file}"
+    return message + _descriptions_message(descriptions, description_dir)
+
+
+def _descriptions_message(descriptions: Optional[Dict[str, Any]], description_dir: Optional[str]) -> str:
+    """Describe the outcome of create_html_descriptions for an export message."""
+    if not descriptions:
+        return ""
+    
+    message = ""
+    if descriptions["created"] > 0:
+        message += f"\nCreated {descriptions['created']} HTML description files in {description_dir}"
+    if descriptions["unchanged"] > 0:
+        message += f"\n{descriptions['unchanged']} HTML description files were already up to date"
+    
+    errors = descriptions["errors"]
+    if errors:
+        message += f"\nCould not create {len(errors)} HTML description files:"
+        for label, error in errors[:MAX_REPORTED_DESCRIPTION_ERRORS]:
+            message += f"\n  {label}: {error}"
+        if len(errors) > MAX_REPORTED_DESCRIPTION_ERRORS:
+            message += f"\n  ... and {len(errors) - MAX_REPORTED_DESCRIPTION_ERRORS} more"
+    return message
 
 
 def export_items_to_excel(items: List[Dict[str, Any]], 
                          output_file: str, 
                          default_values: Dict[str, str] = None,
-                         description_dir: Optional[str] = None) -> Tuple[bool, str]:
+                         description_dir: Optional[str] = None,
+                         workers: int = 0) -> Tuple[bool, str]:
     """
     Export items to Excel format following eBay bulk upload specification.
     
+    The workbook is written in openpyxl's write-only mode: rows are
+    streamed to the file as they are converted instead of being kept as
+    cell objects, so memory stays flat however many items there are.
+    
     Args:
         items: List of item dictionaries to export
         output_file: Path to output Excel file
         default_values: Default values for fields
         description_dir: Directory to save HTML description files
+        workers: Processes converting rows (see iter_csv_rows)
         
     Returns:
         Tuple of (success: bool, message: str)
     """
-    try:
-        if not EXCEL_AVAILABLE:
-            return False, "Excel export requires openpyxl package. Install with: pip install openpyxl"
-        
-        if not items:
-            return False, "No items to export"
-        
-        if default_values is None:
-            default_values = {}
-        
-        # Create workbook
-        wb = openpyxl.Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
-        
-        # Create required sheets
-        _create_welcome_sheet(wb)
-        _create_instructions_sheet(wb)
-        main_sheet = _create_main_template_sheet(wb, items, default_values)
-        
-        # Save workbook
-        wb.save(output_file)
-        
-        # Create HTML description files if requested
-        created_descriptions = 0
-        if description_dir:
-            os.makedirs(description_dir, exist_ok=True)
-            for item in items:
-                if _create_html_description(item, description_dir):
-                    created_descriptions += 1
-        
-        # Prepare success message
-        message = f"Successfully exported {len(items)} items to Excel format: {output_file}"
-        if created_descriptions > 0:
-            message += f"\nCreated {created_descriptions} HTML description files in {description_dir}"
-        
-        return True, message
+    if not EXCEL_AVAILABLE:
+        return False, EXCEL_UNAVAILABLE_MESSAGE
+    
+    if not items:
+        return False, "No items to export"
+    
+    return export_items(items, output_file, "excel", default_values, description_dir, workers)
+
+
+def export_queue_file_to_excel(queue_file: str,
+                               output_file: str,
+                               default_values: Dict[str, str] = None,
+                               description_dir: Optional[str] = None,
+                               workers: int = 0) -> Tuple[bool, str]:
+    """
+    Export a queue file to Excel without loading the whole queue.
+    
+    Args:
+        queue_file: Path to the JSON queue file
+        output_file: Path to output Excel file
+        default_values: Default values for fields
+        description_dir: Directory to save HTML description files
+        workers: Processes converting rows (see iter_csv_rows)
         
-    except Exception as e:
-        return False, f"Error exporting to Excel: {str(e)}"
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    return export_queue_file(queue_file, output_file, "excel", default_values, description_dir, workers)
+
+
+def _write_excel_workbook(items: Iterable[Dict[str, Any]],
+                          output_file: str,
+                          default_values: Dict[str, str],
+                          workers: int = 0) -> int:
+    """Write the eBay bulk upload workbook; returns how many items were written."""
+    wb = openpyxl.Workbook(write_only=True)
+    
+    # Create required sheets
+    _create_welcome_sheet(wb)
+    _create_instructions_sheet(wb)
+    exported = _create_main_template_sheet(wb, items, default_values, workers)
+    
+    # Save workbook
+    wb.save(output_file)
+    return exported
+
+
+def _excel_export_message(exported: int, output_file: str, descriptions: Optional[Dict[str, Any]],
+                          description_dir: Optional[str]) -> str:
+    """Build the message reported after an Excel export."""
+    message = f"Successfully exported {exported} items to Excel format: {output_file}"
+    return message + _descriptions_message(descriptions, description_dir)
+
+
+def _styled_cell(ws: WorksheetType, value: Any, font=None, fill=None):
+    """Build a cell with shared styles for appending to a worksheet."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    return cell
 
 
 def _create_welcome_sheet(wb: WorkbookType) -> None:
@@ -186,15 +483,14 @@ def _create_welcome_sheet(wb: WorkbookType) -> None:
     ws = wb.create_sheet("WELCOME")
     
     # Add welcome message
-    ws['A1'] = "Welcome to eBay Tools Excel Export"
-    ws['A1'].font = Font(size=16, bold=True)
-    
-    ws['A3'] = "This file has been generated by eBay Tools and follows the eBay bulk upload format specification."
-    ws['A4'] = "The main data is in the 'eBay-prefill-listing-template' sheet."
-    ws['A5'] = "Please review all data before uploading to eBay."
-    
-    ws['A7'] = f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    ws['A8'] = "Generated by: eBay Tools"
+    ws.append([_styled_cell(ws, "Welcome to eBay Tools Excel Export", WELCOME_TITLE_FONT)])
+    ws.append([])
+    ws.append(["This file has been generated by eBay Tools and follows the eBay bulk upload format specification."])
+    ws.append(["The main data is in the 'eBay-prefill-listing-template' sheet."])
+    ws.append(["Please review all data before uploading to eBay."])
+    ws.append([])
+    ws.append([f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+    ws.append(["Generated by: eBay Tools"])
 
 
 def _create_instructions_sheet(wb: WorkbookType) -> None:
@@ -226,64 +522,61 @@ def _create_instructions_sheet(wb: WorkbookType) -> None:
     ]
     
     for i, instruction in enumerate(instructions, 1):
-        ws[f'A{i}'] = instruction
         if i == 1:  # Title
-            ws[f'A{i}'].font = Font(size=14, bold=True)
+            ws.append([_styled_cell(ws, instruction, INSTRUCTIONS_TITLE_FONT)])
+        else:
+            ws.append([instruction])
 
 
 def _create_main_template_sheet(wb: WorkbookType, 
-                               items: List[Dict[str, Any]], 
-                               default_values: Dict[str, str]) -> WorksheetType:
-    """Create the main eBay-prefill-listing-template sheet with data."""
-    ws = wb.create_sheet("eBay-prefill-listing-template")
+                               items: Iterable[Dict[str, Any]], 
+                               default_values: Dict[str, str],
+                               workers: int = 0) -> int:
+    """
+    Create the main eBay-prefill-listing-template sheet with data.
     
-    # Add required header rows
-    ws['A1'] = "#INFO | Version=1.0.0 | | Template=eBay-taxonomy-mapping-template_US"
-    ws['A2'] = "#INFO | Set A | | Set B"
-    
-    # Define eBay column headers (per specification)
-    headers = [
-        "Custom Label (SKU)",      # A - SKU/identifier
-        "Item Photo URL",          # B - Image URLs
-        "Title",                   # C - Listing title
-        "Category",                # D - Category or Product ID
-        "Aspects",                 # E - Aspects or Product ID Type  
-        "Item URL"                 # F - E-commerce URLs
-    ]
+    A write-only sheet needs its column widths before the first row, so
+    they are sized from the first EXCEL_WIDTH_SAMPLE_ROWS rows, which are
+    held back until then; the remaining rows are streamed straight through.
     
-    # Add headers in row 3
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=3, column=col, value=header)
-        cell.font = Font(bold=True)
-        cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+    Returns:
+        Number of item rows written
+    """
+    ws = wb.create_sheet("eBay-prefill-listing-template")
+    headers = [header for header, _ in EXCEL_TEMPLATE_COLUMNS]
     
-    # Convert items to eBay format and add data
-    for row_idx, item in enumerate(items, 4):  # Start from row 4
-        # Map item data to eBay columns
-        ebay_row = _convert_item_to_ebay_format(item, default_values)
-        
-        # Add data to columns
-        ws.cell(row=row_idx, column=1, value=ebay_row.get("custom_label", ""))  # Custom Label (SKU)
-        ws.cell(row=row_idx, column=2, value=ebay_row.get("photo_urls", ""))   # Item Photo URL
-        ws.cell(row=row_idx, column=3, value=ebay_row.get("title", ""))        # Title
-        ws.cell(row=row_idx, column=4, value=ebay_row.get("category", ""))     # Category
-        ws.cell(row=row_idx, column=5, value=ebay_row.get("aspects", ""))      # Aspects
-        ws.cell(row=row_idx, column=6, value=ebay_row.get("item_url", ""))     # Item URL
+    # Convert items to eBay format
+    rows = iter_excel_rows(items, default_values, workers)
+    sample = list(islice(rows, EXCEL_WIDTH_SAMPLE_ROWS))
     
     # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-        ws.column_dimensions[column_letter].width = adjusted_width
+    _set_column_widths(ws, chain(EXCEL_TEMPLATE_INFO_ROWS, [headers], sample), len(headers))
+    
+    # Add required header rows, then the column headers in row 3
+    for info_row in EXCEL_TEMPLATE_INFO_ROWS:
+        ws.append(info_row)
+    ws.append([_styled_cell(ws, header, HEADER_FONT, HEADER_FILL) for header in headers])
+    
+    # Add data from row 4
+    exported = 0
+    for row in chain(sample, rows):
+        ws.append(row)
+        exported += 1
     
-    return ws
+    return exported
+
+
+def _set_column_widths(ws: WorksheetType, rows: Iterable[List[Any]], column_count: int) -> None:
+    """Size columns to their longest value, capped at EXCEL_MAX_COLUMN_WIDTH."""
+    max_lengths = [0] * column_count
+    for row in rows:
+        for index in range(column_count):
+            # Missing cells count as "None", as they did when widths were read back from the sheet
+            value = row[index] if index < len(row) else None
+            max_lengths[index] = max(max_lengths[index], len(str(value)))
+    
+    for index, max_length in enumerate(max_lengths, 1):
+        ws.column_dimensions[get_column_letter(index)].width = min(max_length + 2, EXCEL_MAX_COLUMN_WIDTH)
 
 
 def _convert_item_to_ebay_format(item: Dict[str, Any], 
@@ -352,35 +645,129 @@ def _convert_item_to_ebay_format(item: Dict[str, Any],
     return result
 
 
-def _create_html_description(item: Dict[str, Any], description_dir: str) -> bool:
+def create_html_descriptions(items: Iterable[Dict[str, Any]],
+                             description_dir: str,
+                             workers: int = DEFAULT_DESCRIPTION_WORKERS,
+                             chunk_size: int = DESCRIPTION_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Create an HTML description file for each item.
+    
+    Files are rendered and written in a thread pool, chunk_size items per
+    task and a bounded window of tasks at a time, so large exports overlap
+    their file I/O.  A file whose content would not change is left alone.
+    Failures are collected per item instead of stopping the run.
+    
+    Args:
+        items: Item dictionaries
+        description_dir: Directory to save description files
+        workers: Threads rendering and writing files (0 or 1 works in this thread)
+        chunk_size: Items handed to a thread at a time
+        
+    Returns:
+        Dictionary with counts of files "created", "unchanged" and "empty"
+        (items without a description), and "errors" as a list of
+        (item label, error message) tuples
+    """
+    report = {"created": 0, "unchanged": 0, "empty": 0, "errors": []}
+    os.makedirs(description_dir, exist_ok=True)
+    
+    def jobs():
+        used_names = {}
+        for item in items:
+            filename = _description_filename(item)
+            label = filename[:-len("_description.html")] or "(no SKU)"
+            if filename in used_names:
+                report["errors"].append((label, f"{filename} is already used by item {used_names[filename]}"))
+                continue
+            used_names[filename] = item.get("id", "unknown")
+            yield label, item, os.path.join(description_dir, filename)
+    
+    def collect(outcomes):
+        for label, outcome, error in outcomes:
+            if error is None:
+                report[outcome] += 1
+            else:
+                report["errors"].append((label, error))
+    
+    jobs = jobs()
+    if workers <= 1:
+        collect(_write_html_descriptions(jobs))
+        return report
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while True:
+            chunk = list(islice(jobs, chunk_size))
+            if not chunk:
+                break
+            pending.append(executor.submit(_write_html_descriptions, chunk))
+            if len(pending) >= workers * 2:
+                collect(pending.popleft().result())
+        for future in pending:
+            collect(future.result())
+    
+    return report
+
+
+def _write_html_descriptions(jobs: Iterable[Tuple[str, Dict[str, Any], str]]) -> List[Tuple[str, str, Optional[str]]]:
+    """Write description files for (label, item, path) jobs; returns (label, outcome, error) tuples."""
+    outcomes = []
+    for label, item, filepath in jobs:
+        try:
+            outcomes.append((label, _write_html_description(item, filepath), None))
+        except Exception as e:
+            outcomes.append((label, None, str(e)))
+    return outcomes
+
+
+def _description_filename(item: Dict[str, Any]) -> str:
+    """Name of an item's description file, based on SKU or ID."""
+    sku = item.get("sku", item.get("id", "unknown"))
+    return f"{sku}_description.html"
+
+
+def _write_html_description(item: Dict[str, Any], filepath: str) -> str:
     """
     Create an HTML description file for an item.
     
     Args:
         item: Item dictionary
-        description_dir: Directory to save description files
+        filepath: Path of the description file
         
     Returns:
-        True if description was created, False otherwise
+        "created", "unchanged" if the file already had this content, or
+        "empty" if the item has no description
+        
+    Raises:
+        OSError: If the file can't be written
     """
+    # Generate description content
+    description = _generate_item_description(item)
+    if not description:
+        return "empty"
+    
+    # Same bytes as writing in text mode, so files written earlier compare equal
+    if os.linesep != "\n":
+        description = description.replace("\n", os.linesep)
+    content = description.encode('utf-8')
+    
+    if _file_has_content(filepath, content):
+        return "unchanged"
+    
+    with open(filepath, 'wb') as f:
+        f.write(content)
+    
+    return "created"
+
+
+def _file_has_content(filepath: str, content: bytes) -> bool:
+    """Check whether a file exists with exactly this content (sizes are compared first)."""
     try:
-        # Generate description content
-        description = _generate_item_description(item)
-        if not description:
+        if os.path.getsize(filepath) != len(content):
             return False
-        
-        # Create filename based on SKU or ID
-        sku = item.get("sku", item.get("id", "unknown"))
-        filename = f"{sku}_description.html"
-        filepath = os.path.join(description_dir, filename)
-        
-        # Write HTML file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(description)
-        
-        return True
-        
-    except Exception:
+        with open(filepath, 'rb') as f:
+            return f.read() == content
+    except OSError:
         return False
 
 
@@ -406,27 +793,453 @@ def _generate_item_description(item: Dict[str, Any]) -> str:
     condition = EbayItemSchema.get_display_condition(item)
     item_specifics = EbayItemSchema.extract_item_specifics(item)
     
-    html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>{title}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; }}
-        .specs {{ margin: 10px 0; }}
-        .spec-name {{ font-weight: bold; }}
-    </style>
-</head>
-<body>
-    <h1>{title}</h1>
-    <p><strong>Condition:</strong> {condition}</p>
-"""
-    
+    specifics = ""
     if item_specifics:
-        html += "<h2>Item Specifics</h2>\n<div class='specs'>\n"
-        for name, value in item_specifics.items():
-            html += f"<div><span class='spec-name'>{name}:</span> {value}</div>\n"
-        html += "</div>\n"
+        rows = "".join(
+            DESCRIPTION_SPECIFIC_TEMPLATE.substitute(name=_html_text(name), value=_html_text(value))
+            for name, value in item_specifics.items()
+        )
+        specifics = DESCRIPTION_SPECIFICS_TEMPLATE.substitute(rows=rows)
+    
+    return DESCRIPTION_TEMPLATE.substitute(
+        title=_html_text(title),
+        condition=_html_text(condition),
+        specifics=specifics
+    )
+
+
+def _html_text(value: Any) -> str:
+    """Escape a value for use as HTML text."""
+    return escape(str(value), quote=False)
+
+
+# ===== Export engine =====
+
+class FieldMappingCache:
+    """
+    CSV column layouts of queue files, shared by every export.
+    
+    Finding the columns takes a full pass over a queue; the layout is kept
+    per file, size, modification time, default value names and extra
+    columns, so exporting an unchanged queue to CSV again, from any tool in
+    this process, goes straight to writing rows.
+    """
+    
+    def __init__(self, max_entries: int = 32):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Queue files remembered, least recently used dropped first
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def key(queue_file: str, default_values: Dict[str, str], extra_columns: Iterable[str] = ()) -> Optional[tuple]:
+        """Cache key of a queue file in its current state, or None if it can't be read."""
+        try:
+            stat = os.stat(queue_file)
+        except OSError:
+            return None
+        return (os.path.abspath(queue_file), stat.st_size, stat.st_mtime_ns, tuple(sorted(default_values)),
+                tuple(sorted(extra_columns)))
+    
+    def get(self, key: Optional[tuple]) -> Optional[List[str]]:
+        """Get the column layout stored under a key."""
+        if key is None:
+            return None
+        with self.lock:
+            fieldnames = self.entries.get(key)
+            if fieldnames is not None:
+                self.entries.move_to_end(key)
+                return list(fieldnames)
+        return None
+    
+    def put(self, key: Optional[tuple], fieldnames: List[str]) -> None:
+        """Store a column layout under a key."""
+        if key is None:
+            return
+        with self.lock:
+            self.entries[key] = tuple(fieldnames)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
     
-    html += "</body>\n</html>"
+    def clear(self) -> None:
+        """Forget all column layouts."""
+        with self.lock:
+            self.entries.clear()
+
+
+# Column layouts shared by all exports in this process
+field_mapping_cache = FieldMappingCache()
+
+
+class ExportFormat:
+    """
+    An output format of the export engine.
+    
+    Subclasses set the class attributes and implement export().  Formats
+    added with register_export_format() are available to export_items(),
+    export_queue_file(), the export GUI and the command line.
+    """
+    
+    name = ""
+    label = ""
+    extension = ""
+    # True if the output is a directory rather than a file
+    writes_directory = False
+    
+    @property
+    def available(self) -> bool:
+        """Whether the format's optional dependencies are installed."""
+        return True
+    
+    def export(self,
+               items: Callable[[], Iterable[Dict[str, Any]]],
+               output: str,
+               default_values: Dict[str, str],
+               description_dir: Optional[str] = None,
+               workers: int = 0,
+               fieldnames: Optional[List[str]] = None,
+               queue_file: Optional[str] = None,
+               extra_columns: Iterable[str] = ()) -> Tuple[bool, str]:
+        """
+        Export items.
+        
+        Args:
+            items: Returns a new iterator over the items each time it is
+                   called, so formats can make several streaming passes
+            output: Output file (or directory, see writes_directory)
+            default_values: Default values for fields
+            description_dir: Directory to also save HTML description files to
+            workers: Processes converting rows (see iter_csv_rows)
+            fieldnames: Precomputed CSV columns, for formats that use them (the CSV
+                        format finds the columns again if a row doesn't fit them)
+            queue_file: Queue file the items are read from, if any
+            extra_columns: Names of CSV_EXTRA_COLUMNS, for formats that use them
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        raise NotImplementedError
+
+
+class CsvExportFormat(ExportFormat):
+    """eBay File Exchange CSV, one column per mapped field and item specific."""
+    
+    name = "csv"
+    label = "CSV Format"
+    extension = ".csv"
+    
+    def export(self, items, output, default_values, description_dir=None, workers=0,
+               fieldnames=None, queue_file=None, extra_columns=()):
+        try:
+            # Phase one: find the columns, unless this queue's are already known
+            key = field_mapping_cache.key(queue_file, default_values, extra_columns) if queue_file else None
+            discovered = False
+            if fieldnames is None:
+                fieldnames = field_mapping_cache.get(key)
+            if fieldnames is None:
+                fieldnames = discover_csv_fields(items(), default_values, extra_columns)
+                field_mapping_cache.put(key, fieldnames)
+                discovered = True
+            
+            # Phase two: stream the rows to disk
+            try:
+                rows = iter_csv_rows(items(), default_values, workers, extra_columns=extra_columns)
+                exported = write_csv_rows(rows, output, fieldnames)
+            except ValueError:
+                if discovered:
+                    raise
+                # The given or remembered columns are stale; find them again and rewrite
+                fieldnames = discover_csv_fields(items(), default_values, extra_columns)
+                field_mapping_cache.put(key, fieldnames)
+                rows = iter_csv_rows(items(), default_values, workers, extra_columns=extra_columns)
+                exported = write_csv_rows(rows, output, fieldnames)
+            if not exported:
+                os.remove(output)
+                return False, "No items to export"
+            
+            # Create HTML description files if requested
+            descriptions = create_html_descriptions(items(), description_dir) if description_dir else None
+            
+            return True, _export_message(exported, output, descriptions, description_dir)
+            
+        except Exception as e:
+            return False, f"Error exporting to CSV: {str(e)}"
+
+
+class ExcelExportFormat(ExportFormat):
+    """eBay bulk upload template workbook (requires openpyxl)."""
     
-    return html
\ No newline at end of file
+    name = "excel"
+    label = "Excel Format (eBay Bulk Upload)"
+    extension = ".xlsx"
+    
+    @property
+    def available(self) -> bool:
+        return EXCEL_AVAILABLE
+    
+    def export(self, items, output, default_values, description_dir=None, workers=0,
+               fieldnames=None, queue_file=None, extra_columns=()):
+        try:
+            if not EXCEL_AVAILABLE:
+                return False, EXCEL_UNAVAILABLE_MESSAGE
+            
+            exported = _write_excel_workbook(items(), output, default_values, workers)
+            if not exported:
+                os.remove(output)
+                return False, "No items to export"
+            
+            # Create HTML description files if requested
+            descriptions = create_html_descriptions(items(), description_dir) if description_dir else None
+            
+            return True, _excel_export_message(exported, output, descriptions, description_dir)
+            
+        except Exception as e:
+            return False, f"Error exporting to Excel: {str(e)}"
+
+
+class HtmlExportFormat(ExportFormat):
+    """HTML description files only, one per item, written to the output directory."""
+    
+    name = "html"
+    label = "HTML Descriptions"
+    extension = ""
+    writes_directory = True
+    
+    def export(self, items, output, default_values, description_dir=None, workers=0,
+               fieldnames=None, queue_file=None, extra_columns=()):
+        try:
+            descriptions = create_html_descriptions(items(), output)
+            if not any(descriptions[outcome] for outcome in ("created", "unchanged", "empty")) \
+                    and not descriptions["errors"]:
+                return False, "No items to export"
+            
+            message = f"Successfully exported HTML descriptions to {output}"
+            return True, message + _descriptions_message(descriptions, output)
+            
+        except Exception as e:
+            return False, f"Error exporting HTML descriptions: {str(e)}"
+
+
+class JsonExportFormat(ExportFormat):
+    """Normalized queue file, laid out like save_queue() writes it."""
+    
+    name = "json"
+    label = "JSON Queue"
+    extension = ".json"
+    
+    def export(self, items, output, default_values, description_dir=None, workers=0,
+               fieldnames=None, queue_file=None, extra_columns=()):
+        try:
+            exported = 0
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write("[")
+                for item in items():
+                    item = EbayItemSchema.normalize_item(item)
+                    # Indented one level deeper, as inside json.dump(queue, f, indent=2)
+                    f.write(("," if exported else "") + "\n  " + json.dumps(item, indent=2).replace("\n", "\n  "))
+                    exported += 1
+                f.write("\n]" if exported else "]")
+            
+            if not exported:
+                os.remove(output)
+                return False, "No items to export"
+            
+            # Create HTML description files if requested
+            descriptions = create_html_descriptions(items(), description_dir) if description_dir else None
+            
+            return True, _export_message(exported, output, descriptions, description_dir)
+            
+        except Exception as e:
+            return False, f"Error exporting to JSON: {str(e)}"
+
+
+# Export formats by name, in the order they are offered
+EXPORT_FORMATS: Dict[str, ExportFormat] = {}
+
+
+def register_export_format(export_format: ExportFormat) -> ExportFormat:
+    """
+    Make an export format available to the export engine and its front ends.
+    
+    Args:
+        export_format: Format instance (replaces a format of the same name)
+        
+    Returns:
+        The format
+    """
+    EXPORT_FORMATS[export_format.name] = export_format
+    return export_format
+
+
+for _export_format in (CsvExportFormat(), ExcelExportFormat(), HtmlExportFormat(), JsonExportFormat()):
+    register_export_format(_export_format)
+
+
+def get_export_format(format_name: Optional[str] = None, output: Optional[str] = None) -> ExportFormat:
+    """
+    Look up an export format.
+    
+    Args:
+        format_name: Registered format name; if None it is guessed from the
+                     output's extension (no extension means HTML descriptions)
+        output: Output file or directory
+        
+    Returns:
+        The export format
+        
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if format_name is None:
+        extension = os.path.splitext(output or "")[1].lower()
+        if extension == ".xls":
+            extension = ".xlsx"
+        for export_format in EXPORT_FORMATS.values():
+            if export_format.extension == extension:
+                return export_format
+        raise ValueError(f"Can't tell the export format from {output!r}; choose one of: {', '.join(EXPORT_FORMATS)}")
+    
+    export_format = EXPORT_FORMATS.get(format_name)
+    if export_format is None:
+        raise ValueError(f"Unknown export format {format_name!r}; choose one of: {', '.join(EXPORT_FORMATS)}")
+    return export_format
+
+
+def export_items(items: List[Dict[str, Any]],
+                 output: str,
+                 format_name: Optional[str] = None,
+                 default_values: Dict[str, str] = None,
+                 description_dir: Optional[str] = None,
+                 workers: int = 0,
+                 fieldnames: Optional[List[str]] = None,
+                 extra_columns: Iterable[str] = ()) -> Tuple[bool, str]:
+    """
+    Export items in any registered format.
+    
+    Args:
+        items: List of item dictionaries to export
+        output: Output file, or directory for the HTML format
+        format_name: Export format name (guessed from output if None)
+        default_values: Default values for fields
+        description_dir: Directory to also save HTML description files to
+        workers: Processes converting rows (see iter_csv_rows)
+        fieldnames: Precomputed CSV columns (e.g. from discover_csv_fields)
+        extra_columns: Names of CSV_EXTRA_COLUMNS to add to CSV output
+        
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    return _run_export(lambda: iter(items), output, format_name, default_values, description_dir,
+                       workers, fieldnames, None, extra_columns)
+
+
+def export_queue_file(queue_file: str,
+                      output: str,
+                      format_name: Optional[str] = None,
+                      default_values: Dict[str, str] = None,
+                      description_dir: Optional[str] = None,
+                      workers: int = 0,
+                      fieldnames: Optional[List[str]] = None,
+                      extra_columns: Iterable[str] = ()) -> Tuple[bool, str]:
+    """
+    Export a queue file in any registered format without loading the whole queue.
+    
+    Items are streamed from the file with iter_queue_items, once per pass
+    the format needs.
+    
+    Args:
+        queue_file: Path to the JSON queue file
+        output: Output file, or directory for the HTML format
+        format_name: Export format name (guessed from output if None)
+        default_values: Default values for fields
+        description_dir: Directory to also save HTML description files to
+        workers: Processes converting rows (see iter_csv_rows)
+        fieldnames: Precomputed CSV columns (e.g. from discover_csv_fields)
+        extra_columns: Names of CSV_EXTRA_COLUMNS to add to CSV output
+        
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    def queue_items():
+        return (item for item, _, _ in iter_queue_items(queue_file))
+    
+    return _run_export(queue_items, output, format_name, default_values, description_dir,
+                       workers, fieldnames, queue_file, extra_columns)
+
+
+def _run_export(items: Callable[[], Iterable[Dict[str, Any]]], output: str, format_name: Optional[str],
+                default_values: Optional[Dict[str, str]], description_dir: Optional[str], workers: int,
+                fieldnames: Optional[List[str]], queue_file: Optional[str],
+                extra_columns: Iterable[str] = ()) -> Tuple[bool, str]:
+    """Pick the export format and run it."""
+    try:
+        export_format = get_export_format(format_name, output)
+    except ValueError as e:
+        return False, str(e)
+    
+    extra_columns = list(dict.fromkeys(extra_columns))
+    unknown = [column for column in extra_columns if column not in CSV_EXTRA_COLUMNS]
+    if unknown:
+        return False, f"Unknown CSV columns {', '.join(unknown)}; choose from: {', '.join(CSV_EXTRA_COLUMNS)}"
+    
+    return export_format.export(items, output, default_values or {}, description_dir, workers,
+                                fieldnames=fieldnames, queue_file=queue_file, extra_columns=extra_columns)
+
+
+def load_default_values(file_path: str) -> Dict[str, str]:
+    """
+    Load default field values from a JSON file.
+    
+    Args:
+        file_path: Path to a JSON file holding an object
+        
+    Returns:
+        Dictionary of default values
+        
+    Raises:
+        ValueError: If the file does not contain a dictionary
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        default_values = json.load(f)
+    
+    if not isinstance(default_values, dict):
+        raise ValueError("Default values file does not contain a dictionary.")
+    return default_values
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Export a queue file from the command line."""
+    parser = argparse.ArgumentParser(description="Export an eBay Tools queue file for eBay upload.")
+    parser.add_argument("queue_file", help="JSON queue file to export")
+    parser.add_argument("output", help="output file, or directory for the html format")
+    parser.add_argument("-f", "--format", choices=list(EXPORT_FORMATS),
+                        help="export format (guessed from the output extension by default)")
+    parser.add_argument("-d", "--defaults", metavar="FILE", help="JSON file of default field values")
+    parser.add_argument("--descriptions", metavar="DIR", help="also write HTML description files to DIR")
+    parser.add_argument("-w", "--workers", type=int, default=0, help="processes converting rows")
+    parser.add_argument("-c", "--column", action="append", default=[], choices=list(CSV_EXTRA_COLUMNS),
+                        help="also write this CSV column (may be repeated)")
+    args = parser.parse_args(argv)
+    
+    default_values = {}
+    if args.defaults:
+        try:
+            default_values = load_default_values(args.defaults)
+        except (OSError, ValueError) as e:
+            print(f"Failed to load default values: {str(e)}", file=sys.stderr)
+            return 1
+    
+    success, message = export_queue_file(args.queue_file, args.output, args.format, default_values,
+                                         args.descriptions, args.workers, extra_columns=args.column)
+    print(message, file=sys.stdout if success else sys.stderr)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
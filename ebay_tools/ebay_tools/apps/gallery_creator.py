@@ -25,8 +25,23 @@ from ebay_tools.core.exceptions import EbayToolsError
 from ebay_tools.utils.image_utils import open_image_with_orientation, create_thumbnail
 from ebay_tools.utils.file_utils import ensure_directory_exists, safe_load_json, safe_save_json
 from ebay_tools.utils.ui_utils import StatusBar
+from ebay_tools.utils.photo_store_utils import PhotoStore
+from ebay_tools.utils.derivative_utils import (
+    DerivativeCache, DEFAULT_DERIVATIVE_CACHE_MB, DEFAULT_DERIVATIVE_SIZES
+)
+from ebay_tools.utils.export_manifest_utils import MANIFEST_SUFFIX, ExportManifest, content_hash
+from ebay_tools.utils.background_utils import run_with_progress
 from ebay_tools.utils.launcher_utils import ToolLauncher, create_tools_menu
 
+# Items per data feed chunk file; the exported page only loads chunks scrolled into view
+FEED_CHUNK_SIZE = 100
+
+# Gallery export layouts (settings dialog label -> gallery_data['export_mode'])
+EXPORT_MODES = {
+    "Static page": "static",
+    "Data feed (virtualized)": "feed"
+}
+
 class GalleryItem:
     """Data structure for gallery items"""
     def __init__(self):
@@ -91,6 +106,15 @@ class GalleryCreator:
         self.api_client = None
         self.processing = False
         
+        # Source photo path -> URL used in exported HTML
+        self.photo_urls = {}
+        
+        # Source photo path -> web derivative variants placed by the last export
+        self.photo_derivatives = {}
+        
+        # Manifest of the export in progress (item fragments are reused from it)
+        self.export_manifest = None
+        
         # Load configuration
         self.config_manager = ConfigManager()
         self.config_manager.load()
@@ -119,6 +143,7 @@ class GalleryCreator:
         file_menu.add_command(label="Save Gallery", command=self.save_gallery)
         file_menu.add_separator()
         file_menu.add_command(label="Export HTML", command=self.export_html)
+        file_menu.add_command(label="Export HTML (Full Rebuild)", command=lambda: self.export_html(incremental=False))
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
         
@@ -634,19 +659,39 @@ Serious inquiries only. {item_data.get('contact_info', 'Contact for more informa
         """Edit gallery-wide settings"""
         dialog = tk.Toplevel(self.root)
         dialog.title("Gallery Settings")
-        dialog.geometry("400x200")
+        dialog.geometry("400x240")
         
         # Title
         ttk.Label(dialog, text="Gallery Title:").grid(row=0, column=0, sticky=tk.W, padx=10, pady=5)
         title_var = tk.StringVar(value=self.gallery_data.get('title', ''))
         ttk.Entry(dialog, textvariable=title_var, width=40).grid(row=0, column=1, padx=10, pady=5)
         
+        # Export layout
+        current_mode = self.gallery_data.get('export_mode', 'static')
+        mode_labels = {mode: label for label, mode in EXPORT_MODES.items()}
+        ttk.Label(dialog, text="Export Layout:").grid(row=1, column=0, sticky=tk.W, padx=10, pady=5)
+        mode_var = tk.StringVar(value=mode_labels.get(current_mode, "Static page"))
+        ttk.Combobox(dialog, textvariable=mode_var, values=list(EXPORT_MODES.keys()),
+                     state="readonly", width=37).grid(row=1, column=1, padx=10, pady=5)
+        
+        # Pagination (data feed only)
+        ttk.Label(dialog, text="Items per Page:").grid(row=2, column=0, sticky=tk.W, padx=10, pady=5)
+        page_size_var = tk.IntVar(value=self.gallery_data.get('page_size', 0))
+        ttk.Spinbox(dialog, from_=0, to=10000, increment=25, textvariable=page_size_var,
+                    width=10).grid(row=2, column=1, sticky=tk.W, padx=10, pady=5)
+        ttk.Label(dialog, text="(0 = one scrolling page)").grid(row=3, column=1, sticky=tk.W, padx=10)
+        
         # Buttons
         button_frame = ttk.Frame(dialog)
         button_frame.grid(row=10, column=0, columnspan=2, pady=20)
         
         def save_settings():
             self.gallery_data['title'] = title_var.get()
+            self.gallery_data['export_mode'] = EXPORT_MODES.get(mode_var.get(), 'static')
+            try:
+                self.gallery_data['page_size'] = max(0, int(page_size_var.get()))
+            except (tk.TclError, ValueError):
+                self.gallery_data['page_size'] = 0
             dialog.destroy()
             self.status_bar.set_status("Gallery settings updated")
             
@@ -705,8 +750,12 @@ Serious inquiries only. {item_data.get('contact_info', 'Contact for more informa
         webbrowser.open(f'file://{os.path.abspath(preview_file)}')
         self.status_bar.set_status("Gallery preview opened in browser")
         
-    def export_html(self):
-        """Export gallery as HTML file"""
+    def export_html(self, incremental=True):
+        """Export gallery as HTML file
+        
+        Args:
+            incremental: Reuse unchanged items and photos from the previous export
+        """
         # Save current item
         if self.current_item is not None:
             self.save_current_item()
@@ -718,43 +767,138 @@ Serious inquiries only. {item_data.get('contact_info', 'Contact for more informa
         )
         
         if filename:
+            run_with_progress(
+                self.root,
+                "Exporting Gallery",
+                self._export_html_task,
+                kwargs={'filename': filename, 'incremental': incremental},
+                on_complete=self._on_export_html_complete
+            )
+            
+    def _export_html_task(self, filename, incremental, report_progress, check_cancelled):
+        """Place photos and write the gallery HTML (background thread)"""
+        # Place photos in the gallery folder under content-addressed names
+        gallery_dir = os.path.dirname(filename)
+        photos_dir = os.path.join(gallery_dir, 'photos')
+        
+        all_photos = []
+        for item in self.gallery_data.get('items', []):
+            all_photos.extend(item.get('photos', []))
+            if item.get('thumbnail'):
+                all_photos.append(item['thumbnail'])
+        all_photos = list(dict.fromkeys(all_photos))
+        
+        use_derivatives = self.config_manager.get("gallery.web_derivatives", True)
+        manifest = ExportManifest(
+            os.path.splitext(filename)[0] + MANIFEST_SUFFIX,
+            settings={'web_derivatives': use_derivatives, 'sizes': DEFAULT_DERIVATIVE_SIZES}
+        )
+        if not incremental:
+            manifest.reset()
+        
+        # Reuse photos whose source and exported files are unchanged
+        present = set(os.listdir(photos_dir)) if os.path.isdir(photos_dir) else set()
+        self.photo_derivatives = {}
+        self.photo_urls = {}
+        changed = []
+        for photo in all_photos:
+            data = manifest.reuse_photo(photo, present)
+            if data is None:
+                changed.append(photo)
+            elif 'variants' in data:
+                self.photo_derivatives[photo] = data['variants']
+            else:
+                self.photo_urls[photo] = f"photos/{data['original']}"
+        
+        store = PhotoStore()
+        derivatives = DerivativeCache(store)
+        
+        # Resized web copies replace the originals where they can be generated
+        if use_derivatives and changed:
+            derived = derivatives.place_all(
+                changed, photos_dir, report_progress, check_cancelled)
+            for photo, variants in derived.items():
+                self.photo_derivatives[photo] = variants
+                files = [name for info in variants.values()
+                         for name in (info.get('jpeg'), info.get('webp')) if name]
+                manifest.record_photo(photo, files, {'variants': variants})
+        
+        originals = [photo for photo in changed if photo not in self.photo_derivatives]
+        if originals:
+            for src, name in store.place_all(originals, photos_dir).items():
+                self.photo_urls[src] = f"photos/{name}"
+                manifest.record_photo(src, [name], {'original': name})
+        
+        report_progress(1, 1, "Writing gallery HTML")
+        
+        if self.gallery_data.get('export_mode', 'static') == 'feed':
+            # Item data goes to chunk files that the page loads on demand
+            html_content = self._create_html_template(feed=self._write_data_feed(filename))
+        else:
+            # Generate HTML, reusing fragments of unchanged items
+            self.export_manifest = manifest
             try:
-                # Generate HTML
                 html_content = self.generate_html()
-                
-                # Save HTML file
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                    
-                # Copy photos to gallery folder
-                gallery_dir = os.path.dirname(filename)
-                photos_dir = os.path.join(gallery_dir, 'photos')
-                ensure_directory_exists(photos_dir)
-                
-                # Copy all photos
-                for item in self.gallery_data.get('items', []):
-                    for photo in item.get('photos', []):
-                        if os.path.exists(photo):
-                            dest = os.path.join(photos_dir, os.path.basename(photo))
-                            if not os.path.exists(dest):
-                                shutil.copy2(photo, dest)
-                                
-                self.status_bar.set_status(f"Gallery exported to {os.path.basename(filename)}")
-                
-                # Ask if user wants to open it
-                if messagebox.askyesno("Export Complete", "Gallery exported successfully. Open in browser?"):
-                    webbrowser.open(f'file://{os.path.abspath(filename)}')
-                    
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export gallery: {str(e)}")
+            finally:
+                self.export_manifest = None
+        
+        # Save HTML file
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        # Drop photos the gallery no longer uses
+        removed = manifest.remove_orphans(photos_dir)
+        manifest.save()
+        
+        # Galleries keep their own copies, so the shared cache can be bounded
+        cache_mb = self.config_manager.get("gallery.derivative_cache_mb", DEFAULT_DERIVATIVE_CACHE_MB)
+        derivatives.trim(int(cache_mb * 1024 * 1024))
+        
+        return {
+            'filename': filename,
+            'photos_updated': len(changed),
+            'orphans_removed': removed
+        }
+        
+    def _on_export_html_complete(self, result):
+        """Report a finished export (main thread)"""
+        filename = result['filename']
+        self.status_bar.set_status(
+            f"Gallery exported to {os.path.basename(filename)} "
+            f"({result['photos_updated']} photos updated, {result['orphans_removed']} removed)"
+        )
+        
+        # Ask if user wants to open it
+        if messagebox.askyesno("Export Complete", "Gallery exported successfully. Open in browser?"):
+            webbrowser.open(f'file://{os.path.abspath(filename)}')
                 
     def generate_html(self):
         """Generate the HTML content for the gallery"""
         # This will be implemented in the next part
         return self._create_html_template()
         
-    def _create_html_template(self):
-        """Create the HTML template for the gallery"""
+    def _create_html_template(self, feed=None):
+        """Create the HTML template for the gallery
+        
+        Args:
+            feed: Data feed description from _write_data_feed; when given, the
+                  page renders items from the feed instead of inlining them
+        """
+        if feed is None:
+            gallery_html = f"""<div class="gallery">
+            {self._generate_items_html()}
+        </div>"""
+            javascript = self._get_javascript()
+        else:
+            gallery_html = """<div class="gallery virtual"></div>
+        <div class="pager"></div>
+        
+        <div id="item-modal" class="modal">
+            <div class="modal-content"></div>
+        </div>"""
+            feed_json = json.dumps(feed, separators=(',', ':')).replace('</', '<\\/')
+            javascript = self._get_feed_javascript().replace('__FEED__', feed_json)
+            
         html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -778,9 +922,7 @@ Serious inquiries only. {item_data.get('contact_info', 'Contact for more informa
             <button class="filter-btn" data-filter="sold">Sold</button>
         </div>
         
-        <div class="gallery">
-            {self._generate_items_html()}
-        </div>
+        {gallery_html}
         
         <footer>
             <p>Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
@@ -788,7 +930,7 @@ Serious inquiries only. {item_data.get('contact_info', 'Contact for more informa
     </div>
     
     <script>
-        {self._get_javascript()}
+        {javascript}
     </script>
 </body>
 </html>"""
@@ -870,6 +1012,10 @@ Serious inquiries only. {item_data.get('contact_info', 'Contact for more informa
             opacity: 0.7;
         }
         
+        .item picture {
+            display: block;
+        }
+        
         .item-image {
             width: 100%;
             height: 200px;
@@ -1000,6 +1146,33 @@ Serious inquiries only. {item_data.get('contact_info', 'Contact for more informa
             margin-bottom: 20px;
         }
         
+        /* Data feed layout: cards have a fixed height so rows can be virtualized */
+        .gallery.virtual {
+            box-sizing: border-box;
+            grid-auto-rows: 430px;
+            align-content: start;
+        }
+        
+        .gallery.virtual .item-description {
+            max-height: 4.5em;
+            overflow: hidden;
+        }
+        
+        .item.placeholder {
+            background-color: #ecf0f1;
+            box-shadow: none;
+            cursor: default;
+        }
+        
+        .pager {
+            text-align: center;
+            margin-top: 30px;
+        }
+        
+        .pager span {
+            margin: 0 10px;
+        }
+        
         footer {
             text-align: center;
             margin-top: 50px;
@@ -1063,8 +1236,9 @@ Serious inquiries only. {item_data.get('contact_info', 'Contact for more informa
         }
         
         // Image gallery in modal
-        function changeImage(itemId, imageSrc, element) {
+        function changeImage(itemId, imageSrc, element, imageSrcset) {
             const mainImage = document.getElementById('main-image-' + itemId);
+            mainImage.srcset = imageSrcset || '';
             mainImage.src = imageSrc;
             
             // Update active thumbnail
@@ -1074,69 +1248,469 @@ Serious inquiries only. {item_data.get('contact_info', 'Contact for more informa
         }
         """
         
-    def _generate_items_html(self):
-        """Generate HTML for all items"""
-        html_parts = []
+    def _get_feed_javascript(self):
+        """Get JavaScript that renders the gallery from the data feed
         
-        for item in self.gallery_data.get('items', []):
-            item_id = item.get('id', '')
-            status = item.get('status', 'available')
-            photos = item.get('photos', [])
-            thumbnail = item.get('thumbnail', photos[0] if photos else '')
+        Only the rows in view are in the DOM, chunk files are loaded as
+        their items scroll into view, and modals are built when opened.
+        """
+        return """
+        const FEED = __FEED__;
+        const CARD_HEIGHT = 430;
+        const GAP = 20;
+        const MIN_CARD_WIDTH = 300;
+        const OVERSCAN_ROWS = 2;
+        const NO_IMAGE = 'https://via.placeholder.com/300x200?text=No+Image';
+        
+        const gallery = document.querySelector('.gallery');
+        const pager = document.querySelector('.pager');
+        const modal = document.getElementById('item-modal');
+        const chunks = {};
+        const requested = {};
+        let view = [];
+        let page = 0;
+        let renderQueued = false;
+        let renderKey = '';
+        
+        // Called by each chunk file when it has loaded
+        function galleryFeedChunk(number, records) {
+            chunks[number] = records;
+            renderKey = '';
+            scheduleRender();
+        }
+        
+        function loadChunk(number) {
+            if (chunks[number] || requested[number]) return;
+            requested[number] = true;
+            const script = document.createElement('script');
+            script.src = FEED.dir + '/' + FEED.chunks[number];
+            document.head.appendChild(script);
+        }
+        
+        function getRecord(index) {
+            const chunk = chunks[Math.floor(index / FEED.chunkSize)];
+            return chunk ? chunk[index % FEED.chunkSize] : null;
+        }
+        
+        function el(tag, className, text) {
+            const node = document.createElement(tag);
+            if (className) node.className = className;
+            if (text !== undefined) node.textContent = text;
+            return node;
+        }
+        
+        function titleCase(text) {
+            return text.charAt(0).toUpperCase() + text.slice(1).toLowerCase();
+        }
+        
+        function buildImage(image, sizes, className, alt) {
+            const img = el('img', className);
+            img.alt = alt || '';
+            img.loading = 'lazy';
+            if (image.srcset) {
+                img.srcset = image.srcset;
+                img.sizes = sizes;
+            }
+            if (image.w) {
+                img.width = image.w;
+                img.height = image.h;
+            }
+            img.src = image.src;
+            if (!image.webp) return img;
             
-            # Create thumbnail path
-            if thumbnail:
-                thumbnail_path = f"photos/{os.path.basename(thumbnail)}"
-            else:
-                thumbnail_path = "https://via.placeholder.com/300x200?text=No+Image"
+            const picture = el('picture');
+            const source = el('source');
+            source.type = 'image/webp';
+            source.srcset = image.webp;
+            source.sizes = sizes;
+            picture.append(source, img);
+            return picture;
+        }
+        
+        function buildCard(record, index) {
+            const card = el('div', 'item ' + record.s);
+            card.onclick = () => openModal(index);
+            
+            const image = buildImage(record.th || {src: NO_IMAGE}, '(max-width: 768px) 100vw, 380px',
+                                     'item-image', record.t);
+            const details = el('div', 'item-details');
+            details.append(
+                el('div', 'item-location', '📍 ' + (record.l || 'Location not specified')),
+                el('div', 'item-contact', '📞 ' + (record.c || 'Contact for details')));
+            
+            const content = el('div', 'item-content');
+            content.append(
+                el('div', 'item-title', record.t),
+                el('div', 'item-price', record.p),
+                el('div', 'item-status status-' + record.s, titleCase(record.s)),
+                el('div', 'item-description', record.d.slice(0, 100) + '...'),
+                details);
+            
+            card.append(image, content);
+            return card;
+        }
+        
+        // Virtualized grid: only rows near the viewport are rendered
+        function pageIndices() {
+            if (!FEED.pageSize) return view;
+            return view.slice(page * FEED.pageSize, (page + 1) * FEED.pageSize);
+        }
+        
+        function scheduleRender() {
+            if (!renderQueued) {
+                renderQueued = true;
+                requestAnimationFrame(render);
+            }
+        }
+        
+        function render() {
+            renderQueued = false;
+            const indices = pageIndices();
+            const columns = Math.max(1, Math.floor((gallery.clientWidth + GAP) / (MIN_CARD_WIDTH + GAP)));
+            const rowHeight = CARD_HEIGHT + GAP;
+            const rows = Math.ceil(indices.length / columns);
+            
+            const viewTop = -gallery.getBoundingClientRect().top;
+            const firstRow = Math.max(0, Math.floor(viewTop / rowHeight) - OVERSCAN_ROWS);
+            const lastRow = Math.min(rows, Math.ceil((viewTop + window.innerHeight) / rowHeight) + OVERSCAN_ROWS);
+            
+            const key = [firstRow, lastRow, columns, page, view.length].join(':');
+            if (key === renderKey) return;
+            renderKey = key;
+            
+            gallery.style.gridTemplateColumns = 'repeat(' + columns + ', 1fr)';
+            gallery.style.paddingTop = (firstRow * rowHeight) + 'px';
+            gallery.style.height = Math.max(0, rows * rowHeight - GAP) + 'px';
+            
+            const fragment = document.createDocumentFragment();
+            const end = Math.min(indices.length, lastRow * columns);
+            for (let i = firstRow * columns; i < end; i++) {
+                const record = getRecord(indices[i]);
+                if (record) {
+                    fragment.appendChild(buildCard(record, indices[i]));
+                } else {
+                    loadChunk(Math.floor(indices[i] / FEED.chunkSize));
+                    fragment.appendChild(el('div', 'item placeholder'));
+                }
+            }
+            gallery.replaceChildren(fragment);
+        }
+        
+        function renderPager() {
+            const pages = FEED.pageSize ? Math.ceil(view.length / FEED.pageSize) : 1;
+            pager.style.display = pages > 1 ? 'block' : 'none';
+            if (pages <= 1) return;
+            
+            const prev = el('button', 'filter-btn', '‹ Previous');
+            prev.disabled = page === 0;
+            prev.onclick = () => goToPage(page - 1);
+            const next = el('button', 'filter-btn', 'Next ›');
+            next.disabled = page >= pages - 1;
+            next.onclick = () => goToPage(page + 1);
+            pager.replaceChildren(prev, el('span', null, 'Page ' + (page + 1) + ' of ' + pages), next);
+        }
+        
+        function goToPage(number) {
+            page = number;
+            renderKey = '';
+            renderPager();
+            window.scrollTo(0, gallery.getBoundingClientRect().top + window.scrollY - GAP);
+            scheduleRender();
+        }
+        
+        // Filter functionality
+        const filterButtons = document.querySelectorAll('.filter-btn');
+        
+        function applyFilter(filter) {
+            const wanted = FEED.statusNames.indexOf(filter);
+            view = [];
+            for (let i = 0; i < FEED.total; i++) {
+                if (filter === 'all' || FEED.statuses[i] === wanted) view.push(i);
+            }
+            page = 0;
+            renderKey = '';
+            renderPager();
+            scheduleRender();
+        }
+        
+        filterButtons.forEach(btn => {
+            btn.addEventListener('click', () => {
+                filterButtons.forEach(b => b.classList.remove('active'));
+                btn.classList.add('active');
+                applyFilter(btn.getAttribute('data-filter'));
+            });
+        });
+        
+        // Modal built on demand for the clicked item
+        function openModal(index) {
+            const record = getRecord(index);
+            if (!record) return;
+            
+            const close = el('span', 'close', '×');
+            close.onclick = closeModal;
+            const parts = [close, el('h2', null, record.t)];
+            
+            if (record.ph.length) {
+                const main = el('img', 'main-image');
+                const showPhoto = photo => {
+                    main.srcset = photo.srcset || '';
+                    main.sizes = '(max-width: 1000px) 80vw, 760px';
+                    main.src = photo.src;
+                };
+                showPhoto(record.ph[0]);
+                parts.push(main);
                 
-            # Create item HTML
-            item_html = f"""
-            <div class="item {status}" onclick="openModal('{item_id}')">
-                <img src="{thumbnail_path}" alt="{item.get('title', '')}" class="item-image">
-                <div class="item-content">
-                    <div class="item-title">{item.get('title', 'Untitled')}</div>
-                    <div class="item-price">{item.get('price', 'Contact for price')}</div>
-                    <div class="item-status status-{status}">{status.title()}</div>
-                    <div class="item-description">{item.get('description', '')[:100]}...</div>
-                    <div class="item-details">
-                        <div class="item-location">📍 {item.get('location', 'Location not specified')}</div>
-                        <div class="item-contact">📞 {item.get('contact_info', 'Contact for details')}</div>
-                    </div>
-                </div>
-            </div>
+                if (record.ph.length > 1) {
+                    const strip = el('div', 'modal-images');
+                    record.ph.forEach((photo, i) => {
+                        const thumb = el('img', 'modal-image' + (i === 0 ? ' active' : ''));
+                        thumb.loading = 'lazy';
+                        thumb.src = photo.tn;
+                        thumb.onclick = () => {
+                            showPhoto(photo);
+                            strip.querySelectorAll('.modal-image').forEach(t => t.classList.remove('active'));
+                            thumb.classList.add('active');
+                        };
+                        strip.appendChild(thumb);
+                    });
+                    parts.push(strip);
+                }
+            } else {
+                const main = el('img', 'main-image');
+                main.src = 'https://via.placeholder.com/600x400?text=No+Image';
+                parts.push(main);
+            }
             
-            <!-- Modal for item -->
-            <div id="modal-{item_id}" class="modal">
-                <div class="modal-content">
-                    <span class="close" onclick="closeModal('{item_id}')">&times;</span>
-                    <h2>{item.get('title', 'Untitled')}</h2>
-                    
-                    {self._generate_modal_images_html(item)}
-                    
-                    <div class="item-price">{item.get('price', 'Contact for price')}</div>
-                    <div class="item-status status-{status}">{status.title()}</div>
-                    
-                    <h3>Description</h3>
-                    <div class="item-description">{item.get('description', 'No description available')}</div>
-                    
-                    <h3>Contact Information</h3>
-                    <div class="item-details">
-                        <div class="item-location">📍 Location: {item.get('location', 'Not specified')}</div>
-                        <div class="item-contact">📞 Contact: {item.get('contact_info', 'Not provided')}</div>
-                    </div>
+            const details = el('div', 'item-details');
+            details.append(
+                el('div', 'item-location', '📍 Location: ' + (record.l || 'Not specified')),
+                el('div', 'item-contact', '📞 Contact: ' + (record.c || 'Not provided')));
+            
+            const listed = el('p', null, 'Listed on ' + record.dt);
+            listed.style.cssText = 'color: #666; font-size: 0.9em; margin-top: 20px;';
+            
+            parts.push(
+                el('div', 'item-price', record.p),
+                el('div', 'item-status status-' + record.s, titleCase(record.s)),
+                el('h3', null, 'Description'),
+                el('div', 'item-description', record.d || 'No description available'),
+                el('h3', null, 'Contact Information'),
+                details,
+                listed);
+            
+            modal.querySelector('.modal-content').replaceChildren(...parts);
+            modal.style.display = 'block';
+        }
+        
+        function closeModal() {
+            modal.style.display = 'none';
+        }
+        
+        // Close modal when clicking outside
+        window.onclick = function(event) {
+            if (event.target === modal) {
+                closeModal();
+            }
+        }
+        
+        window.addEventListener('scroll', scheduleRender, {passive: true});
+        window.addEventListener('resize', scheduleRender);
+        applyFilter('all');
+        """
+        
+    def _write_data_feed(self, filename):
+        """Write item data as chunk files next to the exported page
+        
+        Chunk files are named by content hash, so unchanged chunks are not
+        rewritten and browsers never see stale cached data.
+        
+        Args:
+            filename: Path of the exported HTML file
+            
+        Returns:
+            Feed description embedded in the page (chunk files, item statuses, paging)
+        """
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        data_dir_name = f"{stem}_data"
+        data_dir = os.path.join(os.path.dirname(filename), data_dir_name)
+        ensure_directory_exists(data_dir)
+        
+        items = self.gallery_data.get('items', [])
+        
+        # Statuses are inlined so filtering works before any chunk is loaded
+        status_names = []
+        statuses = []
+        for item in items:
+            status = item.get('status', 'available')
+            if status not in status_names:
+                status_names.append(status)
+            statuses.append(status_names.index(status))
+        
+        chunks = []
+        for start in range(0, len(items), FEED_CHUNK_SIZE):
+            number = len(chunks)
+            records = [self._feed_record(item) for item in items[start:start + FEED_CHUNK_SIZE]]
+            name = f"chunk-{number:04d}-{content_hash(records)[:12]}.js"
+            path = os.path.join(data_dir, name)
+            if not os.path.exists(path):
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(f"galleryFeedChunk({number}, {json.dumps(records, separators=(',', ':'))});\n")
+            chunks.append(name)
+            
+        # Remove chunks left over from earlier exports
+        for name in os.listdir(data_dir):
+            if name.startswith('chunk-') and name not in chunks:
+                try:
+                    os.remove(os.path.join(data_dir, name))
+                except OSError:
+                    pass
                     
-                    <p style="color: #666; font-size: 0.9em; margin-top: 20px;">
-                        Listed on {datetime.fromisoformat(item.get('created_date', datetime.now().isoformat())).strftime('%B %d, %Y')}
-                    </p>
-                </div>
-            </div>
-            """
+        return {
+            'dir': data_dir_name,
+            'total': len(items),
+            'chunkSize': FEED_CHUNK_SIZE,
+            'chunks': chunks,
+            'statusNames': status_names,
+            'statuses': statuses,
+            'pageSize': max(0, int(self.gallery_data.get('page_size', 0) or 0))
+        }
+        
+    def _feed_record(self, item):
+        """Build the compact data feed record for one item
+        
+        Keys: t=title, p=price, s=status, d=description, l=location,
+        c=contact, dt=listing date, th=thumbnail image, ph=photos
+        """
+        photos = item.get('photos', [])
+        thumbnail = item.get('thumbnail', photos[0] if photos else '')
+        created = datetime.fromisoformat(item.get('created_date', datetime.now().isoformat()))
+        
+        photo_records = []
+        for photo in photos:
+            record = self._feed_image(photo, 'medium', ['medium', 'full'])
+            record['tn'] = self._variant_url(photo, 'thumb') or self._photo_url(photo)
+            photo_records.append(record)
+            
+        return {
+            'id': item.get('id', ''),
+            't': item.get('title', 'Untitled'),
+            'p': item.get('price', 'Contact for price'),
+            's': item.get('status', 'available'),
+            'd': item.get('description', ''),
+            'l': item.get('location', ''),
+            'c': item.get('contact_info', ''),
+            'dt': created.strftime('%B %d, %Y'),
+            'th': self._feed_image(thumbnail, 'thumb', ['thumb', 'medium']) if thumbnail else None,
+            'ph': photo_records
+        }
+        
+    def _feed_image(self, photo, variant, srcset_variants):
+        """Describe a photo for the data feed (src, srcset, webp srcset, size)"""
+        src = self._variant_url(photo, variant)
+        if not src:
+            return {'src': self._photo_url(photo)}
+            
+        info = self.photo_derivatives[photo][variant]
+        image = {
+            'src': src,
+            'srcset': self._srcset(photo, srcset_variants),
+            'w': info['width'],
+            'h': info['height']
+        }
+        webp_srcset = self._srcset(photo, srcset_variants, 'webp')
+        if webp_srcset:
+            image['webp'] = webp_srcset
+        return image
+        
+    def _generate_items_html(self):
+        """Generate HTML for all items"""
+        html_parts = []
+        
+        for index, item in enumerate(self.gallery_data.get('items', [])):
+            if self.export_manifest is None:
+                html_parts.append(self._generate_item_html(item))
+                continue
             
+            # Photo placement is part of the hash, since the fragment embeds its URLs
+            key = item.get('id') or f"#{index}"
+            photos = item.get('photos', []) + [item.get('thumbnail', '')]
+            item_hash = content_hash([
+                item,
+                [self.photo_derivatives.get(photo) or self.photo_urls.get(photo) for photo in photos]
+            ])
+            
+            item_html = self.export_manifest.get_fragment(key, item_hash)
+            if item_html is None:
+                item_html = self._generate_item_html(item)
+            self.export_manifest.record_item(key, item_hash, item_html)
             html_parts.append(item_html)
             
         return '\n'.join(html_parts)
         
+    def _generate_item_html(self, item):
+        """Generate the card and modal HTML for one item"""
+        item_id = item.get('id', '')
+        status = item.get('status', 'available')
+        photos = item.get('photos', [])
+        thumbnail = item.get('thumbnail', photos[0] if photos else '')
+        
+        # Create thumbnail image
+        if thumbnail:
+            thumbnail_html = self._responsive_image_html(
+                thumbnail, 'thumb', ['thumb', 'medium'], "(max-width: 768px) 100vw, 380px",
+                f'alt="{item.get("title", "")}" class="item-image"')
+        else:
+            thumbnail_html = f'<img src="https://via.placeholder.com/300x200?text=No+Image" alt="{item.get("title", "")}" class="item-image">'
+            
+        # Create item HTML
+        item_html = f"""
+        <div class="item {status}" onclick="openModal('{item_id}')">
+            {thumbnail_html}
+            <div class="item-content">
+                <div class="item-title">{item.get('title', 'Untitled')}</div>
+                <div class="item-price">{item.get('price', 'Contact for price')}</div>
+                <div class="item-status status-{status}">{status.title()}</div>
+                <div class="item-description">{item.get('description', '')[:100]}...</div>
+                <div class="item-details">
+                    <div class="item-location">📍 {item.get('location', 'Location not specified')}</div>
+                    <div class="item-contact">📞 {item.get('contact_info', 'Contact for details')}</div>
+                </div>
+            </div>
+        </div>
+        
+        <!-- Modal for item -->
+        <div id="modal-{item_id}" class="modal">
+            <div class="modal-content">
+                <span class="close" onclick="closeModal('{item_id}')">&times;</span>
+                <h2>{item.get('title', 'Untitled')}</h2>
+                
+                {self._generate_modal_images_html(item)}
+                
+                <div class="item-price">{item.get('price', 'Contact for price')}</div>
+                <div class="item-status status-{status}">{status.title()}</div>
+                
+                <h3>Description</h3>
+                <div class="item-description">{item.get('description', 'No description available')}</div>
+                
+                <h3>Contact Information</h3>
+                <div class="item-details">
+                    <div class="item-location">📍 Location: {item.get('location', 'Not specified')}</div>
+                    <div class="item-contact">📞 Contact: {item.get('contact_info', 'Not provided')}</div>
+                </div>
+                
+                <p style="color: #666; font-size: 0.9em; margin-top: 20px;">
+                    Listed on {datetime.fromisoformat(item.get('created_date', datetime.now().isoformat())).strftime('%B %d, %Y')}
+                </p>
+            </div>
+        </div>
+        """
+        
+        return item_html
+        
+    def _photo_url(self, photo):
+        """Get the URL of a photo relative to the exported HTML file"""
+        return self.photo_urls.get(photo, f"photos/{os.path.basename(photo)}")
+        
     def _generate_modal_images_html(self, item):
         """Generate HTML for modal image gallery"""
         photos = item.get('photos', [])
@@ -1144,19 +1718,61 @@ Serious inquiries only. {item_data.get('contact_info', 'Contact for more informa
             return '<img src="https://via.placeholder.com/600x400?text=No+Image" class="main-image">'
             
         item_id = item.get('id', '')
-        first_photo = f"photos/{os.path.basename(photos[0])}"
+        first_src, first_srcset = self._modal_image_sources(photos[0])
+        srcset_attr = f' srcset="{first_srcset}" sizes="(max-width: 1000px) 80vw, 760px"' if first_srcset else ''
         
-        html = f'<img id="main-image-{item_id}" src="{first_photo}" class="main-image">'
+        html = f'<img id="main-image-{item_id}" src="{first_src}"{srcset_attr} class="main-image" loading="lazy">'
         
         if len(photos) > 1:
             html += '<div class="modal-images">'
             for i, photo in enumerate(photos):
-                photo_path = f"photos/{os.path.basename(photo)}"
+                photo_src, photo_srcset = self._modal_image_sources(photo)
+                thumb_src = self._variant_url(photo, 'thumb') or photo_src
                 active_class = 'active' if i == 0 else ''
-                html += f'<img src="{photo_path}" class="modal-image {active_class}" onclick="changeImage(\'{item_id}\', \'{photo_path}\', this)">'
+                html += (f'<img src="{thumb_src}" class="modal-image {active_class}" loading="lazy" '
+                         f'onclick="changeImage(\'{item_id}\', \'{photo_src}\', this, \'{photo_srcset}\')">')
             html += '</div>'
             
         return html
+        
+    def _variant_url(self, photo, variant, fmt='jpeg'):
+        """Get the URL of a web derivative, or None if it wasn't generated"""
+        info = self.photo_derivatives.get(photo, {}).get(variant)
+        if info and info.get(fmt):
+            return f"photos/{info[fmt]}"
+        return None
+        
+    def _srcset(self, photo, variants, fmt='jpeg'):
+        """Build a srcset attribute value from web derivatives"""
+        available = self.photo_derivatives.get(photo, {})
+        entries = []
+        for variant in variants:
+            info = available.get(variant)
+            if info and info.get(fmt):
+                entries.append(f"photos/{info[fmt]} {info['width']}w")
+        return ", ".join(entries)
+        
+    def _responsive_image_html(self, photo, variant, srcset_variants, sizes, attrs):
+        """Build a lazily loaded <img>, wrapped in <picture> when WebP copies exist"""
+        src = self._variant_url(photo, variant)
+        if not src:
+            return f'<img src="{self._photo_url(photo)}" {attrs} loading="lazy">'
+            
+        info = self.photo_derivatives[photo][variant]
+        img = (f'<img src="{src}" srcset="{self._srcset(photo, srcset_variants)}" sizes="{sizes}" '
+               f'width="{info["width"]}" height="{info["height"]}" {attrs} loading="lazy">')
+        
+        webp_srcset = self._srcset(photo, srcset_variants, 'webp')
+        if webp_srcset:
+            return f'<picture><source type="image/webp" srcset="{webp_srcset}" sizes="{sizes}">{img}</picture>'
+        return img
+        
+    def _modal_image_sources(self, photo):
+        """Get (src, srcset) for a modal main image"""
+        src = self._variant_url(photo, 'medium')
+        if not src:
+            return self._photo_url(photo), ''
+        return src, self._srcset(photo, ['medium', 'full'])
 
 
 def main():
@@ -6,17 +6,23 @@ Imports photo collections and metadata from mobile devices
 import os
 import json
 import shutil
+import logging
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import zipfile
+import posixpath
 from pathlib import Path
 import sys
 
 from ebay_tools.core.schema import EbayItemSchema
 from ebay_tools.utils.file_utils import ensure_directory_exists, safe_load_json, safe_save_json
 from ebay_tools.utils.ui_utils import StatusBar
+from ebay_tools.utils.dedup_utils import PhotoHashCache, scan_queue_for_duplicates
+from ebay_tools.utils.photo_store_utils import PhotoStore, PHOTO_EXTENSIONS
+
+logger = logging.getLogger(__name__)
 
 
 class MobileDataImporter:
@@ -132,14 +138,27 @@ class MobileDataImporter:
                 temp_dir = os.path.join(os.path.dirname(filename), 'temp_import')
                 ensure_directory_exists(temp_dir)
                 
+                # Photos go into the shared photo store instead of the temp tree,
+                # so photos already imported once aren't written again
+                store = PhotoStore()
+                stored_photos = {}
                 with zipfile.ZipFile(filename, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
+                    for info in zip_ref.infolist():
+                        if info.is_dir():
+                            continue
+                        ext = os.path.splitext(info.filename)[1]
+                        if ext.lower() in PHOTO_EXTENSIONS:
+                            with zip_ref.open(info) as member:
+                                stored_photos[info.filename] = store.add_stream(member, ext)
+                        else:
+                            zip_ref.extract(info, temp_dir)
                 
                 # Look for manifest.json
                 manifest_path = os.path.join(temp_dir, 'manifest.json')
                 if os.path.exists(manifest_path):
                     self.import_data = safe_load_json(manifest_path)
                     self.import_data['base_path'] = temp_dir
+                    self._map_stored_photos(stored_photos)
                     self.populate_tree()
                     self.status_bar.set_status(f"Imported {len(self.import_data.get('items', []))} items from ZIP")
                 else:
@@ -148,6 +167,15 @@ class MobileDataImporter:
             except Exception as e:
                 messagebox.showerror("Import Error", f"Failed to import ZIP: {str(e)}")
                 
+    def _map_stored_photos(self, stored_photos):
+        """Point imported photo paths at their copies in the photo store"""
+        for item in self.import_data.get('items', []):
+            mapped = []
+            for photo in item.get('photos', []):
+                member = posixpath.normpath(str(photo).replace('\\', '/'))
+                mapped.append(stored_photos.get(member, photo))
+            item['photos'] = mapped
+                
     def import_folder(self):
         """Import data from folder"""
         folder = filedialog.askdirectory(title="Select Mobile Export Folder")
@@ -320,10 +348,14 @@ class MobileDataImporter:
                         else:
                             photo_path = os.path.join(base_path, photo)
                         if os.path.exists(photo_path):
-                            photos.append(photo_path)
+                            photos.append({
+                                "path": photo_path,
+                                "added_at": datetime.now().isoformat(),
+                                "context": ""
+                            })
                             
                     queue_item['photos'] = photos
-                    queue_item['process_photos'] = photos.copy()
+                    queue_item['process_photos'] = list(range(len(photos)))
                     
                     # Add notes to description if available
                     if item.get('notes'):
@@ -334,10 +366,16 @@ class MobileDataImporter:
                         queue_item['mobile_metadata'] = item['metadata']
                         
                     queue_data['items'].append(queue_item)
+                
+                # Drop near-duplicate shots within an item and flag ones repeated across items
+                removed, flagged = self._remove_duplicate_photos(queue_data['items'])
                     
                 # Save queue file
                 safe_save_json(filename, queue_data)
-                self.status_bar.set_status(f"Exported {len(selected)} items to setup queue")
+                status = f"Exported {len(selected)} items to setup queue"
+                if removed or flagged:
+                    status += f" ({removed} duplicate photos skipped, {flagged} flagged)"
+                self.status_bar.set_status(status)
                 
                 if messagebox.askyesno("Export Complete", "Queue file created. Open in Setup tool?"):
                     # Launch setup tool with the queue
@@ -347,6 +385,44 @@ class MobileDataImporter:
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
                 
+    def _remove_duplicate_photos(self, queue_items):
+        """
+        Remove or flag near-duplicate photos in exported queue items.
+        
+        Duplicates within the same item are removed.  Duplicates of a photo
+        in another item are kept but flagged and excluded from processing.
+        
+        Returns:
+            Tuple of (removed count, flagged count)
+        """
+        try:
+            duplicates = scan_queue_for_duplicates(queue_items, PhotoHashCache())
+        except Exception as e:
+            logger.error(f"Duplicate photo check failed: {str(e)}")
+            return 0, 0
+        
+        removed = 0
+        flagged = 0
+        
+        # Remove from the end so earlier photo indices stay valid
+        for dup in sorted(duplicates, key=lambda d: (d['item_index'], d['photo_index']), reverse=True):
+            queue_item = queue_items[dup['item_index']]
+            if dup['same_item']:
+                del queue_item['photos'][dup['photo_index']]
+                removed += 1
+            else:
+                queue_item['photos'][dup['photo_index']]['duplicate_of'] = dup['duplicate_of']['path']
+                flagged += 1
+        
+        # Only process photos that are not flagged as duplicates
+        for queue_item in queue_items:
+            queue_item['process_photos'] = [
+                idx for idx, photo in enumerate(queue_item['photos'])
+                if not photo.get('duplicate_of')
+            ]
+        
+        return removed, flagged
+        
     def export_to_gallery(self):
         """Export selected items to Gallery format"""
         selected = self.get_selected_items()
@@ -434,9 +510,10 @@ class MobileDataImporter:
                 export_path = os.path.join(output_dir, export_name)
                 ensure_directory_exists(export_path)
                 
-                # Copy photos and update paths
+                # Place photos under content-addressed names and update paths
                 base_path = self.import_data.get('base_path', '')
                 exported_items = []
+                store = PhotoStore()
                 
                 for item in selected:
                     exported_item = item.copy()
@@ -450,15 +527,14 @@ class MobileDataImporter:
                             src_path = os.path.join(base_path, photo)
                             
                         if os.path.exists(src_path):
-                            # Copy to export directory
-                            dest_name = os.path.basename(src_path)
-                            dest_path = os.path.join(export_path, dest_name)
-                            shutil.copy2(src_path, dest_path)
-                            exported_photos.append(dest_name)
+                            # Link or copy into the export directory
+                            exported_photos.append(store.place(src_path, export_path))
                             
                     exported_item['photos'] = exported_photos
                     exported_items.append(exported_item)
                     
+                store.save()
+                
                 # Create manifest
                 manifest = {
                     "version": "1.0",
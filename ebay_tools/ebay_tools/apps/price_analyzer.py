@@ -3,8 +3,8 @@
 eBay Price Analyzer
 
 This module provides functionality to analyze eBay pricing based on 
-similar sold items. It can be used standalone or integrated with
-the eBay processing workflow.
+similar sold items. It can be run as its own window or integrated with
+the eBay processing workflow; either way it needs the ebay_tools package.
 """
 
 import json
@@ -15,8 +15,8 @@ from tkinter import ttk, messagebox, simpledialog
 import webbrowser
 from datetime import datetime, timedelta
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import urllib.parse
-import statistics
 import csv
 import os
 import string
@@ -28,13 +28,12 @@ try:
 except ImportError:
     print("Required packages not found. Install with: pip install requests beautifulsoup4")
 
-# Import from ebay_tools package
-try:
-    from ebay_tools.core import schema, config, exceptions
-    from ebay_tools.utils import ui_utils, background_utils
-except ImportError:
-    # For standalone use
-    print("Running in standalone mode without ebay_tools package")
+# Search vocabularies, comp storage and statistics live in the ebay_tools package
+from ebay_tools.utils.comp_set_utils import CompSet
+from ebay_tools.utils.fetch_utils import RequestCoalescer
+from ebay_tools.utils.price_stats_utils import batch_price_stats
+from ebay_tools.utils.research_cache_utils import get_research_cache, research_cache_key
+from ebay_tools.utils.taxonomy_utils import get_taxonomy_manager
 
 
 class eBaySearchURLGenerator:
@@ -196,92 +195,49 @@ class SmartSearchExtractor:
     and mines descriptions for additional search terms.
     """
     
-    def __init__(self):
-        # Common brand patterns and their variations
-        self.brand_patterns = {
-            # Electronics
-            'apple': ['apple', 'iphone', 'ipad', 'macbook', 'airpods'],
-            'samsung': ['samsung', 'galaxy'],
-            'sony': ['sony', 'playstation', 'ps3', 'ps4', 'ps5'],
-            'nintendo': ['nintendo', 'switch', 'wii', 'gameboy'],
-            'microsoft': ['microsoft', 'xbox', 'surface'],
-            
-            # Collectibles
-            'madame alexander': ['madame alexander', 'madam alexander'],
-            'barbie': ['barbie', 'mattel barbie'],
-            'american girl': ['american girl', 'ag doll'],
-            'hot wheels': ['hot wheels', 'hotwheels'],
-            'lego': ['lego', 'legos'],
-            
-            # Watches
-            'rolex': ['rolex'],
-            'omega': ['omega'],
-            'seiko': ['seiko'],
-            'casio': ['casio', 'g-shock'],
-            
-            # Fashion
-            'coach': ['coach'],
-            'louis vuitton': ['louis vuitton', 'lv'],
-            'gucci': ['gucci'],
-            
-            # Tools
-            'dewalt': ['dewalt'],
-            'milwaukee': ['milwaukee'],
-            'makita': ['makita']
-        }
-        
-        # Common model/product type patterns
-        self.model_patterns = {
-            # iPhone models
-            'iphone': r'iphone\s*(\d+)\s*(pro|plus|max|mini)?',
-            # Watch models
-            'submariner': r'submariner',
-            'speedmaster': r'speedmaster',
-            # Doll models
-            'cinderella': r'cinderella',
-            'poor cinderella': r'poor\s+cinderella'
-        }
+    def __init__(self, taxonomy_manager=None):
+        """
+        Initialize the extractor.
         
-        # Stop words to remove
-        self.stop_words = {
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
-            'after', 'above', 'below', 'between', 'among', 'this', 'that', 'these',
-            'those', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
-            'could', 'can', 'may', 'might', 'must', 'shall', 'very', 'too', 'so',
-            'just', 'now', 'only', 'also', 'really', 'quite', 'still', 'already',
-            'yet', 'again', 'back', 'here', 'there', 'where', 'when', 'why', 'how',
-            'what', 'which', 'who', 'whom', 'whose', 'all', 'both', 'each', 'few',
-            'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'own',
-            'same', 'than', 'then', 'them', 'they', 'we', 'you', 'your', 'yours',
-            'he', 'him', 'his', 'she', 'her', 'hers', 'it', 'its', 'our', 'ours',
-            'their', 'theirs', 'me', 'my', 'mine', 'us'
-        }
+        Args:
+            taxonomy_manager: TaxonomyManager supplying the vocabularies
+                              (defaults to the shared one, which follows the
+                              configured taxonomy file)
+        """
+        self.taxonomy_manager = taxonomy_manager or get_taxonomy_manager()
+        self.taxonomy = None
+        self._refresh_taxonomy()
+    
+    def _refresh_taxonomy(self):
+        """Pick up the current compiled taxonomy (reloaded when its file changes)."""
+        taxonomy = self.taxonomy_manager.current()
+        if taxonomy is self.taxonomy:
+            return
         
-        # eBay-specific noise words to remove
-        self.ebay_noise = {
-            'fast', 'free', 'shipping', 'new', 'used', 'nice', 'great', 'excellent',
-            'rare', 'vintage', 'antique', 'beautiful', 'stunning', 'amazing',
-            'perfect', 'mint', 'condition', 'collectible', 'estate', 'sale',
-            'lot', 'bundle', 'set', 'collection', 'authentic', 'genuine',
-            'original', 'oem', 'replacement', 'part', 'parts', 'working',
-            'tested', 'refurbished', 'restored', 'repair', 'broken', 'damaged',
-            'untested', 'as-is', 'asis', 'read', 'description', 'please',
-            'look', 'see', 'photos', 'pictures', 'pics', 'nr', 'reserve',
-            'auction', 'buy', 'now', 'bin', 'obo', 'offer', 'best', 'reduced',
-            'price', 'drop', 'must', 'sell', 'moving', 'quick', 'fast'
-        }
+        self.taxonomy = taxonomy
+        self.brand_patterns = taxonomy.brand_patterns
+        self.model_patterns = taxonomy.model_patterns
+        self.stop_words = taxonomy.stop_words
+        self.ebay_noise = taxonomy.ebay_noise
+        self.skip_words = taxonomy.skip_words
+        self.keyword_matcher = taxonomy.keyword_matcher
+        self.model_matcher = taxonomy.model_matcher
     
     def extract_search_terms(self, item_data):
         """Extract intelligent search terms from item data."""
-        all_text = self._gather_text_sources(item_data)
+        self._refresh_taxonomy()
+        return self._strategies_from_text(self._gather_text_sources(item_data))
+    
+    def _strategies_from_text(self, all_text):
+        """Build the search strategies for gathered item text."""
+        # Brands, product types and words for all strategies come from one scan
+        keywords = self._scan_text_sources(all_text)
         
         # Generate multiple search strategies
         search_strategies = []
         
         # Strategy 1: Brand + Model + Key Features
-        brand_model = self._extract_brand_model_terms(all_text)
+        brand_model = self._extract_brand_model_terms(all_text, keywords)
         if brand_model:
             search_strategies.append({
                 'terms': brand_model,
@@ -290,7 +246,7 @@ class SmartSearchExtractor:
             })
         
         # Strategy 2: Key Features + Type
-        feature_type = self._extract_feature_type_terms(all_text)
+        feature_type = self._extract_feature_type_terms(all_text, keywords)
         if feature_type:
             search_strategies.append({
                 'terms': feature_type,
@@ -299,7 +255,7 @@ class SmartSearchExtractor:
             })
         
         # Strategy 3: Important Keywords from description
-        keyword_terms = self._extract_keyword_terms(all_text)
+        keyword_terms = self._extract_keyword_terms(all_text, keywords)
         if keyword_terms:
             search_strategies.append({
                 'terms': keyword_terms,
@@ -308,7 +264,7 @@ class SmartSearchExtractor:
             })
         
         # Strategy 4: Cleaned title fallback
-        title_fallback = self._extract_cleaned_title(all_text)
+        title_fallback = self._extract_cleaned_title(all_text, keywords)
         if title_fallback:
             search_strategies.append({
                 'terms': title_fallback,
@@ -318,6 +274,30 @@ class SmartSearchExtractor:
         
         return search_strategies
     
+    def extract_search_terms_batch(self, items):
+        """
+        Extract search strategies for many items, e.g. a whole queue.
+        
+        Items with identical text (common for lots of the same product) are
+        only analyzed once.
+        
+        Args:
+            items: Iterable of item data dictionaries
+            
+        Returns:
+            List with the search strategies of each item, in order
+        """
+        self._refresh_taxonomy()
+        results = []
+        seen = {}
+        for item_data in items:
+            text_sources = self._gather_text_sources(item_data)
+            key = tuple(sorted(text_sources.items()))
+            if key not in seen:
+                seen[key] = self._strategies_from_text(text_sources)
+            results.append([dict(strategy) for strategy in seen[key]])
+        return results
+    
     def _gather_text_sources(self, item_data):
         """Gather all available text from item data."""
         text_sources = {}
@@ -345,72 +325,72 @@ class SmartSearchExtractor:
         
         return text_sources
     
-    def _extract_brand_model_terms(self, text_sources):
-        """Extract brand and model information."""
-        all_text = " ".join(text_sources.values()).lower()
+    def _scan_text_sources(self, text_sources):
+        """
+        Scan the gathered text once for brands, product types and words.
         
-        found_brands = []
-        found_models = []
+        Returns:
+            Dictionary with the lowercased 'text' of all sources, the 'brand'
+            found anywhere, the 'product_type' found in title or description,
+            the 'title_product_type' found in the title, and the cleaned
+            'title_words' and 'description_words'
+        """
+        # Remember where each source sits in the combined text
+        parts = []
+        segments = {}
+        position = 0
+        for name, text in text_sources.items():
+            text = text.lower()
+            parts.append(text)
+            segments[name] = (position, position + len(text))
+            position += len(text) + 1
+        
+        all_text = " ".join(parts)
+        matcher = self.keyword_matcher
+        found = matcher.scan(all_text)
         
-        # Find brands
-        for brand, variations in self.brand_patterns.items():
-            for variation in variations:
-                if variation.lower() in all_text:
-                    found_brands.append(brand)
-                    break
+        return {
+            'text': all_text,
+            'brand': matcher.best(found, 'brand'),
+            'product_type': matcher.best(found, 'product_type',
+                                         [segments.get('title'), segments.get('description')]),
+            'title_product_type': matcher.best(found, 'title_product_type', [segments.get('title')]),
+            'title_words': self._clean_words(text_sources.get('title', '')),
+            'description_words': self._clean_words(text_sources.get('description', ''))
+        }
+    
+    def _extract_brand_model_terms(self, text_sources, keywords=None):
+        """Extract brand and model information."""
+        keywords = keywords or self._scan_text_sources(text_sources)
         
-        # Find models using regex patterns
-        import re
-        for model_name, pattern in self.model_patterns.items():
-            matches = re.findall(pattern, all_text, re.IGNORECASE)
-            if matches:
-                found_models.append(model_name)
+        brand = keywords['brand']
+        model = self.model_matcher.first_match(keywords['text'])
         
         # Combine brand and model
-        if found_brands and found_models:
-            return f"{found_brands[0]} {found_models[0]}"
-        elif found_brands:
+        if brand and model:
+            return f"{brand} {model}"
+        elif brand:
             # Add common product type from title
-            title = text_sources.get('title', '')
-            product_type = self._extract_product_type(title)
+            product_type = keywords['title_product_type']
             if product_type:
-                return f"{found_brands[0]} {product_type}"
-            return found_brands[0]
-        elif found_models:
-            return found_models[0]
+                return f"{brand} {product_type}"
+            return brand
+        elif model:
+            return model
         
         return None
     
-    def _extract_feature_type_terms(self, text_sources):
+    def _extract_feature_type_terms(self, text_sources, keywords=None):
         """Extract key features and product type."""
         title = text_sources.get('title', '').lower()
         description = text_sources.get('description', '').lower()
         
-        # Common product types
-        product_types = {
-            'doll': ['doll', 'dolls'],
-            'watch': ['watch', 'watches', 'timepiece'],
-            'phone': ['phone', 'smartphone', 'iphone', 'android'],
-            'game': ['game', 'gaming', 'console', 'xbox', 'playstation'],
-            'tool': ['tool', 'drill', 'saw', 'wrench', 'screwdriver'],
-            'bag': ['bag', 'purse', 'handbag', 'backpack'],
-            'jewelry': ['ring', 'necklace', 'bracelet', 'earrings'],
-            'book': ['book', 'novel', 'guide', 'manual'],
-            'toy': ['toy', 'action figure', 'collectible']
-        }
-        
-        found_type = None
-        for type_name, keywords in product_types.items():
-            for keyword in keywords:
-                if keyword in title or keyword in description:
-                    found_type = type_name
-                    break
-            if found_type:
-                break
+        keywords = keywords or self._scan_text_sources(text_sources)
+        found_type = keywords['product_type']
         
         # Extract important descriptors
         descriptors = []
-        important_words = self._extract_important_words(title + " " + description)
+        important_words = self._rank_words(keywords['title_words'] + keywords['description_words'])
         
         if important_words:
             # Take top 3-4 most important words
@@ -425,40 +405,31 @@ class SmartSearchExtractor:
         
         return None
     
-    def _extract_keyword_terms(self, text_sources):
+    def _extract_keyword_terms(self, text_sources, keywords=None):
         """Extract important keywords from description."""
         description = text_sources.get('description', '')
         if not description:
             return None
         
         # Extract important words from description
-        important_words = self._extract_important_words(description)
+        if keywords:
+            important_words = self._rank_words(keywords['description_words'])
+        else:
+            important_words = self._extract_important_words(description)
         
         if len(important_words) >= 2:
             return ' '.join(important_words[:3])  # Top 3 keywords
         
         return None
     
-    def _extract_cleaned_title(self, text_sources):
+    def _extract_cleaned_title(self, text_sources, keywords=None):
         """Extract and clean the title as fallback."""
         title = text_sources.get('title', '')
         if not title:
             return None
         
-        # Clean the title
-        words = title.lower().split()
-        cleaned_words = []
-        
-        for word in words:
-            # Remove punctuation
-            word = word.strip(string.punctuation)
-            
-            # Skip if empty, stop word, or noise word
-            if (word and 
-                word not in self.stop_words and 
-                word not in self.ebay_noise and
-                len(word) > 2):  # Skip very short words
-                cleaned_words.append(word)
+        # Clean the title, skipping stop/noise words and very short words
+        cleaned_words = keywords['title_words'] if keywords else self._clean_words(title)
         
         # Return first 4-5 meaningful words
         return ' '.join(cleaned_words[:5])
@@ -468,20 +439,11 @@ class SmartSearchExtractor:
         if not text:
             return []
         
-        words = text.lower().split()
-        cleaned_words = []
-        
-        for word in words:
-            # Remove punctuation
-            word = word.strip(string.punctuation)
-            
-            # Skip if empty, stop word, or noise word
-            if (word and 
-                word not in self.stop_words and 
-                word not in self.ebay_noise and
-                len(word) > 2 and
-                not word.isdigit()):  # Skip pure numbers
-                cleaned_words.append(word)
+        return self._rank_words(self._clean_words(text))
+    
+    def _rank_words(self, words):
+        """Rank cleaned words by frequency, skipping pure numbers."""
+        cleaned_words = [word for word in words if not word.isdigit()]
         
         # Count frequency and return most common
         if cleaned_words:
@@ -491,27 +453,17 @@ class SmartSearchExtractor:
         
         return []
     
+    def _clean_words(self, text):
+        """Split text into lowercase words without punctuation, stop/noise words or words under 3 letters."""
+        skip_words = self.skip_words
+        punctuation = string.punctuation
+        return [word for word in (raw.strip(punctuation) for raw in text.lower().split())
+                if len(word) > 2 and word not in skip_words]
+    
     def _extract_product_type(self, title):
         """Extract product type from title."""
-        title_lower = title.lower()
-        
-        # Common product indicators
-        if any(word in title_lower for word in ['doll', 'dolls']):
-            return 'doll'
-        elif any(word in title_lower for word in ['watch', 'timepiece']):
-            return 'watch'
-        elif any(word in title_lower for word in ['phone', 'iphone']):
-            return 'phone'
-        elif any(word in title_lower for word in ['game', 'console']):
-            return 'game'
-        elif any(word in title_lower for word in ['tool', 'drill']):
-            return 'tool'
-        elif any(word in title_lower for word in ['bag', 'purse']):
-            return 'bag'
-        elif any(word in title_lower for word in ['book', 'manual']):
-            return 'book'
-        
-        return None
+        matcher = self.keyword_matcher
+        return matcher.best(matcher.scan(title.lower()), 'title_product_type')
 
 
 class PriceAnalyzer:
@@ -525,6 +477,17 @@ class PriceAnalyzer:
         self.research_manager = ResearchDataManager()
         self.search_extractor = SmartSearchExtractor()
         
+        # Sold listings research shared with the other pricing tools
+        self.research_cache = None
+        if self.config.get("use_research_cache", True):
+            self.research_cache = get_research_cache()
+        
+        # Set a HostRateLimiter to space out requests when analyzing from several threads,
+        # or a FetchScheduler to also cap concurrent requests and back off when throttled
+        self.rate_limiter = None
+        self.fetch_scheduler = None
+        self.request_coalescer = RequestCoalescer()
+        
     def _load_config(self, config_file=None):
         """Load configuration from file or use defaults."""
         default_config = {
@@ -533,7 +496,15 @@ class PriceAnalyzer:
             "min_results": 3,      # Minimum results needed for analysis
             "days_back": 90,       # How far back to look for sold items
             "exclude_words": ["broken", "for parts", "not working", "damaged"],
-            "price_threshold": 0.3  # Threshold for excluding outliers (30% from median)
+            "price_threshold": 0.3,  # Threshold for excluding outliers (30% from median)
+            "parallel_strategies": False, # Research all search strategies at once (opt-in)
+            "max_strategy_workers": 4,    # Concurrent searches when researching in parallel
+            "use_research_cache": True,   # Reuse recent sold listings research
+            "cache_ttl_hours": None,      # Maximum age of reused research (None = cache default)
+            "outlier_method": "iqr",      # Outlier rejection: "iqr", "mad" or "none"
+            "recency_half_life_days": 30, # Sale age at which a price counts half in weighted stats
+            "confidence_min_items": 10,   # Sold items that score 50 toward confidence
+            "price_baseline": "median"    # Statistic to mark up: median, weighted_median or trimmed_mean
         }
         
         if config_file:
@@ -547,7 +518,8 @@ class PriceAnalyzer:
                 
         return default_config
     
-    def analyze_item(self, search_terms=None, item_data=None, markup_percent=None, sample_limit=None):
+    def analyze_item(self, search_terms=None, item_data=None, markup_percent=None, sample_limit=None, parallel=None,
+                     analyze_prices=True):
         """
         Analyze eBay pricing for an item using multiple search strategies.
         
@@ -556,6 +528,10 @@ class PriceAnalyzer:
             item_data: Dictionary containing item data (optional)
             markup_percent: Custom markup percentage (overrides config)
             sample_limit: Limit the number of samples to analyze
+            parallel: Research all strategies concurrently and keep the best
+                      (defaults to the "parallel_strategies" config setting)
+            analyze_prices: Compute the price statistics and suggested price; pass
+                            False to batch them later with complete_price_analyses()
             
         Returns:
             Dictionary with pricing analysis results
@@ -577,41 +553,158 @@ class PriceAnalyzer:
         if not search_strategies:
             raise ValueError("Search terms or item data must be provided")
         
-        # Try each search strategy until we find results
-        best_result = None
-        tried_strategies = []
+        if parallel is None:
+            parallel = self.config.get("parallel_strategies", False)
         
-        for strategy in search_strategies:
+        tried_strategies = [{
+            'terms': strategy['terms'],
+            'strategy': strategy['strategy'],
+            'confidence': strategy['confidence']
+        } for strategy in search_strategies]
+        
+        if parallel and len(search_strategies) > 1:
+            return self._analyze_strategies_parallel(search_strategies, tried_strategies, markup_percent, sample_limit,
+                                                     analyze_prices)
+        
+        # Results by search terms, so no search is run twice
+        attempts = {}
+        
+        # Try each search strategy until we find results
+        for index, strategy in enumerate(search_strategies):
             search_terms = strategy['terms']
-            tried_strategies.append({
-                'terms': search_terms,
-                'strategy': strategy['strategy'],
-                'confidence': strategy['confidence']
-            })
             
-            result = self._analyze_with_search_terms(search_terms, markup_percent, sample_limit, strategy)
+            if search_terms not in attempts:
+                attempts[search_terms] = self._analyze_with_search_terms(search_terms, markup_percent, sample_limit,
+                                                                         strategy, analyze_prices)
+            result = attempts[search_terms]
             
-            if result['success'] or (result.get('current_items') and len(result['current_items']) > 0):
+            if self._has_results(result):
                 # Found results with this strategy
-                result['search_strategies_tried'] = tried_strategies
+                result['search_strategies_tried'] = tried_strategies[:index + 1]
                 result['successful_strategy'] = strategy
                 return result
             
             # If this strategy didn't work, try the next one
             print(f"Strategy '{strategy['strategy']}' with terms '{search_terms}' returned no results, trying next...")
         
-        # If no strategies worked, return the last attempt with all tried strategies
-        if best_result is None:
-            best_result = self._analyze_with_search_terms(search_strategies[0]['terms'], markup_percent, sample_limit, search_strategies[0])
-        
+        # If no strategies worked, return the first attempt with all tried strategies
+        best_result = attempts[search_strategies[0]['terms']]
         best_result['search_strategies_tried'] = tried_strategies
         best_result['message'] = f"No results found with {len(tried_strategies)} search strategies. Consider manual research."
         
         return best_result
     
-    def _analyze_with_search_terms(self, search_terms, markup_percent, sample_limit, strategy_info):
+    def _analyze_strategies_parallel(self, search_strategies, tried_strategies, markup_percent, sample_limit,
+                                     analyze_prices=True):
+        """
+        Research all search strategies concurrently and return the best result.
+        
+        Strategies with identical search terms share a single search.  The
+        comparable items found by all strategies are merged (deduplicated by
+        item_id) into merged_sold_items and merged_current_items.
+        
+        With analyze_prices False no price statistics are computed, so the
+        strategies are ranked without the price spread and the results are
+        left for complete_price_analyses().
+        """
+        unique_terms = list(dict.fromkeys(strategy['terms'] for strategy in search_strategies))
+        first_strategy = {}
+        for strategy in search_strategies:
+            first_strategy.setdefault(strategy['terms'], strategy)
+        
+        workers = max(1, min(self.config.get("max_strategy_workers", 4), len(unique_terms)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                terms: executor.submit(self._analyze_with_search_terms, terms, markup_percent,
+                                       sample_limit, first_strategy[terms], False)
+                for terms in unique_terms
+            }
+            attempts = {}
+            for terms, future in futures.items():
+                try:
+                    attempts[terms] = future.result()
+                except Exception as e:
+                    print(f"Strategy '{first_strategy[terms]['strategy']}' with terms '{terms}' failed: {e}")
+        
+        if not attempts:
+            raise RuntimeError(f"All {len(search_strategies)} search strategies failed")
+        
+        if analyze_prices:
+            # Price statistics of every strategy's comp set, which ranking uses, in one call
+            self.complete_price_analyses(attempts.values())
+        
+        # Highest quality wins; ties keep the earlier (more specific) strategy
+        ranked = [(index, strategy) for index, strategy in enumerate(search_strategies)
+                  if strategy['terms'] in attempts]
+        best_index, best_strategy = max(
+            ranked,
+            key=lambda entry: (self._result_quality(attempts[entry[1]['terms']], entry[1]), -entry[0])
+        )
+        best_result = attempts[best_strategy['terms']]
+        
+        best_result['merged_sold_items'] = CompSet.from_items(self._merge_items(
+            attempts[terms].get('sold_items') or [] for terms in unique_terms if terms in attempts))
+        best_result['merged_current_items'] = self._merge_items(
+            attempts[terms].get('current_items') or [] for terms in unique_terms if terms in attempts)
+        best_result['search_strategies_tried'] = tried_strategies
+        
+        if self._has_results(best_result):
+            best_result['successful_strategy'] = best_strategy
+        else:
+            best_result['message'] = f"No results found with {len(tried_strategies)} search strategies. Consider manual research."
+        
+        return best_result
+    
+    @staticmethod
+    def _has_results(result):
+        """Whether an analysis found sold items or at least current listings."""
+        return bool(result['success'] or result.get('current_items'))
+    
+    def _result_quality(self, result, strategy):
+        """
+        Score a strategy's analysis result for comparison.
+        
+        An analysis with at least min_results sold items beats current
+        listings only, which beats nothing.  Beyond that threshold the
+        number of sold items doesn't count: a higher confidence strategy is
+        preferred, then a tighter price spread.  Ties go to the earlier,
+        more specific strategy.
+        """
+        sold_count = len(result.get('sold_items') or [])
+        analysis = result.get('price_analysis') or {}
+        median = analysis.get('median') or 0
+        spread = analysis.get('stdev', 0) / median if median else float('inf')
+        confidence = {'high': 2, 'medium': 1}.get(strategy.get('confidence'), 0)
+        
+        return (
+            bool(result['success']) and sold_count >= self.config["min_results"],
+            bool(result.get('current_items')),
+            confidence,
+            -spread
+        )
+    
+    @staticmethod
+    def _merge_items(item_lists):
+        """Merge lists of listings, dropping repeats of the same item_id."""
+        merged = []
+        seen = set()
+        for items in item_lists:
+            for item in items:
+                item_id = item.get('item_id')
+                if item_id:
+                    if item_id in seen:
+                        continue
+                    seen.add(item_id)
+                merged.append(item)
+        return merged
+    
+    def _analyze_with_search_terms(self, search_terms, markup_percent, sample_limit, strategy_info,
+                                   analyze_prices=True):
         """
         Perform analysis with specific search terms.
+        
+        With analyze_prices False, a successful result has no price_analysis
+        or suggested_price yet; complete_price_analyses() fills them in.
         """
         if not search_terms:
             return {
@@ -662,10 +755,13 @@ class PriceAnalyzer:
             }
             
         # Analyze prices
-        price_analysis = self._analyze_prices(sold_items)
-        
-        # Calculate suggested price
-        suggested_price = self._calculate_suggested_price(price_analysis, markup)
+        price_analysis = None
+        suggested_price = None
+        if analyze_prices:
+            price_analysis = self._analyze_prices(sold_items)
+            
+            # Calculate suggested price
+            suggested_price = self._calculate_suggested_price(price_analysis, markup)
         
         # Return complete results with research tools
         result = {
@@ -765,7 +861,13 @@ class PriceAnalyzer:
                 'num': min(limit, 100)
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            if self.fetch_scheduler:
+                response = self.fetch_scheduler.get(url, params=params, check_robots=False)
+            else:
+                if self.rate_limiter:
+                    self.rate_limiter.wait(url)
+                
+                response = requests.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -814,12 +916,39 @@ class PriceAnalyzer:
         Fetch sold items from eBay.
         
         First tries unofficial API, falls back to simulated data for demo.
+        Real sold data is kept in the research cache and reused for the
+        same search.
+        
+        Returns:
+            CompSet of the sold items; its cache_key is set when the items
+            are held in the research cache
         """
-        # Try to fetch real sold data first
+        cache_key = research_cache_key("sold", search_terms, days_back=self.config["days_back"])
+        
+        # Reuse recent research for the same search
+        if self.research_cache:
+            ttl_hours = self.config.get("cache_ttl_hours")
+            cached_items = self.research_cache.get(
+                "sold", search_terms, days_back=self.config["days_back"], limit=limit,
+                max_age=ttl_hours * 3600 if ttl_hours is not None else None
+            )
+            if cached_items:
+                return CompSet.from_items(cached_items, cache_key=cache_key)
+        
+        # Try to fetch real sold data first; concurrent identical searches share one fetch
         try:
-            real_sold_items = self._fetch_real_sold_items(search_terms, limit)
+            if self.request_coalescer:
+                real_sold_items = self.request_coalescer.run(
+                    (cache_key, limit), self._fetch_real_sold_items, search_terms, limit
+                )
+            else:
+                real_sold_items = self._fetch_real_sold_items(search_terms, limit)
             if real_sold_items:
-                return real_sold_items
+                if self.research_cache:
+                    self.research_cache.put("sold", search_terms, real_sold_items,
+                                            days_back=self.config["days_back"], limit=limit)
+                    return CompSet.from_items(real_sold_items, cache_key=cache_key)
+                return CompSet.from_items(real_sold_items)
         except Exception as e:
             print(f"Note: Could not fetch real sold data ({e}), using simulated data")
         
@@ -854,9 +983,7 @@ class PriceAnalyzer:
                     "sold_date": sold_date.strftime("%Y-%m-%d"),
                     "url": verification_url,  # Use proper eBay search URL
                     "condition": random.choice(["New", "Used", "Open box", "Refurbished"]),
-                    "item_id": f"{random.randint(100000000, 999999999)}",
-                    "verification_url": verification_url,  # Additional field for research
-                    "research_notes": "Manual verification recommended via eBay sold listings search"
+                    "item_id": f"{random.randint(100000000, 999999999)}"
                 }
                 sold_items.append(item)
                 
@@ -875,7 +1002,7 @@ class PriceAnalyzer:
         # Store research template for potential export
         self.last_research_template = research_template
         
-        return sold_items
+        return CompSet.from_items(sold_items)
 
     def _fetch_current_listings(self, search_terms, limit=10):
         """
@@ -913,9 +1040,7 @@ class PriceAnalyzer:
                     "condition": random.choice(["New", "Used", "Open box", "Refurbished"]),
                     "item_id": f"{random.randint(100000000, 999999999)}",
                     "watchers": random.randint(0, 15),
-                    "views": random.randint(10, 200),
-                    "verification_url": verification_url,
-                    "research_notes": "Manual verification recommended via eBay current listings search"
+                    "views": random.randint(10, 200)
                 }
                 current_items.append(item)
                 
@@ -924,30 +1049,67 @@ class PriceAnalyzer:
         current_items = simulate_current_listings_with_verification_urls(search_terms, limit)
         return current_items
     
+    def complete_price_analyses(self, results):
+        """
+        Fill in the price statistics and suggested price of analysis results.
+        
+        Results from analyze_item(..., analyze_prices=False) are completed
+        together, so many items' comp sets are summarized in one call.
+        Results that already have a price analysis are left alone.
+        
+        Args:
+            results: Iterable of analysis result dictionaries
+            
+        Returns:
+            List of the results
+        """
+        results = list(results)
+        pending = [result for result in results
+                   if result and result.get("success") and result.get("price_analysis") is None]
+        
+        analyses = self.analyze_comp_sets([result["sold_items"] for result in pending])
+        for result, price_analysis in zip(pending, analyses):
+            result["price_analysis"] = price_analysis
+            result["suggested_price"] = self._calculate_suggested_price(price_analysis, result["markup_percent"])
+        
+        return results
+    
+    def analyze_comp_sets(self, sold_item_lists):
+        """
+        Compute price statistics for many lists of sold items in one call.
+        
+        Outliers are rejected first (the "outlier_method" config setting) and
+        weighted statistics favor recent sales ("recency_half_life_days").
+        
+        Args:
+            sold_item_lists: CompSets or lists of sold item dictionaries
+            
+        Returns:
+            List with each list's statistics dictionary (None for an empty list)
+        """
+        comp_sets = [CompSet.from_items(sold_items or []) for sold_items in sold_item_lists]
+        
+        # Prices include shipping
+        analyses = batch_price_stats(
+            [comps.total_prices() for comps in comp_sets],
+            [comps.sold_dates() for comps in comp_sets],
+            method=self.config.get("outlier_method", "iqr"),
+            half_life_days=self.config.get("recency_half_life_days", 30),
+            min_items=self.config.get("confidence_min_items", 10)
+        )
+        
+        for analysis in analyses:
+            if analysis:
+                # Indices of the kept prices don't belong in stored results
+                del analysis["kept"]
+        return analyses
+    
     def _analyze_prices(self, sold_items):
         """Analyze prices from sold items."""
         if not sold_items:
             return None
-            
-        # Extract prices (item price + shipping)
-        prices = [item["price"] + item["shipping"] for item in sold_items]
-        
-        # Calculate statistics
-        stats = {
-            "count": len(prices),
-            "min": min(prices),
-            "max": max(prices),
-            "mean": statistics.mean(prices),
-            "median": statistics.median(prices)
-        }
         
-        # Calculate standard deviation if we have enough data points
-        if len(prices) >= 2:
-            stats["stdev"] = statistics.stdev(prices)
-        else:
-            stats["stdev"] = 0
-            
-        return stats
+        return self.analyze_comp_sets([sold_items])[0]
     
     def _calculate_suggested_price(self, price_analysis, markup_percent):
         """Calculate suggested price based on analysis and markup."""
@@ -955,7 +1117,8 @@ class PriceAnalyzer:
             return None
             
         # Use median price as baseline (more robust than mean against outliers)
-        baseline = price_analysis["median"]
+        # unless the config asks for a recency weighted or trimmed baseline
+        baseline = price_analysis.get(self.config.get("price_baseline", "median")) or price_analysis["median"]
         
         # Calculate markup amount
         markup_amount = baseline * (markup_percent / 100)
@@ -1622,6 +1785,8 @@ class PriceAnalyzerGUI(tk.Toplevel):
         stats_frame.pack(fill=tk.X, padx=10, pady=5)
         
         stats_text = f"Analyzed {analysis['count']} sold items • "
+        if analysis.get("outliers"):
+            stats_text += f"{analysis['outliers']} outliers excluded • "
         stats_text += f"Range: ${analysis['min']:.2f} - ${analysis['max']:.2f} • "
         stats_text += f"Average: ${analysis['mean']:.2f} • "
         stats_text += f"Median: ${analysis['median']:.2f}"
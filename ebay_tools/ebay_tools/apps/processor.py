@@ -20,10 +20,11 @@ import uuid
 import subprocess
 import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional, Callable, Union
 
 # Import core modules
-from ebay_tools.core.schema import EbayItemSchema, load_queue, save_queue
+from ebay_tools.core.schema import EbayItemSchema, save_queue
 from ebay_tools.core.api import LLMApiClient, ApiConfig, ApiError
 from ebay_tools.core.config import ConfigManager
 from ebay_tools.core.exceptions import EbayToolsError
@@ -31,8 +32,12 @@ from ebay_tools.core.exceptions import EbayToolsError
 # Import utility modules
 from ebay_tools.utils.image_utils import open_image_with_orientation, create_thumbnail
 from ebay_tools.utils.file_utils import ensure_directory_exists, safe_load_json, safe_save_json
-from ebay_tools.utils.ui_utils import StatusBar
-from ebay_tools.utils.background_utils import BackgroundTask, BackgroundTaskManager
+from ebay_tools.utils.ui_utils import StatusBar, VirtualListbox, FullTextSearchDialog
+from ebay_tools.utils.search_utils import FullTextIndex
+from ebay_tools.utils.research_cache_utils import normalize_search_terms
+from ebay_tools.utils.fetch_utils import FetchScheduler, HostRateLimiter
+from ebay_tools.utils.comp_set_utils import pricing_summary
+from ebay_tools.utils.background_utils import BackgroundTask, BackgroundTaskManager, load_queue_in_background
 from ebay_tools.utils.launcher_utils import ToolLauncher, create_tools_menu
 from ebay_tools.utils.version_utils import show_about_dialog, PROCESSOR_FEATURES
 
@@ -85,9 +90,10 @@ class EbayLLMProcessor:
         self.current_item_index = -1
         self.current_photo_index = -1
         self.selected_items = set()  # Track selected items for processing
-        self.item_checkboxes = {}  # Store checkbox widgets
+        self.full_text_index = None  # Opened on first full-text search
         self.api_client = None  # Will be initialized with configuration
         self.processing = False
+        self.loading = False  # True while a queue file is loading in the background
         self.processing_thread = None  # For background processing
         self.thread_stop_flag = False  # Flag to stop background thread
         self.auto_pricing = False  # Flag for auto pricing process
@@ -243,13 +249,15 @@ class EbayLLMProcessor:
         self.selection_status_label = ttk.Label(selection_controls_frame, text="0 items selected")
         self.selection_status_label.pack(side=tk.LEFT, padx=20)
         
-        # Create scrollable frame for item checkboxes
-        self.items_canvas = tk.Canvas(self.selection_frame, height=150)
-        self.items_scrollbar = ttk.Scrollbar(self.selection_frame, orient="vertical", command=self.items_canvas.yview)
-        self.items_scrollable_frame = ttk.Frame(self.items_canvas)
-        self.items_canvas.configure(yscrollcommand=self.items_scrollbar.set)
-        self.items_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.items_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Item check list (only the visible rows are drawn)
+        self.item_list = VirtualListbox(
+            self.selection_frame,
+            self.get_item_selection_text,
+            is_checked=lambda index: index in self.selected_items,
+            on_toggle=self.toggle_item_selection,
+            get_badge=self.get_item_status_badge,
+            height=150
+        )
         
         # API settings widgets
         ttk.Label(self.api_frame, text="API Type:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
@@ -412,6 +420,7 @@ class EbayLLMProcessor:
         process_menu.add_command(label="Reprocess Current", command=self.reprocess_current)
         process_menu.add_separator()
         process_menu.add_command(label="Find Next Unprocessed", command=self.find_next_unprocessed)
+        process_menu.add_command(label="Full-Text Search...", command=self.open_full_text_search)
         menubar.add_cascade(label="Process", menu=process_menu)
         
         # Tools menu
@@ -571,6 +580,10 @@ class EbayLLMProcessor:
     
     def load_queue(self):
         """Load a work queue from a JSON file."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         try:
             # Ask for file
             file_path = filedialog.askopenfilename(
@@ -587,50 +600,90 @@ class EbayLLMProcessor:
             self.log(f"Error loading queue: {str(e)}")
             messagebox.showerror("Error", f"Failed to load queue: {str(e)}")
     
-    def _load_queue_from_path(self, file_path):
-        """Internal method to load queue from a specified path."""
-        try:
-            # Load and validate the queue
-            self.work_queue = load_queue(file_path)
-            self.queue_file_path = file_path
-            
-            # Save to recent paths in configuration
-            self.config_manager = ConfigManager()
-            self.config_manager.set("paths.last_queue_file", file_path)
-            self.config_manager.save()
-            
-            # Update UI
-            self.update_queue_status()
-            self.update_item_selection_list()
-            self.log(f"Loaded queue with {len(self.work_queue)} items")
-            
-            # Set current indices to first item, first photo if queue not empty
-            if self.work_queue:
-                self.current_item_index = 0
-                self.current_photo_index = 0
-                self.display_current_item()
-            else:
-                self.current_item_index = -1
-                self.current_photo_index = -1
-            
-            # Find first unprocessed item if needed
-            if self.find_next_unprocessed():
-                self.log("Found unprocessed item, navigation moved to it.")
-            
-            # Update navigation buttons
-            self.update_navigation_buttons()
-            
+    def _load_queue_from_path(self, file_path, on_loaded=None):
+        """
+        Internal method to load queue from a specified path in the background.
+        
+        The first items are shown as soon as they are parsed.  The queue file
+        path is only set once loading finishes, so nothing is saved over a
+        partially loaded queue.
+        
+        Args:
+            file_path: Path to the queue file
+            on_loaded: Optional callback once all items are loaded
+        """
+        self.loading = True
+        self.work_queue = []
+        self.queue_file_path = None
+        self.current_item_index = -1
+        self.current_photo_index = -1
+        self.update_item_selection_list()
+        self.log(f"Loading queue from {os.path.basename(file_path)}...")
+        
+        load_queue_in_background(
+            self.root, self.task_manager, file_path,
+            on_items=self._on_queue_items_loaded,
+            on_complete=lambda items, result: self._on_queue_loaded(file_path, on_loaded),
+            on_error=lambda error: self._on_queue_load_error(file_path, error)
+        )
+    
+    def _on_queue_items_loaded(self, items, start):
+        """Show queue items as they arrive from the background loader."""
+        self.work_queue = items
+        self.update_item_selection_list()
+        
+        # Show the first item right away
+        if start == 0:
+            self.current_item_index = 0
+            self.current_photo_index = 0
+            self.display_current_item()
+        
+        self.update_navigation_buttons()
+    
+    def _on_queue_loaded(self, file_path, on_loaded=None):
+        """Finish loading once all queue items are parsed."""
+        self.loading = False
+        self.queue_file_path = file_path
+        
+        # Save to recent paths in configuration
+        self.config_manager = ConfigManager()
+        self.config_manager.set("paths.last_queue_file", file_path)
+        self.config_manager.save()
+        
+        # Update UI
+        self.update_queue_status()
+        self.update_item_selection_list()
+        self.log(f"Loaded queue with {len(self.work_queue)} items")
+        
+        if not self.work_queue:
+            self.current_item_index = -1
+            self.current_photo_index = -1
+        
+        # Find first unprocessed item if needed
+        if self.find_next_unprocessed():
+            self.log("Found unprocessed item, navigation moved to it.")
+        
+        # Update navigation buttons
+        self.update_navigation_buttons()
+        
+        if on_loaded:
+            on_loaded()
+        else:
             # Show success message
             messagebox.showinfo("Success", f"Loaded {len(self.work_queue)} items from queue.")
-            return True
-        
-        except Exception as e:
-            self.log(f"Error loading queue from {file_path}: {str(e)}")
-            messagebox.showerror("Error", f"Failed to load queue: {str(e)}")
-            return False
+    
+    def _on_queue_load_error(self, file_path, error):
+        """Handle a failed background load."""
+        self.loading = False
+        self.log(f"Error loading queue from {file_path}: {str(error)}")
+        messagebox.showerror("Error", f"Failed to load queue: {str(error)}")
     
     def reload_queue(self):
         """Reload the current queue file."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading.")
+            return
+        
         if not self.queue_file_path:
             messagebox.showinfo("Info", "No queue file loaded yet.")
             return
@@ -639,8 +692,7 @@ class EbayLLMProcessor:
         current_item = self.current_item_index
         current_photo = self.current_photo_index
         
-        # Reload the file
-        if self._load_queue_from_path(self.queue_file_path):
+        def restore_position():
             # Try to restore position
             if 0 <= current_item < len(self.work_queue):
                 self.current_item_index = current_item
@@ -655,9 +707,18 @@ class EbayLLMProcessor:
                 
                 self.display_current_item()
                 self.update_navigation_buttons()
+            
+            messagebox.showinfo("Success", f"Reloaded {len(self.work_queue)} items from queue.")
+        
+        # Reload the file
+        self._load_queue_from_path(self.queue_file_path, on_loaded=restore_position)
     
     def save_queue(self):
         """Save the current work queue to a JSON file."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         if not self.work_queue:
             messagebox.showwarning("Warning", "Queue is empty. Nothing to save.")
             return
@@ -694,6 +755,36 @@ class EbayLLMProcessor:
             self.log(f"Error saving queue: {str(e)}")
             messagebox.showerror("Error", f"Failed to save queue: {str(e)}")
     
+    def open_full_text_search(self):
+        """Open the full-text search dialog."""
+        if self.full_text_index is None:
+            self.full_text_index = FullTextIndex()
+        
+        FullTextSearchDialog(self.root, self.full_text_index,
+                             lambda: (self.queue_file_path, self.work_queue),
+                             self.open_search_result)
+    
+    def open_search_result(self, queue_path, item_index):
+        """Show an item found by full-text search, loading its queue if needed."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
+        if not self.queue_file_path or FullTextIndex.queue_key(self.queue_file_path) != FullTextIndex.queue_key(queue_path):
+            if self.processing:
+                messagebox.showwarning("Processing", "Stop processing before opening another queue.")
+                return
+            if not messagebox.askyesno("Open Queue", f"Load {os.path.basename(queue_path)}?"):
+                return
+            self._load_queue_from_path(queue_path, on_loaded=lambda: self.open_search_result(queue_path, item_index))
+            return
+        
+        if 0 <= item_index < len(self.work_queue):
+            self.current_item_index = item_index
+            self.current_photo_index = 0
+            self.display_current_item()
+            self.update_navigation_buttons()
+    
     def update_queue_status(self):
         """Update the queue status display."""
         if not self.work_queue:
@@ -734,64 +825,41 @@ class EbayLLMProcessor:
             self.progress_bar["value"] = 0
     
     def update_item_selection_list(self):
-        """Update the item selection checkboxes list."""
-        # Clear existing checkboxes
-        for widget in self.items_scrollable_frame.winfo_children():
-            widget.destroy()
-        self.item_checkboxes.clear()
-        
-        # Create new checkboxes for each item
-        for i, item in enumerate(self.work_queue):
-            item_frame = ttk.Frame(self.items_scrollable_frame)
-            item_frame.pack(fill=tk.X, pady=2)
-            
-            # Create checkbox variable
-            var = tk.BooleanVar(value=i in self.selected_items)
-            
-            # Create checkbox
-            cb = ttk.Checkbutton(
-                item_frame,
-                text=f"Item {i+1}: {item.get('temp_title', item.get('title', 'Untitled'))} (SKU: {item.get('sku', 'N/A')})",
-                variable=var,
-                command=lambda idx=i, v=var: self.toggle_item_selection(idx, v)
-            )
-            cb.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            
-            # Add status indicator
-            status = "✓" if any(photo.get('processed', False) for photo in item.get('photos', [])) else "□"
-            status_label = ttk.Label(item_frame, text=status, foreground="green" if status == "✓" else "gray")
-            status_label.pack(side=tk.RIGHT, padx=5)
-            
-            self.item_checkboxes[i] = var
-        
-        # Update canvas scroll region
-        self.items_scrollable_frame.update_idletasks()
-        self.items_canvas.create_window((0, 0), window=self.items_scrollable_frame, anchor="nw")
-        self.items_canvas.configure(scrollregion=self.items_canvas.bbox("all"))
+        """Update the item selection check list."""
+        self.item_list.set_indices(range(len(self.work_queue)))
         
         # Update selection status
         self.update_selection_status()
     
-    def toggle_item_selection(self, index, var):
+    def get_item_selection_text(self, index):
+        """Get the check list text for an item."""
+        item = self.work_queue[index]
+        return f"Item {index+1}: {item.get('temp_title', item.get('title', 'Untitled'))} (SKU: {item.get('sku', 'N/A')})"
+    
+    def get_item_status_badge(self, index):
+        """Get the processed status indicator for an item."""
+        if any(photo.get('processed', False) for photo in self.work_queue[index].get('photos', [])):
+            return "✓", "green"
+        return "□", "gray"
+    
+    def toggle_item_selection(self, index):
         """Toggle item selection."""
-        if var.get():
-            self.selected_items.add(index)
-        else:
+        if index in self.selected_items:
             self.selected_items.discard(index)
+        else:
+            self.selected_items.add(index)
         self.update_selection_status()
     
     def select_all_items(self):
         """Select all items."""
         self.selected_items = set(range(len(self.work_queue)))
-        for i, var in self.item_checkboxes.items():
-            var.set(True)
+        self.item_list.refresh()
         self.update_selection_status()
     
     def deselect_all_items(self):
         """Deselect all items."""
         self.selected_items.clear()
-        for var in self.item_checkboxes.values():
-            var.set(False)
+        self.item_list.refresh()
         self.update_selection_status()
     
     def select_unprocessed_items(self):
@@ -801,11 +869,7 @@ class EbayLLMProcessor:
             # Check if any photo is processed
             if not any(photo.get('processed', False) for photo in item.get('photos', [])):
                 self.selected_items.add(i)
-                if i in self.item_checkboxes:
-                    self.item_checkboxes[i].set(True)
-            else:
-                if i in self.item_checkboxes:
-                    self.item_checkboxes[i].set(False)
+        self.item_list.refresh()
         self.update_selection_status()
     
     def update_selection_status(self):
@@ -1376,16 +1440,15 @@ class EbayLLMProcessor:
                     current_item["start_price"] = final_price
                     current_item["manually_priced"] = True
                     current_item["manually_priced_at"] = datetime.now().isoformat()
-                    current_item["pricing_data"] = {
-                        "final_price": final_price,
-                        "suggested_price": results.get("suggested_price"),
-                        "user_approved": results.get("user_approved", True),
-                        "search_terms": results.get("search_terms", ""),
-                        "price_analysis": results.get("price_analysis", {}),
-                        "sold_items_count": len(results.get("sold_items", [])),
-                        "current_items_count": len(results.get("current_items", [])),
-                        "manual_pricing": results.get("manual_pricing", False)
-                    }
+                    # Only summary statistics and a reference to the cached comps are kept
+                    current_item["pricing_data"] = pricing_summary(
+                        results,
+                        final_price=final_price,
+                        suggested_price=results.get("suggested_price"),
+                        user_approved=results.get("user_approved", True),
+                        search_terms=results.get("search_terms", ""),
+                        manual_pricing=results.get("manual_pricing", False)
+                    )
                     
                     # Auto-save the queue
                     if self.queue_file_path:
@@ -1768,6 +1831,10 @@ For item specifics, use a format like "Brand: Apple" with each item specific on
     
     def start_processing(self):
         """Start processing all unprocessed photos in the queue."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         if not self.work_queue:
             messagebox.showinfo("Info", "No queue loaded. Please load a queue first.")
             return
@@ -1790,8 +1857,12 @@ For item specifics, use a format like "Brand: Apple" with each item specific on
             process_photos = item.get("process_photos", [])
             
             for photo_idx in process_photos:
-                if photo_idx < len(photos) and not photos[photo_idx].get("processed", False):
-                    unprocessed_photos.append((i, photo_idx))
+                if photo_idx >= len(photos) or photos[photo_idx].get("processed", False):
+                    continue
+                # Near-duplicates flagged at intake would be billed twice
+                if photos[photo_idx].get("duplicate_of"):
+                    continue
+                unprocessed_photos.append((i, photo_idx))
         
         if not unprocessed_photos:
             messagebox.showinfo("Info", "No unprocessed photos found in the queue.")
@@ -2007,6 +2078,10 @@ For item specifics, use a format like "Brand: Apple" with each item specific on
     
     def start_processing_selected(self):
         """Start processing only selected items."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         if not self.selected_items:
             messagebox.showwarning("No Selection", "Please select at least one item to process.")
             return
@@ -2135,6 +2210,10 @@ For item specifics, use a format like "Brand: Apple" with each item specific on
         """Automatically price all processed items in the queue using eBay sold listings."""
         logger.info("Auto Price All button clicked")
         
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         if not self.work_queue:
             logger.warning("No queue loaded for auto pricing")
             messagebox.showinfo("Info", "No queue loaded. Please load a queue first.")
@@ -2183,7 +2262,14 @@ For item specifics, use a format like "Brand: Apple" with each item specific on
         )
     
     def _auto_price_task(self, items_to_price, report_progress, check_cancelled):
-        """Background task to automatically price items."""
+        """
+        Background task to automatically price items.
+        
+        Searches run in a worker pool that shares a per-host rate limiter.
+        Items with the same search terms share a single analysis, and the
+        queue is saved every few items instead of after each one; the price
+        statistics of each batch are computed together before it is saved.
+        """
         logger.info(f"Starting auto pricing task for {len(items_to_price)} items")
         
         try:
@@ -2197,6 +2283,7 @@ For item specifics, use a format like "Brand: Apple" with each item specific on
         
         total_items = len(items_to_price)
         priced_count = 0
+        failed_items = []
         
         try:
             analyzer = PriceAnalyzer()
@@ -2207,75 +2294,125 @@ For item specifics, use a format like "Brand: Apple" with each item specific on
             logger.error(f"Instance creation traceback: {traceback.format_exc()}")
             raise
         
-        for i, (item_index, item) in enumerate(items_to_price):
-            logger.info(f"Processing item {i+1}/{total_items}: {item.get('title', 'Unknown')[:50]}")
+        config = ConfigManager()
+        config.load()
+        max_workers = max(1, int(config.get("pricing.auto_price_workers", 4)))
+        save_every = max(1, int(config.get("pricing.auto_price_save_every", 25)))
+        analyzer.rate_limiter = HostRateLimiter(config.get("pricing.request_interval", 1.0))
+        analyzer.fetch_scheduler = FetchScheduler(
+            rate_limiter=analyzer.rate_limiter,
+            max_per_host=int(config.get("pricing.max_requests_per_host", 2)),
+            max_retries=int(config.get("pricing.max_retries", 3)))
+        
+        # Group items by search terms so each distinct search runs once;
+        # identical items share one extraction
+        try:
+            batch_strategies = analyzer.search_extractor.extract_search_terms_batch(
+                [item for _, item in items_to_price])
+        except Exception as e:
+            logger.error(f"Batch search term extraction failed: {str(e)}")
+            batch_strategies = [None] * len(items_to_price)
+        
+        groups = {}
+        for (item_index, item), strategies in zip(items_to_price, batch_strategies):
+            try:
+                if strategies:
+                    search_terms = strategies[0]['terms']
+                else:
+                    search_terms = analyzer._extract_search_terms(item)
+            except Exception as e:
+                logger.error(f"Error extracting search terms for item {item_index + 1}: {str(e)}")
+                failed_items.append((item_index, str(e)))
+                continue
+            key = normalize_search_terms(search_terms) or search_terms
+            groups.setdefault(key, (search_terms, []))[1].append((item_index, item))
+        
+        logger.info(f"{total_items} items need {len(groups)} distinct searches")
+        
+        done = len(failed_items)
+        
+        # Finished searches wait here so their price statistics are computed
+        # in one batch right before each save
+        pending = []
+        
+        def apply_pending():
+            nonlocal priced_count
+            analyzer.complete_price_analyses(results for _, _, results, _ in pending)
+            for search_terms, group, results, error in pending:
+                for item_index, item in group:
+                    if results and results.get("success"):
+                        self._apply_auto_price(item, results, search_terms)
+                        priced_count += 1
+                        logger.info(f"Successfully priced item {item_index + 1}: ${item['start_price']:.2f}")
+                    else:
+                        logger.warning(f"Price analysis failed for item {item_index + 1}. Results: {results}")
+                        failed_items.append((item_index, error or "no pricing data found"))
             
-            # Check if task was cancelled
-            if check_cancelled():
-                logger.info("Auto pricing task was cancelled")
-                break
+            if any(results and results.get("success") for _, _, results, _ in pending) and self.queue_file_path:
+                save_queue(self.work_queue, self.queue_file_path)
+                logger.debug(f"Queue saved after {priced_count} priced items")
+            pending.clear()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(analyzer.analyze_item, search_terms, analyze_prices=False): key
+                for key, (search_terms, _) in groups.items()
+            }
             
-            try:
-                # Extract search terms from item
-                logger.debug(f"Extracting search terms for item {item_index}")
-                search_terms = analyzer._extract_search_terms(item)
-                logger.info(f"Search terms extracted: {search_terms}")
+            for future in as_completed(futures):
+                search_terms, group = groups[futures[future]]
                 
-                # Report progress
-                report_progress(i, total_items, f"Pricing: {item.get('title', 'Unknown')[:50]}...")
+                try:
+                    results = future.result()
+                    error = None
+                except Exception as e:
+                    logger.error(f"Error pricing '{search_terms}': {str(e)}")
+                    logger.error(f"Error traceback: {traceback.format_exc()}")
+                    results = None
+                    error = str(e)
                 
-                # Analyze prices
-                logger.info(f"Starting price analysis for: {search_terms}")
-                results = analyzer.analyze_item(search_terms)
-                logger.info(f"Price analysis results: {results}")
+                pending.append((search_terms, group, results, error))
                 
-                if results and results.get("success"):
-                    # Use final_price if available (from user approval), otherwise use suggested_price
-                    final_price = results.get("final_price", results["suggested_price"])
-                    suggested_price = results["suggested_price"]
-                    logger.info(f"Successfully got price: ${final_price:.2f} (suggested: ${suggested_price:.2f})")
-                    
-                    # Update item with pricing info
-                    item["start_price"] = final_price
-                    item["auto_priced"] = True
-                    item["auto_priced_at"] = datetime.now().isoformat()
-                    item["pricing_data"] = {
-                        "final_price": final_price,
-                        "suggested_price": suggested_price,
-                        "user_approved": results.get("user_approved", False),
-                        "search_terms": search_terms,
-                        "price_analysis": results.get("price_analysis", {}),
-                        "sold_items_count": len(results.get("sold_items", [])),
-                        "current_items_count": len(results.get("current_items", []))
-                    }
-                    
-                    priced_count += 1
-                    self.log(f"Auto-priced item {item_index + 1}: ${final_price:.2f}")
-                    logger.info(f"Successfully priced item {item_index + 1}: ${final_price:.2f}")
-                else:
-                    logger.warning(f"Price analysis failed for item {item_index + 1}. Results: {results}")
-                    self.log(f"Could not price item {item_index + 1}: {item.get('title', 'Unknown')}")
-                
-                # Auto-save queue after each pricing
-                if self.queue_file_path:
-                    save_queue(self.work_queue, self.queue_file_path)
-                    logger.debug(f"Queue saved after pricing item {item_index + 1}")
+                done += len(group)
+                report_progress(done, total_items, f"Priced: {group[0][1].get('title', 'Unknown')[:50]}...")
                 
-                # Delay to avoid rate limiting
-                logger.debug("Waiting 2 seconds before next item...")
-                time.sleep(2)
+                # Apply and save in batches rather than after every item
+                if sum(len(entry[1]) for entry in pending) >= save_every:
+                    apply_pending()
                 
-            except Exception as e:
-                logger.error(f"Error pricing item {item_index + 1}: {str(e)}")
-                logger.error(f"Error traceback: {traceback.format_exc()}")
-                self.log(f"Error pricing item {item_index + 1}: {str(e)}")
-                continue
+                if check_cancelled():
+                    logger.info("Auto pricing task was cancelled")
+                    for other in futures:
+                        other.cancel()
+                    break
+        
+        if pending:
+            apply_pending()
         
         return {
             "total": total_items,
-            "priced": priced_count
+            "priced": priced_count,
+            "failed": sorted(failed_items)
         }
     
+    def _apply_auto_price(self, item, results, search_terms):
+        """Store a successful price analysis on an item."""
+        # Use final_price if available (from user approval), otherwise use suggested_price
+        final_price = results.get("final_price", results["suggested_price"])
+        suggested_price = results["suggested_price"]
+        
+        # Update item with pricing info
+        item["start_price"] = final_price
+        item["auto_priced"] = True
+        item["auto_priced_at"] = datetime.now().isoformat()
+        item["pricing_data"] = pricing_summary(
+            results,
+            final_price=final_price,
+            suggested_price=suggested_price,
+            user_approved=results.get("user_approved", False),
+            search_terms=search_terms
+        )
+    
     def _update_auto_pricing_progress(self, current, total, message):
         """Update progress during auto pricing."""
         progress_pct = (current / total) * 100 if total > 0 else 0
@@ -2293,6 +2430,9 @@ For item specifics, use a format like "Brand: Apple" with each item specific on
         self.time_remaining_label.config(text="")
         
         # Show results
+        for item_index, reason in result.get('failed', []):
+            self.log(f"Could not price item {item_index + 1}: {reason}")
+        
         final_message = f"Auto pricing completed: {result['priced']}/{result['total']} items priced"
         self.log(final_message)
         messagebox.showinfo("Auto Pricing Complete", final_message)
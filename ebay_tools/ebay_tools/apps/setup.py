@@ -16,18 +16,25 @@ from typing import Dict, List, Any, Optional
 import uuid
 
 # Import core modules
-from ebay_tools.core.schema import EbayItemSchema, load_queue, save_queue
+from ebay_tools.core.schema import EbayItemSchema, save_queue
 from ebay_tools.core.config import ConfigManager
 from ebay_tools.core.exceptions import EbayToolsError, FileError, ValidationError
 
 # Import utility modules
 from ebay_tools.utils.image_utils import open_image_with_orientation, create_thumbnail, create_photo_image
 from ebay_tools.utils.file_utils import ensure_directory_exists, safe_load_json, safe_save_json
-from ebay_tools.utils.ui_utils import StatusBar, PhotoFrame, ProgressIndicator, show_error, show_info, ask_yes_no
-from ebay_tools.utils.background_utils import BackgroundTask, BackgroundTaskManager
+from ebay_tools.utils.ui_utils import StatusBar, PhotoFrame, ProgressIndicator, VirtualListbox, show_error, show_info, ask_yes_no
+from ebay_tools.utils.background_utils import BackgroundTask, BackgroundTaskManager, load_queue_in_background
+from ebay_tools.utils.search_utils import QueueSearchIndex
+from ebay_tools.utils.dedup_utils import (
+    PhotoHashCache, classify_by_path, classify_new_photos, get_photo_path, scan_queue_for_duplicates
+)
 from ebay_tools.utils.launcher_utils import ToolLauncher, create_tools_menu
 from ebay_tools.utils.version_utils import create_help_menu, SETUP_FEATURES
 
+# Import the export engine
+from ebay_tools.apps.ebay_csv_export import STANDARD_CSV_FIELDS, export_items
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -53,6 +60,7 @@ class EbayWorkQueueSetup:
         # Initialize variables
         self.queue_file_path = None
         self.work_queue = []
+        self.search_index = None  # Built on first filter after the queue changes
         self.current_item_index = -1
         self.photo_directory = None
         self.current_photos = []
@@ -64,6 +72,10 @@ class EbayWorkQueueSetup:
         
         # Initialize background task manager
         self.task_manager = BackgroundTaskManager(root)
+        self.loading = False  # True while a queue file is loading in the background
+        
+        # Perceptual hash cache for duplicate photo detection
+        self.photo_hash_cache = PhotoHashCache()
         
         # Create the UI
         self.create_menu()
@@ -104,6 +116,7 @@ class EbayWorkQueueSetup:
         # Tools menu
         tools_menu = tk.Menu(menubar, tearoff=0)
         tools_menu.add_command(label="Validate All Items", command=self.validate_all_items)
+        tools_menu.add_command(label="Find Duplicate Photos", command=self.find_duplicate_photos)
         tools_menu.add_command(label="Export to CSV", command=self.export_to_csv)
         tools_menu.add_separator()
         
@@ -181,13 +194,7 @@ class EbayWorkQueueSetup:
         list_frame = ttk.Frame(self.left_frame)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.item_listbox = tk.Listbox(list_frame, selectmode=tk.SINGLE, exportselection=0)
-        self.item_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.item_listbox.bind("<<ListboxSelect>>", self.on_item_select)
-        
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.item_listbox.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.item_listbox.config(yscrollcommand=scrollbar.set)
+        self.item_listbox = VirtualListbox(list_frame, self.get_item_display_text, on_select=self.on_item_select)
         
         # Navigation buttons
         nav_frame = ttk.Frame(self.left_frame)
@@ -414,15 +421,14 @@ class EbayWorkQueueSetup:
 
     def update_item_listbox(self):
         """Update the item listbox with current queue items."""
-        self.item_listbox.delete(0, tk.END)
+        # The queue changed, so the search index is rebuilt on the next filter
+        self.search_index = None
         
-        for item in self.work_queue:
-            # Display title or temp_title
-            display_title = item.get("title", "") or item.get("temp_title", "Untitled Item")
-            sku = item.get("sku", "")
-            display_text = f"{sku}: {display_title}" if sku else display_title
-            
-            self.item_listbox.insert(tk.END, display_text)
+        if self.filter_var.get():
+            self.apply_filter()
+        else:
+            self.item_listbox.set_indices(range(len(self.work_queue)))
+            self.item_listbox.select(self.current_item_index if self.current_item_index >= 0 else None)
         
         # Update count label
         self.count_label.config(text=f"{len(self.work_queue)} items in queue")
@@ -430,36 +436,29 @@ class EbayWorkQueueSetup:
         # Update navigation buttons
         self.update_navigation_buttons()
 
+    def get_item_display_text(self, index):
+        """Get the listbox text for a queue item."""
+        item = self.work_queue[index]
+        
+        # Display title or temp_title
+        display_title = item.get("title", "") or item.get("temp_title", "Untitled Item")
+        sku = item.get("sku", "")
+        return f"{sku}: {display_title}" if sku else display_title
+
     def apply_filter(self, event=None):
         """Filter items based on the filter text."""
-        filter_text = self.filter_var.get().lower()
+        if self.search_index is None:
+            self.search_index = QueueSearchIndex(self.work_queue)
         
-        self.item_listbox.delete(0, tk.END)
-        
-        for item in self.work_queue:
-            # Get display text elements
-            title = item.get("title", "").lower()
-            temp_title = item.get("temp_title", "").lower() 
-            sku = item.get("sku", "").lower()
-            
-            # Check if filter matches any field
-            if (filter_text in title or 
-                filter_text in temp_title or 
-                filter_text in sku):
-                # Display title or temp_title
-                display_title = item.get("title", "") or item.get("temp_title", "Untitled Item")
-                display_text = f"{sku}: {display_title}" if sku else display_title
-                
-                self.item_listbox.insert(tk.END, display_text)
+        # Rows map back to queue indices, so selection works while filtered
+        self.item_listbox.set_indices(self.search_index.search(self.filter_var.get()))
+        self.item_listbox.select(self.current_item_index if self.current_item_index >= 0 else None)
 
-    def on_item_select(self, event):
+    def on_item_select(self, index):
         """Handle item selection in listbox."""
-        selection = self.item_listbox.curselection()
-        if selection:
-            index = selection[0]
-            self.current_item_index = index
-            self.display_current_item()
-            self.update_navigation_buttons()
+        self.current_item_index = index
+        self.display_current_item()
+        self.update_navigation_buttons()
 
     def display_current_item(self):
         """Display the current item's details in the UI."""
@@ -585,6 +584,10 @@ class EbayWorkQueueSetup:
                 # Add photo index label
                 ttk.Label(photo_container, text=f"Photo {i+1}").pack()
                 
+                # Mark near-duplicates of photos in other items
+                if photo.get("duplicate_of"):
+                    ttk.Label(photo_container, text="Duplicate", foreground="red").pack()
+                
                 # Add select checkbox
                 proc_var = tk.BooleanVar(value=i in item.get("process_photos", []))
                 ttk.Checkbutton(photo_container, text="Process", variable=proc_var, 
@@ -662,9 +665,7 @@ class EbayWorkQueueSetup:
         self.update_navigation_buttons()
         
         # Update selection in listbox
-        self.item_listbox.selection_clear(0, tk.END)
-        self.item_listbox.selection_set(self.current_item_index)
-        self.item_listbox.see(self.current_item_index)
+        self.item_listbox.select(self.current_item_index)
 
     def next_item(self):
         """Navigate to the next item."""
@@ -680,9 +681,7 @@ class EbayWorkQueueSetup:
         self.update_navigation_buttons()
         
         # Update selection in listbox
-        self.item_listbox.selection_clear(0, tk.END)
-        self.item_listbox.selection_set(self.current_item_index)
-        self.item_listbox.see(self.current_item_index)
+        self.item_listbox.select(self.current_item_index)
 
     def save_current_item(self):
         """Save the current item data from UI to the queue."""
@@ -740,6 +739,10 @@ class EbayWorkQueueSetup:
 
     def new_queue(self):
         """Create a new empty queue."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         # Ask to save current queue if modified
         if self.work_queue:
             if messagebox.askyesno("Confirm", "Do you want to save the current queue first?"):
@@ -757,6 +760,10 @@ class EbayWorkQueueSetup:
 
     def load_queue(self):
         """Load a queue from a file."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         # Ask to save current queue if modified
         if self.work_queue:
             if messagebox.askyesno("Confirm", "Do you want to save the current queue first?"):
@@ -773,40 +780,78 @@ class EbayWorkQueueSetup:
             self._load_queue_from_path(file_path)
 
     def _load_queue_from_path(self, file_path):
-        """Load a queue from the specified path."""
-        try:
-            # Load and validate the queue
-            queue_data = load_queue(file_path)
-            
-            # Update app state
-            self.work_queue = queue_data
-            self.queue_file_path = file_path
-            self.current_item_index = 0 if queue_data else -1
-            
-            # Update config
-            self.config_manager.set("paths.last_queue_file", file_path)
-            self.config_manager.save()
-            
-            # Update UI
-            self.update_item_listbox()
-            if self.current_item_index >= 0:
-                self.display_current_item()
-                
-                # Select the first item in the listbox
-                self.item_listbox.selection_clear(0, tk.END)
-                self.item_listbox.selection_set(0)
-            else:
-                self.clear_item_fields()
-            
-            # Log success
-            self.status_bar.update(f"Loaded {len(queue_data)} items from {os.path.basename(file_path)}")
-            
-        except Exception as e:
-            logger.error(f"Error loading queue from {file_path}: {str(e)}")
-            messagebox.showerror("Error", f"Failed to load queue: {str(e)}")
+        """
+        Load a queue from the specified path in the background.
+        
+        The first items can be edited as soon as they are parsed.  The queue
+        file path is only set once loading finishes, so nothing is saved over
+        a partially loaded queue.
+        """
+        self.loading = True
+        self.work_queue = []
+        self.queue_file_path = None
+        self.current_item_index = -1
+        self.update_item_listbox()
+        self.clear_item_fields()
+        self.status_bar.update(f"Loading {os.path.basename(file_path)}...")
+        
+        load_queue_in_background(
+            self.root, self.task_manager, file_path,
+            on_items=self._on_queue_items_loaded,
+            on_complete=lambda items, index: self._on_queue_loaded(file_path, index),
+            on_error=lambda error: self._on_queue_load_error(file_path, error),
+            post_process=QueueSearchIndex
+        )
+
+    def _on_queue_items_loaded(self, items, start):
+        """Show queue items as they arrive from the background loader."""
+        self.work_queue = items
+        
+        if start == 0:
+            self.current_item_index = 0
+            self.display_current_item()
+        
+        if not self.filter_var.get():
+            self.item_listbox.set_indices(range(len(items)))
+            if start == 0:
+                self.item_listbox.select(0)
+        
+        self.count_label.config(text=f"{len(items)} items in queue (loading...)")
+        self.update_navigation_buttons()
+
+    def _on_queue_loaded(self, file_path, search_index):
+        """Finish loading once all queue items are parsed and indexed."""
+        self.loading = False
+        self.queue_file_path = file_path
+        
+        # Update config
+        self.config_manager.set("paths.last_queue_file", file_path)
+        self.config_manager.save()
+        
+        # Update UI, reusing the index built while loading
+        self.search_index = search_index
+        if self.filter_var.get():
+            self.apply_filter()
+        else:
+            self.item_listbox.set_indices(range(len(self.work_queue)))
+        self.count_label.config(text=f"{len(self.work_queue)} items in queue")
+        self.update_navigation_buttons()
+        
+        # Log success
+        self.status_bar.update(f"Loaded {len(self.work_queue)} items from {os.path.basename(file_path)}")
+
+    def _on_queue_load_error(self, file_path, error):
+        """Handle a failed background load."""
+        self.loading = False
+        logger.error(f"Error loading queue from {file_path}: {str(error)}")
+        messagebox.showerror("Error", f"Failed to load queue: {str(error)}")
 
     def save_queue(self):
         """Save the queue to the current file or prompt for a new file name."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return False
+        
         if not self.queue_file_path:
             return self.save_queue_as()
         
@@ -825,6 +870,10 @@ class EbayWorkQueueSetup:
 
     def save_queue_as(self):
         """Prompt for a file name and save the queue."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return False
+        
         if not self.work_queue:
             messagebox.showinfo("Info", "Queue is empty. Nothing to save.")
             return False
@@ -851,6 +900,10 @@ class EbayWorkQueueSetup:
 
     def add_new_item(self):
         """Add a new empty item to the queue."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         # Create a new item
         new_item = EbayItemSchema.create_empty_item()
         
@@ -865,9 +918,7 @@ class EbayWorkQueueSetup:
         self.display_current_item()
         
         # Select in listbox
-        self.item_listbox.selection_clear(0, tk.END)
-        self.item_listbox.selection_set(self.current_item_index)
-        self.item_listbox.see(self.current_item_index)
+        self.item_listbox.select(self.current_item_index)
         
         # Update status
         self.status_bar.update("Added new item")
@@ -878,6 +929,10 @@ class EbayWorkQueueSetup:
 
     def delete_current_item(self):
         """Delete the current item from the queue."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         if self.current_item_index < 0 or self.current_item_index >= len(self.work_queue):
             return
         
@@ -899,9 +954,7 @@ class EbayWorkQueueSetup:
             self.display_current_item()
             
             # Select in listbox
-            self.item_listbox.selection_clear(0, tk.END)
-            self.item_listbox.selection_set(self.current_item_index)
-            self.item_listbox.see(self.current_item_index)
+            self.item_listbox.select(self.current_item_index)
         else:
             self.clear_item_fields()
         
@@ -914,6 +967,10 @@ class EbayWorkQueueSetup:
 
     def add_photos(self):
         """Add photos to the current item."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         if self.current_item_index < 0 or self.current_item_index >= len(self.work_queue):
             messagebox.showinfo("Info", "No item selected")
             return
@@ -944,18 +1001,47 @@ class EbayWorkQueueSetup:
         if "photos" not in item:
             item["photos"] = []
         
+        # Check the new photos for near-duplicates in the background; the
+        # queue is snapshotted so the worker never reads lists being edited
+        file_paths = list(file_paths)
+        item_index = self.current_item_index
+        snapshot = [{"photos": list(queue_item.get("photos", []))} for queue_item in self.work_queue]
+        self.status_bar.update(f"Checking {len(file_paths)} photos for duplicates...")
+        
+        def check_task(report_progress, check_cancelled):
+            return classify_new_photos(file_paths, snapshot, item_index, self.photo_hash_cache)
+        
+        def on_error(e):
+            logger.error(f"Duplicate photo check failed: {str(e)}")
+            self._add_checked_photos(item, classify_by_path(file_paths, item["photos"]))
+        
+        self.task_manager.create_and_start_task(
+            name="Check Photos",
+            target_function=check_task,
+            on_complete=lambda checks: self._add_checked_photos(item, checks),
+            on_error=on_error
+        )
+
+    def _add_checked_photos(self, item, checks):
+        """Add photos to an item once their duplicate check is done."""
+        # The item may have been deleted while the photos were checked
+        if not any(queue_item is item for queue_item in self.work_queue):
+            self.status_bar.update("Item was removed before its photos could be added")
+            return
+        
+        # Photos added to the item while the check ran count as existing ones
+        current = classify_by_path([check["path"] for check in checks], item["photos"])
+        
         # Add each photo
         added_count = 0
-        for path in file_paths:
+        skipped = []
+        flagged = []
+        for check, path_check in zip(checks, current):
+            path = check["path"]
             try:
-                # Check if this photo path already exists in the item
-                duplicate = False
-                for photo in item["photos"]:
-                    if photo.get("path") == path:
-                        duplicate = True
-                        break
-                
-                if duplicate:
+                # Skip photos that duplicate one already in this item
+                if check["status"] == "duplicate_in_item" or path_check["status"] != "unique":
+                    skipped.append(path)
                     continue
                 
                 # Create a photo object
@@ -965,6 +1051,11 @@ class EbayWorkQueueSetup:
                     "context": ""
                 }
                 
+                # Flag photos that duplicate one in another item
+                if check["status"] == "duplicate_in_queue":
+                    photo["duplicate_of"] = check["duplicate_of"]
+                    flagged.append((path, check["duplicate_item_index"]))
+                
                 # Add to the item
                 item["photos"].append(photo)
                 added_count += 1
@@ -973,11 +1064,98 @@ class EbayWorkQueueSetup:
                 logger.error(f"Error adding photo {path}: {str(e)}")
                 messagebox.showerror("Error", f"Failed to add photo {os.path.basename(path)}: {str(e)}")
         
-        # Update UI
-        self.display_photos(item)
+        # Update UI if the item is still the one shown
+        if 0 <= self.current_item_index < len(self.work_queue) and self.work_queue[self.current_item_index] is item:
+            self.display_photos(item)
         
         # Update status
-        self.status_bar.update(f"Added {added_count} photos")
+        status = f"Added {added_count} photos"
+        if skipped:
+            status += f", skipped {len(skipped)} duplicates"
+        if flagged:
+            status += f", flagged {len(flagged)} as duplicates of other items"
+        self.status_bar.update(status)
+        
+        if flagged:
+            details = "\n".join(f"{os.path.basename(path)} (matches item {other + 1})"
+                                 for path, other in flagged[:10])
+            messagebox.showwarning(
+                "Duplicate Photos",
+                f"{len(flagged)} photo(s) look like photos already in other items and were "
+                f"flagged so they won't be processed:\n\n{details}"
+            )
+        
+        # Auto-save if we have a queue file
+        if self.queue_file_path:
+            self.save_queue()
+
+    def find_duplicate_photos(self):
+        """Scan the whole queue for near-duplicate photos in the background."""
+        if not self.work_queue:
+            messagebox.showinfo("Info", "Queue is empty")
+            return
+        
+        self.status_bar.update("Scanning queue for duplicate photos...")
+        
+        # Scan a snapshot so the worker never reads lists being edited
+        snapshot = [{"photos": list(item.get("photos", []))} for item in self.work_queue]
+        
+        def scan_task(report_progress, check_cancelled):
+            return scan_queue_for_duplicates(snapshot, self.photo_hash_cache,
+                                             report_progress=report_progress,
+                                             check_cancelled=check_cancelled)
+        
+        self.task_manager.create_and_start_task(
+            name="Find Duplicate Photos",
+            target_function=scan_task,
+            on_progress=lambda current, total, message: self.status_bar.update(message),
+            on_complete=self._on_duplicate_scan_complete,
+            on_error=lambda e: show_error("Error", f"Duplicate scan failed: {str(e)}", self.root)
+        )
+
+    def _on_duplicate_scan_complete(self, duplicates):
+        """Flag duplicates found by the queue scan and exclude them from processing."""
+        if not duplicates:
+            self.status_bar.update("No duplicate photos found")
+            show_info("Duplicate Photos", "No duplicate photos found in the queue.", self.root)
+            return
+        
+        lines = []
+        for dup in duplicates[:15]:
+            lines.append(f"{os.path.basename(dup['path'])} = {os.path.basename(dup['duplicate_of']['path'])}")
+        if len(duplicates) > 15:
+            lines.append(f"...and {len(duplicates) - 15} more")
+        
+        if not ask_yes_no(
+            "Duplicate Photos",
+            f"Found {len(duplicates)} near-duplicate photo(s):\n\n" + "\n".join(lines) +
+            "\n\nFlag them and remove them from processing?",
+            self.root
+        ):
+            return
+        
+        # Items and photos may have moved while the scan ran, so duplicates
+        # are found again by path; the first copy of a repeated file stays
+        # the original
+        originals = {dup["path"]: dup["duplicate_of"]["path"] for dup in duplicates}
+        kept = set()
+        flagged = 0
+        for item in self.work_queue:
+            for photo_idx, photo in enumerate(item.get("photos", [])):
+                path = get_photo_path(photo)
+                if path not in originals:
+                    continue
+                if originals[path] == path and path not in kept:
+                    kept.add(path)
+                    continue
+                if isinstance(photo, dict):
+                    photo["duplicate_of"] = originals[path]
+                if photo_idx in item.get("process_photos", []):
+                    item["process_photos"].remove(photo_idx)
+                flagged += 1
+        
+        self.display_current_item()
+        self.status_bar.update(f"Flagged {flagged} duplicate photos")
         
         # Auto-save if we have a queue file
         if self.queue_file_path:
@@ -1291,9 +1469,7 @@ class EbayWorkQueueSetup:
                 self.display_current_item()
                 
                 # Select in listbox
-                self.item_listbox.selection_clear(0, tk.END)
-                self.item_listbox.selection_set(self.current_item_index)
-                self.item_listbox.see(self.current_item_index)
+                self.item_listbox.select(self.current_item_index)
                 
                 dialog.destroy()
             
@@ -1319,54 +1495,17 @@ class EbayWorkQueueSetup:
         if not file_path:
             return
         
-        try:
-            import csv
-            
-            # Get all field names
-            fieldnames = set(["CustomLabel", "Title", "PicURL", "Category", 
-                              "ConditionID", "ConditionDescription", 
-                              "Format", "Duration", "StartPrice", "Quantity"])
-            
-            # Add all item specifics fields
-            for item in self.work_queue:
-                if "item_specifics" in item:
-                    for name in item["item_specifics"].keys():
-                        fieldnames.add(f"C:{name}")
-            
-            # Sort fieldnames
-            fieldnames = sorted(list(fieldnames))
-            
-            # Write CSV
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for item in self.work_queue:
-                    # Convert item to CSV format
-                    row = EbayItemSchema.to_csv_row(item)
-                    
-                    # Add photo URLs
-                    photos = item.get("photos", [])
-                    if photos:
-                        pic_urls = []
-                        for photo in photos:
-                            path = photo.get("path", "")
-                            if path:
-                                # Just use local path for now - would need to be replaced with actual URLs
-                                pic_urls.append(path)
-                        
-                        if pic_urls:
-                            row["PicURL"] = "|".join(pic_urls)
-                    
-                    # Write row
-                    writer.writerow(row)
-            
-            # Show success message
+        # The standard eBay columns are always written, and the photos as local
+        # paths for now - they would need to be replaced with actual URLs
+        success, message = export_items(self.work_queue, file_path, "csv",
+                                        default_values=dict.fromkeys(STANDARD_CSV_FIELDS, ""),
+                                        extra_columns=["PicURL"])
+        
+        if success:
             messagebox.showinfo("Export", f"Successfully exported {len(self.work_queue)} items to CSV.")
-            
-        except Exception as e:
-            logger.error(f"Error exporting to CSV: {str(e)}")
-            messagebox.showerror("Error", f"Failed to export to CSV: {str(e)}")
+        else:
+            logger.error(f"Error exporting to CSV: {message}")
+            messagebox.showerror("Error", f"Failed to export to CSV: {message}")
     
     def launch_processor(self):
         """Launch the LLM Processor with current queue file."""
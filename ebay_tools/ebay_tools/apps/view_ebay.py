@@ -28,6 +28,9 @@ from ebay_tools.core.config import ConfigManager
 from ebay_tools.utils.image_utils import open_image_with_orientation, fit_image_to_frame, create_photo_image
 from ebay_tools.utils.ui_utils import StatusBar, center_window
 
+# Import the export engine
+from ebay_tools.apps.ebay_csv_export import export_items
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -1046,40 +1049,15 @@ class EbayJsonViewer:
         if not file_path:
             return
         
-        try:
-            import csv
-            
-            # Convert item to CSV row format
-            row = EbayItemSchema.to_csv_row(item)
-            
-            # Add photo URLs if available
-            photos = item.get("photos", [])
-            if photos:
-                pic_urls = []
-                for photo in photos:
-                    path = photo.get("path", "")
-                    if path:
-                        pic_urls.append(path)
-                
-                if pic_urls:
-                    row["PicURL"] = "|".join(pic_urls)
-            
-            # Get all field names
-            fieldnames = sorted(row.keys())
-            
-            # Write CSV file
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerow(row)
-            
-            # Show confirmation
+        # Same eBay File Exchange columns as the export tool, with the photo paths
+        success, message = export_items([item], file_path, "csv", extra_columns=["PicURL"])
+        
+        if success:
             self.status_bar.update(f"Item exported to {os.path.basename(file_path)}")
             messagebox.showinfo("Export Complete", "Item successfully exported as CSV.")
-            
-        except Exception as e:
-            logger.error(f"Error exporting CSV: {str(e)}")
-            messagebox.showerror("Error", f"Failed to export CSV: {str(e)}")
+        else:
+            logger.error(f"Error exporting CSV: {message}")
+            messagebox.showerror("Error", f"Failed to export CSV: {message}")
     
     def show_about(self):
         """Show the about dialog."""
@@ -21,15 +21,20 @@ if __name__ == "__main__":
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import core modules
-from ebay_tools.core.schema import EbayItemSchema, load_queue
+from ebay_tools.core.schema import EbayItemSchema
 from ebay_tools.core.config import ConfigManager
 
 # Import utility modules
 from ebay_tools.utils.image_utils import open_image_with_orientation, fit_image_to_frame, create_photo_image
-from ebay_tools.utils.ui_utils import StatusBar, center_window
+from ebay_tools.utils.ui_utils import StatusBar, VirtualListbox, FullTextSearchDialog, center_window
+from ebay_tools.utils.search_utils import QueueSearchIndex, FullTextIndex
+from ebay_tools.utils.background_utils import BackgroundTaskManager, load_queue_in_background
 from ebay_tools.utils.launcher_utils import ToolLauncher, create_tools_menu
 from ebay_tools.utils.version_utils import show_about_dialog, VIEWER_FEATURES
 
+# Import the export engine
+from ebay_tools.apps.ebay_csv_export import export_items
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -59,6 +64,11 @@ class EbayJsonViewer:
         
         # Initialize variables
         self.items = []
+        self.current_file = None
+        self.loading = False  # True while a queue file is loading in the background
+        self.search_index = QueueSearchIndex([])
+        self.full_text_index = None  # Opened on first full-text search
+        self.filtered_indices = []
         self.current_index = 0
         self.current_photo_index = 0
         self.current_photo_image = None  # Store reference to prevent garbage collection
@@ -78,6 +88,9 @@ class EbayJsonViewer:
         # Create status bar
         self.status_bar = StatusBar(self.root, "Ready")
         
+        # Background task manager for file loading
+        self.task_manager = BackgroundTaskManager(root)
+        
         # Load file if provided
         if file_path:
             self.load_file(file_path)
@@ -118,6 +131,8 @@ class EbayJsonViewer:
         tools_menu.add_command(label="Export All Descriptions", command=self.export_all_descriptions)
         tools_menu.add_command(label="Export Item as CSV", command=self.export_item_as_csv)
         tools_menu.add_separator()
+        tools_menu.add_command(label="Full-Text Search...", command=self.open_full_text_search)
+        tools_menu.add_separator()
         
         # Add launch options for other tools
         tools_menu.add_command(label="Launch Setup", command=lambda: ToolLauncher.launch_setup())
@@ -218,13 +233,7 @@ class EbayJsonViewer:
         list_frame = ttk.Frame(self.left_frame)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.item_listbox = tk.Listbox(list_frame, selectmode=tk.SINGLE)
-        self.item_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.item_listbox.bind("<<ListboxSelect>>", self.on_item_select)
-        
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.item_listbox.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.item_listbox.config(yscrollcommand=scrollbar.set)
+        self.item_listbox = VirtualListbox(list_frame, self.get_item_display_text, on_select=self.on_item_select)
         
         # Navigation frame
         nav_frame = ttk.Frame(self.left_frame)
@@ -417,6 +426,10 @@ class EbayJsonViewer:
     
     def open_file(self):
         """Open a file dialog to select a JSON file."""
+        if self.loading:
+            messagebox.showinfo("Info", "The queue is still loading. Please wait until it has finished.")
+            return
+        
         file_path = filedialog.askopenfilename(
             title="Open eBay Queue File",
             filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
@@ -426,110 +439,135 @@ class EbayJsonViewer:
         if file_path:
             self.load_file(file_path)
     
-    def load_file(self, file_path):
-        """Load items from a JSON file."""
-        try:
-            # Load the items using the schema loader
-            self.items = load_queue(file_path)
-            
-            # Update the config
-            self.config_manager.set("paths.last_queue_file", file_path)
-            self.config_manager.save()
-            
-            # Update the item listbox
-            self.update_item_listbox()
-            
-            # Set current index to first item
-            if self.items:
-                self.current_index = 0
-                self.current_photo_index = 0
-                self.display_current_item()
-            
-            # Update status
-            self.status_bar.update(f"Loaded {len(self.items)} items from {os.path.basename(file_path)}")
-            
-        except Exception as e:
-            logger.error(f"Error loading file: {str(e)}")
-            messagebox.showerror("Error", f"Failed to load file: {str(e)}")
+    def load_file(self, file_path, on_loaded=None):
+        """
+        Load items from a JSON file in the background.
+        
+        The first items are shown as soon as they are parsed; the list fills
+        in and the search index is built while the rest of the file loads.
+        
+        Args:
+            file_path: Path to the queue file
+            on_loaded: Optional callback once all items are loaded
+        """
+        self.loading = True
+        self.items = []
+        self.current_file = file_path
+        self.current_index = 0
+        self.current_photo_index = 0
+        self.search_index = QueueSearchIndex([])
+        self.item_listbox.set_indices([])
+        self.status_bar.update(f"Loading {os.path.basename(file_path)}...")
+        
+        load_queue_in_background(
+            self.root, self.task_manager, file_path,
+            on_items=self._on_items_loaded,
+            on_complete=lambda items, index: self._on_file_loaded(file_path, index, on_loaded),
+            on_error=self._on_file_load_error,
+            post_process=QueueSearchIndex
+        )
+    
+    def _on_items_loaded(self, items, start):
+        """Show items as they arrive from the background loader."""
+        self.items = items
+        
+        # Until the search index is ready every loaded item is listed
+        self.item_listbox.set_indices(range(len(items)))
+        self.status_count.config(text=f"{len(items)} items (loading...)")
+        
+        if start == 0:
+            self.display_current_item()
+            self.item_listbox.select(self.current_index)
+    
+    def _on_file_loaded(self, file_path, search_index, on_loaded=None):
+        """Finish loading once all items are parsed and indexed."""
+        self.loading = False
+        self.search_index = search_index
+        
+        # Update the config
+        self.config_manager.set("paths.last_queue_file", file_path)
+        self.config_manager.save()
+        
+        # Apply the current filters now that the index is ready
+        self.update_item_listbox()
+        if not self.items:
+            self.display_current_item()
+        
+        # Update status
+        self.status_bar.update(f"Loaded {len(self.items)} items from {os.path.basename(file_path)}")
+        
+        if on_loaded:
+            on_loaded()
+    
+    def _on_file_load_error(self, error):
+        """Handle a failed background load."""
+        self.loading = False
+        logger.error(f"Error loading file: {str(error)}")
+        messagebox.showerror("Error", f"Failed to load file: {str(error)}")
     
     def update_item_listbox(self):
         """Update the item listbox with filtered items."""
-        self.item_listbox.delete(0, tk.END)
+        if self.loading:
+            # Filters are applied once loading finishes
+            return
         
-        filter_text = self.filter_var.get().lower()
         show_processed = self.show_processed_var.get()
         show_unprocessed = self.show_unprocessed_var.get()
         
-        filtered_items = []
-        for i, item in enumerate(self.items):
-            # Check processed status filters
-            is_processed = item.get("processed", False)
-            if (is_processed and not show_processed) or (not is_processed and not show_unprocessed):
-                continue
-            
-            # Check text filter
-            if filter_text:
-                title = item.get("title", "").lower()
-                temp_title = item.get("temp_title", "").lower()
-                sku = item.get("sku", "").lower()
-                
-                if not (filter_text in title or filter_text in temp_title or filter_text in sku):
-                    continue
-            
-            # Item passed all filters, add to listbox and filtered items
-            filtered_items.append(i)
-            
-            # Create display text
-            title = item.get("title", "") or item.get("temp_title", "Untitled")
-            sku = item.get("sku", "")
-            prefix = "✓ " if item.get("processed", False) else "□ "
-            display_text = f"{prefix}{sku}: {title}" if sku else f"{prefix}{title}"
-            
-            self.item_listbox.insert(tk.END, display_text)
+        # Text filter via the search index, then the processed status filters
+        filtered_items = self.search_index.search(self.filter_var.get())
+        if not (show_processed and show_unprocessed):
+            filtered_items = [
+                i for i in filtered_items
+                if (show_processed if self.items[i].get("processed", False) else show_unprocessed)
+            ]
+        self.filtered_indices = filtered_items
+        
+        # Only the visible rows are drawn
+        self.item_listbox.set_indices(filtered_items)
+        self.item_listbox.select(self.current_index if self.items else None)
         
         # Update status count
         self.status_count.config(text=f"{len(filtered_items)} / {len(self.items)} items")
     
+    def get_item_display_text(self, index):
+        """Get the listbox text for an item."""
+        item = self.items[index]
+        title = item.get("title", "") or item.get("temp_title", "Untitled")
+        sku = item.get("sku", "")
+        prefix = "✓ " if item.get("processed", False) else "□ "
+        return f"{prefix}{sku}: {title}" if sku else f"{prefix}{title}"
+    
     def apply_filter(self, event=None):
         """Apply the current filter settings."""
         self.update_item_listbox()
     
-    def on_item_select(self, event):
+    def on_item_select(self, index):
         """Handle item selection from the listbox."""
-        selection = self.item_listbox.curselection()
-        if not selection:
+        self.current_index = index
+        self.current_photo_index = 0
+        self.display_current_item()
+    
+    def open_full_text_search(self):
+        """Open the full-text search dialog."""
+        if self.full_text_index is None:
+            self.full_text_index = FullTextIndex()
+        
+        FullTextSearchDialog(self.root, self.full_text_index,
+                             lambda: (None if self.loading else self.current_file, self.items),
+                             self.open_search_result)
+    
+    def open_search_result(self, queue_path, item_index):
+        """Show an item found by full-text search, loading its queue if needed."""
+        if not self.current_file or FullTextIndex.queue_key(self.current_file) != FullTextIndex.queue_key(queue_path):
+            self.load_file(queue_path, on_loaded=lambda: self.open_search_result(queue_path, item_index))
             return
         
-        # Get the index in the filtered list
-        listbox_index = selection[0]
-        
-        # Find the corresponding index in the full list
-        filter_text = self.filter_var.get().lower()
-        show_processed = self.show_processed_var.get()
-        show_unprocessed = self.show_unprocessed_var.get()
-        
-        item_indices = []
-        for i, item in enumerate(self.items):
-            # Check processed status filters
-            is_processed = item.get("processed", False)
-            if (is_processed and not show_processed) or (not is_processed and not show_unprocessed):
-                continue
-            
-            # Check text filter
-            if filter_text:
-                title = item.get("title", "").lower()
-                temp_title = item.get("temp_title", "").lower()
-                sku = item.get("sku", "").lower()
-                
-                if not (filter_text in title or filter_text in temp_title or filter_text in sku):
-                    continue
-            
-            item_indices.append(i)
-        
-        if listbox_index < len(item_indices):
-            self.current_index = item_indices[listbox_index]
+        if 0 <= item_index < len(self.items):
+            self.current_index = item_index
             self.current_photo_index = 0
             self.display_current_item()
+            self.update_listbox_selection()
     
     def prev_item(self):
         """Navigate to the previous item."""
@@ -557,40 +595,8 @@ class EbayJsonViewer:
     
     def update_listbox_selection(self):
         """Update the listbox selection to match the current index."""
-        # Clear current selection
-        self.item_listbox.selection_clear(0, tk.END)
-        
-        # Find the current item in the filtered list
-        filter_text = self.filter_var.get().lower()
-        show_processed = self.show_processed_var.get()
-        show_unprocessed = self.show_unprocessed_var.get()
-        
-        filtered_indices = []
-        for i, item in enumerate(self.items):
-            # Check processed status filters
-            is_processed = item.get("processed", False)
-            if (is_processed and not show_processed) or (not is_processed and not show_unprocessed):
-                continue
-            
-            # Check text filter
-            if filter_text:
-                title = item.get("title", "").lower()
-                temp_title = item.get("temp_title", "").lower()
-                sku = item.get("sku", "").lower()
-                
-                if not (filter_text in title or filter_text in temp_title or filter_text in sku):
-                    continue
-            
-            filtered_indices.append(i)
-        
-        # Find current index in filtered list
-        try:
-            listbox_index = filtered_indices.index(self.current_index)
-            self.item_listbox.selection_set(listbox_index)
-            self.item_listbox.see(listbox_index)
-        except ValueError:
-            # Current item not in filtered list
-            pass
+        # Items hidden by the filter are simply not highlighted
+        self.item_listbox.select(self.current_index)
     
     def prev_photo(self):
         """Navigate to the previous photo."""
@@ -1060,40 +1066,15 @@ class EbayJsonViewer:
         if not file_path:
             return
         
-        try:
-            import csv
-            
-            # Convert item to CSV row format
-            row = EbayItemSchema.to_csv_row(item)
-            
-            # Add photo URLs if available
-            photos = item.get("photos", [])
-            if photos:
-                pic_urls = []
-                for photo in photos:
-                    path = photo.get("path", "")
-                    if path:
-                        pic_urls.append(path)
-                
-                if pic_urls:
-                    row["PicURL"] = "|".join(pic_urls)
-            
-            # Get all field names
-            fieldnames = sorted(row.keys())
-            
-            # Write CSV file
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerow(row)
-            
-            # Show confirmation
+        # Same eBay File Exchange columns as the export tool, with the photo paths
+        success, message = export_items([item], file_path, "csv", extra_columns=["PicURL"])
+        
+        if success:
             self.status_bar.update(f"Item exported to {os.path.basename(file_path)}")
             messagebox.showinfo("Export Complete", "Item successfully exported as CSV.")
-            
-        except Exception as e:
-            logger.error(f"Error exporting CSV: {str(e)}")
-            messagebox.showerror("Error", f"Failed to export CSV: {str(e)}")
+        else:
+            logger.error(f"Error exporting CSV: {message}")
+            messagebox.showerror("Error", f"Failed to export CSV: {message}")
     
     def show_about(self):
         """Show the about dialog."""
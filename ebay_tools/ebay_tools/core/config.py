@@ -95,6 +95,17 @@ class ConfigManager:
                 "window_height": 800,
                 "font_size": 10,
                 "show_tooltips": True
+            },
+            "pricing": {
+                "cache_ttl_hours": 24,
+                "cache_max_entries": 2000,
+                "auto_price_workers": 4,
+                "auto_price_save_every": 25,
+                "request_interval": 1.0,  # seconds between requests to the same host
+                "max_requests_per_host": 2,  # requests in flight to the same host
+                "max_retries": 3,  # retries after a 429/5xx answer, with backoff
+                "taxonomy_file": "",  # JSON or SQLite taxonomy; defaults to ~/.ebay_tools/taxonomy.json
+                "taxonomy_check_seconds": 5.0  # how often to check the taxonomy file for changes
             }
         }
     
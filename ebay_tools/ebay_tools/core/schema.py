@@ -3,10 +3,13 @@ Schema definition for eBay listing data structure.
 This module provides consistent field names and data validation for the eBay listing tools.
 """
 
+import os
+import re
 import json
+import hashlib
 from datetime import datetime
 import uuid
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
 
 
 class EbayItemSchema:
@@ -57,6 +60,10 @@ class EbayItemSchema:
         "duration": "Duration",
     }
     
+    # Item field holding the extracted item specifics ("values") and a
+    # fingerprint of the fields they were extracted from ("fingerprint")
+    SPECIFICS_FIELD = "extracted_specifics"
+    
     # Mapping of condition codes to readable names
     CONDITION_MAP = {
         "1000": "New", 
@@ -180,17 +187,59 @@ class EbayItemSchema:
         
         return normalized
     
+    @staticmethod
+    def specifics_fingerprint(item: Dict[str, Any]) -> str:
+        """
+        Get a fingerprint of the item fields that item specifics come from.
+        
+        Covers item_specifics, the C: fields, and the item_specifics and
+        final_description of each API result.
+        
+        Args:
+            item: The item data dictionary
+            
+        Returns:
+            Hex digest that changes whenever one of those fields does
+        """
+        api_results = item.get("api_results")
+        sources = [
+            item.get("item_specifics"),
+            [(key, value) for key, value in item.items() if key.startswith("C:")],
+            [(result.get("item_specifics"), result.get("final_description"))
+             for result in api_results if isinstance(result, dict)] if isinstance(api_results, list) else None
+        ]
+        data = json.dumps(sources, ensure_ascii=False, default=str)
+        return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+    
     @staticmethod
     def extract_item_specifics(item: Dict[str, Any]) -> Dict[str, str]:
         """
         Extract all item specifics from various sources in the item data.
         
+        The result is stored on the item under SPECIFICS_FIELD together with
+        a fingerprint of its sources, and extracted again only once the
+        fingerprint changes (e.g. after new api_results), so exports and
+        views reuse it, also across saved queue files.
+        
         Args:
             item: The item data dictionary
             
         Returns:
-            Dictionary of item specifics (name-value pairs)
+            Dictionary of item specifics (name-value pairs); a copy the caller may change
         """
+        fingerprint = EbayItemSchema.specifics_fingerprint(item)
+        stored = item.get(EbayItemSchema.SPECIFICS_FIELD)
+        if (isinstance(stored, dict) and stored.get("fingerprint") == fingerprint
+                and isinstance(stored.get("values"), dict)):
+            return dict(stored["values"])
+        
+        item_specifics = EbayItemSchema._extract_item_specifics(item)
+        item[EbayItemSchema.SPECIFICS_FIELD] = {"fingerprint": fingerprint, "values": item_specifics}
+        return dict(item_specifics)
+    
+    @staticmethod
+    def _extract_item_specifics(item: Dict[str, Any]) -> Dict[str, str]:
+        """Extract item specifics from their source fields."""
         item_specifics = {}
         
         # First check for direct item_specifics field
@@ -229,6 +278,37 @@ class EbayItemSchema:
         
         return item_specifics
     
+    @staticmethod
+    def csv_field_names(item: Dict[str, Any], default_values: Dict[str, str] = None) -> List[str]:
+        """
+        Get the CSV columns to_csv_row() produces for an item without building the row.
+        
+        Args:
+            item: The item data dictionary
+            default_values: Default values for CSV fields
+            
+        Returns:
+            List of eBay CSV field names (may contain repeats)
+        """
+        fields = list(default_values or ())
+        
+        for our_field, ebay_field in EbayItemSchema.EBAY_CSV_MAPPING.items():
+            if item.get(our_field):
+                fields.append(ebay_field)
+        
+        if item.get("temp_title"):
+            fields.append("Title")
+        
+        fields.extend(f"C:{name}" for name in EbayItemSchema.extract_item_specifics(item))
+        
+        product_ids = item.get("productIdentifiers", {})
+        if isinstance(product_ids, dict):
+            for key in ("upc", "ean", "isbn"):
+                if key in product_ids:
+                    fields.append(f"Product:{key.upper()}")
+        
+        return fields
+    
     @staticmethod
     def to_csv_row(item: Dict[str, Any], default_values: Dict[str, str] = None) -> Dict[str, str]:
         """
@@ -307,4 +387,94 @@ def load_queue(file_path: str) -> List[Dict[str, Any]]:
         normalized_item = EbayItemSchema.normalize_item(item)
         normalized_queue.append(normalized_item)
     
-    return normalized_queue
\ No newline at end of file
+    return normalized_queue
+
+
+# Characters read from a queue file at a time by iter_queue_items
+QUEUE_READ_SIZE = 1 << 20
+
+# Whitespace allowed between JSON tokens
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def iter_queue_items(file_path: str) -> Iterator[Tuple[Dict[str, Any], int, int]]:
+    """
+    Load a queue of items from a JSON file one item at a time.
+    
+    The file is read QUEUE_READ_SIZE characters at a time and the
+    top-level array is decoded element by element, so memory use depends
+    on the largest item rather than the size of the queue, and the first
+    items can be used before the rest of a large queue has been read.
+    
+    Args:
+        file_path: Path to the JSON file
+        
+    Yields:
+        Tuples of (normalized item, characters parsed so far, file size in bytes)
+        
+    Raises:
+        json.JSONDecodeError: If the file contains invalid JSON
+    """
+    total = os.path.getsize(file_path)
+    decoder = json.JSONDecoder()
+    
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = ""
+        pos = 0
+        read = 0
+        eof = False
+        
+        def read_more():
+            """Drop the parsed text and read the next block."""
+            nonlocal text, pos, read, eof
+            block = f.read(QUEUE_READ_SIZE)
+            eof = not block
+            read += len(block)
+            text = text[pos:] + block
+            pos = 0
+        
+        def next_token():
+            """Skip whitespace, reading as needed."""
+            nonlocal pos
+            while True:
+                pos = _JSON_WHITESPACE.match(text, pos).end()
+                if pos < len(text) or eof:
+                    return
+                read_more()
+        
+        next_token()
+        if not text.startswith('[', pos):
+            # Not an array; parse the whole file the regular way
+            for item in json.loads(text[pos:] + f.read()):
+                yield EbayItemSchema.normalize_item(item), total, total
+            return
+        
+        pos += 1
+        next_token()
+        if text.startswith(']', pos):
+            return
+        
+        while True:
+            # An item cut off at the end of the block fails to decode (or, for
+            # a number, ends with the block), so read on and decode it again
+            while True:
+                try:
+                    item, end = decoder.raw_decode(text, pos)
+                    if end < len(text) or eof:
+                        break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                read_more()
+            
+            pos = end
+            yield EbayItemSchema.normalize_item(item), read - (len(text) - pos), total
+            
+            next_token()
+            if text.startswith(',', pos):
+                pos += 1
+                next_token()
+            elif text.startswith(']', pos):
+                return
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
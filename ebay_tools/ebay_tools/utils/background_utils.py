@@ -6,8 +6,10 @@ This module provides tools for running operations in the background including:
 - Progress reporting
 - Cancellation support
 - Safe UI updates from background threads
+- Incremental loading of queue files
 """
 
+import os
 import threading
 import queue
 import time
@@ -15,6 +17,9 @@ import logging
 import traceback
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import tkinter as tk
+from tkinter import ttk
+
+from ebay_tools.core.schema import iter_queue_items
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -252,6 +257,11 @@ class BackgroundTaskManager:
         self.poll_interval = poll_interval
         self.tasks = {}
         self.polling_active = False
+        
+        # Queue loads started by load_queue_in_background; only the newest
+        # one may deliver items
+        self.queue_load_generation = 0
+        self.abandon_queue_load = None
     
     def start_task(self, task: BackgroundTask) -> str:
         """
@@ -452,6 +462,130 @@ def run_with_progress(root: tk.Tk,
     return dialog
 
 
+
+def load_queue_in_background(root: tk.Tk,
+                             task_manager: BackgroundTaskManager,
+                             file_path: str,
+                             on_items: Callable[[List[Dict[str, Any]], int], None],
+                             on_complete: Callable[[List[Dict[str, Any]], Any], None],
+                             on_error: Optional[Callable[[Exception], None]] = None,
+                             post_process: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+                             first_batch_size: int = 50,
+                             batch_size: int = 500) -> str:
+    """
+    Load a queue file in a background thread with a progress dialog.
+    
+    Items are handed to the UI in batches as they are parsed.  The dialog is
+    only modal until the first batch arrives, so the first screenful of items
+    can be browsed while the rest of the file is still loading.
+    
+    Each load is one generation of the task manager: starting another load
+    cancels the previous one, closes its dialog and drops any of its
+    callbacks still queued, so a late batch can never mix with the new
+    queue's items.  Callers should still refuse to edit, save or reload the
+    queue until on_complete has run.
+    
+    Args:
+        root: Tkinter root widget
+        task_manager: Task manager to run the load in
+        file_path: Path to the queue file
+        on_items: Called on the main thread with (items, first_new_index) whenever
+                  new items are available; items is the same list each time and
+                  is only extended on the main thread
+        on_complete: Called on the main thread with (items, post_process result)
+        on_error: Optional callback if loading fails
+        post_process: Optional function run in the background on the loaded items
+                      (e.g. to build a search index)
+        first_batch_size: Number of items in the first batch
+        batch_size: Number of items in each later batch
+        
+    Returns:
+        Task ID
+    """
+    if task_manager.abandon_queue_load:
+        task_manager.abandon_queue_load()
+    task_manager.queue_load_generation += 1
+    generation = task_manager.queue_load_generation
+    
+    title = f"Loading {os.path.basename(file_path)}"
+    dialog = ProgressDialog(root, title, cancellable=False)
+    
+    # The worker fills parsed; the UI only ever sees shown, which is
+    # extended here on the main thread
+    parsed = []
+    shown = []
+    delivered = [0]
+    
+    def current():
+        return generation == task_manager.queue_load_generation
+    
+    def deliver():
+        count = len(parsed)
+        if count > delivered[0]:
+            if not delivered[0]:
+                # Let the user work with the first items while the rest load
+                dialog.dialog.grab_release()
+            start = len(shown)
+            shown.extend(parsed[delivered[0]:count])
+            delivered[0] = count
+            on_items(shown, start)
+    
+    def on_progress(current_value, total, message):
+        if current():
+            dialog.update_progress(current_value, total, message)
+            deliver()
+    
+    def on_task_complete(result):
+        if current():
+            task_manager.abandon_queue_load = None
+            deliver()
+            dialog.dialog.destroy()
+            on_complete(shown, result)
+    
+    def on_task_error(error):
+        if current():
+            task_manager.abandon_queue_load = None
+            dialog.show_error(str(error))
+            if on_error:
+                on_error(error)
+    
+    task_id = task_manager.create_and_start_task(
+        name=title,
+        target_function=_load_queue_task,
+        args=(file_path, parsed, post_process, first_batch_size, batch_size),
+        on_progress=on_progress,
+        on_complete=on_task_complete,
+        on_error=on_task_error
+    )
+    
+    def abandon():
+        if task_id in task_manager.tasks:
+            task_manager.cancel_task(task_id)
+        if dialog.dialog.winfo_exists():
+            dialog.dialog.destroy()
+    
+    task_manager.abandon_queue_load = abandon
+    return task_id
+
+
+def _load_queue_task(file_path, items, post_process, first_batch_size, batch_size,
+                     report_progress=None, check_cancelled=None):
+    """Background part of load_queue_in_background."""
+    next_report = first_batch_size
+    for item, position, total in iter_queue_items(file_path):
+        if check_cancelled():
+            return None
+        items.append(item)
+        if len(items) >= next_report:
+            report_progress(position, total, f"Loaded {len(items)} items")
+            next_report = len(items) + batch_size
+    
+    if post_process is None:
+        return None
+    
+    report_progress(1, 1, f"Indexing {len(items)} items")
+    return post_process(items)
+
 class ProgressDialog:
     """
     Dialog for displaying progress of a background operation.
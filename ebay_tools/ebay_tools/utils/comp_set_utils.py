@@ -0,0 +1,352 @@
+"""
+comp_set_utils.py - Compact comparable sales sets for eBay listing tools
+
+This module stores the sold listings behind a price analysis compactly including:
+- Columnar comp sets with prices, shipping and sold dates in typed arrays
+- Condition and source strings interned once per process
+- Slotted records that read like the listing dictionaries they replace
+- Queue pricing summaries that keep statistics and a research cache
+  reference instead of the comps themselves
+"""
+
+import sys
+import logging
+import threading
+from array import array
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Listing URLs that follow this pattern are rebuilt from the item ID instead of stored
+ITEM_URL_TEMPLATE = "https://www.ebay.com/itm/{}"
+
+# Decimal places kept for prices in queue pricing summaries
+SUMMARY_PRICE_DIGITS = 2
+
+COMP_FIELDS = ("title", "price", "shipping", "condition", "sold_date", "url",
+               "item_id", "source", "location", "bid_count")
+
+# Process-wide table of interned condition and source strings
+_labels = [""]
+_label_codes = {"": 0}
+_labels_lock = threading.Lock()
+
+
+def _label_code(value: Any) -> int:
+    """Get the code of an interned label, adding it the first time."""
+    value = "" if value is None else str(value)
+    code = _label_codes.get(value)
+    if code is None:
+        with _labels_lock:
+            code = _label_codes.get(value)
+            if code is None:
+                code = len(_labels)
+                _labels.append(sys.intern(value))
+                _label_codes[value] = code
+    return code
+
+
+def _field(item: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a listing dictionary or object."""
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+class CompRecord:
+    """
+    One comparable sale read from a CompSet.
+
+    Fields can be read as attributes (record.price) or like a listing
+    dictionary (record["price"], record.get("url")).
+    """
+
+    __slots__ = COMP_FIELDS
+
+    def __init__(self, title: str, price: float, shipping: float, condition: str,
+                 sold_date: str, url: str, item_id: str, source: str,
+                 location: str = "", bid_count: int = 0):
+        self.title = title
+        self.price = price
+        self.shipping = shipping
+        self.condition = condition
+        self.sold_date = sold_date
+        self.url = url
+        self.item_id = item_id
+        self.source = source
+        self.location = location
+        self.bid_count = bid_count
+
+    @property
+    def total_price(self) -> float:
+        """Total price including shipping."""
+        return self.price + self.shipping
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in COMP_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in COMP_FIELDS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field like dict.get."""
+        return getattr(self, key) if key in COMP_FIELDS else default
+
+    def keys(self) -> tuple:
+        """Field names, so dict(record) works."""
+        return COMP_FIELDS
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert to a listing dictionary."""
+        return {name: getattr(self, name) for name in COMP_FIELDS}
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in COMP_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"CompRecord(item_id={self.item_id!r}, title={self.title!r}, total_price={self.total_price:.2f})"
+
+
+class CompSet:
+    """
+    The sold listings behind a price analysis, stored by column.
+
+    Prices, shipping, bid counts and sold dates live in typed arrays;
+    conditions and sources are codes into a shared table of interned
+    strings; listing URLs of the standard /itm/<id> form are rebuilt from
+    the item ID.  Sold dates in YYYY-MM-DD form are kept as day numbers,
+    other date text as is.
+
+    A CompSet is a read-only sequence of CompRecord, so code written for
+    lists of listing dictionaries keeps working.  cache_key names the
+    research cache entry the comps came from, if any.
+    """
+
+    __slots__ = ("titles", "prices", "shipping", "condition_codes", "sold_days", "other_dates",
+                 "urls", "item_ids", "source_codes", "locations", "bid_counts", "cache_key")
+
+    def __init__(self, cache_key: Optional[str] = None):
+        """
+        Create an empty comp set.
+
+        Args:
+            cache_key: Research cache key of the comps
+        """
+        self.titles = []
+        self.prices = array("d")
+        self.shipping = array("d")
+        self.condition_codes = array("I")
+        self.sold_days = array("l")
+        self.other_dates = {}
+        self.urls = []
+        self.item_ids = []
+        self.source_codes = array("I")
+        self.locations = []
+        self.bid_counts = array("l")
+        self.cache_key = cache_key
+
+    @classmethod
+    def from_items(cls, items: Iterable[Any], cache_key: Optional[str] = None) -> "CompSet":
+        """
+        Build a comp set from listings.
+
+        Args:
+            items: Listing dictionaries or objects with the listing fields
+                   (fields outside COMP_FIELDS are dropped); a CompSet is
+                   returned as is
+            cache_key: Research cache key of the comps
+
+        Returns:
+            CompSet holding the listings
+        """
+        if isinstance(items, CompSet):
+            if cache_key and not items.cache_key:
+                items.cache_key = cache_key
+            return items
+
+        comps = cls(cache_key)
+        for item in items:
+            comps.append(item)
+        return comps
+
+    def append(self, item: Any) -> None:
+        """
+        Add a listing.
+
+        Args:
+            item: Listing dictionary or object
+        """
+        index = len(self.titles)
+        item_id = str(_field(item, "item_id") or "")
+        url = _field(item, "url") or ""
+
+        self.titles.append(_field(item, "title") or "")
+        self.prices.append(float(_field(item, "price") or 0))
+        self.shipping.append(float(_field(item, "shipping") or 0))
+        self.condition_codes.append(_label_code(_field(item, "condition")))
+        self.item_ids.append(item_id)
+        self.urls.append(None if item_id and url == ITEM_URL_TEMPLATE.format(item_id) else url)
+        self.source_codes.append(_label_code(_field(item, "source")))
+        self.locations.append(_field(item, "location") or "")
+        self.bid_counts.append(int(_field(item, "bid_count") or 0))
+
+        sold_date = _field(item, "sold_date") or ""
+        try:
+            day = date.fromisoformat(sold_date).toordinal() if len(sold_date) == 10 else 0
+        except (TypeError, ValueError):
+            day = 0
+        self.sold_days.append(day)
+        if not day and sold_date:
+            self.other_dates[index] = sold_date
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __bool__(self) -> bool:
+        return bool(self.titles)
+
+    def sold_date(self, index: int) -> str:
+        """Sold date of a listing as text."""
+        day = self.sold_days[index]
+        if day:
+            return date.fromordinal(day).isoformat()
+        return self.other_dates.get(index, "")
+
+    def url(self, index: int) -> str:
+        """Listing URL of a listing."""
+        url = self.urls[index]
+        return ITEM_URL_TEMPLATE.format(self.item_ids[index]) if url is None else url
+
+    def record(self, index: int) -> CompRecord:
+        """Get one listing as a CompRecord."""
+        return CompRecord(
+            title=self.titles[index],
+            price=self.prices[index],
+            shipping=self.shipping[index],
+            condition=_labels[self.condition_codes[index]],
+            sold_date=self.sold_date(index),
+            url=self.url(index),
+            item_id=self.item_ids[index],
+            source=_labels[self.source_codes[index]],
+            location=self.locations[index],
+            bid_count=self.bid_counts[index],
+        )
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            comps = CompSet(self.cache_key)
+            for position in range(*index.indices(len(self))):
+                comps.append(self.record(position))
+            return comps
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CompSet index out of range")
+        return self.record(index)
+
+    def __iter__(self) -> Iterator[CompRecord]:
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def total_prices(self) -> List[float]:
+        """Prices including shipping, in listing order."""
+        return [price + shipping for price, shipping in zip(self.prices, self.shipping)]
+
+    def sold_dates(self) -> List[str]:
+        """Sold dates as text, in listing order."""
+        return [self.sold_date(index) for index in range(len(self))]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert to listing dictionaries, e.g. for the research cache."""
+        return [record.as_dict() for record in self]
+
+    def reference(self) -> Optional[Dict[str, Any]]:
+        """
+        Get a reference to the cached comps for storing in a queue.
+
+        Returns:
+            Dictionary with cache_key and count, or None if the comps are not cached
+        """
+        if not self.cache_key:
+            return None
+        return {"cache_key": self.cache_key, "count": len(self)}
+
+
+def compact_price_analysis(price_analysis: Optional[Dict[str, Any]],
+                           digits: int = SUMMARY_PRICE_DIGITS) -> Dict[str, Any]:
+    """
+    Round the statistics of a price analysis for storage.
+
+    Args:
+        price_analysis: Statistics dictionary
+        digits: Decimal places kept for float values
+
+    Returns:
+        Copy of the statistics with rounded floats (lists of indices are dropped)
+    """
+    compact = {}
+    for key, value in (price_analysis or {}).items():
+        if isinstance(value, float):
+            compact[key] = round(value, digits)
+        elif not isinstance(value, (list, tuple, dict)):
+            compact[key] = value
+    return compact
+
+
+def pricing_summary(results: Dict[str, Any], **fields: Any) -> Dict[str, Any]:
+    """
+    Build the pricing_data stored on a queue item from analysis results.
+
+    Only the summary statistics, the comp counts and a reference to the
+    cached comps are kept; load_comp_set() gets the comps back while the
+    research cache still holds them.
+
+    Args:
+        results: Analysis results from PriceAnalyzer
+        **fields: Further values to store (final_price, search_terms, ...)
+
+    Returns:
+        pricing_data dictionary
+    """
+    sold_items = results.get("sold_items") or []
+    summary = dict(fields)
+    summary["price_analysis"] = compact_price_analysis(results.get("price_analysis"))
+    summary["sold_items_count"] = len(sold_items)
+    summary["current_items_count"] = len(results.get("current_items") or [])
+
+    reference = sold_items.reference() if isinstance(sold_items, CompSet) else None
+    if reference:
+        summary["comps_ref"] = reference
+    return summary
+
+
+def load_comp_set(reference: Optional[Dict[str, Any]], cache=None) -> Optional[CompSet]:
+    """
+    Get the comps a pricing summary refers to.
+
+    Args:
+        reference: comps_ref of a pricing summary
+        cache: ResearchCache to read (defaults to the shared one)
+
+    Returns:
+        CompSet, or None if there is no reference or the cache no longer has the comps
+    """
+    if not reference or not reference.get("cache_key"):
+        return None
+    if cache is None:
+        from ebay_tools.utils.research_cache_utils import get_research_cache
+        cache = get_research_cache()
+        if cache is None:
+            return None
+
+    items = cache.get_by_key(reference["cache_key"])
+    if items is None:
+        logger.debug(f"Comps no longer cached: {reference['cache_key']}")
+        return None
+    return CompSet.from_items(items, cache_key=reference["cache_key"])
@@ -0,0 +1,520 @@
+"""
+dedup_utils.py - Photo deduplication utilities for eBay listing tools
+
+This module provides tools for detecting near-duplicate photos including:
+- Perceptual difference hashing (dHash) of photos
+- A persistent hash cache keyed by path, size and modification time
+- Parallel hashing of photo batches in a worker pool
+- Near-duplicate lookup within an item and across a whole work queue
+"""
+
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from PIL import Image, ImageOps
+
+from ebay_tools.core.config import DEFAULT_CONFIG_DIR
+from ebay_tools.utils.file_utils import safe_load_json, safe_save_json
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Default location of the persistent hash cache
+DEFAULT_HASH_CACHE_FILE = os.path.join(DEFAULT_CONFIG_DIR, "photo_hashes.json")
+
+# Hash size in pixels per side (8 gives a 64-bit hash)
+DEFAULT_HASH_SIZE = 8
+
+# Maximum Hamming distance at which two 64-bit hashes count as the same shot
+DEFAULT_THRESHOLD = 6
+
+
+def get_photo_path(photo: Union[Dict[str, Any], str]) -> str:
+    """
+    Get the file path of a photo entry.
+
+    Queue items store photos as dictionaries with a 'path' key, while
+    mobile imports use plain path strings; both are accepted.
+
+    Args:
+        photo: Photo dictionary or path string
+
+    Returns:
+        Photo path, or an empty string if none is set
+    """
+    if isinstance(photo, dict):
+        return photo.get("path", "") or ""
+    return photo or ""
+
+
+def _path_key(path: str) -> str:
+    """Normalize a photo path for exact comparison."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def compute_dhash(path: str, hash_size: int = DEFAULT_HASH_SIZE) -> int:
+    """
+    Compute the perceptual difference hash of an image file.
+
+    The image is orientation-corrected, reduced to grayscale at
+    (hash_size + 1) x hash_size pixels, and each bit records whether a pixel
+    is brighter than its right-hand neighbour.  Re-exports, resizes and
+    recompressions of the same shot produce hashes a few bits apart.
+
+    Args:
+        path: Path to the image file
+        hash_size: Number of rows/columns compared (hash has hash_size**2 bits)
+
+    Returns:
+        Hash as an integer
+
+    Raises:
+        FileNotFoundError: If the image file doesn't exist
+        UnidentifiedImageError: If the file is not a valid image
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Image file not found: {path}")
+
+    with Image.open(path) as image:
+        # Let the JPEG decoder downscale while decoding, which avoids
+        # materialising the full-resolution bitmap
+        image.draft("L", (hash_size * 16, hash_size * 16))
+        image = ImageOps.exif_transpose(image)
+        small = image.convert("L").resize((hash_size + 1, hash_size), Image.LANCZOS)
+        pixels = list(small.getdata())
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+
+    return value
+
+
+def hamming_distance(hash_a: int, hash_b: int) -> int:
+    """
+    Count the differing bits between two hashes.
+
+    Args:
+        hash_a: First hash
+        hash_b: Second hash
+
+    Returns:
+        Number of differing bits
+    """
+    return bin(hash_a ^ hash_b).count("1")
+
+
+class PhotoHashCache:
+    """
+    Persistent cache of perceptual photo hashes.
+
+    Entries are keyed by absolute path and invalidated when the file's size
+    or modification time changes, so photos are only decoded once.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None,
+                 hash_size: int = DEFAULT_HASH_SIZE,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize the hash cache.
+
+        Args:
+            cache_path: Path of the JSON cache file (defaults to ~/.ebay_tools/photo_hashes.json)
+            hash_size: Hash size passed to compute_dhash
+            max_workers: Worker pool size for hashing (defaults to CPU count)
+        """
+        self.cache_path = cache_path or DEFAULT_HASH_CACHE_FILE
+        self.hash_size = hash_size
+        self.max_workers = max_workers or min(8, os.cpu_count() or 4)
+        self.entries = {}
+        self.modified = False
+
+        self.load()
+
+    def load(self) -> None:
+        """Load cached hashes from disk."""
+        data = safe_load_json(self.cache_path, default_value={}) if os.path.exists(self.cache_path) else {}
+
+        # Discard the cache if it was built with a different hash size
+        if not isinstance(data, dict) or data.get("hash_size") != self.hash_size:
+            self.entries = {}
+            return
+
+        self.entries = data.get("entries", {})
+
+    def save(self) -> bool:
+        """
+        Save cached hashes to disk if anything changed.
+
+        Returns:
+            True on success or when there was nothing to save, False on failure
+        """
+        if not self.modified:
+            return True
+
+        data = {"hash_size": self.hash_size, "entries": self.entries}
+        if safe_save_json(data, self.cache_path, indent=None):
+            self.modified = False
+            return True
+        return False
+
+    def _lookup(self, path: str) -> Tuple[str, Optional[os.stat_result], Optional[int]]:
+        """Return (key, stat, cached hash or None) for a path."""
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return key, None, None
+
+        entry = self.entries.get(key)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime_ns:
+            return key, stat, int(entry["hash"], 16)
+        return key, stat, None
+
+    def _store(self, key: str, stat: os.stat_result, value: int) -> None:
+        """Record a freshly computed hash."""
+        self.entries[key] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hash": format(value, "x")
+        }
+        self.modified = True
+
+    def get_hash(self, path: str) -> Optional[int]:
+        """
+        Get the hash of a single photo, computing it if needed.
+
+        Args:
+            path: Path to the photo
+
+        Returns:
+            Hash as an integer, or None if the file is missing or unreadable
+        """
+        return self.hash_photos([path]).get(path)
+
+    def hash_photos(self, paths: Iterable[str],
+                    report_progress: Optional[Callable[[int, int, str], None]] = None,
+                    check_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Optional[int]]:
+        """
+        Hash a batch of photos, decoding cache misses in a worker pool.
+
+        Args:
+            paths: Photo paths to hash
+            report_progress: Optional progress callback (current, total, message)
+            check_cancelled: Optional callback returning True to stop early
+
+        Returns:
+            Dictionary mapping each path to its hash, or None if it couldn't be hashed
+        """
+        results = {}
+        pending = {}
+
+        for path in paths:
+            if not path or path in results or path in pending:
+                continue
+            key, stat, cached = self._lookup(path)
+            if stat is None:
+                results[path] = None
+            elif cached is not None:
+                results[path] = cached
+            else:
+                pending[path] = (key, stat)
+
+        if not pending:
+            return results
+
+        total = len(pending)
+        done = 0
+
+        # Pillow releases the GIL while decoding, so threads scale across cores
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(compute_dhash, path, self.hash_size): path
+                for path in pending
+            }
+
+            for future in as_completed(futures):
+                path = futures[future]
+                key, stat = pending[path]
+                try:
+                    value = future.result()
+                    self._store(key, stat, value)
+                    results[path] = value
+                except Exception as e:
+                    logger.warning(f"Could not hash photo {path}: {str(e)}")
+                    results[path] = None
+
+                done += 1
+                if report_progress:
+                    report_progress(done, total, f"Hashing photos ({done}/{total})")
+
+                if check_cancelled and check_cancelled():
+                    for other in futures:
+                        other.cancel()
+                    break
+
+        return results
+
+
+class NearDuplicateIndex:
+    """
+    Index of photo hashes supporting fast near-duplicate lookup.
+
+    Each hash is split into threshold + 1 bands.  Two hashes within the
+    threshold must agree exactly on at least one band, so lookups only
+    compare against hashes sharing a band instead of scanning everything.
+    """
+
+    def __init__(self, threshold: int = DEFAULT_THRESHOLD, hash_bits: int = DEFAULT_HASH_SIZE ** 2):
+        """
+        Initialize the index.
+
+        Args:
+            threshold: Maximum Hamming distance treated as a duplicate
+            hash_bits: Number of bits in each hash
+        """
+        self.threshold = threshold
+        band_count = threshold + 1
+        base, extra = divmod(hash_bits, band_count)
+
+        # (shift, mask) for each band
+        self.bands = []
+        shift = 0
+        for i in range(band_count):
+            width = base + (1 if i < extra else 0)
+            self.bands.append((shift, (1 << width) - 1))
+            shift += width
+
+        self.buckets = [{} for _ in self.bands]
+        self.entries = []
+
+    def add(self, value: int, ref: Any) -> None:
+        """
+        Add a hash to the index.
+
+        Args:
+            value: Photo hash
+            ref: Reference returned by find() for this entry
+        """
+        entry_id = len(self.entries)
+        self.entries.append((value, ref))
+        for bucket, (shift, mask) in zip(self.buckets, self.bands):
+            bucket.setdefault((value >> shift) & mask, []).append(entry_id)
+
+    def find(self, value: int) -> Optional[Tuple[Any, int]]:
+        """
+        Find the closest indexed hash within the threshold.
+
+        Args:
+            value: Photo hash to look up
+
+        Returns:
+            Tuple of (ref, distance) for the best match, or None
+        """
+        best = None
+        seen = set()
+        for bucket, (shift, mask) in zip(self.buckets, self.bands):
+            for entry_id in bucket.get((value >> shift) & mask, ()):
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+
+                other, ref = self.entries[entry_id]
+                distance = hamming_distance(value, other)
+                if distance <= self.threshold and (best is None or distance < best[1] or
+                                                   (distance == best[1] and entry_id < best[2])):
+                    best = (ref, distance, entry_id)
+
+        return (best[0], best[1]) if best else None
+
+
+def scan_queue_for_duplicates(work_queue: List[Dict[str, Any]],
+                              cache: Optional[PhotoHashCache] = None,
+                              threshold: int = DEFAULT_THRESHOLD,
+                              report_progress: Optional[Callable[[int, int, str], None]] = None,
+                              check_cancelled: Optional[Callable[[], bool]] = None) -> List[Dict[str, Any]]:
+    """
+    Find near-duplicate photos across a whole work queue.
+
+    Photos are visited in queue order and the first occurrence of a shot is
+    kept as the original; every later near-duplicate is reported.
+
+    Args:
+        work_queue: List of item dictionaries
+        cache: Hash cache to use (a default cache is created if None)
+        threshold: Maximum Hamming distance treated as a duplicate
+        report_progress: Optional progress callback for hashing
+        check_cancelled: Optional cancellation callback for hashing
+
+    Returns:
+        List of duplicate records with keys:
+        - item_index, photo_index, path: the duplicate photo
+        - duplicate_of: dict with item_index, photo_index and path of the original
+        - distance: Hamming distance between the two hashes
+        - same_item: True if both photos belong to the same item
+    """
+    cache = cache or PhotoHashCache()
+
+    locations = []
+    for item_idx, item in enumerate(work_queue):
+        for photo_idx, photo in enumerate(item.get("photos", [])):
+            path = get_photo_path(photo)
+            if path:
+                locations.append((item_idx, photo_idx, path))
+
+    hashes = cache.hash_photos([loc[2] for loc in locations], report_progress, check_cancelled)
+    cache.save()
+
+    index = NearDuplicateIndex(threshold, cache.hash_size ** 2)
+    duplicates = []
+
+    for item_idx, photo_idx, path in locations:
+        value = hashes.get(path)
+        if value is None:
+            continue
+
+        match = index.find(value)
+        if match:
+            (orig_item, orig_photo, orig_path), distance = match
+            duplicates.append({
+                "item_index": item_idx,
+                "photo_index": photo_idx,
+                "path": path,
+                "duplicate_of": {"item_index": orig_item, "photo_index": orig_photo, "path": orig_path},
+                "distance": distance,
+                "same_item": orig_item == item_idx
+            })
+        else:
+            index.add(value, (item_idx, photo_idx, path))
+
+    return duplicates
+
+
+def _unique_record(path: str) -> Dict[str, Any]:
+    """Record for a new photo that matches nothing."""
+    return {
+        "path": path,
+        "status": "unique",
+        "duplicate_of": None,
+        "duplicate_item_index": None,
+        "distance": None
+    }
+
+
+def classify_by_path(new_paths: List[str],
+                     item_photos: Iterable[Union[Dict[str, Any], str]],
+                     item_index: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Check photos about to be added to an item for exact path repeats.
+
+    This needs no image decoding, so it is also the fallback when photos
+    can't be hashed.
+
+    Args:
+        new_paths: Paths of the photos being added, in order
+        item_photos: Photos already in the item
+        item_index: Index of the item, reported for repeats
+
+    Returns:
+        One record per new path, as classify_new_photos() returns them;
+        repeats of a photo already in the item (or earlier in new_paths)
+        are 'duplicate_in_item' at distance 0
+    """
+    known = {}
+    for photo in item_photos:
+        path = get_photo_path(photo)
+        if path:
+            known.setdefault(_path_key(path), path)
+
+    results = []
+    for path in new_paths:
+        record = _unique_record(path)
+        key = _path_key(path)
+        if key in known:
+            record["status"] = "duplicate_in_item"
+            record["duplicate_of"] = known[key]
+            record["duplicate_item_index"] = item_index
+            record["distance"] = 0
+        else:
+            known[key] = path
+        results.append(record)
+
+    return results
+
+
+def classify_new_photos(new_paths: List[str],
+                        work_queue: List[Dict[str, Any]],
+                        item_index: int,
+                        cache: Optional[PhotoHashCache] = None,
+                        threshold: int = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Check photos about to be added to an item against the existing queue.
+
+    Args:
+        new_paths: Paths of the photos being added, in order
+        work_queue: List of item dictionaries (the target item included)
+        item_index: Index of the item the photos are being added to
+        cache: Hash cache to use (a default cache is created if None)
+        threshold: Maximum Hamming distance treated as a duplicate
+
+    Returns:
+        One record per new path with keys:
+        - path: the new photo path
+        - status: 'unique', 'duplicate_in_item' or 'duplicate_in_queue'
+        - duplicate_of: path of the matching photo (None when unique)
+        - duplicate_item_index: item index of the matching photo (None when unique)
+        - distance: Hamming distance to the match (None when unique)
+    """
+    cache = cache or PhotoHashCache()
+
+    # Exact path repeats are caught even for photos that can't be hashed
+    by_path = classify_by_path(new_paths, work_queue[item_index].get("photos", []), item_index)
+
+    existing = []
+    for item_idx, item in enumerate(work_queue):
+        for photo in item.get("photos", []):
+            path = get_photo_path(photo)
+            if path:
+                existing.append((item_idx, path))
+
+    hashes = cache.hash_photos([path for _, path in existing] + list(new_paths))
+    cache.save()
+
+    # Matches within the target item take precedence over the rest of the queue
+    bits = cache.hash_size ** 2
+    item_photos = NearDuplicateIndex(threshold, bits)
+    queue_photos = NearDuplicateIndex(threshold, bits)
+    for item_idx, path in existing:
+        value = hashes.get(path)
+        if value is not None:
+            target = item_photos if item_idx == item_index else queue_photos
+            target.add(value, (item_idx, path))
+
+    results = []
+    for path, path_record in zip(new_paths, by_path):
+        if path_record["status"] != "unique":
+            results.append(path_record)
+            continue
+
+        record = _unique_record(path)
+
+        value = hashes.get(path)
+        if value is not None:
+            match = item_photos.find(value) or queue_photos.find(value)
+            if match:
+                (match_item, match_path), distance = match
+                record["status"] = "duplicate_in_item" if match_item == item_index else "duplicate_in_queue"
+                record["duplicate_of"] = match_path
+                record["duplicate_item_index"] = match_item
+                record["distance"] = distance
+
+            # Later photos in the same batch are checked against this one too
+            item_photos.add(value, (item_index, path))
+
+        results.append(record)
+
+    return results
@@ -0,0 +1,354 @@
+"""
+derivative_utils.py - Web-optimized photo derivatives for eBay listing tools
+
+This module generates resized copies of photos for web galleries including:
+- Thumbnail, medium and full size variants of each photo
+- Progressive JPEG and (when supported) WebP encodings with metadata stripped
+- A persistent, size-bounded derivative cache shared between exports
+- Parallel generation in a worker pool
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from PIL import Image, ImageOps, features
+
+from ebay_tools.utils.file_utils import ensure_directory_exists, safe_load_json, safe_save_json
+from ebay_tools.utils.photo_store_utils import PhotoStore, link_or_copy
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Variant name -> maximum width/height in pixels, largest last
+DEFAULT_DERIVATIVE_SIZES = {
+    "thumb": 320,
+    "medium": 800,
+    "full": 1600
+}
+
+DEFAULT_JPEG_QUALITY = 82
+DEFAULT_WEBP_QUALITY = 80
+
+# Size the derivative cache is trimmed back to after an export
+DEFAULT_DERIVATIVE_CACHE_MB = 1024
+
+
+def _flatten_to_rgb(image: Image.Image) -> Image.Image:
+    """Convert an image to RGB, compositing any transparency onto white."""
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.split()[-1])
+        return background
+    if image.mode != "RGB":
+        return image.convert("RGB")
+    return image
+
+
+def generate_derivatives(path: str, out_base: str,
+                         sizes: Optional[Dict[str, int]] = None,
+                         jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+                         webp_quality: Optional[int] = DEFAULT_WEBP_QUALITY) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate resized web copies of a photo.
+
+    The photo is decoded once, orientation-corrected, and then downscaled
+    step by step from the largest variant to the smallest.  Files are written
+    as <out_base>_<variant>.jpg (progressive) and, if webp_quality is set,
+    <out_base>_<variant>.webp.  No EXIF or other metadata is copied.
+
+    Args:
+        path: Path to the source photo
+        out_base: Output path prefix (without variant suffix or extension)
+        sizes: Variant name -> maximum width/height (defaults to DEFAULT_DERIVATIVE_SIZES)
+        jpeg_quality: JPEG quality (0-100)
+        webp_quality: WebP quality (0-100), or None to skip WebP
+
+    Returns:
+        Dictionary mapping variant name to {"jpeg", "webp", "width", "height"},
+        where jpeg/webp are output file names (webp is None when skipped)
+    """
+    sizes = sizes or DEFAULT_DERIVATIVE_SIZES
+    ordered = sorted(sizes.items(), key=lambda kv: kv[1], reverse=True)
+    largest = ordered[0][1]
+
+    with Image.open(path) as source:
+        # Let the JPEG decoder downscale while decoding
+        source.draft("RGB", (largest, largest))
+        image = _flatten_to_rgb(ImageOps.exif_transpose(source))
+
+    results = {}
+    for variant, max_size in ordered:
+        if image.width > max_size or image.height > max_size:
+            image = image.copy()
+            image.thumbnail((max_size, max_size), Image.LANCZOS)
+
+        jpeg_path = f"{out_base}_{variant}.jpg"
+        image.save(jpeg_path, "JPEG", quality=jpeg_quality, optimize=True, progressive=True)
+
+        webp_name = None
+        if webp_quality is not None:
+            webp_path = f"{out_base}_{variant}.webp"
+            image.save(webp_path, "WEBP", quality=webp_quality, method=4)
+            webp_name = os.path.basename(webp_path)
+
+        results[variant] = {
+            "jpeg": os.path.basename(jpeg_path),
+            "webp": webp_name,
+            "width": image.width,
+            "height": image.height
+        }
+
+    return results
+
+
+class DerivativeCache:
+    """
+    Persistent cache of web derivatives, keyed by source content digest.
+
+    Derivatives live next to the photo store (derivatives/<xx>/<sha256>_<variant>.<ext>),
+    so a photo is only resized once no matter how many galleries use it.
+    Exports hold their own copies, so trim() can evict the least recently
+    used derivatives to keep the cache within a size limit.
+    """
+
+    def __init__(self, store: Optional[PhotoStore] = None,
+                 sizes: Optional[Dict[str, int]] = None,
+                 jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+                 webp: Optional[bool] = None,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize the derivative cache.
+
+        Args:
+            store: Photo store used for digests (a default store is created if None)
+            sizes: Variant name -> maximum width/height
+            jpeg_quality: JPEG quality (0-100)
+            webp: Whether to also write WebP files (defaults to Pillow support)
+            max_workers: Worker pool size (defaults to CPU count)
+        """
+        self.store = store or PhotoStore()
+        self.sizes = dict(sizes or DEFAULT_DERIVATIVE_SIZES)
+        self.jpeg_quality = jpeg_quality
+        self.webp = features.check("webp") if webp is None else webp
+        self.max_workers = max_workers or min(8, os.cpu_count() or 4)
+
+        self.cache_dir = os.path.join(self.store.store_dir, "derivatives")
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        ensure_directory_exists(self.cache_dir)
+
+        # Settings signature; entries made with other settings are regenerated
+        self.signature = f"{sorted(self.sizes.items())}|q{jpeg_quality}|webp{int(self.webp)}"
+
+        # Digest -> {"signature", "variants", "used"}
+        self.index = {}
+        self.modified = False
+        self.load()
+
+    def load(self) -> None:
+        """Load the derivative index from disk."""
+        if os.path.exists(self.index_path):
+            data = safe_load_json(self.index_path, default_value={})
+            self.index = data if isinstance(data, dict) else {}
+
+    def save(self) -> bool:
+        """
+        Save the derivative index (and the store's digest index) if changed.
+
+        Returns:
+            True on success or when there was nothing to save, False on failure
+        """
+        self.store.save()
+        if not self.modified:
+            return True
+        if safe_save_json(self.index, self.index_path, indent=None):
+            self.modified = False
+            return True
+        return False
+
+    def _cache_base(self, digest: str) -> str:
+        """Output path prefix for a digest's derivatives."""
+        return os.path.join(self.cache_dir, digest[:2], digest)
+
+    def _cached(self, digest: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Return cached variants for a digest if they are complete and current."""
+        entry = self.index.get(digest)
+        if not entry or entry.get("signature") != self.signature:
+            return None
+
+        folder = os.path.dirname(self._cache_base(digest))
+        for info in entry["variants"].values():
+            for name in (info.get("jpeg"), info.get("webp")):
+                if name and not os.path.exists(os.path.join(folder, name)):
+                    return None
+        return entry["variants"]
+
+    def _generate(self, path: str, digest: str) -> Dict[str, Dict[str, Any]]:
+        """Generate derivatives for one photo into the cache (worker thread)."""
+        base = self._cache_base(digest)
+        ensure_directory_exists(os.path.dirname(base))
+        return generate_derivatives(
+            path, base, self.sizes, self.jpeg_quality,
+            DEFAULT_WEBP_QUALITY if self.webp else None
+        )
+
+    def generate_all(self, paths: Iterable[str],
+                     report_progress: Optional[Callable[[int, int, str], None]] = None,
+                     check_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Make sure derivatives exist for a batch of photos.
+
+        Cached derivatives are reused; the rest are generated in parallel.
+        Photos that are missing or fail to decode are logged and left out.
+
+        Args:
+            paths: Source photo paths
+            report_progress: Optional progress callback (current, total, message)
+            check_cancelled: Optional callback returning True to stop early
+
+        Returns:
+            Dictionary mapping each source path to {"digest", "variants"}
+        """
+        results = {}
+        pending = {}
+
+        for path in paths:
+            if path in results or path in pending or not os.path.exists(path):
+                continue
+            try:
+                digest = self.store.digest(path)
+            except OSError as e:
+                logger.warning(f"Could not read photo {path}: {str(e)}")
+                continue
+
+            variants = self._cached(digest)
+            if variants is not None:
+                self.index[digest]["used"] = time.time()
+                self.modified = True
+                results[path] = {"digest": digest, "variants": variants}
+            else:
+                pending[path] = digest
+
+        total = len(pending)
+        if total:
+            done = 0
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self._generate, path, digest): path
+                    for path, digest in pending.items()
+                }
+
+                for future in as_completed(futures):
+                    path = futures[future]
+                    digest = pending[path]
+                    try:
+                        variants = future.result()
+                        self.index[digest] = {"signature": self.signature, "variants": variants,
+                                              "used": time.time()}
+                        self.modified = True
+                        results[path] = {"digest": digest, "variants": variants}
+                    except Exception as e:
+                        logger.error(f"Error generating derivatives for {path}: {str(e)}")
+
+                    done += 1
+                    if report_progress:
+                        report_progress(done, total, f"Optimizing photos ({done}/{total})")
+
+                    if check_cancelled and check_cancelled():
+                        for other in futures:
+                            other.cancel()
+                        break
+
+        self.save()
+        return results
+
+    def place_all(self, paths: Iterable[str], dest_dir: str,
+                  report_progress: Optional[Callable[[int, int, str], None]] = None,
+                  check_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Generate derivatives as needed and place them in an export directory.
+
+        Files already present in dest_dir are left alone, since their names
+        are derived from the source content digest.
+
+        Args:
+            paths: Source photo paths
+            dest_dir: Directory to place the derivative files in
+            report_progress: Optional progress callback
+            check_cancelled: Optional cancellation callback
+
+        Returns:
+            Dictionary mapping each source path to its variants, where each
+            variant is {"jpeg", "webp", "width", "height"} with file names
+            relative to dest_dir
+        """
+        ensure_directory_exists(dest_dir)
+        generated = self.generate_all(paths, report_progress, check_cancelled)
+
+        placed = {}
+        for path, entry in generated.items():
+            folder = os.path.dirname(self._cache_base(entry["digest"]))
+            try:
+                for info in entry["variants"].values():
+                    for name in (info.get("jpeg"), info.get("webp")):
+                        if name and not os.path.exists(os.path.join(dest_dir, name)):
+                            link_or_copy(os.path.join(folder, name), os.path.join(dest_dir, name))
+                placed[path] = entry["variants"]
+            except OSError as e:
+                logger.error(f"Error placing derivatives for {path}: {str(e)}")
+
+        return placed
+
+    def trim(self, max_bytes: int) -> Dict[str, int]:
+        """
+        Remove the least recently used derivatives until the cache fits in max_bytes.
+
+        Files the index doesn't know (e.g. from an interrupted export) go first.
+
+        Args:
+            max_bytes: Maximum total size of the cached derivative files
+
+        Returns:
+            Dictionary with 'removed' (photos), 'kept' and 'bytes_freed'
+        """
+        # Digest -> [total size, file paths]
+        groups = {}
+        for folder, _, files in os.walk(self.cache_dir):
+            if folder == self.cache_dir:
+                continue
+            for name in files:
+                path = os.path.join(folder, name)
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    continue
+                group = groups.setdefault(name.split("_", 1)[0], [0, []])
+                group[0] += size
+                group[1].append(path)
+
+        total = sum(size for size, _ in groups.values())
+        report = {"removed": 0, "kept": len(groups), "bytes_freed": 0}
+        if total <= max_bytes:
+            return report
+
+        for digest in sorted(groups, key=lambda d: self.index.get(d, {}).get("used", 0)):
+            if total <= max_bytes:
+                break
+            size, paths = groups[digest]
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(f"Could not remove derivative {path}: {str(e)}")
+            if self.index.pop(digest, None) is not None:
+                self.modified = True
+            total -= size
+            report["removed"] += 1
+            report["kept"] -= 1
+            report["bytes_freed"] += size
+
+        self.save()
+        return report
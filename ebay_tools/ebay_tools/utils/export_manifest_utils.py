@@ -0,0 +1,248 @@
+"""
+export_manifest_utils.py - Export manifests for incremental exports
+
+This module tracks what a previous export wrote so the next one can skip work:
+- Content hashes of exported items and their rendered fragments
+- Fingerprints (size, modification time) of source photos and the files placed for them
+- Detection of orphaned files that are no longer referenced by any export
+  sharing the folder
+"""
+
+import os
+import json
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from ebay_tools.utils.file_utils import safe_load_json, safe_save_json
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# File name suffix of export manifests
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def content_hash(data: Any) -> str:
+    """
+    Compute a stable hash of JSON-serializable data.
+
+    Args:
+        data: Data to hash (dict keys are sorted first)
+
+    Returns:
+        Hex digest string
+    """
+    encoded = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def file_fingerprint(path: str) -> Optional[List[int]]:
+    """
+    Get a cheap fingerprint of a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        [size, mtime in nanoseconds], or None if the file doesn't exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class ExportManifest:
+    """
+    Record of a previous export, stored as JSON next to the exported file.
+
+    The manifest is rebuilt on every export: lookups read the previous
+    export's entries, and record_* calls fill in the new ones.  Entries are
+    discarded wholesale when the export settings signature changes.
+    """
+
+    def __init__(self, manifest_path: str, settings: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the manifest.
+
+        Args:
+            manifest_path: Path of the manifest JSON file
+            settings: Export settings; a change invalidates all previous entries
+        """
+        self.manifest_path = manifest_path
+        self.signature = content_hash(settings or {})
+
+        self.previous_items = {}
+        self.previous_photos = {}
+        self.previous_files = set()
+        self.items = {}
+        self.photos = {}
+
+        self.load()
+
+    def load(self) -> None:
+        """Load the previous export's entries from disk."""
+        if not os.path.exists(self.manifest_path):
+            return
+
+        data = safe_load_json(self.manifest_path, default_value={})
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            logger.info(f"Ignoring outdated export manifest {self.manifest_path}")
+            return
+
+        # Files are remembered even when the settings changed, so they can be cleaned up
+        self.previous_files = {
+            name for entry in data.get("photos", {}).values() for name in entry.get("files", [])
+        }
+
+        if data.get("signature") != self.signature:
+            logger.info(f"Export settings changed since {self.manifest_path} was written")
+            return
+
+        self.previous_items = data.get("items", {})
+        self.previous_photos = data.get("photos", {})
+
+    def save(self) -> bool:
+        """
+        Save the entries recorded during this export.
+
+        Returns:
+            True on success, False on failure
+        """
+        data = {
+            "version": MANIFEST_VERSION,
+            "signature": self.signature,
+            "items": self.items,
+            "photos": self.photos
+        }
+        return safe_save_json(data, self.manifest_path, indent=None)
+
+    def reset(self) -> None:
+        """Forget the previous export so everything is regenerated."""
+        self.previous_items = {}
+        self.previous_photos = {}
+
+    # ===== Items =====
+
+    def get_fragment(self, item_id: str, item_hash: str) -> Optional[str]:
+        """
+        Get the fragment rendered for an unchanged item by the previous export.
+
+        Args:
+            item_id: Item identifier
+            item_hash: Hash of the item's current content
+
+        Returns:
+            Previously rendered fragment, or None if the item is new or changed
+        """
+        entry = self.previous_items.get(item_id)
+        if entry and entry.get("hash") == item_hash:
+            return entry.get("fragment")
+        return None
+
+    def record_item(self, item_id: str, item_hash: str, fragment: str) -> None:
+        """
+        Record an item's rendered fragment for the next export.
+
+        Args:
+            item_id: Item identifier
+            item_hash: Hash of the item's content
+            fragment: Rendered fragment
+        """
+        self.items[item_id] = {"hash": item_hash, "fragment": fragment}
+
+    # ===== Photos =====
+
+    def reuse_photo(self, path: str, present_files: Set[str]) -> Optional[Any]:
+        """
+        Carry over the previous export's entry for an unchanged source photo.
+
+        Args:
+            path: Source photo path
+            present_files: Names of files currently in the export folder
+
+        Returns:
+            Data recorded for the photo, or None if the photo is new, changed,
+            or any of its exported files are missing
+        """
+        entry = self.previous_photos.get(path)
+        if not entry or entry.get("fingerprint") != file_fingerprint(path):
+            return None
+        if not all(name in present_files for name in entry.get("files", [])):
+            return None
+
+        self.photos[path] = entry
+        return entry.get("data")
+
+    def record_photo(self, path: str, files: Iterable[str], data: Any) -> None:
+        """
+        Record the files exported for a source photo.
+
+        Args:
+            path: Source photo path
+            files: Names of the files written for the photo
+            data: Any extra data needed to reuse the export (e.g. variant sizes)
+        """
+        self.photos[path] = {
+            "fingerprint": file_fingerprint(path),
+            "files": sorted(set(files)),
+            "data": data
+        }
+
+    def files_used_elsewhere(self) -> Set[str]:
+        """
+        Get files recorded by the other manifests next to this one.
+
+        Exports saved to the same folder share its photo folder, so a file
+        this export stops using may still belong to another export.
+
+        Returns:
+            Set of file names
+        """
+        folder = os.path.dirname(os.path.abspath(self.manifest_path))
+        own = os.path.basename(self.manifest_path)
+        used = set()
+        for name in os.listdir(folder):
+            if not name.endswith(MANIFEST_SUFFIX) or name == own:
+                continue
+            data = safe_load_json(os.path.join(folder, name), default_value={})
+            if isinstance(data, dict):
+                used.update(file_name for entry in data.get("photos", {}).values()
+                            for file_name in entry.get("files", []))
+        return used
+
+    def orphaned_files(self) -> Set[str]:
+        """
+        Get files written by the previous export that no export uses any more.
+
+        Returns:
+            Set of file names
+        """
+        current = {name for entry in self.photos.values() for name in entry.get("files", [])}
+        orphans = self.previous_files - current
+        return orphans - self.files_used_elsewhere() if orphans else orphans
+
+    def remove_orphans(self, folder: str) -> int:
+        """
+        Delete orphaned files from an export folder.
+
+        Args:
+            folder: Folder the files were exported to
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        for name in self.orphaned_files():
+            path = os.path.join(folder, name)
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+                    removed += 1
+            except OSError as e:
+                logger.warning(f"Could not remove orphaned file {path}: {str(e)}")
+        return removed
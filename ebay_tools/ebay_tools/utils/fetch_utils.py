@@ -0,0 +1,494 @@
+"""
+fetch_utils.py - Concurrent fetching helpers for eBay listing tools
+
+This module coordinates network requests made from worker threads including:
+- A per-host rate limiter shared by all workers
+- Coalescing of identical in-flight requests into a single fetch
+- A fetch scheduler with per-host concurrency limits, conditional GETs,
+  robots.txt rules and backoff on throttling responses
+"""
+
+import json
+import time
+import random
+import logging
+import threading
+import urllib.parse
+import urllib.robotparser
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+from ebay_tools.core.exceptions import NetworkError
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUEST_INTERVAL = 1.0
+DEFAULT_MAX_PER_HOST = 2
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 2.0
+DEFAULT_MAX_BACKOFF_SECONDS = 60.0
+DEFAULT_VALIDATOR_ENTRIES = 256
+
+# Responses that ask the client to slow down and retry later
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def url_host(url: str) -> str:
+    """
+    Get the host a URL points to.
+
+    Args:
+        url: URL (a bare host name is returned as is)
+
+    Returns:
+        Lowercase host name
+    """
+    host = urllib.parse.urlsplit(url).netloc if "://" in url else url
+    return host.lower()
+
+
+class HostRateLimiter:
+    """
+    Spaces out requests to each host across all threads.
+
+    Every request reserves the next free slot for its host, so concurrent
+    workers queue up behind each other instead of bursting.
+    """
+
+    def __init__(self, min_interval: float = DEFAULT_REQUEST_INTERVAL,
+                 host_intervals: Optional[Dict[str, float]] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            min_interval: Minimum seconds between requests to the same host
+            host_intervals: Host name -> interval overrides
+        """
+        self.min_interval = min_interval
+        self.host_intervals = {url_host(host): interval for host, interval in (host_intervals or {}).items()}
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    def interval_for(self, host: str) -> float:
+        """Get the request interval for a host."""
+        return self.host_intervals.get(host, self.min_interval)
+
+    def wait(self, url: str, interval: Optional[float] = None) -> float:
+        """
+        Block until a request to the URL's host is allowed.
+
+        Args:
+            url: URL (or host name) about to be requested
+            interval: Gap to keep after this request (defaults to the host's interval)
+
+        Returns:
+            Seconds waited
+        """
+        host = url_host(url)
+        if interval is None:
+            interval = self.interval_for(host)
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, 0.0))
+            self.next_slot[host] = slot + interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def defer(self, url: str, seconds: float):
+        """
+        Hold back all requests to the URL's host for a while.
+
+        Args:
+            url: URL (or host name) of the host to back off from
+            seconds: Seconds from now before the next request may start
+        """
+        host = url_host(url)
+        with self.lock:
+            resume = time.monotonic() + seconds
+            if resume > self.next_slot.get(host, 0.0):
+                self.next_slot[host] = resume
+
+
+class RequestCoalescer:
+    """
+    Shares one fetch between threads asking for the same thing at once.
+
+    The first caller for a key runs the fetch; callers arriving while it is
+    in flight wait for and receive the same result (or exception).  Results
+    are not kept once the fetch completes.
+    """
+
+    def __init__(self):
+        """Initialize the coalescer."""
+        self.in_flight = {}
+        self.lock = threading.Lock()
+
+    def run(self, key: Hashable, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a fetch, or join an identical one already in flight.
+
+        Args:
+            key: Identifies identical requests
+            function: Fetch function
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            The fetch result, shared by all callers for the key
+        """
+        with self.lock:
+            future = self.in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.in_flight[key] = future
+
+        if not owner:
+            logger.debug(f"Joining in-flight request for {key}")
+            return future.result()
+
+        try:
+            result = function(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+
+
+class FetchResult:
+    """
+    Outcome of a scheduled GET request.
+
+    A 304 Not Modified answer is turned into the stored copy of the page,
+    so callers always get the full content; not_modified tells them it was
+    reused.
+    """
+
+    def __init__(self, url: str, status_code: int, content: bytes,
+                 headers: Optional[Dict[str, str]] = None, not_modified: bool = False):
+        """
+        Initialize the result.
+
+        Args:
+            url: Requested URL including the query string
+            status_code: HTTP status (that of the stored copy for a 304)
+            content: Response body
+            headers: Response headers
+            not_modified: True if the server answered 304 and the stored copy was used
+        """
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.not_modified = not_modified
+
+    @property
+    def text(self) -> str:
+        """Body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Body parsed as JSON."""
+        return json.loads(self.content)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Read a Retry-After header.
+
+    Args:
+        value: Header value, either seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class FetchScheduler:
+    """
+    Runs GET requests from many threads while staying polite to each host.
+
+    Requests to a host are spaced out by a HostRateLimiter and at most
+    max_per_host of them are in flight at once, however many threads ask.
+    On top of that the scheduler:
+    - Reads each host's robots.txt once, refuses disallowed URLs and
+      widens the host's interval to its Crawl-delay
+    - Revalidates pages it has seen with If-None-Match/If-Modified-Since
+      and reuses its stored copy on 304 Not Modified
+    - Backs off from a host answering 429 or 5xx, honouring Retry-After,
+      before retrying
+    """
+
+    def __init__(self, session=None, rate_limiter: Optional[HostRateLimiter] = None,
+                 max_per_host: int = DEFAULT_MAX_PER_HOST,
+                 host_limits: Optional[Dict[str, int]] = None, max_workers: int = 8,
+                 respect_robots: bool = True, user_agent: Optional[str] = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+                 max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+                 validator_entries: int = DEFAULT_VALIDATOR_ENTRIES,
+                 timeout: float = 30):
+        """
+        Initialize the scheduler.
+
+        Args:
+            session: requests.Session used for all requests (a new one by default)
+            rate_limiter: Spaces out requests per host (a default HostRateLimiter by default)
+            max_per_host: Requests allowed in flight to one host at once
+            host_limits: Host name -> max_per_host overrides
+            max_workers: Threads used by map() and fetch_many()
+            respect_robots: Obey robots.txt rules and Crawl-delay
+            user_agent: Agent name matched against robots.txt (defaults to the session's)
+            max_retries: Retries after a throttling or server error response
+            backoff_seconds: First backoff delay, doubled on each retry
+            max_backoff_seconds: Longest backoff delay
+            validator_entries: Pages kept for conditional GETs
+            timeout: Request timeout in seconds
+        """
+        if session is None:
+            if requests is None:
+                raise NetworkError("requests is required for FetchScheduler")
+            session = requests.Session()
+        self.session = session
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.max_per_host = max(1, max_per_host)
+        self.host_limits = {url_host(host): max(1, limit) for host, limit in (host_limits or {}).items()}
+        self.max_workers = max(1, max_workers)
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent or self.session.headers.get("User-Agent", "*")
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.validator_entries = validator_entries
+        self.timeout = timeout
+
+        self.lock = threading.Lock()
+        self.host_slots = {}
+        self.robots = {}
+        self.robots_coalescer = RequestCoalescer()
+        self.validators = OrderedDict()
+
+    def _host_slot(self, host: str) -> threading.Semaphore:
+        """Get the semaphore limiting concurrent requests to a host."""
+        with self.lock:
+            slot = self.host_slots.get(host)
+            if slot is None:
+                limit = self.host_limits.get(host, self.max_per_host)
+                slot = self.host_slots[host] = threading.BoundedSemaphore(limit)
+            return slot
+
+    def _robots_for(self, url: str) -> Optional[urllib.robotparser.RobotFileParser]:
+        """Get the parsed robots.txt of the URL's host, fetching it the first time."""
+        parts = urllib.parse.urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        with self.lock:
+            if origin in self.robots:
+                return self.robots[origin]
+        return self.robots_coalescer.run(origin, self._load_robots, origin)
+
+    def _load_robots(self, origin: str) -> Optional[urllib.robotparser.RobotFileParser]:
+        """
+        Fetch and parse a host's robots.txt.
+
+        A missing robots.txt (4xx) allows everything.  If it cannot be read
+        because of a network or server error, everything is allowed for now
+        and it is fetched again next time.
+        """
+        robots_url = origin + "/robots.txt"
+        try:
+            self.rate_limiter.wait(robots_url)
+            response = self.session.get(robots_url, timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"Could not read {robots_url}: {e}")
+            return None
+
+        parser = urllib.robotparser.RobotFileParser(robots_url)
+        if response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif response.status_code >= 500:
+            logger.warning(f"Could not read {robots_url}: HTTP {response.status_code}")
+            return None
+        elif response.status_code >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(response.text.splitlines())
+
+        with self.lock:
+            self.robots[origin] = parser
+        return parser
+
+    def allowed(self, url: str) -> bool:
+        """
+        Check whether robots.txt lets the scheduler fetch a URL.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            True if the URL may be fetched
+        """
+        if not self.respect_robots:
+            return True
+        robots = self._robots_for(url)
+        return robots is None or robots.can_fetch(self.user_agent, url)
+
+    def _crawl_delay(self, url: str) -> Optional[float]:
+        """Get the Crawl-delay robots.txt sets for the URL's host, if any."""
+        if not self.respect_robots:
+            return None
+        robots = self._robots_for(url)
+        if robots is None:
+            return None
+        delay = robots.crawl_delay(self.user_agent)
+        return float(delay) if delay is not None else None
+
+    def _remember(self, url: str, response) -> None:
+        """Store a page that carries validators for later conditional GETs."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified) or self.validator_entries <= 0:
+            return
+        with self.lock:
+            self.validators[url] = (etag, last_modified, response.status_code,
+                                    response.content, dict(response.headers))
+            self.validators.move_to_end(url)
+            while len(self.validators) > self.validator_entries:
+                self.validators.popitem(last=False)
+
+    def _backoff_delay(self, attempt: int, response) -> float:
+        """Get how long to back off before retry number attempt."""
+        delay = retry_after_seconds(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = self.backoff_seconds * (2 ** attempt) * (1 + random.random() * 0.25)
+        return min(delay, self.max_backoff_seconds)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            interval: Optional[float] = None, check_robots: bool = True) -> FetchResult:
+        """
+        Fetch a URL politely.
+
+        Args:
+            url: URL to fetch
+            params: Query parameters to add to the URL
+            interval: Gap to keep before the next request to the host
+                      (defaults to the rate limiter's interval for the host)
+            check_robots: Apply robots.txt (switch off for API endpoints,
+                          which are not crawled)
+
+        Returns:
+            FetchResult with the page content
+
+        Raises:
+            NetworkError: If robots.txt disallows the URL
+            requests.HTTPError: If the server still answers with an error after retries
+        """
+        if params:
+            url = url + ("&" if "?" in url else "?") + urllib.parse.urlencode(params)
+
+        if check_robots and not self.allowed(url):
+            raise NetworkError(f"robots.txt disallows fetching {url}", {"url": url})
+
+        crawl_delay = self._crawl_delay(url) if check_robots else None
+        if crawl_delay is not None:
+            interval = max(interval if interval is not None else self.rate_limiter.interval_for(url_host(url)),
+                           crawl_delay)
+
+        with self.lock:
+            stored = self.validators.get(url)
+        headers = {}
+        if stored:
+            etag, last_modified = stored[0], stored[1]
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        host = url_host(url)
+        attempt = 0
+        while True:
+            with self._host_slot(host):
+                self.rate_limiter.wait(url, interval)
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                delay = self._backoff_delay(attempt, response)
+                logger.warning(f"HTTP {response.status_code} from {host}; backing off {delay:.1f} seconds")
+                self.rate_limiter.defer(url, delay)
+                attempt += 1
+                continue
+            break
+
+        if response.status_code == 304 and stored:
+            logger.debug(f"Not modified: {url}")
+            return FetchResult(url, stored[2], stored[3], stored[4], not_modified=True)
+
+        response.raise_for_status()
+        self._remember(url, response)
+        return FetchResult(url, response.status_code, response.content, dict(response.headers))
+
+    def map(self, function: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Run a function over items concurrently.
+
+        The function would normally fetch through this scheduler, which keeps
+        the requests polite whatever the number of threads.
+
+        Args:
+            function: Function called with each item
+            items: Items to process
+
+        Returns:
+            List of results in the order of items (exceptions are raised)
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [function(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(function, items))
+
+    def fetch_many(self, urls: Iterable[str], interval: Optional[float] = None) -> List[Any]:
+        """
+        Fetch several URLs concurrently.
+
+        Args:
+            urls: URLs to fetch
+            interval: Gap to keep between requests to a host (see get())
+
+        Returns:
+            List with a FetchResult, or the exception raised, for each URL in order
+        """
+        def fetch(url):
+            try:
+                return self.get(url, interval=interval)
+            except Exception as e:
+                return e
+
+        return self.map(fetch, urls)
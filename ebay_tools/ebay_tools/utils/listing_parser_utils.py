@@ -0,0 +1,390 @@
+"""
+listing_parser_utils.py - Fast parsing of eBay search result pages for eBay listing tools
+
+This module extracts listings from scraped eBay sold-listing pages including:
+- The container and field selectors for eBay's search result markup
+- Selectors compiled once into a single query per listing container
+- selectolax and lxml parser backends, chosen by what is installed
+- Lazy iteration, so parsing stops once enough listings are collected
+"""
+
+import re
+import logging
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxHTMLParser
+except ImportError:
+    try:
+        # selectolax before 0.3 only has the Modest parser
+        from selectolax.parser import HTMLParser as SelectolaxHTMLParser
+    except ImportError:
+        SelectolaxHTMLParser = None
+
+try:
+    from lxml import etree
+    import lxml.html
+except ImportError:
+    etree = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Listing containers, tried in order until one matches
+LISTING_CONTAINER_SELECTORS = [
+    '.s-item__wrapper',
+    '.s-item',
+    '.srp-results .s-item'
+]
+
+# Listing field -> (selectors tried in order, default text); "url" takes an href
+LISTING_FIELD_SELECTORS = {
+    'title': (['.s-item__title', 'h3.s-item__title', '.it-ttl a'], "Unknown"),
+    'price': (['.s-item__price .notranslate', '.s-item__price', '.u-flL.condText span', '.bidsold'], "$0.00"),
+    'shipping': (['.s-item__shipping', '.s-item__detail--shipping', '.vi-acc-del-range'], ""),
+    'condition': (['.SECONDARY_INFO', '.s-item__subtitle', '.condText'], "Used"),
+    'url': (['.s-item__link', 'h3.s-item__title a', '.it-ttl a'], ""),
+    'sold_date': (['.s-item__title--tag', '.s-item__ended-date', '.sold-date'], ""),
+    'location': (['.s-item__location', '.s-item__itemLocation'], ""),
+}
+
+# Parser backends in order of preference
+PARSER_BACKENDS = ('selectolax', 'lxml')
+
+_COMPOUND_PATTERN = re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)?((?:\.[-_a-zA-Z0-9]+)*)$')
+
+
+class CompiledSelector:
+    """
+    A CSS selector of tag/class compounds joined by descendant combinators.
+
+    That subset covers eBay's search result markup and can be matched
+    against an element and its ancestors without a CSS engine.
+    """
+
+    def __init__(self, selector: str):
+        """
+        Compile a selector.
+
+        Args:
+            selector: CSS selector such as ".s-item__price .notranslate" or "h3.s-item__title a"
+
+        Raises:
+            ValueError: If the selector uses unsupported syntax
+        """
+        self.selector = selector
+        self.parts = []
+        for compound in selector.split():
+            match = _COMPOUND_PATTERN.match(compound)
+            if not match or compound == '':
+                raise ValueError(f"Unsupported selector: {selector}")
+            tag = match.group(1).lower() if match.group(1) else None
+            classes = frozenset(name for name in match.group(2).split('.') if name)
+            self.parts.append((tag, classes))
+        if not self.parts:
+            raise ValueError("Empty selector")
+
+    @staticmethod
+    def _compound_matches(part: Tuple[Optional[str], frozenset], tag: str, classes: frozenset) -> bool:
+        """Check one tag/class compound against an element."""
+        part_tag, part_classes = part
+        return (part_tag is None or part_tag == tag) and part_classes <= classes
+
+    def matches(self, tag: str, classes: frozenset, ancestors: Iterator[Tuple[str, frozenset]]) -> bool:
+        """
+        Check whether an element matches.
+
+        Args:
+            tag: Element tag (lowercase)
+            classes: Element classes
+            ancestors: (tag, classes) of the element's ancestors, nearest first
+
+        Returns:
+            True if the element matches the selector
+        """
+        if not self._compound_matches(self.parts[-1], tag, classes):
+            return False
+        remaining = len(self.parts) - 2
+        if remaining < 0:
+            return True
+        for ancestor_tag, ancestor_classes in ancestors:
+            if self._compound_matches(self.parts[remaining], ancestor_tag, ancestor_classes):
+                remaining -= 1
+                if remaining < 0:
+                    return True
+        return False
+
+    def xpath(self, relative: bool = True) -> str:
+        """Translate to an equivalent XPath expression."""
+        steps = []
+        for tag, classes in self.parts:
+            tests = "".join(
+                f"[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]" for name in sorted(classes)
+            )
+            steps.append(f"{tag or '*'}{tests}")
+        return ("." if relative else "") + "//" + "//".join(steps)
+
+
+class ListingParser:
+    """
+    Base class of the listing parser backends.
+
+    Every field selector is compiled once.  Each listing container is
+    searched in a single pass (one combined query, or one walk) for the
+    elements that could match any field selector, in document order; each
+    is then attributed to the selectors it matches, keeping the first match
+    of each selector as select_one() would.
+    """
+
+    name = None
+
+    def __init__(self, container_selectors: Optional[List[str]] = None,
+                 field_selectors: Optional[Dict[str, Tuple[List[str], str]]] = None):
+        """
+        Compile the selectors.
+
+        Args:
+            container_selectors: Listing container selectors, tried in order
+            field_selectors: Field name -> (selectors tried in order, default text)
+        """
+        self.container_selectors = [CompiledSelector(selector)
+                                    for selector in (container_selectors or LISTING_CONTAINER_SELECTORS)]
+        self.field_selectors = field_selectors or LISTING_FIELD_SELECTORS
+
+        # Unique selectors and, for each field, the indices of its selectors in order
+        self.selectors = []
+        index_of = {}
+        self.field_indices = {}
+        for field, (selectors, _) in self.field_selectors.items():
+            indices = []
+            for selector in selectors:
+                if selector not in index_of:
+                    index_of[selector] = len(self.selectors)
+                    self.selectors.append(CompiledSelector(selector))
+                indices.append(index_of[selector])
+            self.field_indices[field] = indices
+
+        # Candidate selectors for an element, looked up by its classes and tag
+        self.by_class = {}
+        self.by_tag = {}
+        for index, selector in enumerate(self.selectors):
+            tag, classes = selector.parts[-1]
+            if classes:
+                self.by_class.setdefault(min(classes), []).append(index)
+            else:
+                self.by_tag.setdefault(tag, []).append(index)
+
+    def iter_listings(self, html: bytes) -> Iterator[Dict[str, str]]:
+        """
+        Parse a search results page lazily.
+
+        Args:
+            html: Page content
+
+        Yields:
+            Dictionary of raw field texts for each listing container, in page order
+        """
+        raise NotImplementedError
+
+    def _first_matches(self, candidates) -> List[Optional[object]]:
+        """
+        Attribute a container's candidate elements to selectors.
+
+        Args:
+            candidates: (element, tag, classes, ancestors function) in document order
+
+        Returns:
+            First matching element for each selector (None where nothing matched)
+        """
+        first = [None] * len(self.selectors)
+        missing = len(self.selectors)
+        for element, tag, classes, ancestors in candidates:
+            indices = list(self.by_tag.get(tag, ()))
+            for name in classes:
+                indices.extend(self.by_class.get(name, ()))
+            for index in indices:
+                if first[index] is None and self.selectors[index].matches(tag, classes, ancestors()):
+                    first[index] = element
+                    missing -= 1
+            if not missing:
+                break
+        return first
+
+    def _fields(self, first: List[Optional[object]], text, href) -> Dict[str, str]:
+        """Pick each field's value from the first selector with a usable match."""
+        fields = {}
+        for field, (_, default) in self.field_selectors.items():
+            value = default
+            for index in self.field_indices[field]:
+                element = first[index]
+                if element is None:
+                    continue
+                if field == 'url':
+                    # Links use the first selector whose element has an href
+                    link = href(element)
+                    if link:
+                        value = link
+                        break
+                else:
+                    content = text(element)
+                    if content:
+                        value = content
+                        break
+            fields[field] = value
+        return fields
+
+
+class SelectolaxListingParser(ListingParser):
+    """Listing parser backed by selectolax."""
+
+    name = 'selectolax'
+
+    def __init__(self, *args, **kwargs):
+        """Compile the selectors, including one combined CSS selector list."""
+        super().__init__(*args, **kwargs)
+        self.candidate_query = ", ".join(selector.selector for selector in self.selectors)
+
+    @staticmethod
+    def _classes(node) -> frozenset:
+        """Get a node's classes."""
+        return frozenset((node.attributes.get('class') or '').split())
+
+    def _ancestors(self, node):
+        """Get a function yielding a node's ancestors as (tag, classes), nearest first."""
+        def ancestors():
+            parent = node.parent
+            # The document node (named "#document" or "-undef") ends the walk
+            while parent is not None and parent.tag[:1] not in ('#', '-'):
+                yield parent.tag, self._classes(parent)
+                parent = parent.parent
+        return ancestors
+
+    def iter_listings(self, html: bytes) -> Iterator[Dict[str, str]]:
+        """Parse a search results page lazily."""
+        tree = SelectolaxHTMLParser(html)
+        containers = []
+        for selector in self.container_selectors:
+            containers = tree.css(selector.selector)
+            if containers:
+                break
+
+        logger.debug(f"Found {len(containers)} item containers")
+
+        text = lambda node: node.text(deep=True, separator='', strip=True)
+        href = lambda node: node.attributes.get('href')
+        for container in containers:
+            candidates = ((node, node.tag, self._classes(node), self._ancestors(node))
+                          for node in container.css(self.candidate_query))
+            yield self._fields(self._first_matches(candidates), text, href)
+
+
+class LxmlListingParser(ListingParser):
+    """Listing parser backed by lxml with precompiled XPath queries."""
+
+    name = 'lxml'
+
+    def __init__(self, *args, **kwargs):
+        """Compile the container selectors into XPath."""
+        super().__init__(*args, **kwargs)
+        self.container_queries = [etree.XPath(selector.xpath(relative=False)) for selector in self.container_selectors]
+
+    @staticmethod
+    def _classes(element) -> frozenset:
+        """Get an element's classes."""
+        return frozenset((element.get('class') or '').split())
+
+    def _ancestors(self, element):
+        """Get a function yielding an element's ancestors as (tag, classes), nearest first."""
+        def ancestors():
+            for ancestor in element.iterancestors():
+                yield ancestor.tag, self._classes(ancestor)
+        return ancestors
+
+    def _candidates(self, container):
+        """
+        Walk a container once, yielding the elements that could match a field selector.
+
+        A union XPath of all the selectors rescans the container for each of
+        them; one walk checking each element's tag and classes is cheaper.
+        """
+        by_tag = self.by_tag
+        by_class = self.by_class
+        for element in container.iterdescendants():
+            tag = element.tag
+            if not isinstance(tag, str):
+                # Comments and processing instructions
+                continue
+            class_attribute = element.get('class')
+            if class_attribute:
+                classes = frozenset(class_attribute.split())
+                if tag not in by_tag and by_class.keys().isdisjoint(classes):
+                    continue
+            elif tag in by_tag:
+                classes = frozenset()
+            else:
+                continue
+            yield element, tag, classes, self._ancestors(element)
+
+    @staticmethod
+    def _text(element) -> str:
+        """Get an element's text like BeautifulSoup's get_text(strip=True), skipping comments."""
+        # itertext() leaves out the text of comments
+        return "".join(piece.strip() for piece in element.itertext())
+
+    def iter_listings(self, html: bytes) -> Iterator[Dict[str, str]]:
+        """Parse a search results page lazily."""
+        tree = lxml.html.fromstring(html)
+        containers = []
+        for query in self.container_queries:
+            containers = query(tree)
+            if containers:
+                break
+
+        logger.debug(f"Found {len(containers)} item containers")
+
+        href = lambda element: element.get('href')
+        for container in containers:
+            yield self._fields(self._first_matches(self._candidates(container)), self._text, href)
+
+
+_BACKEND_CLASSES = {
+    'selectolax': SelectolaxListingParser if SelectolaxHTMLParser else None,
+    'lxml': LxmlListingParser if etree is not None else None,
+}
+
+
+def available_parser_backends() -> List[str]:
+    """
+    Get the installed parser backends.
+
+    Returns:
+        Backend names in order of preference
+    """
+    return [name for name in PARSER_BACKENDS if _BACKEND_CLASSES[name]]
+
+
+def get_listing_parser(backend: Optional[str] = None) -> Optional[ListingParser]:
+    """
+    Get a listing parser.
+
+    Args:
+        backend: "selectolax", "lxml", "auto"/None for the fastest installed
+                 backend, or "bs4" for none (callers fall back to BeautifulSoup)
+
+    Returns:
+        ListingParser, or None if no fast backend is available or wanted
+    """
+    if backend == 'bs4':
+        return None
+    if backend in (None, 'auto'):
+        available = available_parser_backends()
+        if not available:
+            logger.info("Neither selectolax nor lxml is installed; parsing with BeautifulSoup")
+            return None
+        backend = available[0]
+    if backend not in _BACKEND_CLASSES:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    if not _BACKEND_CLASSES[backend]:
+        logger.warning(f"Parser backend {backend} is not installed; parsing with BeautifulSoup")
+        return None
+    return _BACKEND_CLASSES[backend]()
@@ -0,0 +1,459 @@
+"""
+photo_store_utils.py - Content-addressed photo storage for eBay listing tools
+
+This module provides a shared store of photos named by their SHA-256 digest:
+- Digest computation with a persistent cache keyed by path, size and mtime
+- Adding streams (e.g. ZIP members) to the store without duplicates
+- Placing photos into export folders under their digest by reflink or copy
+- Pruning stored photos that no queue or gallery refers to any more
+"""
+
+import os
+import sys
+import json
+import stat
+import time
+import shutil
+import hashlib
+import logging
+import argparse
+import tempfile
+from typing import Any, BinaryIO, Dict, Iterable, Optional, Set
+
+from ebay_tools.core.config import DEFAULT_CONFIG_DIR
+from ebay_tools.utils.file_utils import ensure_directory_exists, safe_load_json, safe_save_json
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Default location of the shared photo store
+DEFAULT_PHOTO_STORE_DIR = os.path.join(DEFAULT_CONFIG_DIR, "photo_store")
+
+# File extensions treated as photos
+PHOTO_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.heic')
+
+# Read size used when hashing
+CHUNK_SIZE = 1024 * 1024
+
+# Linux ioctl request number for copy-on-write clones (FICLONE)
+_FICLONE = 0x40049409
+
+# Stored photos younger than this are never pruned, so photos added by an
+# import that hasn't saved its queue yet survive
+DEFAULT_PRUNE_MIN_AGE = 24 * 60 * 60
+
+_READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+def file_sha256(path: str) -> str:
+    """
+    Compute the SHA-256 digest of a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(src: str, dest: str) -> bool:
+    """Try to create a copy-on-write clone of src at dest (Linux only)."""
+    if not sys.platform.startswith('linux'):
+        return False
+
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    try:
+        with open(src, 'rb') as fsrc, open(dest, 'wb') as fdest:
+            fcntl.ioctl(fdest.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copystat(src, dest)
+        return True
+    except OSError:
+        if os.path.exists(dest):
+            os.remove(dest)
+        return False
+
+
+def _make_read_only(path: str) -> None:
+    """Clear the write permission bits of a file."""
+    os.chmod(path, _READ_ONLY)
+
+
+def _make_writable(path: str) -> None:
+    """Give the owner write permission on a file."""
+    os.chmod(path, os.stat(path).st_mode | stat.S_IWUSR)
+
+
+def link_or_copy(src: str, dest: str, allow_hardlink: bool = False) -> str:
+    """
+    Place a file at dest using the cheapest safe method available.
+
+    Tries a hardlink first (only when allowed: both names then share one
+    file, so editing either changes the other), then a copy-on-write
+    reflink, and falls back to a regular copy.  Copies are always writable,
+    even when src is read-only.
+
+    Args:
+        src: Source file path
+        dest: Destination file path (must not exist)
+        allow_hardlink: Whether a hardlink may be used
+
+    Returns:
+        Method used: 'hardlink', 'reflink' or 'copy'
+    """
+    if allow_hardlink:
+        try:
+            os.link(src, dest)
+            return 'hardlink'
+        except OSError:
+            pass
+
+    if _reflink(src, dest):
+        method = 'reflink'
+    else:
+        shutil.copy2(src, dest)
+        method = 'copy'
+
+    _make_writable(dest)
+    return method
+
+
+class PhotoStore:
+    """
+    Content-addressed photo store.
+
+    Photos that have no file of their own (e.g. ZIP imports) are stored once
+    as objects/<xx>/<sha256><ext>, read-only since their name is their
+    content.  Exports get copies (reflinks where the file system supports
+    them) named after the digest, made straight from the source file, so
+    photos with the same file name can never collide.  prune() removes
+    stored photos nothing refers to any more.
+    """
+
+    def __init__(self, store_dir: Optional[str] = None, hardlink_exports: bool = False):
+        """
+        Initialize the photo store.
+
+        Args:
+            store_dir: Store directory (defaults to ~/.ebay_tools/photo_store)
+            hardlink_exports: Hardlink exported photos to stored objects
+                              instead of copying them; the shared file is
+                              read-only, so it can't be edited in place.
+                              Photos from outside the store are always copied.
+        """
+        self.store_dir = store_dir or DEFAULT_PHOTO_STORE_DIR
+        self.hardlink_exports = hardlink_exports
+        self.objects_dir = os.path.join(self.store_dir, "objects")
+        self.index_path = os.path.join(self.store_dir, "index.json")
+
+        ensure_directory_exists(self.objects_dir)
+
+        # Source path -> {"size", "mtime", "digest"}
+        self.index = {}
+        self.modified = False
+        self.load()
+
+    def load(self) -> None:
+        """Load the digest index from disk."""
+        if os.path.exists(self.index_path):
+            data = safe_load_json(self.index_path, default_value={})
+            self.index = data if isinstance(data, dict) else {}
+
+    def save(self) -> bool:
+        """
+        Save the digest index to disk if anything changed.
+
+        Returns:
+            True on success or when there was nothing to save, False on failure
+        """
+        if not self.modified:
+            return True
+        if safe_save_json(self.index, self.index_path, indent=None):
+            self.modified = False
+            return True
+        return False
+
+    @staticmethod
+    def object_name(digest: str, ext: str) -> str:
+        """
+        Get the file name used for a stored photo.
+
+        Args:
+            digest: SHA-256 hex digest
+            ext: File extension including the dot
+
+        Returns:
+            File name of the form <digest><ext>
+        """
+        return f"{digest}{ext.lower()}"
+
+    def object_path(self, digest: str, ext: str) -> str:
+        """
+        Get the full path of a stored photo.
+
+        Args:
+            digest: SHA-256 hex digest
+            ext: File extension including the dot
+
+        Returns:
+            Path inside the objects directory
+        """
+        return os.path.join(self.objects_dir, digest[:2], self.object_name(digest, ext))
+
+    def digest(self, path: str) -> str:
+        """
+        Get the SHA-256 digest of a file, using the index when it is up to date.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Hex digest string
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+
+        entry = self.index.get(key)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime_ns:
+            return entry["digest"]
+
+        value = file_sha256(key)
+        self.index[key] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "digest": value}
+        self.modified = True
+        return value
+
+    def is_stored(self, path: str) -> bool:
+        """
+        Check whether a path is an object inside the store.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if the path lies in the objects directory
+        """
+        objects_dir = os.path.abspath(self.objects_dir)
+        return os.path.abspath(path).startswith(objects_dir + os.sep)
+
+    def add_stream(self, stream: BinaryIO, ext: str) -> str:
+        """
+        Add the contents of a binary stream to the store.
+
+        The data is hashed while it is written to a temporary file, so the
+        stream is read exactly once.
+
+        Args:
+            stream: Readable binary stream (e.g. an open ZIP member)
+            ext: File extension including the dot
+
+        Returns:
+            Path of the stored object
+        """
+        digest = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self.objects_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    out.write(chunk)
+
+            dest = self.object_path(digest.hexdigest(), ext)
+            if os.path.exists(dest):
+                os.remove(tmp)
+            else:
+                ensure_directory_exists(os.path.dirname(dest))
+                _make_read_only(tmp)
+                os.replace(tmp, dest)
+            return dest
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def place(self, path: str, dest_dir: str) -> str:
+        """
+        Place a photo in an export directory under its content-addressed name.
+
+        The photo is cloned or copied straight from its source, so it is
+        written once.  If a file with that name already exists it has the
+        same content, so repeat exports only cost a stat call per photo.
+
+        Args:
+            path: Path to the source photo
+            dest_dir: Directory to place the photo in
+
+        Returns:
+            File name of the placed photo (relative to dest_dir)
+        """
+        ext = os.path.splitext(path)[1]
+        name = self.object_name(self.digest(path), ext)
+        dest = os.path.join(dest_dir, name)
+
+        if not os.path.exists(dest):
+            # Write under a temporary name so an interrupted copy never
+            # leaves a partial file behind the digest name
+            tmp = f"{dest}.tmp{os.getpid()}"
+            try:
+                link_or_copy(path, tmp, allow_hardlink=self.hardlink_exports and self.is_stored(path))
+                os.replace(tmp, dest)
+            except Exception:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+
+        return name
+
+    def place_all(self, paths: Iterable[str], dest_dir: str) -> Dict[str, str]:
+        """
+        Place several photos in an export directory.
+
+        Missing or unreadable photos are logged and left out of the result.
+
+        Args:
+            paths: Source photo paths
+            dest_dir: Directory to place the photos in
+
+        Returns:
+            Dictionary mapping each source path to its placed file name
+        """
+        ensure_directory_exists(dest_dir)
+
+        names = {}
+        for path in paths:
+            if path in names or not os.path.exists(path):
+                continue
+            try:
+                names[path] = self.place(path, dest_dir)
+            except Exception as e:
+                logger.error(f"Error placing photo {path} in {dest_dir}: {str(e)}")
+
+        self.save()
+        return names
+
+    def prune(self, keep: Iterable[str], min_age: float = DEFAULT_PRUNE_MIN_AGE,
+              dry_run: bool = False) -> Dict[str, int]:
+        """
+        Remove stored photos that are no longer referenced.
+
+        Export folders hold their own copies, so a stored photo is only
+        needed while some queue or gallery still refers to it, either by
+        its stored path (mobile imports) or by a source file with the same
+        content.  Index entries of source files that are gone are dropped
+        as well.
+
+        Args:
+            keep: Paths of photos still in use (stored objects or source files)
+            min_age: Only remove stored photos older than this many seconds
+            dry_run: Only count what would be removed
+
+        Returns:
+            Dictionary with 'removed', 'kept' and 'bytes_freed'
+        """
+        keep_names = set()
+        for path in keep:
+            if self.is_stored(path):
+                keep_names.add(os.path.basename(path).lower())
+            elif os.path.isfile(path):
+                try:
+                    keep_names.add(self.object_name(self.digest(path), os.path.splitext(path)[1]))
+                except OSError as e:
+                    logger.warning(f"Could not read photo {path}: {str(e)}")
+
+        report = {"removed": 0, "kept": 0, "bytes_freed": 0}
+        cutoff = time.time() - min_age
+        for folder, _, files in os.walk(self.objects_dir):
+            for name in files:
+                path = os.path.join(folder, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                # Temporary files of interrupted adds are removed once they are old
+                if name.lower() in keep_names or info.st_mtime > cutoff:
+                    report["kept"] += 1
+                    continue
+                if not dry_run:
+                    try:
+                        _make_writable(path)
+                        os.remove(path)
+                    except OSError as e:
+                        logger.warning(f"Could not remove stored photo {path}: {str(e)}")
+                        report["kept"] += 1
+                        continue
+                report["removed"] += 1
+                report["bytes_freed"] += info.st_size
+
+        if not dry_run:
+            for key in [key for key in self.index if not os.path.exists(key)]:
+                del self.index[key]
+                self.modified = True
+            self.save()
+
+        return report
+
+
+def referenced_photos(json_files: Iterable[str]) -> Set[str]:
+    """
+    Collect the photo paths referred to by queue, gallery or import files.
+
+    Every string in the files that names an existing photo file counts, so
+    any layout of item data works.
+
+    Args:
+        json_files: Paths of JSON files
+
+    Returns:
+        Set of photo paths
+    """
+    paths = set()
+
+    def visit(value: Any) -> None:
+        if isinstance(value, dict):
+            for child in value.values():
+                visit(child)
+        elif isinstance(value, list):
+            for child in value:
+                visit(child)
+        elif isinstance(value, str) and value.lower().endswith(PHOTO_EXTENSIONS) and os.path.isfile(value):
+            paths.add(value)
+
+    for json_file in json_files:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            visit(json.load(f))
+
+    return paths
+
+
+def main():
+    """Prune the photo store from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Remove stored photos that none of the given queue or gallery files refer to.")
+    parser.add_argument('files', nargs='+', metavar='JSON_FILE',
+                        help='queue, gallery or import files whose photos are kept')
+    parser.add_argument('--store', help='photo store directory')
+    parser.add_argument('--min-age', type=float, default=DEFAULT_PRUNE_MIN_AGE / 3600,
+                        help='only remove photos stored more than this many hours ago')
+    parser.add_argument('--dry-run', action='store_true', help='only report what would be removed')
+    args = parser.parse_args()
+
+    store = PhotoStore(args.store)
+    report = store.prune(referenced_photos(args.files), args.min_age * 3600, args.dry_run)
+    action = "Would remove" if args.dry_run else "Removed"
+    print(f"{action} {report['removed']} stored photos ({report['bytes_freed'] / 1024 / 1024:.1f} MB), "
+          f"kept {report['kept']}")
+
+
+if __name__ == '__main__':
+    main()
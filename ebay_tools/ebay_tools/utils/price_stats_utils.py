@@ -0,0 +1,458 @@
+"""
+price_stats_utils.py - Price statistics for eBay listing tools
+
+This module summarizes the prices of comparable listings including:
+- Quantiles by linear interpolation (the NumPy default)
+- Outlier rejection by interquartile range or median absolute deviation
+- Trimmed means and sold-date recency weighted means and medians
+- A confidence score from the number and spread of comparables
+- A batched API that summarizes many comp sets in one call
+
+NumPy is used when installed; otherwise the same statistics are computed
+in pure Python.
+"""
+
+import math
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+HAS_NUMPY = np is not None
+
+# Outlier rejection defaults
+DEFAULT_OUTLIER_METHOD = "iqr"
+DEFAULT_IQR_MULTIPLIER = 1.5
+DEFAULT_MAD_THRESHOLD = 3.5
+MIN_OUTLIER_COUNT = 4
+
+# Share of the lowest and highest prices left out of the trimmed mean
+DEFAULT_TRIM_PROPORTION = 0.1
+
+# A sale this many days old counts half as much as one made today
+DEFAULT_HALF_LIFE_DAYS = 30.0
+
+# Number of comparables that earns half the confidence score on its own
+DEFAULT_CONFIDENCE_MIN_ITEMS = 10
+
+# Scales the median absolute deviation to a normal standard deviation
+_MAD_SCALE = 0.6745
+
+# Relative slack when cumulative weight is compared with half the total, so
+# rounding in the order the weights are summed can't change the median
+_MEDIAN_TOLERANCE = 1e-9
+
+
+def quantile(values: Sequence[float], q: float) -> float:
+    """
+    Get a quantile by linear interpolation between the closest values.
+
+    Args:
+        values: Non-empty values
+        q: Quantile between 0 and 1
+
+    Returns:
+        Quantile value
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def outlier_mask(values: Sequence[float], method: str = DEFAULT_OUTLIER_METHOD,
+                 iqr_multiplier: float = DEFAULT_IQR_MULTIPLIER,
+                 mad_threshold: float = DEFAULT_MAD_THRESHOLD) -> List[bool]:
+    """
+    Flag the values to keep after outlier rejection.
+
+    Args:
+        values: Values
+        method: "iqr" (outside the quartiles by more than iqr_multiplier
+                interquartile ranges), "mad" (modified z-score above
+                mad_threshold) or "none"
+        iqr_multiplier: Interquartile ranges allowed outside the quartiles
+        mad_threshold: Largest modified z-score kept
+
+    Returns:
+        List with True for each value to keep (all True for fewer than four values)
+    """
+    if method == "none" or len(values) < MIN_OUTLIER_COUNT:
+        return [True] * len(values)
+
+    if method == "mad":
+        median = quantile(values, 0.5)
+        mad = quantile([abs(value - median) for value in values], 0.5)
+        if mad == 0:
+            return [True] * len(values)
+        return [abs(_MAD_SCALE * (value - median) / mad) <= mad_threshold for value in values]
+
+    if method != "iqr":
+        raise ValueError(f"Unknown outlier method: {method}")
+
+    q1 = quantile(values, 0.25)
+    q3 = quantile(values, 0.75)
+    spread = (q3 - q1) * iqr_multiplier
+    return [q1 - spread <= value <= q3 + spread for value in values]
+
+
+def trimmed_mean(values: Sequence[float], proportion: float = DEFAULT_TRIM_PROPORTION) -> float:
+    """
+    Get the mean after leaving out a share of the lowest and highest values.
+
+    Args:
+        values: Non-empty values
+        proportion: Share cut from each end (rounded down to whole values)
+
+    Returns:
+        Trimmed mean
+    """
+    ordered = sorted(values)
+    cut = int(len(ordered) * proportion)
+    kept = ordered[cut:len(ordered) - cut] or ordered
+    return sum(kept) / len(kept)
+
+
+def parse_sold_date(value: Any) -> Optional[datetime]:
+    """
+    Parse a listing's sold date.
+
+    Args:
+        value: datetime, or ISO 8601 / "YYYY-MM-DD" string
+
+    Returns:
+        Timezone-aware datetime (UTC when unspecified), or None if unparseable
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value.strip():
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def recency_weights(sold_dates: Sequence[Any], half_life_days: float = DEFAULT_HALF_LIFE_DAYS,
+                    now: Optional[datetime] = None) -> List[float]:
+    """
+    Weight listings by how recently they sold.
+
+    A weight halves for every half_life_days of age.  Listings without a
+    usable sold date get the average weight of the dated ones.
+
+    Args:
+        sold_dates: Sold date of each listing
+        half_life_days: Age in days at which a sale counts half
+        now: Reference time (defaults to the current time)
+
+    Returns:
+        Weight of each listing (all 1.0 when no dates are known)
+    """
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+
+    weights = []
+    for value in sold_dates:
+        sold = parse_sold_date(value)
+        if sold is None or not half_life_days:
+            weights.append(None)
+            continue
+        age_days = max(0.0, (now - sold).total_seconds() / 86400)
+        weights.append(0.5 ** (age_days / half_life_days))
+
+    known = [weight for weight in weights if weight is not None]
+    fill = sum(known) / len(known) if known else 1.0
+    return [fill if weight is None else weight for weight in weights]
+
+
+def weighted_median(values: Sequence[float], weights: Sequence[float]) -> float:
+    """
+    Get the value at which the cumulative weight first reaches half the total.
+
+    Cumulative weights within a relative _MEDIAN_TOLERANCE of half count as
+    reaching it, so a median that falls exactly between two values is the
+    lower one however the sums round.
+
+    Args:
+        values: Non-empty values
+        weights: Non-negative weight of each value
+
+    Returns:
+        Weighted median
+    """
+    pairs = sorted(zip(values, weights))
+    threshold = sum(weight for _, weight in pairs) / 2 * (1 - _MEDIAN_TOLERANCE)
+    cumulative = 0.0
+    for value, weight in pairs:
+        cumulative += weight
+        if cumulative >= threshold:
+            return value
+    return pairs[-1][0]
+
+
+def confidence_score(count: int, stdev: float, median: float,
+                     min_items: int = DEFAULT_CONFIDENCE_MIN_ITEMS) -> float:
+    """
+    Score how far a price estimate can be trusted (0-100).
+
+    The number of comparables scores 50 per min_items, and a tight spread up
+    to 50 more (less the coefficient of variation, stdev / median, in percent).
+
+    Args:
+        count: Number of comparables
+        stdev: Standard deviation of their prices
+        median: Median of their prices
+        min_items: Number of comparables that scores 50
+
+    Returns:
+        Confidence score
+    """
+    count_score = min(100, (count / min_items) * 50) if min_items else 50
+    variability_score = max(0, 50 - (stdev / median * 100)) if median > 0 else 0
+    return min(100, count_score + variability_score)
+
+
+def _python_stats(prices: List[float], weights: List[float], options: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize one comp set in pure Python."""
+    mask = outlier_mask(prices, options["method"], options["iqr_multiplier"], options["mad_threshold"])
+    kept = [index for index, keep in enumerate(mask) if keep]
+    clean = [prices[index] for index in kept]
+    clean_weights = [weights[index] for index in kept]
+
+    count = len(clean)
+    mean = sum(clean) / count
+    median = quantile(clean, 0.5)
+    stdev = math.sqrt(sum((price - mean) ** 2 for price in clean) / (count - 1)) if count > 1 else 0.0
+    total_weight = sum(clean_weights)
+
+    return {
+        "count": count,
+        "raw_count": len(prices),
+        "outliers": len(prices) - count,
+        "min": min(clean),
+        "max": max(clean),
+        "mean": mean,
+        "median": median,
+        "stdev": stdev,
+        "q1": quantile(clean, 0.25),
+        "q3": quantile(clean, 0.75),
+        "trimmed_mean": trimmed_mean(clean, options["trim"]),
+        "weighted_mean": sum(p * w for p, w in zip(clean, clean_weights)) / total_weight if total_weight else mean,
+        "weighted_median": weighted_median(clean, clean_weights) if total_weight else median,
+        "confidence": confidence_score(count, stdev, median, options["min_items"]),
+        "kept": kept,
+    }
+
+
+def _sorted_quantiles(ordered: "np.ndarray", counts: "np.ndarray", qs: Sequence[float]) -> List["np.ndarray"]:
+    """
+    Get quantiles of each row of a sorted, NaN-padded array.
+
+    Interpolates like quantile(); np.nanquantile gives the same results but
+    loops over the rows in Python.
+    """
+    rows = np.arange(len(counts))
+    last = np.maximum(counts - 1, 0)
+    results = []
+    for q in qs:
+        position = last * q
+        lower = np.floor(position).astype(int)
+        upper = np.minimum(lower + 1, last)
+        low_values = ordered[rows, lower]
+        results.append(low_values + (ordered[rows, upper] - low_values) * (position - lower))
+    return results
+
+
+def _numpy_stats(comp_sets: List[List[float]], weight_sets: List[List[float]],
+                 options: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Summarize non-empty comp sets together, padded into one NumPy array."""
+    rows = len(comp_sets)
+    width = max(len(prices) for prices in comp_sets)
+    prices = np.full((rows, width), np.nan)
+    weights = np.zeros((rows, width))
+    for row, (values, row_weights) in enumerate(zip(comp_sets, weight_sets)):
+        prices[row, :len(values)] = values
+        weights[row, :len(values)] = row_weights
+
+    present = ~np.isnan(prices)
+    raw_counts = present.sum(axis=1)
+
+    # Outlier rejection, skipped for sets too small to judge
+    # (np.sort puts the NaN padding last, after each row's values)
+    method = options["method"]
+    keep = present.copy()
+    if method == "iqr":
+        q1, q3 = _sorted_quantiles(np.sort(prices, axis=1), raw_counts, (0.25, 0.75))
+        spread = (q3 - q1) * options["iqr_multiplier"]
+        with np.errstate(invalid="ignore"):
+            keep &= (prices >= (q1 - spread)[:, None]) & (prices <= (q3 + spread)[:, None])
+    elif method == "mad":
+        median, = _sorted_quantiles(np.sort(prices, axis=1), raw_counts, (0.5,))
+        deviations = np.sort(np.abs(prices - median[:, None]), axis=1)
+        mad, = _sorted_quantiles(deviations, raw_counts, (0.5,))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = np.abs(_MAD_SCALE * (prices - median[:, None]) / mad[:, None])
+            keep &= (z <= options["mad_threshold"]) | (mad == 0)[:, None]
+    elif method != "none":
+        raise ValueError(f"Unknown outlier method: {method}")
+    keep[raw_counts < MIN_OUTLIER_COUNT] = present[raw_counts < MIN_OUTLIER_COUNT]
+
+    clean = np.where(keep, prices, np.nan)
+    clean_weights = np.where(keep, weights, 0.0)
+    counts = keep.sum(axis=1)
+
+    # Sorting puts NaN padding last, so kept values occupy the first count columns
+    order = np.argsort(clean, axis=1)
+    ordered = np.take_along_axis(clean, order, axis=1)
+    ordered_weights = np.take_along_axis(clean_weights, order, axis=1)
+
+    sums = np.where(keep, clean, 0.0).sum(axis=1)
+    means = sums / counts
+    q1, medians, q3 = _sorted_quantiles(ordered, counts, (0.25, 0.5, 0.75))
+    squares = np.where(keep, (clean - means[:, None]) ** 2, 0.0).sum(axis=1)
+    stdevs = np.sqrt(squares / np.maximum(counts - 1, 1))
+    stdevs[counts < 2] = 0.0
+
+    columns = np.arange(width)[None, :]
+    cuts = (counts * options["trim"]).astype(int)[:, None]
+    trimmed = (columns >= cuts) & (columns < counts[:, None] - cuts)
+    trimmed_counts = trimmed.sum(axis=1)
+    # Like trimmed_mean(), use every value when the trim would leave none
+    with np.errstate(divide="ignore", invalid="ignore"):
+        trimmed_means = np.where(trimmed_counts > 0,
+                                 np.where(trimmed, ordered, 0.0).sum(axis=1) / trimmed_counts, means)
+
+    total_weights = clean_weights.sum(axis=1)
+    weighted_means = np.where(keep, clean * clean_weights, 0.0).sum(axis=1)
+    cumulative = np.cumsum(ordered_weights, axis=1)
+    thresholds = total_weights / 2 * (1 - _MEDIAN_TOLERANCE)
+    median_columns = np.argmax(cumulative >= thresholds[:, None], axis=1)
+    weighted_medians = ordered[np.arange(rows), median_columns]
+
+    results = []
+    for row in range(rows):
+        count = int(counts[row])
+        stdev = float(stdevs[row])
+        median = float(medians[row])
+        total_weight = float(total_weights[row])
+        results.append({
+            "count": count,
+            "raw_count": int(raw_counts[row]),
+            "outliers": int(raw_counts[row]) - count,
+            "min": float(ordered[row, 0]),
+            "max": float(ordered[row, count - 1]),
+            "mean": float(means[row]),
+            "median": median,
+            "stdev": stdev,
+            "q1": float(q1[row]),
+            "q3": float(q3[row]),
+            "trimmed_mean": float(trimmed_means[row]),
+            "weighted_mean": float(weighted_means[row]) / total_weight if total_weight else float(means[row]),
+            "weighted_median": float(weighted_medians[row]) if total_weight else median,
+            "confidence": confidence_score(count, stdev, median, options["min_items"]),
+            "kept": np.flatnonzero(keep[row]).tolist(),
+        })
+    return results
+
+
+def batch_price_stats(comp_sets: Iterable[Sequence[float]],
+                      sold_dates: Optional[Iterable[Optional[Sequence[Any]]]] = None,
+                      method: str = DEFAULT_OUTLIER_METHOD,
+                      iqr_multiplier: float = DEFAULT_IQR_MULTIPLIER,
+                      mad_threshold: float = DEFAULT_MAD_THRESHOLD,
+                      trim: float = DEFAULT_TRIM_PROPORTION,
+                      half_life_days: float = DEFAULT_HALF_LIFE_DAYS,
+                      min_items: int = DEFAULT_CONFIDENCE_MIN_ITEMS,
+                      now: Optional[datetime] = None,
+                      use_numpy: Optional[bool] = None) -> List[Optional[Dict[str, Any]]]:
+    """
+    Summarize the prices of many comp sets in one call.
+
+    Outliers are removed first; every other statistic describes the prices
+    that were kept.
+
+    Args:
+        comp_sets: Prices of each comp set
+        sold_dates: Sold dates matching each comp set's prices, for recency
+                    weighting (None, or None for a set, weighs prices equally)
+        method: Outlier rejection method ("iqr", "mad" or "none")
+        iqr_multiplier: Interquartile ranges allowed outside the quartiles
+        mad_threshold: Largest modified z-score kept
+        trim: Share of prices cut from each end for the trimmed mean
+        half_life_days: Sale age in days at which a price counts half
+        min_items: Number of comparables that scores 50 toward confidence
+        now: Reference time for recency weighting
+        use_numpy: Force NumPy on or off (defaults to using it when installed)
+
+    Returns:
+        List with a statistics dictionary for each comp set (None for an
+        empty set) with count, raw_count, outliers, min, max, mean, median,
+        stdev, q1, q3, trimmed_mean, weighted_mean, weighted_median,
+        confidence and the kept price indices
+    """
+    comp_sets = [[float(price) for price in prices] for prices in comp_sets]
+    date_sets = list(sold_dates) if sold_dates is not None else [None] * len(comp_sets)
+    if len(date_sets) != len(comp_sets):
+        raise ValueError("sold_dates must match comp_sets")
+
+    now = now or datetime.now(timezone.utc)
+    weight_sets = [
+        recency_weights(dates, half_life_days, now) if dates is not None else [1.0] * len(prices)
+        for prices, dates in zip(comp_sets, date_sets)
+    ]
+
+    options = {
+        "method": method,
+        "iqr_multiplier": iqr_multiplier,
+        "mad_threshold": mad_threshold,
+        "trim": trim,
+        "min_items": min_items,
+    }
+
+    filled = [index for index, prices in enumerate(comp_sets) if prices]
+    results = [None] * len(comp_sets)
+    if not filled:
+        return results
+
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    if use_numpy and not HAS_NUMPY:
+        raise ImportError("NumPy is not installed")
+
+    if use_numpy:
+        stats = _numpy_stats([comp_sets[index] for index in filled],
+                             [weight_sets[index] for index in filled], options)
+    else:
+        stats = [_python_stats(comp_sets[index], weight_sets[index], options) for index in filled]
+
+    for index, summary in zip(filled, stats):
+        results[index] = summary
+    return results
+
+
+def price_stats(prices: Sequence[float], sold_dates: Optional[Sequence[Any]] = None,
+                **options) -> Optional[Dict[str, Any]]:
+    """
+    Summarize the prices of one comp set.
+
+    Args:
+        prices: Prices
+        sold_dates: Sold date of each price, for recency weighting
+        **options: Options of batch_price_stats()
+
+    Returns:
+        Statistics dictionary (see batch_price_stats()), or None if there are no prices
+    """
+    return batch_price_stats([prices], [sold_dates] if sold_dates is not None else None, **options)[0]
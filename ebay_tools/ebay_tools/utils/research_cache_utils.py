@@ -0,0 +1,271 @@
+"""
+research_cache_utils.py - Persistent price research cache for eBay listing tools
+
+This module caches the listings fetched during price research including:
+- Keys normalized from search terms, condition filter and days back
+- Expiry of stale results after a configurable time to live
+- Size-bounded storage that evicts the least recently used searches
+- A shared cache instance for all pricing front-ends in a process
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from ebay_tools.core.config import DEFAULT_CONFIG_DIR, ConfigManager
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESEARCH_CACHE_DB = os.path.join(DEFAULT_CONFIG_DIR, "research_cache.db")
+
+# Cached searches expire after a day and at most this many are kept
+DEFAULT_CACHE_TTL = 24 * 3600
+DEFAULT_CACHE_MAX_ENTRIES = 2000
+
+# A leading "-" excludes the word from the search, so it is part of the token
+_TOKEN_PATTERN = re.compile(r"(?:(?<![^\s(,])-)?[^\W_]+(?:[-'.][^\W_]+)*")
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def normalize_search_terms(search_terms: str) -> str:
+    """
+    Normalize search terms so equivalent searches share a cache entry.
+
+    eBay matches keywords in any order, so the terms are lowercased,
+    stripped of punctuation, deduplicated and sorted.  Excluded words
+    ("-word") keep their minus sign.
+
+    Args:
+        search_terms: Search query
+
+    Returns:
+        Normalized search terms
+    """
+    tokens = _TOKEN_PATTERN.findall((search_terms or "").lower())
+    return " ".join(sorted(set(tokens)))
+
+
+def research_cache_key(kind: str, search_terms: str, condition: Optional[str] = None,
+                       days_back: Optional[int] = None) -> str:
+    """
+    Build the cache key for a search.
+
+    Args:
+        kind: What was fetched (e.g. "sold" or "current")
+        search_terms: Search query
+        condition: Condition filter (None or "Any" for no filter)
+        days_back: How many days back the search covered
+
+    Returns:
+        Cache key string
+    """
+    condition = (condition or "").strip().lower()
+    if condition == "any":
+        condition = ""
+    return json.dumps([kind, normalize_search_terms(search_terms), condition, days_back])
+
+
+class ResearchCache:
+    """
+    Persistent cache of price research results, stored in SQLite.
+
+    Each entry holds the listings returned by one search together with the
+    limit it was fetched with, so a later search asking for fewer (or the
+    same number of) listings can be answered from the cache.
+    """
+
+    def __init__(self, db_path: Optional[str] = None,
+                 ttl: float = DEFAULT_CACHE_TTL,
+                 max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        """
+        Open (or create) the cache.
+
+        Args:
+            db_path: Database path (defaults to ~/.ebay_tools/research_cache.db)
+            ttl: Default time to live of entries in seconds
+            max_entries: Maximum number of searches kept
+        """
+        self.db_path = db_path or DEFAULT_RESEARCH_CACHE_DB
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS research ("
+                "key TEXT PRIMARY KEY, kind TEXT, search_terms TEXT, items TEXT, "
+                "item_count INTEGER, fetch_limit INTEGER, created REAL, last_used REAL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS research_last_used ON research(last_used)")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
+
+    def get(self, kind: str, search_terms: str, condition: Optional[str] = None,
+            days_back: Optional[int] = None, limit: Optional[int] = None,
+            max_age: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached listings for a search.
+
+        Args:
+            kind: What was fetched (e.g. "sold" or "current")
+            search_terms: Search query
+            condition: Condition filter
+            days_back: How many days back the search covered
+            limit: Number of listings needed (None for whatever was cached)
+            max_age: Maximum entry age in seconds (defaults to the cache TTL)
+
+        Returns:
+            Cached listings (at most limit), or None on a miss
+        """
+        key = research_cache_key(kind, search_terms, condition, days_back)
+        items = self._lookup(key, limit, max_age)
+        if items is not None:
+            logger.debug(f"Research cache hit for {kind} '{search_terms}'")
+        return items
+
+    def get_by_key(self, key: str, max_age: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached listings by cache key, e.g. one stored with a pricing summary.
+
+        Args:
+            key: Key from research_cache_key()
+            max_age: Maximum entry age in seconds (defaults to the cache TTL)
+
+        Returns:
+            Cached listings, or None on a miss
+        """
+        return self._lookup(key, None, max_age)
+
+    def _lookup(self, key: str, limit: Optional[int],
+                max_age: Optional[float]) -> Optional[List[Dict[str, Any]]]:
+        """Read an entry that is fresh enough and holds enough listings."""
+        max_age = self.ttl if max_age is None else max_age
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT items, item_count, fetch_limit, created FROM research WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            items, item_count, fetch_limit, created = row
+            if now - created > max_age:
+                return None
+
+            # A search that returned fewer listings than it asked for has no more to give
+            if limit is not None and fetch_limit is not None and limit > fetch_limit and item_count >= fetch_limit:
+                return None
+
+            with self.conn:
+                self.conn.execute("UPDATE research SET last_used = ? WHERE key = ?", (now, key))
+
+        items = json.loads(items)
+        return items[:limit] if limit is not None else items
+
+    def put(self, kind: str, search_terms: str, items: List[Dict[str, Any]],
+            condition: Optional[str] = None, days_back: Optional[int] = None,
+            limit: Optional[int] = None) -> None:
+        """
+        Store the listings fetched for a search.
+
+        Args:
+            kind: What was fetched (e.g. "sold" or "current")
+            search_terms: Search query
+            items: JSON-serializable listings
+            condition: Condition filter
+            days_back: How many days back the search covered
+            limit: Number of listings the search asked for
+        """
+        key = research_cache_key(kind, search_terms, condition, days_back)
+        now = time.time()
+        data = json.dumps(items, default=str)
+
+        with self.lock:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO research "
+                    "(key, kind, search_terms, items, item_count, fetch_limit, created, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, kind, search_terms, data, len(items), limit, now, now)
+                )
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the least recently used beyond max_entries (lock held)."""
+        self.conn.execute("DELETE FROM research WHERE created < ?", (now - self.ttl,))
+        self.conn.execute(
+            "DELETE FROM research WHERE key IN ("
+            "SELECT key FROM research ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def clear(self) -> int:
+        """
+        Remove all cached research.
+
+        Returns:
+            Number of entries removed
+        """
+        with self.lock:
+            with self.conn:
+                cursor = self.conn.execute("DELETE FROM research")
+            self.conn.execute("VACUUM")
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entries, listings and size_bytes
+        """
+        with self.lock:
+            entries, listings = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(item_count), 0) FROM research"
+            ).fetchone()
+        size = os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
+        return {"entries": entries, "listings": listings, "size_bytes": size}
+
+
+def get_research_cache() -> Optional[ResearchCache]:
+    """
+    Get the research cache shared by all pricing front-ends.
+
+    TTL and size come from the "pricing.cache_ttl_hours" and
+    "pricing.cache_max_entries" configuration settings.
+
+    Returns:
+        Shared ResearchCache, or None if it could not be opened
+    """
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            try:
+                config = ConfigManager()
+                config.load()
+                ttl_hours = config.get("pricing.cache_ttl_hours", DEFAULT_CACHE_TTL / 3600)
+                max_entries = config.get("pricing.cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES)
+                _shared_cache = ResearchCache(ttl=float(ttl_hours) * 3600, max_entries=int(max_entries))
+            except Exception as e:
+                logger.error(f"Research cache unavailable: {str(e)}")
+                return None
+        return _shared_cache
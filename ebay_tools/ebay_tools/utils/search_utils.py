@@ -0,0 +1,513 @@
+"""
+search_utils.py - Item search indexes for eBay listing tools
+
+This module provides fast filtering and searching of work queues including:
+- Prelowered search fields per item
+- A trigram inverted index for substring queries
+- Narrowing of the previous result set as a query grows
+- A persistent SQLite FTS5 full-text index over descriptions, item specifics
+  and LLM responses, shared by all queues
+"""
+
+import os
+import re
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+from ebay_tools.core.config import DEFAULT_CONFIG_DIR
+from ebay_tools.core.schema import load_queue
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Fields matched by the item list filters
+DEFAULT_SEARCH_FIELDS = ("title", "temp_title", "sku")
+
+# Separates fields in an item's search text so matches can't span two fields
+FIELD_SEPARATOR = "\x00"
+
+# Default location of the full-text index database
+DEFAULT_FULL_TEXT_DB = os.path.join(DEFAULT_CONFIG_DIR, "search_index.db")
+
+# Full-text columns and their bm25 weights (matches in titles rank highest)
+FULL_TEXT_COLUMNS = ("sku", "title", "specifics", "description", "responses")
+FULL_TEXT_WEIGHTS = (5.0, 5.0, 3.0, 2.0, 1.0)
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Get the set of three-character substrings of a text.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Set of trigrams (empty for texts shorter than three characters)
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class QueueSearchIndex:
+    """
+    Substring search over a few fields of every item in a queue.
+
+    Each item's fields are lowercased once and indexed by trigram.  Queries of
+    three or more characters intersect the trigram posting sets and only
+    verify the remaining candidates; shorter queries scan the prelowered
+    text.  The last result is cached, so typing one more character only
+    filters the previous matches.
+    """
+
+    def __init__(self, items: Sequence[Dict[str, Any]], fields: Sequence[str] = DEFAULT_SEARCH_FIELDS):
+        """
+        Build the index.
+
+        Args:
+            items: Queue items (indices into this sequence are returned by search)
+            fields: Item fields to search
+        """
+        self.fields = tuple(fields)
+        self.texts = []
+        self.postings = {}
+
+        self._last_query = ""
+        self._last_result = None
+
+        for item in items:
+            self.texts.append(self._item_text(item))
+        for index, text in enumerate(self.texts):
+            self._add_postings(index, text)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _item_text(self, item: Dict[str, Any]) -> str:
+        """Get the lowered search text of an item."""
+        return FIELD_SEPARATOR.join(str(item.get(field) or "").lower() for field in self.fields)
+
+    def _add_postings(self, index: int, text: str) -> None:
+        """Add an item's trigrams to the inverted index."""
+        for gram in trigrams(text):
+            postings = self.postings.get(gram)
+            if postings is None:
+                self.postings[gram] = {index}
+            else:
+                postings.add(index)
+
+    def update_item(self, index: int, item: Dict[str, Any]) -> None:
+        """
+        Re-index an item after its fields changed.
+
+        Args:
+            index: Index of the item in the queue
+            item: The item's current data
+        """
+        text = self._item_text(item)
+        old_text = self.texts[index]
+        if text == old_text:
+            return
+
+        for gram in trigrams(old_text) - trigrams(text):
+            self.postings[gram].discard(index)
+        self.texts[index] = text
+        self._add_postings(index, text)
+
+        self._last_query = ""
+        self._last_result = None
+
+    def search(self, query: str) -> List[int]:
+        """
+        Find the items whose fields contain a query as a substring.
+
+        Args:
+            query: Search text (case-insensitive); empty matches every item
+
+        Returns:
+            Sorted list of matching item indices
+        """
+        query = query.lower()
+        if not query:
+            return list(range(len(self.texts)))
+
+        if self._last_result is not None and query == self._last_query:
+            return self._last_result
+
+        if self._last_result is not None and self._last_query and self._last_query in query:
+            # Anything matching the longer query also matched the previous one
+            candidates = self._last_result
+        elif len(query) >= 3:
+            candidates = self._trigram_candidates(query)
+        else:
+            candidates = range(len(self.texts))
+
+        texts = self.texts
+        result = [index for index in candidates if query in texts[index]]
+
+        self._last_query = query
+        self._last_result = result
+        return result
+
+    def _trigram_candidates(self, query: str) -> List[int]:
+        """Get the items containing every trigram of a query."""
+        posting_sets = []
+        for gram in trigrams(query):
+            postings = self.postings.get(gram)
+            if not postings:
+                return []
+            posting_sets.append(postings)
+
+        # Intersect starting from the rarest trigram
+        posting_sets.sort(key=len)
+        candidates = set(posting_sets[0])
+        for postings in posting_sets[1:]:
+            candidates &= postings
+            if not candidates:
+                break
+        return sorted(candidates)
+
+
+def item_document(item: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Get the full-text columns of an item.
+
+    Args:
+        item: Queue item
+
+    Returns:
+        Dictionary with sku, title, specifics, description and responses text
+    """
+    specifics = item.get("item_specifics")
+    specifics_text = ""
+    if isinstance(specifics, dict):
+        specifics_text = "\n".join(f"{name}: {value}" for name, value in specifics.items() if value)
+
+    responses = []
+    for photo in item.get("photos", []):
+        if isinstance(photo, dict):
+            api_result = photo.get("api_result")
+            if isinstance(api_result, dict) and api_result.get("response"):
+                responses.append(str(api_result["response"]))
+
+    return {
+        "sku": str(item.get("sku") or ""),
+        "title": str(item.get("title") or item.get("temp_title") or ""),
+        "specifics": specifics_text,
+        "description": str(item.get("description") or ""),
+        "responses": "\n\n".join(responses)
+    }
+
+
+def build_match_query(text: str, prefix: bool = True) -> str:
+    """
+    Turn user input into an FTS5 MATCH expression.
+
+    Words (and "quoted phrases") are quoted so punctuation such as
+    "Brand: Sony" can't be mistaken for query syntax, and all of them must
+    match.  The last word also matches as a prefix while the user is typing.
+
+    Args:
+        text: Search text
+        prefix: Whether the last bare word matches as a prefix
+
+    Returns:
+        MATCH expression, or an empty string if the text has no terms
+    """
+    terms = []
+    last_is_word = False
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', text):
+        term = (phrase or word).replace('"', ' ').strip()
+        if term:
+            terms.append(f'"{term}"')
+            last_is_word = bool(word)
+
+    if terms and prefix and last_is_word and not text.endswith((" ", '"')):
+        terms[-1] += "*"
+    return " AND ".join(terms)
+
+
+class FullTextIndex:
+    """
+    Persistent full-text index over the items of any number of queues.
+
+    Items are stored per queue file in an SQLite FTS5 table.  Re-indexing a
+    queue compares a hash of each item's text with the stored one, so only
+    changed items are written.  Queue files indexed from disk remember their
+    size and modification time and are re-read only when they change.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Open (or create) the index.
+
+        Args:
+            db_path: Database path (defaults to ~/.ebay_tools/search_index.db)
+        """
+        self.db_path = db_path or DEFAULT_FULL_TEXT_DB
+        self.lock = threading.Lock()
+        self.available = True
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            with self.conn:
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS queues ("
+                    "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER)"
+                )
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS items ("
+                    "id INTEGER PRIMARY KEY, queue_path TEXT NOT NULL, item_index INTEGER NOT NULL, "
+                    "item_hash TEXT, sku TEXT, title TEXT, UNIQUE(queue_path, item_index))"
+                )
+                self.conn.execute(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5("
+                    f"{', '.join(FULL_TEXT_COLUMNS)}, tokenize='unicode61 remove_diacritics 2')"
+                )
+        except sqlite3.OperationalError as e:
+            # SQLite builds without FTS5
+            logger.error(f"Full-text search unavailable: {str(e)}")
+            self.available = False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
+
+    @staticmethod
+    def queue_key(path: str) -> str:
+        """
+        Get the key a queue file is stored under.
+
+        Args:
+            path: Queue file path
+
+        Returns:
+            Absolute, normalized path
+        """
+        return os.path.normcase(os.path.abspath(path))
+
+    def index_queue(self, path: str, items: Sequence[Dict[str, Any]], from_disk: bool = False) -> int:
+        """
+        Bring the index up to date with a queue's items.
+
+        Args:
+            path: Queue file path (identifies the queue)
+            items: Current queue items (e.g. the copy being edited)
+            from_disk: Whether the items were just read from path; otherwise the
+                       file is re-read on the next refresh, since unsaved edits
+                       may differ from it
+
+        Returns:
+            Number of items written (new or changed)
+        """
+        if not self.available:
+            return 0
+
+        key = self.queue_key(path)
+        written = 0
+
+        with self.lock, self.conn:
+            existing = {
+                item_index: (row_id, item_hash)
+                for row_id, item_index, item_hash in self.conn.execute(
+                    "SELECT id, item_index, item_hash FROM items WHERE queue_path = ?", (key,))
+            }
+
+            for item_index, item in enumerate(items):
+                document = item_document(item)
+                item_hash = hashlib.sha1(
+                    "\x00".join(document[column] for column in FULL_TEXT_COLUMNS).encode("utf-8")
+                ).hexdigest()
+
+                row = existing.pop(item_index, None)
+                if row and row[1] == item_hash:
+                    continue
+
+                if row:
+                    row_id = row[0]
+                    self.conn.execute("DELETE FROM items_fts WHERE rowid = ?", (row_id,))
+                    self.conn.execute(
+                        "UPDATE items SET item_hash = ?, sku = ?, title = ? WHERE id = ?",
+                        (item_hash, document["sku"], document["title"], row_id))
+                else:
+                    row_id = self.conn.execute(
+                        "INSERT INTO items (queue_path, item_index, item_hash, sku, title) VALUES (?, ?, ?, ?, ?)",
+                        (key, item_index, item_hash, document["sku"], document["title"])).lastrowid
+
+                self.conn.execute(
+                    f"INSERT INTO items_fts (rowid, {', '.join(FULL_TEXT_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                    (row_id, *(document[column] for column in FULL_TEXT_COLUMNS)))
+                written += 1
+
+            # Items removed from the queue
+            for row_id, _ in existing.values():
+                self.conn.execute("DELETE FROM items_fts WHERE rowid = ?", (row_id,))
+                self.conn.execute("DELETE FROM items WHERE id = ?", (row_id,))
+
+            fingerprint = (None, None)
+            if from_disk:
+                stat = os.stat(path)
+                fingerprint = (stat.st_size, stat.st_mtime_ns)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO queues (path, size, mtime_ns) VALUES (?, ?, ?)",
+                (key, *fingerprint))
+
+        if written:
+            logger.info(f"Full-text index: {written} items updated for {os.path.basename(path)}")
+        return written
+
+    def index_file(self, path: str) -> int:
+        """
+        Index a queue file if it changed since it was last indexed.
+
+        Args:
+            path: Queue file path
+
+        Returns:
+            Number of items written
+        """
+        if not self.available:
+            return 0
+
+        stat = os.stat(path)
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT size, mtime_ns FROM queues WHERE path = ?", (self.queue_key(path),)).fetchone()
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return 0
+
+        return self.index_queue(path, load_queue(path), from_disk=True)
+
+    def index_directory(self, folder: str,
+                        report_progress: Optional[Callable[[int, int, str], None]] = None,
+                        check_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, int]:
+        """
+        Index every queue file in a folder (recursively).
+
+        JSON files that aren't queues are skipped.
+
+        Args:
+            folder: Folder containing queue JSON files
+            report_progress: Optional progress callback (current, total, message)
+            check_cancelled: Optional callback returning True to stop early
+
+        Returns:
+            Dictionary with counts of "queues" indexed and "items" written
+        """
+        paths = []
+        for dirpath, _, filenames in os.walk(folder):
+            paths.extend(os.path.join(dirpath, name) for name in filenames if name.lower().endswith(".json"))
+
+        queues = items = 0
+        for count, path in enumerate(sorted(paths), 1):
+            if check_cancelled and check_cancelled():
+                break
+            try:
+                items += self.index_file(path)
+                queues += 1
+            except Exception as e:
+                logger.debug(f"Skipping {path}: {str(e)}")
+
+            if report_progress:
+                report_progress(count, len(paths), f"Indexing {os.path.basename(path)}")
+
+        return {"queues": queues, "items": items}
+
+    def refresh(self, skip: Optional[str] = None) -> None:
+        """
+        Re-index indexed queue files that changed on disk; forget deleted ones.
+
+        Args:
+            skip: Queue path to leave alone (e.g. the open queue, indexed from memory)
+        """
+        if not self.available:
+            return
+
+        skip_key = self.queue_key(skip) if skip else None
+        with self.lock:
+            paths = [row[0] for row in self.conn.execute("SELECT path FROM queues")]
+
+        for path in paths:
+            if path == skip_key:
+                continue
+            if not os.path.exists(path):
+                self.remove_queue(path)
+                continue
+            try:
+                self.index_file(path)
+            except Exception as e:
+                logger.warning(f"Could not re-index {path}: {str(e)}")
+
+    def remove_queue(self, path: str) -> None:
+        """
+        Remove a queue from the index.
+
+        Args:
+            path: Queue file path
+        """
+        if not self.available:
+            return
+
+        key = self.queue_key(path)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM items_fts WHERE rowid IN (SELECT id FROM items WHERE queue_path = ?)", (key,))
+            self.conn.execute("DELETE FROM items WHERE queue_path = ?", (key,))
+            self.conn.execute("DELETE FROM queues WHERE path = ?", (key,))
+
+    def search(self, text: str, queue_path: Optional[str] = None, limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        Search indexed items, best matches first.
+
+        Args:
+            text: Search text (see build_match_query)
+            queue_path: Only search this queue, or None for all indexed queues
+            limit: Maximum number of results
+
+        Returns:
+            List of results with queue_path, item_index, sku, title, score and snippet
+        """
+        query = build_match_query(text)
+        if not self.available or not query:
+            return []
+
+        weights = ", ".join(str(weight) for weight in FULL_TEXT_WEIGHTS)
+        sql = (
+            f"SELECT items.queue_path, items.item_index, items.sku, items.title, "
+            f"bm25(items_fts, {weights}) AS rank, "
+            f"snippet(items_fts, -1, '[', ']', '...', 12) "
+            f"FROM items_fts JOIN items ON items.id = items_fts.rowid "
+            f"WHERE items_fts MATCH ?"
+        )
+        params = [query]
+        if queue_path:
+            sql += " AND items.queue_path = ?"
+            params.append(self.queue_key(queue_path))
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        try:
+            with self.lock:
+                rows = self.conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text query failed for {text!r}: {str(e)}")
+            return []
+
+        return [
+            {
+                "queue_path": path,
+                "item_index": item_index,
+                "sku": sku,
+                "title": title,
+                "score": -rank,
+                "snippet": snippet.replace("\n", " ")
+            }
+            for path, item_index, sku, title, rank, snippet in rows
+        ]
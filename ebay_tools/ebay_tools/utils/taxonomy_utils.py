@@ -0,0 +1,760 @@
+"""
+taxonomy_utils.py - Product taxonomy for search term extraction in eBay listing tools
+
+This module holds the vocabularies used to turn listings into searches including:
+- Built-in brands, models, product types, stop words and eBay noise words,
+  extended by the taxonomy data file shipped with the package
+- Loading a larger taxonomy from a JSON or SQLite file
+- Compiling every keyword vocabulary into one regex matcher
+- Reloading the taxonomy file when it changes, without restarting
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ebay_tools.core.config import DEFAULT_CONFIG_DIR, ConfigManager
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_FILE = os.path.join(DEFAULT_CONFIG_DIR, "taxonomy.json")
+
+# Taxonomy data shipped with the package, merged over the tables below
+BUNDLED_TAXONOMY_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "taxonomy.json")
+
+# Seconds between checks of the taxonomy file for changes
+DEFAULT_CHECK_INTERVAL = 5.0
+
+# Sections of group name -> keywords, and sections of plain word lists
+KEYWORD_SECTIONS = ("brands", "product_types", "title_product_types")
+WORD_SECTIONS = ("stop_words", "noise_words")
+
+# SQLite "kind" column -> taxonomy section
+SQLITE_KINDS = {
+    "brand": "brands",
+    "model": "models",
+    "product_type": "product_types",
+    "title_product_type": "title_product_types",
+    "stop_word": "stop_words",
+    "noise_word": "noise_words",
+}
+
+_shared_manager = None
+_shared_manager_lock = threading.Lock()
+
+_bundled_data = None
+_bundled_data_lock = threading.Lock()
+
+
+# Core of the built-in taxonomy; the bundled data file adds to it
+# Brand -> name variations that identify it
+BRAND_PATTERNS = {
+    # Electronics
+    'apple': ['apple', 'iphone', 'ipad', 'macbook', 'airpods'],
+    'samsung': ['samsung', 'galaxy'],
+    'sony': ['sony', 'playstation', 'ps3', 'ps4', 'ps5'],
+    'nintendo': ['nintendo', 'switch', 'wii', 'gameboy'],
+    'microsoft': ['microsoft', 'xbox', 'surface'],
+    
+    # Collectibles
+    'madame alexander': ['madame alexander', 'madam alexander'],
+    'barbie': ['barbie', 'mattel barbie'],
+    'american girl': ['american girl', 'ag doll'],
+    'hot wheels': ['hot wheels', 'hotwheels'],
+    'lego': ['lego', 'legos'],
+    
+    # Watches
+    'rolex': ['rolex'],
+    'omega': ['omega'],
+    'seiko': ['seiko'],
+    'casio': ['casio', 'g-shock'],
+    
+    # Fashion
+    'coach': ['coach'],
+    'louis vuitton': ['louis vuitton', 'lv'],
+    'gucci': ['gucci'],
+    
+    # Tools
+    'dewalt': ['dewalt'],
+    'milwaukee': ['milwaukee'],
+    'makita': ['makita']
+}
+
+# Common model/product type patterns
+MODEL_PATTERNS = {
+    # iPhone models
+    'iphone': r'iphone\s*(\d+)\s*(pro|plus|max|mini)?',
+    # Watch models
+    'submariner': r'submariner',
+    'speedmaster': r'speedmaster',
+    # Doll models
+    'cinderella': r'cinderella',
+    'poor cinderella': r'poor\s+cinderella'
+}
+
+# Product type -> keywords, searched in title and description
+PRODUCT_TYPES = {
+    'doll': ['doll', 'dolls'],
+    'watch': ['watch', 'watches', 'timepiece'],
+    'phone': ['phone', 'smartphone', 'iphone', 'android'],
+    'game': ['game', 'gaming', 'console', 'xbox', 'playstation'],
+    'tool': ['tool', 'drill', 'saw', 'wrench', 'screwdriver'],
+    'bag': ['bag', 'purse', 'handbag', 'backpack'],
+    'jewelry': ['ring', 'necklace', 'bracelet', 'earrings'],
+    'book': ['book', 'novel', 'guide', 'manual'],
+    'toy': ['toy', 'action figure', 'collectible']
+}
+
+# Product type -> keywords, searched in the title to qualify a bare brand
+TITLE_PRODUCT_TYPES = {
+    'doll': ['doll', 'dolls'],
+    'watch': ['watch', 'timepiece'],
+    'phone': ['phone', 'iphone'],
+    'game': ['game', 'console'],
+    'tool': ['tool', 'drill'],
+    'bag': ['bag', 'purse'],
+    'book': ['book', 'manual']
+}
+
+# Stop words to remove
+STOP_WORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
+    'after', 'above', 'below', 'between', 'among', 'this', 'that', 'these',
+    'those', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
+    'could', 'can', 'may', 'might', 'must', 'shall', 'very', 'too', 'so',
+    'just', 'now', 'only', 'also', 'really', 'quite', 'still', 'already',
+    'yet', 'again', 'back', 'here', 'there', 'where', 'when', 'why', 'how',
+    'what', 'which', 'who', 'whom', 'whose', 'all', 'both', 'each', 'few',
+    'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'own',
+    'same', 'than', 'then', 'them', 'they', 'we', 'you', 'your', 'yours',
+    'he', 'him', 'his', 'she', 'her', 'hers', 'it', 'its', 'our', 'ours',
+    'their', 'theirs', 'me', 'my', 'mine', 'us'
+})
+
+# eBay-specific noise words to remove
+EBAY_NOISE = frozenset({
+    'fast', 'free', 'shipping', 'new', 'used', 'nice', 'great', 'excellent',
+    'rare', 'vintage', 'antique', 'beautiful', 'stunning', 'amazing',
+    'perfect', 'mint', 'condition', 'collectible', 'estate', 'sale',
+    'lot', 'bundle', 'set', 'collection', 'authentic', 'genuine',
+    'original', 'oem', 'replacement', 'part', 'parts', 'working',
+    'tested', 'refurbished', 'restored', 'repair', 'broken', 'damaged',
+    'untested', 'as-is', 'asis', 'read', 'description', 'please',
+    'look', 'see', 'photos', 'pictures', 'pics', 'nr', 'reserve',
+    'auction', 'buy', 'now', 'bin', 'obo', 'offer', 'best', 'reduced',
+    'price', 'drop', 'must', 'sell', 'moving', 'quick', 'fast'
+})
+
+
+
+class KeywordMatcher:
+    """
+    Finds keywords from several vocabularies in a text with one compiled regex.
+    
+    Keywords match as lowercase substrings (the way a plain `in` test does),
+    or only as whole words when whole_words is set.  All keywords are folded
+    into a single trie-shaped pattern, so a text is scanned once for every
+    vocabulary however many keywords there are, and overlapping occurrences
+    are found by resuming the scan one character after each match.
+    """
+    
+    def __init__(self, vocabularies: Dict[str, Dict[str, Iterable[str]]], whole_words: bool = False):
+        """
+        Compile the matcher.
+        
+        Args:
+            vocabularies: Dictionary mapping vocabulary name to a dictionary of
+                          group name -> keywords; earlier groups take priority
+            whole_words: Only match keywords that aren't part of a longer word
+        """
+        self.whole_words = whole_words
+        
+        # Group names of each vocabulary in priority order
+        self.groups = {vocabulary: list(groups) for vocabulary, groups in vocabularies.items()}
+        keyword_groups = {}
+        for vocabulary, groups in vocabularies.items():
+            for name, keywords in groups.items():
+                for keyword in keywords:
+                    keyword = keyword.lower()
+                    if keyword:
+                        keyword_groups.setdefault(keyword, set()).add((vocabulary, name))
+        
+        trie = {}
+        for keyword in keyword_groups:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = True
+        
+        # A match also implies every keyword that is a prefix of it, which the
+        # regex doesn't report separately: keyword -> [(length, groups)]
+        self.implied = {}
+        for keyword in keyword_groups:
+            node = trie
+            prefixes = []
+            for length, char in enumerate(keyword, 1):
+                node = node[char]
+                if '' in node:
+                    prefixes.append((length, frozenset(keyword_groups[keyword[:length]])))
+            self.implied[keyword] = prefixes
+        
+        self.pattern = None
+        if trie:
+            pattern = self._trie_pattern(trie)
+            if whole_words:
+                pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+            self.pattern = re.compile(pattern)
+    
+    @classmethod
+    def _trie_pattern(cls, node: Dict[str, Any]) -> str:
+        """Build a regex from a trie, trying longer keywords first."""
+        branches = [re.escape(char) + cls._trie_pattern(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if '' in node:
+            # This node also ends a keyword
+            pattern = f"(?:{pattern})?"
+        return pattern
+    
+    def scan(self, text: str) -> Dict[Tuple[str, str], List[Tuple[int, int]]]:
+        """
+        Find every keyword occurrence in a text.
+        
+        Args:
+            text: Lowercase text
+            
+        Returns:
+            Dictionary mapping (vocabulary, group) to a list of (start, end) spans
+        """
+        found = {}
+        if not self.pattern:
+            return found
+        
+        whole_words = self.whole_words
+        text_length = len(text)
+        search = self.pattern.search
+        match = search(text)
+        while match:
+            start = match.start()
+            for length, groups in self.implied[match.group()]:
+                end = start + length
+                if whole_words and end < text_length and (text[end].isalnum() or text[end] == '_'):
+                    # A shorter keyword inside the matched one isn't a whole word
+                    continue
+                span = (start, end)
+                for key in groups:
+                    spans = found.get(key)
+                    if spans is None:
+                        found[key] = [span]
+                    else:
+                        spans.append(span)
+            match = search(text, start + 1)
+        return found
+    
+    def best(self, found: Dict[Tuple[str, str], List[Tuple[int, int]]], vocabulary: str,
+             segments: Optional[List[Optional[Tuple[int, int]]]] = None) -> Optional[str]:
+        """
+        Get the highest priority group of a vocabulary among scan results.
+        
+        Args:
+            found: Result of scan()
+            vocabulary: Vocabulary name
+            segments: Optional (start, end) ranges a match must lie within
+            
+        Returns:
+            Group name, or None if nothing matched
+        """
+        for name in self.groups.get(vocabulary, ()):
+            spans = found.get((vocabulary, name))
+            if not spans:
+                continue
+            if segments is None:
+                return name
+            for start, end in spans:
+                if any(segment and segment[0] <= start and end <= segment[1] for segment in segments):
+                    return name
+        return None
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Check whether a regex has a "|" outside any group."""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 1
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal
+            if pattern[i + 1:i + 2] == '^':
+                i += 1
+            if pattern[i + 1:i + 2] == ']':
+                i += 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _literal_prefix(pattern: str) -> str:
+    """
+    Get literal text that every match of a regex starts with.
+    
+    Args:
+        pattern: Regex
+        
+    Returns:
+        Prefix, or "" if the regex doesn't start with literal text
+    """
+    if _has_top_level_alternation(pattern):
+        return ''
+    
+    # A leading word boundary doesn't move where a match starts
+    i = 2 if pattern.startswith('\\b') else 0
+    prefix = []
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            literal, step = pattern[i + 1], 2
+        elif char.isalnum() or char in " -'":
+            literal, step = char, 1
+        else:
+            break
+        if pattern[i + step:i + step + 1] in ('?', '*', '{'):
+            # The character is optional or repeated
+            break
+        prefix.append(literal)
+        i += step
+    return ''.join(prefix)
+
+
+class ModelMatcher:
+    """
+    Ordered model patterns, compiled once.
+    
+    Patterns that start with literal text are found through a KeywordMatcher
+    of those prefixes, so a text is scanned once however many models there
+    are and only the models whose prefix occurs are tried, at the places it
+    occurs.  Other patterns are searched one by one.
+    """
+    
+    def __init__(self, patterns: Dict[str, str]):
+        """
+        Compile the patterns.
+        
+        Args:
+            patterns: Dictionary mapping model name to regex; earlier models take priority
+            
+        Raises:
+            re.error: If a pattern isn't a valid regex
+        """
+        self.patterns = [(name, re.compile(pattern, re.IGNORECASE)) for name, pattern in patterns.items()]
+        
+        prefixes = {}
+        self.unprefixed = []
+        for index, pattern in enumerate(patterns.values()):
+            prefix = _literal_prefix(pattern).lower()
+            if prefix:
+                prefixes[index] = [prefix]
+            else:
+                self.unprefixed.append(index)
+        self.prefix_matcher = KeywordMatcher({'model': prefixes})
+    
+    def first_match(self, text: str) -> Optional[str]:
+        """Get the first model whose pattern occurs in the text, or None."""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing moved the positions; search every pattern instead
+            for name, pattern in self.patterns:
+                if pattern.search(text):
+                    return name
+            return None
+        
+        found = self.prefix_matcher.scan(lowered)
+        candidates = sorted([index for _, index in found] + self.unprefixed)
+        for index in candidates:
+            name, pattern = self.patterns[index]
+            spans = found.get(('model', index))
+            if spans is None:
+                if pattern.search(text):
+                    return name
+            elif any(pattern.match(text, start) for start, _ in spans):
+                return name
+        return None
+
+
+def _core_taxonomy_data() -> Dict[str, Any]:
+    """Get the taxonomy tables defined in this module in file format."""
+    return {
+        "brands": {brand: list(variations) for brand, variations in BRAND_PATTERNS.items()},
+        "models": dict(MODEL_PATTERNS),
+        "product_types": {name: list(keywords) for name, keywords in PRODUCT_TYPES.items()},
+        "title_product_types": {name: list(keywords) for name, keywords in TITLE_PRODUCT_TYPES.items()},
+        "stop_words": sorted(STOP_WORDS),
+        "noise_words": sorted(EBAY_NOISE),
+    }
+
+
+def default_taxonomy_data() -> Dict[str, Any]:
+    """
+    Get the built-in taxonomy in file format.
+    
+    This is the tables of this module with the bundled data file merged
+    over them.  The file is read once; if it is missing or invalid, the
+    tables are used alone.
+    
+    Returns:
+        Dictionary with brands, models, product_types, title_product_types,
+        stop_words and noise_words sections
+    """
+    global _bundled_data
+    
+    with _bundled_data_lock:
+        if _bundled_data is None:
+            try:
+                _bundled_data = read_taxonomy_file(BUNDLED_TAXONOMY_FILE, base=_core_taxonomy_data())
+            except (OSError, ValueError) as e:
+                logger.error(f"Error loading bundled taxonomy {BUNDLED_TAXONOMY_FILE}: {str(e)}")
+                _bundled_data = _core_taxonomy_data()
+    return merge_taxonomy_data(_bundled_data, {})
+
+
+class Taxonomy:
+    """
+    A compiled taxonomy.
+    
+    Instances are immutable once built; a reload produces a new Taxonomy,
+    so an extraction in progress keeps a consistent view.
+    """
+    
+    def __init__(self, data: Optional[Dict[str, Any]] = None, source: Optional[str] = None):
+        """
+        Compile a taxonomy.
+        
+        Args:
+            data: Taxonomy sections (defaults to the built-in taxonomy).  A
+                  "whole_words" flag makes keywords match only as whole words.
+            source: Where the data came from, for logging
+        """
+        data = data if data is not None else default_taxonomy_data()
+        self.source = source or "built-in"
+        self.whole_words = bool(data.get("whole_words", False))
+        
+        self.brand_patterns = {name: [str(k) for k in keywords] for name, keywords in (data.get("brands") or {}).items()}
+        self.model_patterns = {name: str(pattern) for name, pattern in (data.get("models") or {}).items()}
+        self.product_types = {name: [str(k) for k in keywords] for name, keywords in (data.get("product_types") or {}).items()}
+        self.title_product_types = {name: [str(k) for k in keywords]
+                                    for name, keywords in (data.get("title_product_types") or {}).items()}
+        self.stop_words = frozenset(str(word).lower() for word in data.get("stop_words") or ())
+        self.ebay_noise = frozenset(str(word).lower() for word in data.get("noise_words") or ())
+        self.skip_words = self.stop_words | self.ebay_noise
+        
+        self.keyword_matcher = KeywordMatcher({
+            'brand': self.brand_patterns,
+            'product_type': self.product_types,
+            'title_product_type': self.title_product_types
+        }, whole_words=self.whole_words)
+        self.model_matcher = ModelMatcher(self.model_patterns)
+    
+    def size(self) -> int:
+        """Get the total number of keywords, model patterns and words."""
+        keyword_count = sum(len(keywords) for section in (self.brand_patterns, self.product_types,
+                                                           self.title_product_types)
+                            for keywords in section.values())
+        return keyword_count + len(self.model_patterns) + len(self.skip_words)
+
+
+def merge_taxonomy_data(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge a taxonomy file over another taxonomy.
+    
+    Groups and models in the overlay replace those of the same name and new
+    ones are added after the existing ones (so they take lower priority);
+    word lists are combined.
+    
+    Args:
+        base: Taxonomy sections
+        overlay: Taxonomy sections to merge in
+        
+    Returns:
+        Merged taxonomy sections
+    """
+    merged = {}
+    for section in KEYWORD_SECTIONS + ("models",):
+        combined = dict(base.get(section) or {})
+        combined.update(overlay.get(section) or {})
+        merged[section] = combined
+    for section in WORD_SECTIONS:
+        merged[section] = sorted(set(base.get(section) or ()) | set(overlay.get(section) or ()))
+    merged["whole_words"] = overlay.get("whole_words", base.get("whole_words", False))
+    return merged
+
+
+def _is_sqlite_path(path: str) -> bool:
+    """Check whether a taxonomy path names a SQLite database."""
+    return os.path.splitext(path)[1].lower() in (".db", ".sqlite", ".sqlite3")
+
+
+def _read_sqlite_taxonomy(path: str) -> Dict[str, Any]:
+    """
+    Read a taxonomy database.
+    
+    The "taxonomy" table has one row per entry: kind (brand, model,
+    product_type, title_product_type, stop_word or noise_word), name (the
+    brand, model or product type; the word itself for word kinds), value
+    (a keyword or model regex) and an optional priority.  A "settings" table
+    of key/value rows may hold "extends_defaults" and "whole_words".
+    """
+    data = {section: {} for section in KEYWORD_SECTIONS + ("models",)}
+    data.update({section: [] for section in WORD_SECTIONS})
+    
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            "SELECT kind, name, value FROM taxonomy ORDER BY COALESCE(priority, 0), rowid"
+        ).fetchall()
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        settings = dict(conn.execute("SELECT key, value FROM settings").fetchall()) if "settings" in tables else {}
+    finally:
+        conn.close()
+    
+    for kind, name, value in rows:
+        section = SQLITE_KINDS.get(kind)
+        if section is None:
+            logger.warning(f"Unknown taxonomy kind '{kind}' in {path}")
+        elif section in WORD_SECTIONS:
+            data[section].append(name)
+        elif section == "models":
+            data[section][name] = value or re.escape(name)
+        else:
+            data[section].setdefault(name, []).append(value or name)
+    
+    for key in ("extends_defaults", "whole_words"):
+        if key in settings:
+            data[key] = str(settings[key]).lower() in ("1", "true", "yes")
+    return data
+
+
+def read_taxonomy_file(path: str, base: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Read a taxonomy file.
+    
+    JSON files hold the same sections as default_taxonomy_data(); files
+    ending in .db, .sqlite or .sqlite3 are read as SQLite databases.  Unless
+    the file sets "extends_defaults" to false, it is merged over the
+    built-in taxonomy.
+    
+    Args:
+        path: Taxonomy file path
+        base: Taxonomy to merge the file over (defaults to the built-in one)
+        
+    Returns:
+        Taxonomy sections
+        
+    Raises:
+        ValueError: If the file isn't a valid taxonomy
+    """
+    if _is_sqlite_path(path):
+        try:
+            data = _read_sqlite_taxonomy(path)
+        except sqlite3.Error as e:
+            raise ValueError(f"Invalid taxonomy database {path}: {str(e)}")
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid taxonomy file {path}: {str(e)}")
+    
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid taxonomy file {path}: expected an object of sections")
+    for section in KEYWORD_SECTIONS + ("models",):
+        if not isinstance(data.get(section) or {}, dict):
+            raise ValueError(f"Invalid taxonomy file {path}: '{section}' must map names to entries")
+    for section in KEYWORD_SECTIONS:
+        for name, keywords in (data.get(section) or {}).items():
+            if not isinstance(keywords, list):
+                raise ValueError(f"Invalid taxonomy file {path}: '{section}' entry '{name}' must be a list of keywords")
+    for name, pattern in (data.get("models") or {}).items():
+        if not isinstance(pattern, str):
+            raise ValueError(f"Invalid taxonomy file {path}: model '{name}' must be a regex string")
+    for section in WORD_SECTIONS:
+        if not isinstance(data.get(section) or [], list):
+            raise ValueError(f"Invalid taxonomy file {path}: '{section}' must be a list of words")
+    
+    if data.get("extends_defaults", True):
+        data = merge_taxonomy_data(base if base is not None else default_taxonomy_data(), data)
+    return data
+
+
+def write_taxonomy_file(path: str, data: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Write a taxonomy file, e.g. to start a custom taxonomy from the built-in one.
+    
+    Args:
+        path: Taxonomy file path (.json, or .db/.sqlite/.sqlite3 for SQLite)
+        data: Taxonomy sections (defaults to the built-in taxonomy)
+    """
+    data = data if data is not None else default_taxonomy_data()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    if not _is_sqlite_path(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return
+    
+    rows = []
+    for kind, section in SQLITE_KINDS.items():
+        entries = data.get(section) or ()
+        if section in WORD_SECTIONS:
+            rows.extend((kind, word, None, 0) for word in entries)
+        elif section == "models":
+            rows.extend((kind, name, pattern, priority) for priority, (name, pattern) in enumerate(entries.items()))
+        else:
+            rows.extend((kind, name, keyword, priority)
+                        for priority, (name, keywords) in enumerate(entries.items())
+                        for keyword in keywords)
+    
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS taxonomy")
+            conn.execute("CREATE TABLE taxonomy (kind TEXT, name TEXT, value TEXT, priority INTEGER)")
+            conn.executemany("INSERT INTO taxonomy (kind, name, value, priority) VALUES (?, ?, ?, ?)", rows)
+            conn.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("INSERT OR REPLACE INTO settings VALUES ('extends_defaults', 'false')")
+            conn.execute("INSERT OR REPLACE INTO settings VALUES ('whole_words', ?)",
+                         ('true' if data.get("whole_words") else 'false',))
+    finally:
+        conn.close()
+
+
+class TaxonomyManager:
+    """
+    Keeps the compiled taxonomy in step with its file.
+    
+    current() checks the file's modification time at most once per check
+    interval and recompiles when it changed.  A file that fails to load is
+    logged and the previous taxonomy stays in use.
+    """
+    
+    def __init__(self, path: Optional[str] = None, check_interval: float = DEFAULT_CHECK_INTERVAL):
+        """
+        Initialize the manager.
+        
+        Args:
+            path: Taxonomy file (None to use only the built-in taxonomy)
+            check_interval: Minimum seconds between checks of the file
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self.lock = threading.Lock()
+        self.taxonomy = Taxonomy()
+        self.file_state = None
+        self.last_check = 0.0
+        self.reload()
+    
+    def _stat(self) -> Optional[Tuple[float, int]]:
+        """Get the file's modification time and size, or None if it doesn't exist."""
+        try:
+            stat = os.stat(self.path)
+            return (stat.st_mtime, stat.st_size)
+        except (OSError, TypeError):
+            return None
+    
+    def reload(self, force: bool = False) -> bool:
+        """
+        Reload the taxonomy if its file changed.
+        
+        Args:
+            force: Reload even if the file looks unchanged
+            
+        Returns:
+            True if a new taxonomy was loaded
+        """
+        with self.lock:
+            self.last_check = time.monotonic()
+            state = self._stat()
+            if state == self.file_state and not force:
+                return False
+            
+            if state is None:
+                self.taxonomy = Taxonomy()
+                self.file_state = None
+                logger.info("Using the built-in taxonomy")
+                return True
+            
+            try:
+                start = time.monotonic()
+                taxonomy = Taxonomy(read_taxonomy_file(self.path), source=self.path)
+            except (OSError, ValueError, TypeError, re.error) as e:
+                logger.error(f"Error loading taxonomy {self.path}: {str(e)}")
+                # Don't retry until the file changes again
+                self.file_state = state
+                return False
+            
+            self.taxonomy = taxonomy
+            self.file_state = state
+            logger.info(f"Loaded taxonomy {self.path} with {taxonomy.size()} entries "
+                        f"in {time.monotonic() - start:.2f}s")
+            return True
+    
+    def current(self) -> Taxonomy:
+        """
+        Get the current taxonomy, reloading it first if its file changed.
+        
+        Returns:
+            Compiled taxonomy
+        """
+        if self.path and time.monotonic() - self.last_check >= self.check_interval:
+            self.reload()
+        return self.taxonomy
+
+
+def get_taxonomy_manager() -> TaxonomyManager:
+    """
+    Get the taxonomy manager shared by all search extractors.
+    
+    The file comes from the "pricing.taxonomy_file" setting (defaulting to
+    ~/.ebay_tools/taxonomy.json when it exists) and the check interval from
+    "pricing.taxonomy_check_seconds".
+    
+    Returns:
+        Shared TaxonomyManager
+    """
+    global _shared_manager
+    
+    with _shared_manager_lock:
+        if _shared_manager is None:
+            path = DEFAULT_TAXONOMY_FILE
+            check_interval = DEFAULT_CHECK_INTERVAL
+            try:
+                config = ConfigManager()
+                config.load()
+                path = config.get("pricing.taxonomy_file") or path
+                check_interval = float(config.get("pricing.taxonomy_check_seconds", check_interval))
+            except Exception as e:
+                logger.error(f"Error reading taxonomy settings: {str(e)}")
+            _shared_manager = TaxonomyManager(os.path.expanduser(path), check_interval)
+        return _shared_manager
@@ -6,16 +6,21 @@ This module provides reusable UI components and helpers including:
 - Navigation controls
 - Status bar management
 - Common widgets like photo frames
+- Virtualized lists for large queues
+- Full-text search dialog
 - UI-related utility functions
 """
 
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import logging
-from typing import Dict, List, Any, Optional, Union, Callable, Tuple
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple, Sequence
 from datetime import datetime
 
+from ebay_tools.utils.background_utils import BackgroundTaskManager, run_with_progress
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -377,6 +382,472 @@ class PhotoFrame:
         self.photo_label.config(image="", text="No photo selected")
         self.context_var.set("")
 
+# ===== Virtualized List =====
+
+class VirtualListbox:
+    """
+    Scrollable list that only draws the rows currently in view.
+    
+    Rows are given as an array of item indices, and row text (plus optional
+    check state and badge) is looked up through callbacks for the visible
+    rows only.  Filtering or refreshing a list of any length therefore costs
+    the same as redrawing one screenful.
+    """
+    
+    SELECT_BACKGROUND = "#3478c6"
+    SELECT_FOREGROUND = "white"
+    
+    def __init__(self,
+                parent: tk.Widget,
+                get_text: Callable[[int], str],
+                on_select: Optional[Callable[[int], None]] = None,
+                is_checked: Optional[Callable[[int], bool]] = None,
+                on_toggle: Optional[Callable[[int], None]] = None,
+                get_badge: Optional[Callable[[int], Optional[Tuple[str, str]]]] = None,
+                height: Optional[int] = None):
+        """
+        Initialize the list.
+        
+        Args:
+            parent: Parent widget
+            get_text: Returns the display text for an item index
+            on_select: Callback with the item index when a row is selected
+            is_checked: Returns whether an item is checked (shows a check box column)
+            on_toggle: Callback with the item index when its check box is clicked
+            get_badge: Returns (text, color) drawn at the right edge of a row, or None
+            height: Requested height in pixels
+        """
+        self.get_text = get_text
+        self.on_select = on_select
+        self.is_checked = is_checked
+        self.on_toggle = on_toggle
+        self.get_badge = get_badge
+        
+        self.indices = []
+        self.top = 0
+        self.selected = None
+        self._rows_by_item = None
+        self._slots = []
+        
+        self.font = tkfont.nametofont("TkDefaultFont")
+        self.row_height = self.font.metrics("linespace") + 4
+        self.check_width = self.font.measure("☐ ") + 6 if is_checked else 0
+        
+        self.frame = ttk.Frame(parent)
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.canvas = tk.Canvas(self.frame, background="white", highlightthickness=1,
+                                highlightbackground="#c0c0c0", takefocus=1)
+        if height:
+            self.canvas.config(height=height)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda e: self.scroll_rows(-3))
+        self.canvas.bind("<Button-5>", lambda e: self.scroll_rows(3))
+        self.canvas.bind("<Up>", lambda e: self._move_selection(-1))
+        self.canvas.bind("<Down>", lambda e: self._move_selection(1))
+        self.canvas.bind("<Prior>", lambda e: self._move_selection(-self.visible_rows()))
+        self.canvas.bind("<Next>", lambda e: self._move_selection(self.visible_rows()))
+        self.canvas.bind("<Home>", lambda e: self._move_selection(-len(self.indices)))
+        self.canvas.bind("<End>", lambda e: self._move_selection(len(self.indices)))
+        self.canvas.bind("<space>", self._on_space)
+    
+    def set_indices(self, indices: Sequence[int]):
+        """
+        Set the item indices shown as rows, in display order.
+        
+        Args:
+            indices: Item indices (e.g. a list of filtered indices or a range)
+        """
+        self.indices = indices
+        self._rows_by_item = None
+        self.top = max(0, min(self.top, len(indices) - self.visible_rows()))
+        self.redraw()
+    
+    def size(self) -> int:
+        """
+        Get the number of rows.
+        
+        Returns:
+            Number of rows
+        """
+        return len(self.indices)
+    
+    def item_at(self, row: int) -> Optional[int]:
+        """
+        Get the item index shown in a row.
+        
+        Args:
+            row: Row number
+            
+        Returns:
+            Item index, or None if the row doesn't exist
+        """
+        if 0 <= row < len(self.indices):
+            return self.indices[row]
+        return None
+    
+    def row_of(self, item_index: int) -> Optional[int]:
+        """
+        Get the row showing an item.
+        
+        Args:
+            item_index: Item index
+            
+        Returns:
+            Row number, or None if the item is not in the list
+        """
+        if self._rows_by_item is None:
+            self._rows_by_item = {item: row for row, item in enumerate(self.indices)}
+        return self._rows_by_item.get(item_index)
+    
+    def get_selected(self) -> Optional[int]:
+        """
+        Get the selected item index.
+        
+        Returns:
+            Selected item index, or None
+        """
+        return self.selected
+    
+    def select(self, item_index: Optional[int], see: bool = True):
+        """
+        Select an item without invoking the on_select callback.
+        
+        Args:
+            item_index: Item index to select, or None to clear the selection
+            see: Whether to scroll the item into view
+        """
+        self.selected = item_index
+        if see and item_index is not None:
+            row = self.row_of(item_index)
+            if row is not None:
+                self.see(row)
+                return
+        self.redraw()
+    
+    def see(self, row: int):
+        """
+        Scroll so that a row is visible.
+        
+        Args:
+            row: Row number
+        """
+        visible = self.visible_rows()
+        if row < self.top:
+            self.top = row
+        elif row >= self.top + visible:
+            self.top = row - visible + 1
+        self.redraw()
+    
+    def visible_rows(self) -> int:
+        """
+        Get the number of rows that fit in the list.
+        
+        Returns:
+            Number of fully visible rows (at least 1)
+        """
+        height = self.canvas.winfo_height()
+        if height <= 1:
+            height = int(self.canvas.cget("height"))
+        return max(1, height // self.row_height)
+    
+    def scroll_rows(self, count: int):
+        """
+        Scroll by a number of rows.
+        
+        Args:
+            count: Rows to scroll (negative scrolls up)
+        """
+        self.top = max(0, min(self.top + count, len(self.indices) - self.visible_rows()))
+        self.redraw()
+    
+    def refresh(self):
+        """Redraw the visible rows after item data changed."""
+        self.redraw()
+    
+    def redraw(self):
+        """Draw the visible rows, reusing canvas items from a small pool."""
+        width = self.canvas.winfo_width()
+        visible = self.visible_rows()
+        
+        # One extra slot for the partially visible row at the bottom
+        while len(self._slots) < visible + 1:
+            self._slots.append((
+                self.canvas.create_rectangle(0, 0, 0, 0, width=0),
+                self.canvas.create_text(0, 0, anchor=tk.W, font=self.font),
+                self.canvas.create_text(0, 0, anchor=tk.W, font=self.font),
+                self.canvas.create_text(0, 0, anchor=tk.E, font=self.font)
+            ))
+        
+        for slot, (background, check, text, badge) in enumerate(self._slots):
+            item_index = self.item_at(self.top + slot) if slot <= visible else None
+            if item_index is None:
+                for canvas_item in (background, check, text, badge):
+                    self.canvas.itemconfigure(canvas_item, state=tk.HIDDEN)
+                continue
+            
+            y = slot * self.row_height
+            middle = y + self.row_height // 2
+            is_selected = item_index == self.selected
+            foreground = self.SELECT_FOREGROUND if is_selected else "black"
+            
+            self.canvas.coords(background, 0, y, width, y + self.row_height)
+            self.canvas.itemconfigure(
+                background, state=tk.NORMAL,
+                fill=self.SELECT_BACKGROUND if is_selected else self.canvas.cget("background")
+            )
+            
+            if self.is_checked:
+                self.canvas.coords(check, 4, middle)
+                self.canvas.itemconfigure(check, state=tk.NORMAL, fill=foreground,
+                                          text="☑" if self.is_checked(item_index) else "☐")
+            else:
+                self.canvas.itemconfigure(check, state=tk.HIDDEN)
+            
+            self.canvas.coords(text, 4 + self.check_width, middle)
+            self.canvas.itemconfigure(text, state=tk.NORMAL, fill=foreground,
+                                      text=self.get_text(item_index))
+            
+            badge_info = self.get_badge(item_index) if self.get_badge else None
+            if badge_info:
+                self.canvas.coords(badge, width - 6, middle)
+                self.canvas.itemconfigure(badge, state=tk.NORMAL, text=badge_info[0],
+                                          fill=foreground if is_selected else badge_info[1])
+            else:
+                self.canvas.itemconfigure(badge, state=tk.HIDDEN)
+        
+        # Scrollbar shows the visible fraction of the rows
+        total = len(self.indices)
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    def _on_scrollbar(self, *args):
+        """Handle scrollbar commands (moveto / scroll units or pages)."""
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.indices))
+            self.scroll_rows(0)
+        elif args[0] == "scroll":
+            count = int(args[1])
+            if args[2] == "pages":
+                count *= self.visible_rows()
+            self.scroll_rows(count)
+    
+    def _on_mousewheel(self, event):
+        """Scroll with the mouse wheel (Windows / macOS)."""
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+    
+    def _on_click(self, event):
+        """Select or toggle the clicked row."""
+        self.canvas.focus_set()
+        item_index = self.item_at(self.top + event.y // self.row_height)
+        if item_index is None:
+            return
+        
+        # Without a select callback, clicking anywhere on the row toggles it
+        if self.is_checked and (event.x < self.check_width + 4 or not self.on_select):
+            self._toggle(item_index)
+            return
+        
+        self._activate(item_index)
+    
+    def _on_space(self, event):
+        """Toggle the selected row's check box."""
+        if self.is_checked and self.selected is not None:
+            self._toggle(self.selected)
+    
+    def _toggle(self, item_index: int):
+        """Toggle an item's check box."""
+        if self.on_toggle:
+            self.on_toggle(item_index)
+        self.redraw()
+    
+    def _activate(self, item_index: int):
+        """Select an item and notify the on_select callback."""
+        self.select(item_index)
+        if self.on_select:
+            self.on_select(item_index)
+    
+    def _move_selection(self, offset: int):
+        """Move the selection by a number of rows."""
+        if not self.indices:
+            return
+        row = self.row_of(self.selected) if self.selected is not None else None
+        row = 0 if row is None else max(0, min(row + offset, len(self.indices) - 1))
+        self._activate(self.indices[row])
+
+# ===== Full-Text Search Dialog =====
+
+class FullTextSearchDialog:
+    """
+    Dialog for ranked full-text search over the open queue and indexed archives.
+    """
+    
+    def __init__(self,
+                parent: tk.Widget,
+                search_index,
+                get_current_queue: Callable[[], Tuple[Optional[str], Sequence[Dict[str, Any]]]],
+                on_open: Callable[[str, int], None]):
+        """
+        Initialize and show the dialog.
+        
+        Args:
+            parent: Parent widget
+            search_index: FullTextIndex to search
+            get_current_queue: Returns (queue file path, items) of the open queue
+            on_open: Callback with (queue file path, item index) for a chosen result
+        """
+        self.parent = parent
+        self.search_index = search_index
+        self.get_current_queue = get_current_queue
+        self.on_open = on_open
+        self.results = []
+        
+        self.window = tk.Toplevel(parent)
+        self.task_manager = BackgroundTaskManager(parent)
+        self.window.title("Full-Text Search")
+        self.window.transient(parent)
+        center_on_parent(self.window, parent, 800, 450)
+        
+        # Query row
+        query_frame = ttk.Frame(self.window, padding=5)
+        query_frame.pack(fill=tk.X)
+        
+        self.query_var = tk.StringVar()
+        query_entry = ttk.Entry(query_frame, textvariable=self.query_var)
+        query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        query_entry.bind("<Return>", lambda e: self.search())
+        query_entry.focus_set()
+        
+        self.search_button = ttk.Button(query_frame, text="Search", command=self.search)
+        self.search_button.pack(side=tk.LEFT, padx=5)
+        
+        # Scope row
+        scope_frame = ttk.Frame(self.window, padding=(5, 0))
+        scope_frame.pack(fill=tk.X)
+        
+        self.scope_var = tk.StringVar(value="current")
+        ttk.Radiobutton(scope_frame, text="Current queue", variable=self.scope_var,
+                        value="current").pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(scope_frame, text="All indexed queues", variable=self.scope_var,
+                        value="all").pack(side=tk.LEFT, padx=5)
+        ttk.Button(scope_frame, text="Index Folder...", command=self.index_folder).pack(side=tk.RIGHT, padx=5)
+        
+        # Results
+        results_frame = ttk.Frame(self.window, padding=5)
+        results_frame.pack(fill=tk.BOTH, expand=True)
+        
+        columns = ("queue", "sku", "title", "match")
+        self.tree = ttk.Treeview(results_frame, columns=columns, show="headings")
+        for column, heading, width in zip(columns, ("Queue", "SKU", "Title", "Match"), (120, 90, 220, 350)):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, stretch=column in ("title", "match"))
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.tree.bind("<Double-1>", self._on_open_result)
+        self.tree.bind("<Return>", self._on_open_result)
+        
+        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.config(yscrollcommand=scrollbar.set)
+        
+        self.status_label = ttk.Label(self.window, text="Search descriptions, item specifics and LLM responses",
+                                      padding=5)
+        self.status_label.pack(fill=tk.X)
+        
+        if not search_index.available:
+            self.status_label.config(text="Full-text search is not supported by this SQLite build")
+    
+    def search(self):
+        """Run the query in the background and show ranked results when done."""
+        text = self.query_var.get().strip()
+        if not text or str(self.search_button.cget("state")) == tk.DISABLED:
+            return
+        
+        # The worker gets its own list, so edits to the open queue can't race it
+        current_path, items = self.get_current_queue()
+        items = list(items)
+        search_all = self.scope_var.get() == "all"
+        
+        def search_task(report_progress, check_cancelled):
+            # Bring the index up to date with the open queue (only changed items are written)
+            if current_path:
+                report_progress(0, 1, "Indexing the open queue...")
+                self.search_index.index_queue(current_path, items)
+            
+            if search_all:
+                report_progress(0, 1, "Indexing changed queues...")
+                self.search_index.refresh(skip=current_path)
+                return self.search_index.search(text)
+            if current_path:
+                return self.search_index.search(text, queue_path=current_path)
+            return []
+        
+        def on_error(e):
+            if self.window.winfo_exists():
+                self.search_button.config(state=tk.NORMAL)
+                self.status_label.config(text=f"Search failed: {str(e)}")
+        
+        self.search_button.config(state=tk.DISABLED)
+        self.status_label.config(text="Searching...")
+        self.task_manager.create_and_start_task(
+            name="Full-Text Search",
+            target_function=search_task,
+            on_progress=self._on_search_progress,
+            on_complete=self._show_results,
+            on_error=on_error
+        )
+    
+    def _on_search_progress(self, current, total, message):
+        """Show what a running search is doing."""
+        if self.window.winfo_exists():
+            self.status_label.config(text=message)
+    
+    def _show_results(self, results):
+        """Show the results of a finished search."""
+        if not self.window.winfo_exists():
+            return
+        self.search_button.config(state=tk.NORMAL)
+        self.results = results
+        
+        self.tree.delete(*self.tree.get_children())
+        for row, result in enumerate(self.results):
+            self.tree.insert("", tk.END, iid=str(row), values=(
+                os.path.basename(result["queue_path"]),
+                result["sku"],
+                result["title"],
+                result["snippet"]
+            ))
+        
+        self.status_label.config(text=f"{len(self.results)} matching items (best matches first)")
+    
+    def index_folder(self):
+        """Add the queue files in a folder to the index (in the background)."""
+        folder = filedialog.askdirectory(parent=self.window, title="Index Queue Folder")
+        if not folder:
+            return
+        
+        def on_complete(counts):
+            self.status_label.config(
+                text=f"Indexed {counts['queues']} queues ({counts['items']} items updated)")
+        
+        run_with_progress(self.window, "Indexing Queues", self.search_index.index_directory,
+                          kwargs={"folder": folder}, on_complete=on_complete)
+    
+    def _on_open_result(self, event=None):
+        """Open the selected result."""
+        selection = self.tree.selection()
+        if selection:
+            result = self.results[int(selection[0])]
+            self.on_open(result["queue_path"], result["item_index"])
+
 # ===== Form Validation =====
 
 def validate_nonempty(value: str, field_name: str = "Field") -> Tuple[bool, str]:
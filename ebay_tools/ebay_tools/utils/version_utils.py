@@ -131,6 +131,7 @@ PROCESSOR_FEATURES = [
     "Interactive pricing system",
     "Batch processing capabilities",
     "Multiple LLM API support",
+    "Full-text search across queues",
     "Auto-save and queue management"
 ]
 
@@ -139,6 +140,7 @@ SETUP_FEATURES = [
     "Photo import and organization",
     "Batch item setup",
     "Queue validation and verification", 
+    "Duplicate photo detection",
     "Item metadata management"
 ]
 
@@ -147,6 +149,7 @@ VIEWER_FEATURES = [
     "Photo gallery display",
     "Export to multiple formats",
     "Queue status overview",
+    "Full-text search across queues",
     "Item editing and updates"
 ]
 
@@ -2,6 +2,8 @@
 """
 Simplified PriceAnalyzer without tkinter dependency for auto pricing
 """
+import os
+import sys
 import json
 import re
 import random
@@ -14,6 +16,17 @@ try:
 except ImportError:
     print("Required packages not found. Install with: pip install requests beautifulsoup4")
 
+# Research cache and price statistics shared with the other eBay Tools pricing front-ends
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ebay_tools'))
+try:
+    from ebay_tools.utils.research_cache_utils import get_research_cache
+except ImportError:
+    get_research_cache = None
+try:
+    from ebay_tools.utils.price_stats_utils import price_stats
+except ImportError:
+    price_stats = None
+
 class SimplePriceAnalyzer:
     """eBay price analyzer that finds similar sold items and recommends pricing (no GUI)."""
     
@@ -22,6 +35,11 @@ class SimplePriceAnalyzer:
         self.config = self._load_config(config_file)
         self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         
+        # Reuse recent research for the same search
+        self.research_cache = None
+        if self.config.get("use_research_cache", True) and get_research_cache:
+            self.research_cache = get_research_cache()
+        
     def _load_config(self, config_file=None):
         """Load configuration from file or use defaults."""
         default_config = {
@@ -29,6 +47,7 @@ class SimplePriceAnalyzer:
             "max_results": 10,     # Maximum number of results to analyze
             "min_results": 3,      # Minimum results needed for analysis
             "days_back": 90,       # How far back to look for sold items
+            "use_research_cache": True,  # Reuse recent research for the same search
         }
         
         if config_file and os.path.exists(config_file):
@@ -149,13 +168,44 @@ class SimplePriceAnalyzer:
             
             return sold_items
         
+        limit = min(limit, 20)
+        
+        # Simulated results are cached apart from real sold listings, so the
+        # same search is priced consistently without mixing in demo data
+        if self.research_cache:
+            cached_items = self.research_cache.get("simulated_sold", search_terms,
+                                                   days_back=self.config["days_back"], limit=limit)
+            if cached_items:
+                return cached_items
+        
         print(f"Simulating sold items for: {search_terms}")
-        return simulate_sold_items(search_terms, min(limit, 20))
+        sold_items = simulate_sold_items(search_terms, limit)
+        
+        if self.research_cache:
+            self.research_cache.put("simulated_sold", search_terms, sold_items,
+                                    days_back=self.config["days_back"], limit=limit)
+        
+        return sold_items
     
     def _analyze_prices(self, sold_items):
         """Analyze the prices of sold items."""
         prices = [item["price"] for item in sold_items]
         
+        if price_stats:
+            # Same outlier rejection and statistics as the other pricing tools
+            stats = price_stats(prices, [item.get("sold_date") for item in sold_items])
+            return {
+                "count": stats["count"],
+                "min_price": stats["min"],
+                "max_price": stats["max"],
+                "average_price": stats["mean"],
+                "median_price": stats["median"],
+                "std_deviation": stats["stdev"],
+                "outliers": stats["outliers"],
+                "weighted_median_price": stats["weighted_median"],
+                "confidence": stats["confidence"]
+            }
+        
         analysis = {
             "count": len(prices),
             "min_price": min(prices),
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent auto-pricing: rate limiting, request coalescing
+and batched queue saves.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Keep the research cache and config of the test away from the user's
+TEST_HOME = tempfile.mkdtemp(prefix="auto_pricing_test_")
+os.environ["HOME"] = TEST_HOME
+os.environ["USERPROFILE"] = TEST_HOME
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from ebay_tools.apps import processor
+from ebay_tools.apps.price_analyzer import PriceAnalyzer
+from ebay_tools.core.config import ConfigManager
+from ebay_tools.utils.fetch_utils import HostRateLimiter, RequestCoalescer
+
+
+def run_threads(count, target):
+    """Run a function in several threads at once and wait for them."""
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_rate_limiter_spaces_requests():
+    """Requests to one host are spaced out across threads; other hosts don't wait."""
+    print("⏱️ Testing the per-host rate limiter")
+    print("=" * 50)
+
+    limiter = HostRateLimiter(0.05)
+    started = []
+    lock = threading.Lock()
+
+    def request():
+        limiter.wait("https://www.ebay.com/sch/i.html")
+        with lock:
+            started.append(time.monotonic())
+
+    run_threads(4, request)
+    started.sort()
+    gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+    assert all(gap >= 0.045 for gap in gaps), gaps
+    assert limiter.wait("https://api.example.com/items") == 0
+    print(f"✅ Gaps between requests: {', '.join(f'{gap:.3f}s' for gap in gaps)}")
+
+
+def test_coalescer_shares_one_fetch():
+    """Identical requests in flight at the same time run the fetch once."""
+    print("🔗 Testing request coalescing")
+    print("=" * 50)
+
+    coalescer = RequestCoalescer()
+    calls = []
+    results = []
+    release = threading.Event()
+
+    def fetch(terms):
+        calls.append(terms)
+        release.wait(5)
+        return [{"title": terms}]
+
+    def request():
+        results.append(coalescer.run(("sold", "rolex"), fetch, "rolex"))
+
+    threads = [threading.Thread(target=request) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    # Let every thread reach the coalescer before the fetch finishes
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and sum(t.is_alive() for t in threads) < 5:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["rolex"], calls
+    assert len(results) == 5 and all(result is results[0] for result in results)
+    assert not coalescer.in_flight
+    print("✅ Five callers shared one fetch")
+
+
+def test_auto_price_task_groups_and_batches():
+    """Items with the same search share one analysis and the queue is saved in batches."""
+    print("💲 Testing the auto-pricing task")
+    print("=" * 50)
+
+    config = ConfigManager()
+    config.load()
+    config.set("pricing.auto_price_save_every", 2)
+    config.set("pricing.request_interval", 0)
+    config.save()
+
+    searches = []
+    lock = threading.Lock()
+
+    def fetch_sold_items(self, search_terms, limit=10):
+        with lock:
+            searches.append(search_terms)
+        time.sleep(0.01)
+        return [{"title": f"{search_terms} {i}", "price": 100 + i, "shipping": 0,
+                 "sold_date": "2026-10-01", "item_id": f"{search_terms}-{i}"} for i in range(5)]
+
+    saves = []
+
+    def save_queue(queue, path):
+        saves.append(sum(1 for item in queue if item.get("auto_priced")))
+        return True
+
+    items = [{"title": "Rolex Submariner Watch"} for _ in range(3)]
+    items += [{"title": "Lego Star Wars Millennium Falcon"}, {"title": "Makita Cordless Drill"}]
+
+    app = processor.EbayLLMProcessor.__new__(processor.EbayLLMProcessor)
+    app.work_queue = items
+    app.queue_file_path = os.path.join(TEST_HOME, "queue.json")
+
+    original_fetch = PriceAnalyzer._fetch_sold_items
+    original_save = processor.save_queue
+    PriceAnalyzer._fetch_sold_items = fetch_sold_items
+    processor.save_queue = save_queue
+    try:
+        result = app._auto_price_task(list(enumerate(items)), lambda *args: None, lambda: False)
+    finally:
+        PriceAnalyzer._fetch_sold_items = original_fetch
+        processor.save_queue = original_save
+
+    assert result["priced"] == 5 and not result["failed"], result
+    assert len(searches) == 3 and len(set(searches)) == 3, searches
+    assert len({item["start_price"] for item in items[:3]}) == 1
+    assert all(item["pricing_data"]["price_analysis"] for item in items)
+    assert 1 <= len(saves) < len(items), saves
+    assert saves[-1] == 5, saves
+    print(f"✅ 5 items priced with {len(searches)} searches and {len(saves)} queue saves")
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Auto Pricing Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_rate_limiter_spaces_requests,
+        test_coalescer_shares_one_fetch,
+        test_auto_price_task_groups_and_batches
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming CSV export.
+"""
+import csv
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from ebay_tools.apps import ebay_csv_export
+from ebay_tools.core.schema import save_queue
+
+
+def make_items(count):
+    """Items with varying fields and item specifics, so rows have different columns."""
+    items = []
+    for index in range(count):
+        item = {
+            "id": f"item_{index}",
+            "sku": f"SKU-{index:04d}",
+            "title": f"Test item {index}",
+            "price": str(10 + index),
+            "condition": "3000",
+            "item_specifics": {f"Spec{index % 7}": f"value {index}"}
+        }
+        if index % 3 == 0:
+            item["api_results"] = [{"final_description": f"Brand: Maker{index}\nColor: Red"}]
+        if index % 5 == 0:
+            item["productIdentifiers"] = {"upc": f"0000{index}"}
+        if index % 4 == 0:
+            item["quantity"] = "2"
+        items.append(item)
+    return items
+
+
+def build_rows_in_memory(items, default_values):
+    """The columns and rows of a CSV export, built all at once as before streaming."""
+    rows = [ebay_csv_export.EbayItemSchema.to_csv_row(item, default_values) for item in items]
+    fields = set()
+    for row in rows:
+        fields.update(row)
+    return ebay_csv_export.order_csv_fields(fields), rows
+
+
+def read_csv(path):
+    """The header and rows of a CSV file."""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+def test_streamed_rows_match():
+    """Streaming, with or without worker processes, writes the same file as building every row first."""
+    print("📄 Testing streamed CSV rows")
+    print("=" * 50)
+
+    items = make_items(60)
+    default_values = {"Format": "FixedPrice", "Duration": "GTC"}
+    temp_dir = tempfile.mkdtemp(prefix="csv_export_")
+
+    serial_file = os.path.join(temp_dir, "serial.csv")
+    success, message = ebay_csv_export.export_items_to_csv(items, serial_file, default_values)
+    assert success, message
+
+    fieldnames, rows = read_csv(serial_file)
+    expected_fields, expected_rows = build_rows_in_memory(items, default_values)
+    assert fieldnames == expected_fields, fieldnames
+    assert len(rows) == len(items)
+    for row, expected in zip(rows, expected_rows):
+        assert row == {field: str(expected.get(field, "")) for field in expected_fields}, row
+    print(f"✅ {len(rows)} rows with {len(fieldnames)} columns match")
+
+    parallel_file = os.path.join(temp_dir, "parallel.csv")
+    success, message = ebay_csv_export.export_items_to_csv(items, parallel_file, default_values, workers=2)
+    assert success, message
+    with open(serial_file, 'rb') as serial, open(parallel_file, 'rb') as parallel:
+        assert serial.read() == parallel.read()
+    print("✅ Worker processes write the same file")
+
+
+def test_queue_file_export():
+    """A queue file streamed from disk exports like the loaded items."""
+    print("📂 Testing CSV export of a queue file")
+    print("=" * 50)
+
+    items = make_items(25)
+    temp_dir = tempfile.mkdtemp(prefix="csv_export_")
+    queue_file = os.path.join(temp_dir, "queue.json")
+    save_queue(items, queue_file)
+
+    items_file = os.path.join(temp_dir, "items.csv")
+    queue_output = os.path.join(temp_dir, "queue.csv")
+    assert ebay_csv_export.export_items_to_csv(items, items_file)[0]
+    success, message = ebay_csv_export.export_queue_file_to_csv(queue_file, queue_output)
+    assert success, message
+
+    with open(items_file, 'rb') as a, open(queue_output, 'rb') as b:
+        assert a.read() == b.read()
+    print("✅ Queue file and items export the same CSV")
+
+
+def test_empty_exports_remove_file():
+    """Exporting an empty queue reports it and leaves no output file behind."""
+    print("🗑️ Testing exports of an empty queue")
+    print("=" * 50)
+
+    temp_dir = tempfile.mkdtemp(prefix="csv_export_")
+    queue_file = os.path.join(temp_dir, "empty.json")
+    save_queue([], queue_file)
+
+    assert ebay_csv_export.export_items_to_csv([], os.path.join(temp_dir, "items.csv")) == \
+        (False, "No items to export")
+
+    formats = ["csv", "json"] + (["excel"] if ebay_csv_export.EXCEL_AVAILABLE else [])
+    for format_name in formats:
+        output = os.path.join(temp_dir, "export" + ebay_csv_export.EXPORT_FORMATS[format_name].extension)
+        result = ebay_csv_export.export_queue_file(queue_file, output, format_name)
+        assert result == (False, "No items to export"), result
+        assert not os.path.exists(output), output
+        print(f"✅ {format_name}: no file left behind")
+
+
+def main():
+    """Run all tests."""
+    print("🧪 CSV Export Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_streamed_rows_match,
+        test_queue_file_export,
+        test_empty_exports_remove_file
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
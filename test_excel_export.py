@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test script for the write-only Excel bulk upload export.
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from ebay_tools.apps import ebay_csv_export
+
+TEMPLATE_SHEET = "eBay-prefill-listing-template"
+
+
+def make_items(count):
+    """Items with titles of varying length, some over eBay's 80 character limit."""
+    return [{
+        "id": f"item_{index}",
+        "sku": f"SKU-{index:05d}",
+        "title": f"Test item {index} " + "x" * (index % 100),
+        "category": "Toys",
+        "condition": "3000",
+        "source_url": f"https://example.com/{index}",
+        "photos": [{"path": f"https://example.com/{index}.jpg"}, {"path": "local.jpg"}],
+        "item_specifics": {"Brand": f"Maker{index % 9}"}
+    } for index in range(count)]
+
+
+def expected_row(item):
+    """The template row of an item."""
+    ebay_row = ebay_csv_export._convert_item_to_ebay_format(item, {})
+    return [ebay_row[key] or None for _, key in ebay_csv_export.EXCEL_TEMPLATE_COLUMNS]
+
+
+def read_template_sheet(path):
+    """All rows of the template sheet, and the column widths."""
+    import openpyxl
+    wb = openpyxl.load_workbook(path, read_only=True)
+    try:
+        assert wb.sheetnames[-1] == TEMPLATE_SHEET, wb.sheetnames
+        rows = [list(row) for row in wb[TEMPLATE_SHEET].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+    # Column widths aren't available in read-only mode
+    wb = openpyxl.load_workbook(path)
+    widths = {letter: dimension.width for letter, dimension in wb[TEMPLATE_SHEET].column_dimensions.items()}
+    return rows, widths
+
+
+def test_streamed_workbook():
+    """Every item is written, past the rows held back for the column widths."""
+    print("📊 Testing the write-only Excel export")
+    print("=" * 50)
+
+    if not ebay_csv_export.EXCEL_AVAILABLE:
+        print("⚠️ openpyxl is not installed, skipping")
+        return
+
+    items = make_items(ebay_csv_export.EXCEL_WIDTH_SAMPLE_ROWS + 250)
+    output = os.path.join(tempfile.mkdtemp(prefix="excel_export_"), "export.xlsx")
+    success, message = ebay_csv_export.export_items_to_excel(items, output)
+    assert success, message
+    assert f"exported {len(items)} items" in message, message
+
+    rows, widths = read_template_sheet(output)
+    info_rows = len(ebay_csv_export.EXCEL_TEMPLATE_INFO_ROWS)
+    assert [row[0] for row in rows[:info_rows]] == [row[0] for row in ebay_csv_export.EXCEL_TEMPLATE_INFO_ROWS]
+    assert rows[info_rows] == [header for header, _ in ebay_csv_export.EXCEL_TEMPLATE_COLUMNS], rows[info_rows]
+
+    data_rows = rows[info_rows + 1:]
+    assert len(data_rows) == len(items), len(data_rows)
+    for row, item in zip(data_rows, items):
+        assert row == expected_row(item), (row, item["sku"])
+    assert max(len(row[2]) for row in data_rows) == 80
+    print(f"✅ {len(data_rows)} rows match the converted items")
+
+    assert max(widths.values()) == ebay_csv_export.EXCEL_MAX_COLUMN_WIDTH, widths
+    print(f"✅ Column widths are capped at {ebay_csv_export.EXCEL_MAX_COLUMN_WIDTH}")
+
+
+def test_workers_write_same_rows():
+    """Converting rows in worker processes writes the same rows in the same order."""
+    print("⚙️ Testing the Excel export with worker processes")
+    print("=" * 50)
+
+    if not ebay_csv_export.EXCEL_AVAILABLE:
+        print("⚠️ openpyxl is not installed, skipping")
+        return
+
+    items = make_items(500)
+    temp_dir = tempfile.mkdtemp(prefix="excel_export_")
+    serial_file = os.path.join(temp_dir, "serial.xlsx")
+    parallel_file = os.path.join(temp_dir, "parallel.xlsx")
+    assert ebay_csv_export.export_items_to_excel(items, serial_file)[0]
+    success, message = ebay_csv_export.export_items_to_excel(items, parallel_file, workers=2)
+    assert success, message
+
+    assert read_template_sheet(serial_file) == read_template_sheet(parallel_file)
+    print("✅ Worker processes write the same sheet")
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Excel Export Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_streamed_workbook,
+        test_workers_write_same_rows
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
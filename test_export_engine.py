@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test script for the unified export engine.
+"""
+import contextlib
+import csv
+import io
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from ebay_tools.apps import ebay_csv_export
+from ebay_tools.core.schema import EbayItemSchema, load_queue, save_queue
+
+
+def make_items(count):
+    """Items with varying fields, item specifics, descriptions and photos."""
+    items = []
+    for index in range(count):
+        item = {
+            "id": f"item_{index}",
+            "created_at": "2026-10-01T12:00:00",
+            "sku": f"SKU-{index:03d}",
+            "title": f"Test item {index}",
+            "price": str(5 + index),
+            "description": f"Description of item {index}",
+            "photos": [{"path": f"photos/{index}_{side}.jpg"} for side in ("front", "back")],
+            "item_specifics": {f"Spec{index % 4}": f"value {index}"}
+        }
+        if index % 2:
+            item["quantity"] = "3"
+            item["format"] = "Auction"
+        if index % 3 == 0:
+            item["productIdentifiers"] = {"ean": f"4000{index}"}
+        items.append(item)
+    return items
+
+
+def legacy_csv(items, default_values, extra_columns):
+    """The CSV the exporters wrote before the engine: every row built first, then written."""
+    rows = []
+    for item in items:
+        row = EbayItemSchema.to_csv_row(item, default_values)
+        for column in extra_columns:
+            row[column] = ebay_csv_export.CSV_EXTRA_COLUMNS[column](item)
+        rows.append(row)
+
+    fields = set(extra_columns)
+    for row in rows:
+        fields.update(row)
+
+    output = io.StringIO(newline='')
+    writer = csv.DictWriter(output, fieldnames=ebay_csv_export.order_csv_fields(fields))
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue().encode('utf-8')
+
+
+def read_bytes(path):
+    """The bytes of a file."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_front_end_exports_match_legacy():
+    """Each front end's export settings give the same CSV as building it in memory."""
+    print("🔁 Testing front end CSV exports against the in-memory export")
+    print("=" * 50)
+
+    items = make_items(30)
+    temp_dir = tempfile.mkdtemp(prefix="export_engine_")
+    settings = {
+        "export tool": ({}, []),
+        "direct listing": ({"Quantity": "1", "Format": "FIXED_PRICE"}, ["Description"]),
+        "setup": (dict.fromkeys(ebay_csv_export.STANDARD_CSV_FIELDS, ""), ["PicURL"]),
+        "viewer": ({}, ["PicURL"])
+    }
+    for name, (default_values, extra_columns) in settings.items():
+        output = os.path.join(temp_dir, f"{name}.csv")
+        success, message = ebay_csv_export.export_items(items, output, "csv", default_values=default_values,
+                                                        extra_columns=extra_columns)
+        assert success, message
+        assert read_bytes(output) == legacy_csv(items, default_values, extra_columns), name
+        print(f"✅ {name}")
+
+    # Item values win over the direct listing defaults
+    with open(os.path.join(temp_dir, "direct listing.csv"), newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [row["Format"] for row in rows[:2]] == ["FIXED_PRICE", "Auction"], rows[:2]
+    assert rows[0]["Description"] == "Description of item 0"
+
+
+def test_routes_write_same_file():
+    """Items, queue files and the command line all go through the same engine."""
+    print("🛣️ Testing the export routes")
+    print("=" * 50)
+
+    items = make_items(12)
+    temp_dir = tempfile.mkdtemp(prefix="export_engine_")
+    queue_file = os.path.join(temp_dir, "queue.json")
+    save_queue(items, queue_file)
+
+    outputs = [os.path.join(temp_dir, f"{route}.csv") for route in ("items", "queue", "wrapper", "cli")]
+    assert ebay_csv_export.export_items(items, outputs[0], extra_columns=["PicURL"])[0]
+    assert ebay_csv_export.export_queue_file(queue_file, outputs[1], extra_columns=["PicURL"])[0]
+    ebay_csv_export.field_mapping_cache.clear()
+    assert ebay_csv_export.export_queue_file(queue_file, outputs[2], "csv", workers=2,
+                                             extra_columns=["PicURL"])[0]
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert ebay_csv_export.main([queue_file, outputs[3], "-c", "PicURL"]) == 0
+
+    expected = read_bytes(outputs[0])
+    for output in outputs[1:]:
+        assert read_bytes(output) == expected, output
+    print("✅ All routes wrote the same CSV")
+
+    json_output = os.path.join(temp_dir, "export.json")
+    assert ebay_csv_export.export_queue_file(queue_file, json_output)[0]
+    saved = os.path.join(temp_dir, "saved.json")
+    save_queue([EbayItemSchema.normalize_item(item) for item in load_queue(queue_file)], saved)
+    assert read_bytes(json_output) == read_bytes(saved)
+    print("✅ JSON export is laid out like a saved queue")
+
+    assert ebay_csv_export.get_export_format(output="out.xls").name == "excel"
+    assert ebay_csv_export.get_export_format(output=temp_dir).name == "html"
+    success, message = ebay_csv_export.export_items(items, outputs[0], "csv", extra_columns=["Nope"])
+    assert not success and "Unknown CSV columns Nope" in message, message
+    print("✅ Formats are picked by extension and bad columns are refused")
+
+
+def test_field_mapping_cache():
+    """Columns of an unchanged queue are reused, and stale columns are found again."""
+    print("🗂️ Testing the field mapping cache")
+    print("=" * 50)
+
+    items = make_items(10)
+    temp_dir = tempfile.mkdtemp(prefix="export_engine_")
+    queue_file = os.path.join(temp_dir, "queue.json")
+    save_queue(items, queue_file)
+    output = os.path.join(temp_dir, "export.csv")
+    expected = legacy_csv(items, {}, [])
+
+    discover = ebay_csv_export.discover_csv_fields
+    discoveries = []
+
+    def counting_discover(*args, **kwargs):
+        discoveries.append(1)
+        return discover(*args, **kwargs)
+
+    ebay_csv_export.discover_csv_fields = counting_discover
+    try:
+        ebay_csv_export.field_mapping_cache.clear()
+        for _ in range(2):
+            assert ebay_csv_export.export_queue_file(queue_file, output, "csv")[0]
+            assert read_bytes(output) == expected
+        assert len(discoveries) == 1, discoveries
+        print("✅ The second export reused the columns")
+
+        # Columns remembered for this queue that miss an item specific
+        key = ebay_csv_export.field_mapping_cache.key(queue_file, {})
+        fieldnames = ebay_csv_export.field_mapping_cache.get(key)
+        ebay_csv_export.field_mapping_cache.put(key, [name for name in fieldnames if name != "C:Spec3"])
+        assert ebay_csv_export.export_queue_file(queue_file, output, "csv")[0]
+        assert read_bytes(output) == expected
+        assert ebay_csv_export.field_mapping_cache.get(key) == fieldnames
+        assert len(discoveries) == 2, discoveries
+
+        success, message = ebay_csv_export.export_items(items, output, "csv", fieldnames=["CustomLabel", "Title"])
+        assert success, message
+        assert read_bytes(output) == expected
+        print("✅ Stale columns were found again")
+
+        # Changing the queue file changes its key
+        items.append(dict(items[0], sku="SKU-NEW", item_specifics={"Extra": "yes"}))
+        save_queue(items, queue_file)
+        assert ebay_csv_export.export_queue_file(queue_file, output, "csv")[0]
+        assert read_bytes(output) == legacy_csv(items, {}, [])
+        print("✅ A changed queue gets new columns")
+    finally:
+        ebay_csv_export.discover_csv_fields = discover
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Export Engine Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_front_end_exports_match_legacy,
+        test_routes_write_same_file,
+        test_field_mapping_cache
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
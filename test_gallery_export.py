@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental gallery export into a shared folder.
+"""
+import os
+import sys
+import tempfile
+
+# Keep the photo store and config of the test away from the user's
+TEST_HOME = tempfile.mkdtemp(prefix="gallery_export_test_")
+os.environ["HOME"] = TEST_HOME
+os.environ["USERPROFILE"] = TEST_HOME
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from PIL import Image
+
+from ebay_tools.apps.gallery_creator import GalleryCreator
+from ebay_tools.core.config import ConfigManager
+
+
+def make_photo(folder, name, color):
+    """Write a small test photo."""
+    path = os.path.join(folder, name)
+    Image.new("RGB", (900, 700), color).save(path)
+    return path
+
+
+def export_gallery(filename, photos):
+    """Export a one-item gallery without opening any windows."""
+    creator = GalleryCreator.__new__(GalleryCreator)
+    creator.config_manager = ConfigManager()
+    creator.export_manifest = None
+    creator.gallery_data = {
+        "title": os.path.basename(filename),
+        "items": [{"title": "Test item", "photos": list(photos)}]
+    }
+    creator._export_html_task(filename, True, lambda *args: None, lambda: False)
+    return creator
+
+
+def exported_files(creator, photo):
+    """Names of the files exported for a source photo."""
+    variants = creator.photo_derivatives.get(photo)
+    if variants:
+        return {name for info in variants.values() for name in (info.get("jpeg"), info.get("webp")) if name}
+    return {os.path.basename(creator.photo_urls[photo])}
+
+
+def test_two_galleries_share_photos_folder():
+    """Re-exporting one gallery must not delete photos another gallery in the folder uses."""
+    print("🖼️ Testing two galleries exported to one folder")
+    print("=" * 50)
+
+    work = tempfile.mkdtemp(prefix="gallery_export_")
+    source = os.path.join(work, "source")
+    output = os.path.join(work, "galleries")
+    os.makedirs(source)
+    photos_dir = os.path.join(output, "photos")
+
+    only_a = make_photo(source, "a.jpg", "red")
+    shared = make_photo(source, "shared.jpg", "green")
+    only_b = make_photo(source, "b.jpg", "blue")
+
+    gallery_a = os.path.join(output, "a.html")
+    gallery_b = os.path.join(output, "b.html")
+    export_gallery(gallery_a, [only_a, shared])
+    creator_b = export_gallery(gallery_b, [shared, only_b])
+    shared_files = exported_files(creator_b, shared)
+    print(f"Shared photo exported as {len(shared_files)} files")
+
+    # Gallery A drops the shared photo; gallery B still shows it
+    export_gallery(gallery_a, [only_a])
+    missing = [name for name in shared_files if not os.path.exists(os.path.join(photos_dir, name))]
+    assert not missing, f"Photos of gallery B were removed: {missing}"
+    print("✅ Photos still used by gallery B were kept")
+
+    # Once no gallery uses the photo any more, it is cleaned up
+    export_gallery(gallery_b, [only_b])
+    left = [name for name in shared_files if os.path.exists(os.path.join(photos_dir, name))]
+    assert not left, f"Unused photos were left behind: {left}"
+    print("✅ Photos no gallery uses were removed")
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Gallery Export Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_two_galleries_share_photos_folder
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
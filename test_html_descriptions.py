@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test script for the HTML description files written by the exports.
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from ebay_tools.apps import ebay_csv_export
+
+
+def make_items(count):
+    """Items alternating between processed descriptions and generated ones."""
+    items = []
+    for index in range(count):
+        item = {"id": f"item_{index}", "sku": f"SKU-{index:03d}", "title": f"Item {index}", "condition": "1000"}
+        if index % 2:
+            item["api_results"] = [{"final_description": f"<p>Processed description {index}</p>"}]
+        items.append(item)
+    return items
+
+
+def read_file(path):
+    """The text of a file."""
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def test_generated_description_is_escaped():
+    """Titles and item specifics are escaped in generated descriptions."""
+    print("🔒 Testing escaping in generated descriptions")
+    print("=" * 50)
+
+    item = {
+        "sku": "ESC-1",
+        "title": "Tom & Jerry <script>alert(1)</script> $5",
+        "condition": "1000",
+        "item_specifics": {"Size <cm>": "5 > 4 & up"}
+    }
+    description_dir = tempfile.mkdtemp(prefix="descriptions_")
+    report = ebay_csv_export.create_html_descriptions([item], description_dir)
+    assert report["created"] == 1 and not report["errors"], report
+
+    html = read_file(os.path.join(description_dir, "ESC-1_description.html"))
+    assert "<script>" not in html
+    assert "<h1>Tom &amp; Jerry &lt;script&gt;alert(1)&lt;/script&gt; $5</h1>" in html, html
+    assert "<span class='spec-name'>Size &lt;cm&gt;:</span> 5 &gt; 4 &amp; up" in html, html
+    print("✅ Item text is escaped")
+
+
+def test_unchanged_files_are_skipped():
+    """A second run leaves files alone and only rewrites changed descriptions."""
+    print("⏭️ Testing unchanged description files")
+    print("=" * 50)
+
+    items = make_items(20)
+    description_dir = tempfile.mkdtemp(prefix="descriptions_")
+    report = ebay_csv_export.create_html_descriptions(items, description_dir, workers=4, chunk_size=3)
+    assert report == {"created": 20, "unchanged": 0, "empty": 0, "errors": []}, report
+
+    # Backdate the files so a rewrite would show in the modification time
+    paths = [os.path.join(description_dir, f"{item['sku']}_description.html") for item in items]
+    for path in paths:
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    items[1]["api_results"][0]["final_description"] = "<p>Edited</p>"
+    report = ebay_csv_export.create_html_descriptions(items, description_dir, workers=4, chunk_size=3)
+    assert report == {"created": 1, "unchanged": 19, "empty": 0, "errors": []}, report
+
+    rewritten = [path for path in paths if os.stat(path).st_mtime_ns != 1_000_000_000]
+    assert rewritten == [paths[1]], rewritten
+    assert read_file(paths[1]) == "<p>Edited</p>"
+    print("✅ Only the edited description was written")
+
+
+def test_errors_are_reported():
+    """Failed items are reported one by one and don't stop the others."""
+    print("⚠️ Testing the description error report")
+    print("=" * 50)
+
+    items = make_items(6)
+    items.append(dict(items[0], id="duplicate"))
+    items.append({"id": "blank", "sku": "SKU-BLANK", "api_results": [{"final_description": ""}]})
+    description_dir = tempfile.mkdtemp(prefix="descriptions_")
+    # A directory where the file should go can't be written
+    os.makedirs(os.path.join(description_dir, "SKU-002_description.html"))
+
+    for workers in (0, 4):
+        report = ebay_csv_export.create_html_descriptions(items, description_dir, workers=workers, chunk_size=2)
+        labels = sorted(label for label, _ in report["errors"])
+        assert labels == ["SKU-000", "SKU-002"], report["errors"]
+        assert report["empty"] == 1, report
+        assert report["created"] + report["unchanged"] == 5, report
+    print("✅ Duplicate and unwritable files are reported per item")
+
+    output = os.path.join(tempfile.mkdtemp(prefix="descriptions_"), "export.csv")
+    success, message = ebay_csv_export.export_items(items, output, "csv", description_dir=description_dir)
+    assert success, message
+    assert "Could not create 2 HTML description files:" in message, message
+    assert "SKU-000: SKU-000_description.html is already used by item item_0" in message, message
+    print("✅ The export message lists the failures")
+
+
+def main():
+    """Run all tests."""
+    print("🧪 HTML Description Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_generated_description_is_escaped,
+        test_unchanged_files_are_skipped,
+        test_errors_are_reported
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script for the item specifics stored on each item.
+"""
+import csv
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from ebay_tools.apps import ebay_csv_export
+from ebay_tools.core.schema import EbayItemSchema, load_queue, save_queue
+
+
+class CountingExtraction:
+    """Counts the real extractions of a schema class while it is active."""
+
+    def __init__(self, schema=EbayItemSchema):
+        self.schema = schema
+        self.original = schema._extract_item_specifics
+
+    def __enter__(self):
+        self.calls = 0
+
+        def extract(item):
+            self.calls += 1
+            return self.original(item)
+
+        self.schema._extract_item_specifics = staticmethod(extract)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.schema._extract_item_specifics = staticmethod(self.original)
+
+
+def make_item():
+    """An item with specifics from every source."""
+    return {
+        "title": "Sony Walkman WM-2",
+        "item_specifics": {"Color": "Silver"},
+        "C:Type": "Cassette Player",
+        "api_results": [{
+            "item_specifics": {"Brand": ""},
+            "final_description": "Great player.\nBrand: Sony\nModel: WM-2\n"
+        }]
+    }
+
+
+def test_specifics_are_reused():
+    """Specifics are extracted once and reused while their sources are unchanged."""
+    print("♻️ Testing stored item specifics")
+    print("=" * 50)
+
+    item = make_item()
+    with CountingExtraction() as counter:
+        first = EbayItemSchema.extract_item_specifics(item)
+        first["Color"] = "Changed by the caller"
+        second = EbayItemSchema.extract_item_specifics(item)
+        EbayItemSchema.to_csv_row(item)
+        EbayItemSchema.csv_field_names(item)
+    assert counter.calls == 1, counter.calls
+    assert second == {"Color": "Silver", "Type": "Cassette Player", "Brand": "Sony", "Model": "WM-2"}, second
+    assert item[EbayItemSchema.SPECIFICS_FIELD]["values"] == second
+    print("✅ One extraction served four lookups")
+
+    # The stored specifics survive saving and loading the queue
+    path = os.path.join(tempfile.mkdtemp(prefix="item_specifics_"), "queue.json")
+    save_queue([item], path)
+    loaded = load_queue(path)[0]
+    with CountingExtraction() as counter:
+        assert EbayItemSchema.extract_item_specifics(loaded) == second
+    assert counter.calls == 0, counter.calls
+    print("✅ A loaded queue reuses the saved specifics")
+
+
+def test_specifics_follow_source_changes():
+    """Changing api_results or another source extracts the specifics again."""
+    print("🔄 Testing stored item specifics after changes")
+    print("=" * 50)
+
+    item = make_item()
+    EbayItemSchema.extract_item_specifics(item)
+
+    with CountingExtraction() as counter:
+        item["api_results"].append({"item_specifics": {"MPN": "WM2-S"}})
+        assert EbayItemSchema.extract_item_specifics(item)["MPN"] == "WM2-S"
+
+        item["api_results"][0]["final_description"] = "Brand: Aiwa"
+        assert EbayItemSchema.extract_item_specifics(item)["Brand"] == "Aiwa"
+
+        item["item_specifics"]["Color"] = "Black"
+        item["C:Type"] = "Walkman"
+        specifics = EbayItemSchema.extract_item_specifics(item)
+        assert specifics["Color"] == "Black" and specifics["Type"] == "Walkman", specifics
+
+        EbayItemSchema.extract_item_specifics(item)
+    assert counter.calls == 3, counter.calls
+    print("✅ Each change was picked up, and only changes extracted again")
+
+
+def test_csv_export_extracts_once():
+    """Both CSV export passes share the stored specifics."""
+    print("📄 Testing CSV export with stored item specifics")
+    print("=" * 50)
+
+    items = [make_item() for _ in range(3)]
+    output = os.path.join(tempfile.mkdtemp(prefix="item_specifics_"), "export.csv")
+    # The exporter imports the schema through its own path
+    with CountingExtraction(ebay_csv_export.EbayItemSchema) as counter:
+        success, message = ebay_csv_export.export_items(items, output, "csv")
+    assert success, message
+    assert counter.calls == len(items), counter.calls
+
+    with open(output, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [row["C:Brand"] for row in rows] == ["Sony"] * 3
+    print(f"✅ {len(items)} items exported with {counter.calls} extractions")
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Item Specifics Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_specifics_are_reused,
+        test_specifics_follow_source_changes,
+        test_csv_export_extracts_once
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
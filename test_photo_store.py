@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed photo store and derivative cache.
+"""
+import os
+import sys
+import tempfile
+
+# Keep the photo store and config of the test away from the user's
+TEST_HOME = tempfile.mkdtemp(prefix="photo_store_test_")
+os.environ["HOME"] = TEST_HOME
+os.environ["USERPROFILE"] = TEST_HOME
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from PIL import Image
+
+from ebay_tools.utils.derivative_utils import DerivativeCache
+from ebay_tools.utils.photo_store_utils import PhotoStore
+
+
+def make_photo(folder, name, color, size=(900, 700)):
+    """Write a small test photo."""
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, name)
+    Image.new("RGB", size, color).save(path)
+    return path
+
+
+def stored_objects(store):
+    """Names of all files in the store's objects directory."""
+    return [name for _, _, files in os.walk(store.objects_dir) for name in files]
+
+
+def test_same_basename_photos_get_distinct_names():
+    """Two different IMG_0001.jpg files are placed side by side, an identical one is shared."""
+    print("📸 Testing photos with the same file name")
+    print("=" * 50)
+
+    work = tempfile.mkdtemp(prefix="photo_store_")
+    store = PhotoStore(os.path.join(work, "store"))
+    first = make_photo(os.path.join(work, "camera1"), "IMG_0001.jpg", "red")
+    second = make_photo(os.path.join(work, "camera2"), "IMG_0001.jpg", "blue")
+    copy = make_photo(os.path.join(work, "camera3"), "IMG_0001.jpg", "red")
+
+    export = os.path.join(work, "export")
+    names = store.place_all([first, second, copy], export)
+
+    assert names[first] != names[second], names
+    assert names[first] == names[copy], names
+    assert sorted(os.listdir(export)) == sorted({names[first], names[second]}), os.listdir(export)
+    with open(os.path.join(export, names[second]), 'rb') as placed, open(second, 'rb') as source:
+        assert placed.read() == source.read()
+    print(f"✅ Placed as {names[first]} and {names[second]}")
+
+
+def test_place_writes_each_photo_once():
+    """Placing copies straight from the source and skips photos already exported."""
+    print("📁 Testing direct placement")
+    print("=" * 50)
+
+    work = tempfile.mkdtemp(prefix="photo_store_")
+    store = PhotoStore(os.path.join(work, "store"))
+    photo = make_photo(os.path.join(work, "source"), "item.jpg", "green")
+    export = os.path.join(work, "export")
+
+    name = store.place_all([photo], export)[photo]
+    assert not stored_objects(store), stored_objects(store)
+    assert os.access(os.path.join(export, name), os.W_OK)
+    print("✅ Nothing was copied into the store")
+
+    placed = os.path.join(export, name)
+    before = os.stat(placed).st_mtime_ns
+    os.utime(placed, ns=(before - 10**9, before - 10**9))
+    assert store.place_all([photo], export)[photo] == name
+    assert os.stat(placed).st_mtime_ns == before - 10**9
+    print("✅ Repeat export left the placed file alone")
+
+
+def test_derivative_cache_trim():
+    """Trimming evicts the least recently used derivatives first."""
+    print("✂️ Testing derivative cache trimming")
+    print("=" * 50)
+
+    work = tempfile.mkdtemp(prefix="photo_store_")
+    cache = DerivativeCache(PhotoStore(os.path.join(work, "store")), sizes={"thumb": 64}, webp=False)
+    old = make_photo(os.path.join(work, "source"), "old.jpg", "red")
+    new = make_photo(os.path.join(work, "source"), "new.jpg", "blue")
+
+    cache.generate_all([old])
+    cache.generate_all([new])
+    old_digest = cache.store.digest(old)
+    new_digest = cache.store.digest(new)
+    cache.index[old_digest]["used"] = 1.0
+
+    report = cache.trim(1)
+    assert report["removed"] == 2 and report["kept"] == 0, report
+
+    cache.generate_all([old, new])
+    cache.index[old_digest]["used"] = 1.0
+    size = os.path.getsize(os.path.join(os.path.dirname(cache._cache_base(new_digest)),
+                                        f"{new_digest}_thumb.jpg"))
+    report = cache.trim(size)
+    assert report["removed"] == 1, report
+    assert old_digest not in cache.index and new_digest in cache.index
+    print("✅ Least recently used derivatives were removed")
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Photo Store Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_same_basename_photos_get_distinct_names,
+        test_place_writes_each_photo_once,
+        test_derivative_cache_trim
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
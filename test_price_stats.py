@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test script for the NumPy and pure Python price statistics.
+"""
+import math
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from ebay_tools.utils.price_stats_utils import HAS_NUMPY, batch_price_stats, price_stats
+
+NOW = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def assert_same_stats(numpy_stats, python_stats, context):
+    """Check that two statistics dictionaries agree."""
+    assert (numpy_stats is None) == (python_stats is None), context
+    if numpy_stats is None:
+        return
+    assert numpy_stats.keys() == python_stats.keys(), context
+    for key, expected in python_stats.items():
+        actual = numpy_stats[key]
+        if isinstance(expected, float):
+            assert math.isclose(actual, expected, rel_tol=1e-9, abs_tol=1e-9), \
+                f"{key}: NumPy {actual} != Python {expected} for {context}"
+        else:
+            assert actual == expected, f"{key}: NumPy {actual} != Python {expected} for {context}"
+
+
+def test_weighted_median_ties():
+    """Both paths pick the same weighted median when the weights tie at half."""
+    print("⚖️ Testing weighted median ties")
+    print("=" * 50)
+
+    if not HAS_NUMPY:
+        print("⚠️ NumPy is not installed, skipping")
+        return
+
+    cases = [
+        ([2, 3, 5, 2, 3, 2], [None, '2026-10-01', '2026-09-01', None, '2026-08-02', None]),
+        ([5, 2, 3, 3, 2, 5, 5, 5], [None, '2026-09-11', '2026-08-02', None, '2026-09-01', None, None, None])
+    ]
+    for prices, sold_dates in cases:
+        numpy_stats = price_stats(prices, sold_dates, now=NOW, use_numpy=True)
+        python_stats = price_stats(prices, sold_dates, now=NOW, use_numpy=False)
+        print(f"NumPy: {numpy_stats['weighted_median']}, Python: {python_stats['weighted_median']}")
+        assert numpy_stats['weighted_median'] == python_stats['weighted_median']
+    print("✅ Weighted medians match")
+
+
+def test_trimmed_mean_trims_everything():
+    """A trim that would leave no prices falls back to all of them in both paths."""
+    print("✂️ Testing a trim that leaves no prices")
+    print("=" * 50)
+
+    for use_numpy in ([True, False] if HAS_NUMPY else [False]):
+        stats = price_stats([10, 20], trim=0.5, use_numpy=use_numpy)
+        assert stats['trimmed_mean'] == 15.0, stats['trimmed_mean']
+    print("✅ Trimmed mean uses every price")
+
+
+def test_random_equivalence():
+    """The NumPy and Python paths agree on random comp sets."""
+    print("🎲 Testing NumPy and Python equivalence on random comp sets")
+    print("=" * 50)
+
+    if not HAS_NUMPY:
+        print("⚠️ NumPy is not installed, skipping")
+        return
+
+    rng = random.Random(40)
+    for trial in range(1000):
+        comp_sets = []
+        date_sets = []
+        for _ in range(rng.randint(1, 8)):
+            size = rng.randint(0, 25)
+            # Few distinct prices, so ties are common
+            choices = [rng.choice([1, 2, 3, 5, 9.99, 10, 250]) for _ in range(rng.randint(1, 6))]
+            comp_sets.append([rng.choice(choices) for _ in range(size)])
+            if rng.random() < 0.2:
+                date_sets.append(None)
+            else:
+                date_sets.append([
+                    # Undated prices get the average weight, which often ties
+                    None if rng.random() < 0.4
+                    else (NOW - timedelta(days=rng.choice([0, 10, 20, 30, 60, rng.uniform(0, 120)]))).isoformat()
+                    for _ in range(size)
+                ])
+
+        options = {
+            "method": rng.choice(["iqr", "mad", "none"]),
+            "trim": rng.choice([0.0, 0.1, 0.25, 0.5]),
+            "half_life_days": rng.choice([0, 15.0, 30.0]),
+            "now": NOW,
+        }
+        numpy_results = batch_price_stats(comp_sets, date_sets, use_numpy=True, **options)
+        python_results = batch_price_stats(comp_sets, date_sets, use_numpy=False, **options)
+        for prices, numpy_stats, python_stats in zip(comp_sets, numpy_results, python_results):
+            assert_same_stats(numpy_stats, python_stats, f"trial {trial}, prices {prices}, options {options}")
+
+    print("✅ 1000 random batches match")
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Price Statistics Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_weighted_median_ties,
+        test_trimmed_mean_trims_everything,
+        test_random_equivalence
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test script for researching several search strategies in PriceAnalyzer.
+"""
+import json
+import os
+import sys
+import tempfile
+
+# Keep the research cache and config of the test away from the user's
+TEST_HOME = tempfile.mkdtemp(prefix="price_strategies_test_")
+os.environ["HOME"] = TEST_HOME
+os.environ["USERPROFILE"] = TEST_HOME
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from ebay_tools.apps.price_analyzer import PriceAnalyzer
+
+
+class ScriptedAnalyzer(PriceAnalyzer):
+    """PriceAnalyzer whose searches return prepared listings instead of going online."""
+
+    def __init__(self, sold, config=None):
+        config_file = os.path.join(tempfile.mkdtemp(prefix="price_strategies_"), "config.json")
+        with open(config_file, 'w') as f:
+            json.dump(dict({"use_research_cache": False}, **(config or {})), f)
+        super().__init__(config_file)
+        self.sold = sold
+        self.searches = []
+
+    def _fetch_sold_items(self, search_terms, limit=10):
+        self.searches.append(search_terms)
+        return list(self.sold.get(search_terms, []))[:limit]
+
+    def _fetch_current_listings(self, search_terms, limit=10):
+        return []
+
+
+def listings(prefix, prices):
+    """Sold listings with the given prices."""
+    return [{"title": f"{prefix} {i}", "price": price, "shipping": 0, "sold_date": "2026-10-01",
+             "item_id": f"{prefix}-{i}"} for i, price in enumerate(prices)]
+
+
+STRATEGIES = [
+    {'terms': 'madame alexander cinderella', 'strategy': 'brand_model', 'confidence': 'high'},
+    {'terms': 'vintage doll', 'strategy': 'title_cleaned', 'confidence': 'low'}
+]
+
+
+def analyze(analyzer, **kwargs):
+    """Analyze a test item with the prepared strategies."""
+    analyzer.search_extractor.extract_search_terms = lambda item: [dict(s) for s in STRATEGIES]
+    return analyzer.analyze_item(item_data={"title": "test"}, **kwargs)
+
+
+def test_parallel_is_opt_in():
+    """Without the setting only strategies up to the first success are searched."""
+    print("🔀 Testing that parallel strategies are opt-in")
+    print("=" * 50)
+
+    analyzer = ScriptedAnalyzer({'madame alexander cinderella': listings("ma", [40, 42, 45, 50])})
+    assert analyzer.config["parallel_strategies"] is False
+    result = analyze(analyzer)
+    assert analyzer.searches == ['madame alexander cinderella'], analyzer.searches
+    assert result['successful_strategy']['strategy'] == 'brand_model'
+    print("✅ The low confidence strategy was never searched")
+
+
+def test_confident_strategy_beats_more_results():
+    """A high confidence strategy with enough results wins over a vaguer one with more."""
+    print("🏆 Testing strategy ranking")
+    print("=" * 50)
+
+    sold = {
+        'madame alexander cinderella': listings("ma", [40, 42, 45, 50]),
+        'vintage doll': listings("vd", [5, 12, 18, 25, 30, 41, 47, 52, 60, 75])
+    }
+    for parallel in (True, False):
+        analyzer = ScriptedAnalyzer(sold)
+        result = analyze(analyzer, parallel=parallel)
+        assert result['successful_strategy']['strategy'] == 'brand_model', (parallel, result['successful_strategy'])
+        assert len(result['sold_items']) == 4
+        if parallel:
+            assert len(result['merged_sold_items']) == 14
+    print("✅ brand_model won with 4 sold items over title_cleaned with 10")
+
+    # Below min_results the specific strategy no longer counts as a result
+    sold['madame alexander cinderella'] = listings("ma", [40, 42])
+    result = analyze(ScriptedAnalyzer(sold), parallel=True)
+    assert result['successful_strategy']['strategy'] == 'title_cleaned', result['successful_strategy']
+    print("✅ Too few sold items fall back to the next strategy")
+
+
+def test_parallel_merges_duplicates():
+    """Listings found by several strategies are merged once."""
+    print("🧩 Testing merged listings")
+    print("=" * 50)
+
+    shared = listings("shared", [40, 41, 42])
+    sold = {
+        'madame alexander cinderella': shared + listings("ma", [45]),
+        'vintage doll': shared + listings("vd", [20, 30])
+    }
+    result = analyze(ScriptedAnalyzer(sold), parallel=True)
+    ids = [item['item_id'] for item in result['merged_sold_items']]
+    assert sorted(ids) == sorted(['shared-0', 'shared-1', 'shared-2', 'ma-0', 'vd-0', 'vd-1']), ids
+    print(f"✅ {len(ids)} distinct listings merged")
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Price Strategy Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_parallel_is_opt_in,
+        test_confident_strategy_beats_more_results,
+        test_parallel_merges_duplicates
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the taxonomy data file and its hot reloading.
+"""
+import json
+import os
+import sys
+import tempfile
+
+# Keep the config of the test away from the user's
+TEST_HOME = tempfile.mkdtemp(prefix="taxonomy_test_")
+os.environ["HOME"] = TEST_HOME
+os.environ["USERPROFILE"] = TEST_HOME
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ebay_tools'))
+
+from ebay_tools.apps.price_analyzer import SmartSearchExtractor
+from ebay_tools.utils.taxonomy_utils import (
+    BUNDLED_TAXONOMY_FILE, Taxonomy, TaxonomyManager, read_taxonomy_file, write_taxonomy_file
+)
+
+
+def brand_of(extractor, title):
+    """Brand term of the brand_model strategy for a title, if any."""
+    for strategy in extractor.extract_search_terms({"title": title}):
+        if strategy['strategy'] == 'brand_model':
+            return strategy['terms']
+    return None
+
+
+def test_bundled_taxonomy():
+    """The shipped data file loads and adds hundreds of brands to the built-in ones."""
+    print("📚 Testing the bundled taxonomy")
+    print("=" * 50)
+
+    with open(BUNDLED_TAXONOMY_FILE, 'r', encoding='utf-8') as f:
+        bundled = json.load(f)
+    taxonomy = Taxonomy()
+    print(f"Built-in taxonomy has {len(taxonomy.brand_patterns)} brands, {taxonomy.size()} entries")
+
+    assert len(bundled["brands"]) >= 400, len(bundled["brands"])
+    assert set(bundled["brands"]) <= set(taxonomy.brand_patterns)
+    # The tables in the module keep priority over the data file
+    assert list(taxonomy.brand_patterns)[0] == 'apple'
+
+    extractor = SmartSearchExtractor(TaxonomyManager(None))
+    terms = brand_of(extractor, "Vintage Fisher-Price Little People Farm Barn")
+    assert terms and terms.startswith('fisher-price'), terms
+    print(f"✅ Bundled brand recognized: {terms}")
+
+
+def test_reload_picks_up_edits():
+    """Editing the taxonomy file changes what the next extraction sees."""
+    print("🔄 Testing taxonomy reload after an edit")
+    print("=" * 50)
+
+    path = os.path.join(tempfile.mkdtemp(prefix="taxonomy_"), "taxonomy.json")
+    write_taxonomy_file(path, {"brands": {"acme": ["acme"]}})
+    manager = TaxonomyManager(path, check_interval=0)
+    extractor = SmartSearchExtractor(manager)
+
+    title = "Zorblatt Widget Doll 1987"
+    assert 'acme' in manager.current().brand_patterns
+    assert not (brand_of(extractor, title) or '').startswith('zorblatt')
+
+    data = read_taxonomy_file(path, base={})
+    data["brands"]["zorblatt"] = ["zorblatt"]
+    write_taxonomy_file(path, data)
+    # Make sure the edit is visible even on file systems with coarse timestamps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+
+    taxonomy = manager.current()
+    assert 'zorblatt' in taxonomy.brand_patterns
+    assert manager.reload() is False, "Unchanged file was reloaded"
+    terms = brand_of(extractor, title)
+    assert terms and terms.startswith('zorblatt'), terms
+    print(f"✅ Edited brand recognized: {terms}")
+
+    # A broken edit keeps the previous taxonomy
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("{not json")
+    assert manager.reload(force=True) is False
+    assert manager.current() is taxonomy
+    print("✅ Broken file kept the previous taxonomy")
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Taxonomy Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_bundled_taxonomy,
+        test_reload_picks_up_edits
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print("✅ Test passed\n")
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}\n")
+
+    print("=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)